@@ -14,12 +14,6 @@ from beeai_sdk.platform import File, VectorStore
 from beeai_sdk.platform.vector_store import VectorStoreItem
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from rag.helpers.trajectory import TrajectoryEvent
-from tenacity import (
-    AsyncRetrying,
-    retry_if_exception_type,
-    stop_after_delay,
-    wait_fixed,
-)
 
 
 class FileExtractionEvent(TrajectoryEvent):
@@ -42,22 +36,10 @@ class EmbeddingFunction(Protocol):
 
 
 async def extract_file(file: File) -> None:
-    file_id = file.id
-    extraction = await file.create_extraction()
-
-    async for attempt in AsyncRetrying(
-        stop=stop_after_delay(timedelta(minutes=2)),
-        wait=wait_fixed(1),
-        retry=retry_if_exception_type(TimeoutError),
-        reraise=True,
-    ):
-        with attempt:
-            extraction = await file.get_extraction()
-            final_status = extraction.status
-            if final_status == "failed":
-                raise RuntimeError(f"Extraction for file {file_id} has failed: {extraction.model_dump_json()}")
-            if final_status != "completed":
-                raise TimeoutError("Text extraction is not finished yet")
+    await file.create_extraction()
+    extraction = await file.wait_for_extraction(timeout=timedelta(minutes=2).total_seconds())
+    if extraction.status != "completed":
+        raise RuntimeError(f"Extraction for file {file.id} has failed: {extraction.model_dump_json()}")
 
 
 async def chunk_and_embed(embedding_function: EmbeddingFunction, file: File, vector_store_id: str):
@@ -10,6 +10,6 @@ T = TypeVar("T", bound=BaseModel)
 
 class PaginatedResult(BaseModel, Generic[T]):
     items: list[T]
-    total_count: int
+    total_count: int | None = None  # not counted when requested with total_count="none"
     has_more: bool = False
     next_page_token: str | None = None
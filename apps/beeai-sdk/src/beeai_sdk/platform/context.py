@@ -83,6 +83,7 @@ class Context(pydantic.BaseModel):
         order: Literal["asc"] | Literal["desc"] | None = None,
         order_by: Literal["created_at"] | Literal["updated_at"] | None = None,
         include_empty: bool = True,
+        total_count: Literal["exact", "estimated", "none"] | None = None,
     ) -> PaginatedResult[Context]:
         # `self` has a weird type so that you can call both `instance.get()` to update an instance, or `File.get("123")` to obtain a new instance
         async with client or get_platform_client() as client:
@@ -97,6 +98,7 @@ class Context(pydantic.BaseModel):
                                 "order": order,
                                 "order_by": order_by,
                                 "include_empty": include_empty,
+                                "total_count": total_count,
                             }
                         ),
                     )
@@ -173,6 +175,22 @@ class Context(pydantic.BaseModel):
                 await platform_client.post(url=f"/api/v1/contexts/{target_context_id}/history", json=data.model_dump())
             ).raise_for_status()
 
+    async def add_history_items(
+        self: Context | str,
+        *,
+        data: list[Message | Artifact],
+        client: PlatformClient | None = None,
+    ) -> None:
+        """Add multiple Messages or Artifacts to the context history in a single request, preserving their order"""
+        target_context_id = self if isinstance(self, str) else self.id
+        async with client or get_platform_client() as platform_client:
+            _ = (
+                await platform_client.post(
+                    url=f"/api/v1/contexts/{target_context_id}/history:batch",
+                    json={"items": [item.model_dump() for item in data]},
+                )
+            ).raise_for_status()
+
     async def list_history(
         self: Context | str,
         *,
@@ -180,9 +198,15 @@ class Context(pydantic.BaseModel):
         limit: int | None = None,
         order: Literal["asc"] | Literal["desc"] | None = "asc",
         order_by: Literal["created_at"] | Literal["updated_at"] | None = None,
+        total_count: Literal["exact", "estimated", "none"] | None = None,
+        since: str | None = None,
         client: PlatformClient | None = None,
     ) -> PaginatedResult[ContextHistoryItem]:
-        """List all history items for this context in chronological order"""
+        """
+        List all history items for this context in chronological order
+
+        With `since` (an item id or next_page_token), only the items added after it are returned.
+        """
         target_context_id = self if isinstance(self, str) else self.id
         async with client or get_platform_client() as platform_client:
             return pydantic.TypeAdapter(PaginatedResult[ContextHistoryItem]).validate_python(
@@ -190,7 +214,14 @@ class Context(pydantic.BaseModel):
                     await platform_client.get(
                         url=f"/api/v1/contexts/{target_context_id}/history",
                         params=filter_dict(
-                            {"page_token": page_token, "limit": limit, "order": order, "order_by": order_by}
+                            {
+                                "page_token": page_token,
+                                "limit": limit,
+                                "order": order,
+                                "order_by": order_by,
+                                "total_count": total_count,
+                                "since": since,
+                            }
                         ),
                     )
                 )
@@ -198,13 +229,27 @@ class Context(pydantic.BaseModel):
                 .json()
             )
 
+    async def get_full_history(
+        self: Context | str, *, client: PlatformClient | None = None
+    ) -> PaginatedResult[ContextHistoryItem]:
+        """Get the whole history in a single request, next_page_token can be used as `since` afterwards"""
+        target_context_id = self if isinstance(self, str) else self.id
+        async with client or get_platform_client() as platform_client:
+            return pydantic.TypeAdapter(PaginatedResult[ContextHistoryItem]).validate_python(
+                (await platform_client.get(url=f"/api/v1/contexts/{target_context_id}/history/full"))
+                .raise_for_status()
+                .json()
+            )
+
     async def list_all_history(
-        self: Context | str, client: PlatformClient | None = None
+        self: Context | str, since: str | None = None, client: PlatformClient | None = None
     ) -> AsyncIterator[ContextHistoryItem]:
-        result = await Context.list_history(self, client=client)
+        result = await Context.list_history(self, total_count="none", since=since, client=client)
         for item in result.items:
             yield item
         while result.has_more:
-            result = await Context.list_history(self, page_token=result.next_page_token, client=client)
+            result = await Context.list_history(
+                self, page_token=result.next_page_token, total_count="none", since=since, client=client
+            )
             for item in result.items:
                 yield item
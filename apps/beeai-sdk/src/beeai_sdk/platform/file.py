@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import time
 import typing
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -12,7 +13,7 @@ import pydantic
 from a2a.types import FilePart, FileWithUri
 
 from beeai_sdk.platform.client import PlatformClient, get_platform_client
-from beeai_sdk.util.file import LoadedFile, LoadedFileWithUri, PlatformFileUrl
+from beeai_sdk.util.file import LoadedFile, LoadedFileWithUri, PlatformFileUrl, conditional_headers
 
 
 class Extraction(pydantic.BaseModel):
@@ -27,12 +28,17 @@ class Extraction(pydantic.BaseModel):
     finished_at: pydantic.AwareDatetime | None = None
     created_at: pydantic.AwareDatetime
 
+    @property
+    def finished(self) -> bool:
+        return self.status in {"completed", "failed", "cancelled"}
+
 
 class File(pydantic.BaseModel):
     id: str
     filename: str
     content_type: str
     file_size_bytes: int
+    content_sha256: str | None = None
     created_at: pydantic.AwareDatetime
     created_by: str
     file_type: typing.Literal["user_upload", "extracted_text"]
@@ -107,9 +113,16 @@ class File(pydantic.BaseModel):
         self: File | str,
         *,
         stream: bool = False,
+        byte_range: tuple[int, int | None] | None = None,
+        if_none_match: str | None = None,
         client: PlatformClient | None = None,
         context_id: str | None | Literal["auto"] = "auto",
     ) -> AsyncIterator[LoadedFile]:
+        """
+        :param byte_range: load only the inclusive (start, end) range of bytes, end=None reads until the end of file
+        :param if_none_match: ETag of a previously loaded content, if it did not change, the yielded file has
+            `not_modified` set and no content
+        """
         # `self` has a weird type so that you can call both `instance.load_content()` to create an extraction for an instance, or `File.load_content("123")`
         file_id = self if isinstance(self, str) else self.id
         async with client or get_platform_client() as platform_client:
@@ -118,9 +131,14 @@ class File(pydantic.BaseModel):
             file = await File.get(file_id, client=client, context_id=context_id) if isinstance(self, str) else self
 
             async with platform_client.stream(
-                "GET", url=f"/api/v1/files/{file_id}/content", params=context_id and {"context_id": context_id}
+                "GET",
+                url=f"/api/v1/files/{file_id}/content",
+                params=context_id and {"context_id": context_id},
+                headers=conditional_headers(byte_range=byte_range, if_none_match=if_none_match),
+                follow_redirects=True,  # the server might redirect to object storage
             ) as response:
-                response.raise_for_status()
+                if response.status_code != 304:
+                    response.raise_for_status()
                 if not stream:
                     await response.aread()
                 yield LoadedFileWithUri(response=response, content_type=file.content_type, filename=file.filename)
@@ -130,6 +148,8 @@ class File(pydantic.BaseModel):
         self: File | str,
         *,
         stream: bool = False,
+        byte_range: tuple[int, int | None] | None = None,
+        if_none_match: str | None = None,
         client: PlatformClient | None = None,
         context_id: str | None | Literal["auto"] = "auto",
     ) -> AsyncIterator[LoadedFile]:
@@ -144,8 +164,11 @@ class File(pydantic.BaseModel):
                 "GET",
                 url=f"/api/v1/files/{file_id}/text_content",
                 params=context_id and {"context_id": context_id},
+                headers=conditional_headers(byte_range=byte_range, if_none_match=if_none_match),
+                follow_redirects=True,  # the server might redirect to object storage
             ) as response:
-                response.raise_for_status()
+                if response.status_code != 304:
+                    response.raise_for_status()
                 if not stream:
                     await response.aread()
                 yield LoadedFileWithUri(response=response, content_type=file.content_type, filename=file.filename)
@@ -192,6 +215,61 @@ class File(pydantic.BaseModel):
                 .json()
             )
 
+    @staticmethod
+    async def wait_for_extractions(
+        file_ids: typing.Iterable[str],
+        *,
+        timeout: float | None = 120,  # noqa: ASYNC109
+        poll_timeout: float = 30,
+        client: PlatformClient | None = None,
+        context_id: str | None | Literal["auto"] = "auto",
+    ) -> list[Extraction]:
+        """
+        Wait until text extractions of all files are finished (completed, failed or cancelled).
+
+        The server holds each request until the extractions finish or `poll_timeout` elapses, so no polling interval
+        is needed. Raises TimeoutError if the extractions are not finished within `timeout` seconds.
+        """
+        extractions: dict[str, Extraction | None] = dict.fromkeys(file_ids)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        async with client or get_platform_client() as platform_client:
+            context_id = platform_client.context_id if context_id == "auto" else context_id
+            while pending := [
+                file_id for file_id, extraction in extractions.items() if not (extraction and extraction.finished)
+            ]:
+                request_timeout = poll_timeout
+                if deadline is not None:
+                    if (remaining := deadline - time.monotonic()) <= 0:
+                        raise TimeoutError(f"Text extraction of files {pending} is not finished")
+                    request_timeout = min(poll_timeout, remaining)
+                result = (
+                    (
+                        await platform_client.post(
+                            url="/api/v1/files/extractions/wait",
+                            json={"file_ids": pending, "timeout_sec": request_timeout},
+                            params=context_id and {"context_id": context_id},
+                            timeout=request_timeout + 30,
+                        )
+                    )
+                    .raise_for_status()
+                    .json()
+                )
+                for extraction in pydantic.TypeAdapter(list[Extraction]).validate_python(result["items"]):
+                    extractions[extraction.file_id] = extraction
+        return typing.cast(list[Extraction], list(extractions.values()))
+
+    async def wait_for_extraction(
+        self: File | str,
+        *,
+        timeout: float | None = 120,  # noqa: ASYNC109
+        client: PlatformClient | None = None,
+        context_id: str | None | Literal["auto"] = "auto",
+    ) -> Extraction:
+        # `self` has a weird type so that you can call both `instance.wait_for_extraction()` or `File.wait_for_extraction("123")`
+        file_id = self if isinstance(self, str) else self.id
+        [extraction] = await File.wait_for_extractions([file_id], timeout=timeout, client=client, context_id=context_id)
+        return extraction
+
     async def delete_extraction(
         self: File | str,
         *,
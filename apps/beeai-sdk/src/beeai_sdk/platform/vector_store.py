@@ -41,6 +41,36 @@ class VectorStoreSearchResult(pydantic.BaseModel):
     score: float
 
 
+class ChunkingParameters(pydantic.BaseModel):
+    chunk_size: int = 1000
+    chunk_overlap: int = 200
+    separators: list[str] = pydantic.Field(default_factory=lambda: ["\n\n", "\n", " ", ""])
+
+
+class IngestionProgress(pydantic.BaseModel):
+    total_files: int = 0
+    processed_files: int = 0
+    embedded_chunks: int = 0
+
+
+class VectorStoreIngestion(pydantic.BaseModel):
+    id: str
+    vector_store_id: str
+    file_ids: list[str]
+    chunking: ChunkingParameters
+    status: typing.Literal["pending", "in_progress", "completed", "failed", "cancelled"]
+    progress: IngestionProgress
+    job_id: str | None = None
+    error_message: str | None = None
+    started_at: pydantic.AwareDatetime | None = None
+    finished_at: pydantic.AwareDatetime | None = None
+    created_at: pydantic.AwareDatetime
+
+    @property
+    def finished(self) -> bool:
+        return self.status in {"completed", "failed", "cancelled"}
+
+
 class VectorStore(pydantic.BaseModel):
     id: str
     name: str | None = None
@@ -203,3 +233,55 @@ class VectorStore(pydantic.BaseModel):
                     params=context_id and {"context_id": context_id},
                 )
             ).raise_for_status()
+
+    async def ingest(
+        self: VectorStore | str,
+        /,
+        file_ids: list[str],
+        *,
+        chunking: ChunkingParameters | None = None,
+        client: PlatformClient | None = None,
+        context_id: str | None | Literal["auto"] = "auto",
+    ) -> VectorStoreIngestion:
+        """Extract, chunk and embed files into the vector store, the ingestion runs as a job on the server."""
+        # `self` has a weird type so that you can call both `instance.ingest()` or `VectorStore.ingest("123", file_ids)`
+        vector_store_id = self if isinstance(self, str) else self.id
+        async with client or get_platform_client() as platform_client:
+            context_id = platform_client.context_id if context_id == "auto" else context_id
+            return pydantic.TypeAdapter(VectorStoreIngestion).validate_json(
+                (
+                    await platform_client.post(
+                        url=f"/api/v1/vector_stores/{vector_store_id}/ingest",
+                        json={
+                            "file_ids": file_ids,
+                            "chunking": (chunking or ChunkingParameters()).model_dump(mode="json"),
+                        },
+                        params=context_id and {"context_id": context_id},
+                    )
+                )
+                .raise_for_status()
+                .content
+            )
+
+    async def get_ingestion(
+        self: VectorStore | str,
+        /,
+        ingestion_id: str,
+        *,
+        client: PlatformClient | None = None,
+        context_id: str | None | Literal["auto"] = "auto",
+    ) -> VectorStoreIngestion:
+        # `self` has a weird type so that you can call both `instance.get_ingestion()` or `VectorStore.get_ingestion("123", "456")`
+        vector_store_id = self if isinstance(self, str) else self.id
+        async with client or get_platform_client() as platform_client:
+            context_id = platform_client.context_id if context_id == "auto" else context_id
+            return pydantic.TypeAdapter(VectorStoreIngestion).validate_json(
+                (
+                    await platform_client.get(
+                        url=f"/api/v1/vector_stores/{vector_store_id}/ingestions/{ingestion_id}",
+                        params=context_id and {"context_id": context_id},
+                    )
+                )
+                .raise_for_status()
+                .content
+            )
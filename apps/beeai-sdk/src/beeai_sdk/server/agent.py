@@ -233,6 +233,8 @@ def agent(
                         context_id=request_context.context_id,
                         initialized_dependencies=list(dependency_args.values()),
                     )
+                    # flush buffered history before the dependencies (e.g. platform client) are closed
+                    stack.push_async_callback(context.store.flush)
 
                     async def agent_generator():
                         yield_queue = context._yield_queue
@@ -388,11 +390,13 @@ class Executor(AgentExecutor):
                             )
                         case TaskStatus(state=TaskState.input_required, message=message, timestamp=timestamp):
                             await task_updater.requires_input(message=with_context(message), final=True)
+                            await run_context.store.flush()
                             value = cast(RunYieldResume, await resume_queue.dequeue_event())
                             resume_queue.task_done()
                             continue
                         case TaskStatus(state=TaskState.auth_required, message=message, timestamp=timestamp):
                             await task_updater.requires_auth(message=with_context(message), final=True)
+                            await run_context.store.flush()
                             value = cast(RunYieldResume, await resume_queue.dequeue_event())
                             resume_queue.task_done()
                             continue
@@ -24,6 +24,10 @@ class ContextStoreInstance(Protocol):
 
     async def store(self, data: Message | Artifact) -> None: ...
 
+    async def flush(self) -> None:
+        """Persist buffered items, called when the task finishes or waits for input."""
+        return
+
 
 class ContextStore(abc.ABC):
     def modify_dependencies(self, dependencies: dict[str, Depends]) -> None:
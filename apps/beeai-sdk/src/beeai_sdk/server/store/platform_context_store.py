@@ -1,9 +1,14 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import logging
 from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import timedelta
 
 from a2a.types import Artifact, Message
+from cachetools import TTLCache
 
 from beeai_sdk.a2a.extensions.services.platform import (
     PlatformApiExtensionServer,
@@ -14,8 +19,39 @@ from beeai_sdk.server.constants import _IMPLICIT_DEPENDENCY_PREFIX
 from beeai_sdk.server.dependencies import Dependency, Depends
 from beeai_sdk.server.store.context_store import ContextStore, ContextStoreInstance
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _CachedHistory:
+    items: list[Message | Artifact] = field(default_factory=list)
+    last_item_id: str | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
 
 class PlatformContextStore(ContextStore):
+    def __init__(
+        self,
+        max_cached_contexts: int = 1000,
+        cache_ttl: timedelta = timedelta(minutes=30),
+        max_buffered_items: int = 50,
+        flush_interval: timedelta = timedelta(seconds=1),
+    ):
+        """
+        Initialize the platform context store.
+
+        Args:
+            max_cached_contexts: Maximum number of context histories cached in memory
+            cache_ttl: Time-to-live of a cached history, only new items are fetched from the platform meanwhile
+            max_buffered_items: Stored items are sent in batches, a batch is flushed once it reaches this size
+            flush_interval: Maximum time an item waits in the buffer before it is flushed
+        """
+        self._history_cache: TTLCache[str, _CachedHistory] = TTLCache(
+            maxsize=max_cached_contexts, ttl=cache_ttl.total_seconds()
+        )
+        self._max_buffered_items = max_buffered_items
+        self._flush_interval = flush_interval
+
     def modify_dependencies(self, dependencies: dict[str, Depends]) -> None:
         for dependency in dependencies.values():
             if dependency.extension is None:
@@ -30,19 +66,83 @@ class PlatformContextStore(ContextStore):
 
     async def create(self, context_id: str, initialized_dependencies: list[Dependency]) -> ContextStoreInstance:
         [platform_ext] = [d for d in initialized_dependencies if isinstance(d, PlatformApiExtensionServer)]
-        return PlatformContextStoreInstance(context_id=context_id, platform_extension=platform_ext)
+        if context_id not in self._history_cache:
+            self._history_cache[context_id] = _CachedHistory()
+        return PlatformContextStoreInstance(
+            context_id=context_id,
+            platform_extension=platform_ext,
+            cache=self._history_cache[context_id],
+            max_buffered_items=self._max_buffered_items,
+            flush_interval=self._flush_interval,
+        )
 
 
 class PlatformContextStoreInstance(ContextStoreInstance):
-    def __init__(self, context_id: str, platform_extension: PlatformApiExtensionServer):
+    def __init__(
+        self,
+        context_id: str,
+        platform_extension: PlatformApiExtensionServer,
+        cache: _CachedHistory | None = None,
+        max_buffered_items: int = 50,
+        flush_interval: timedelta = timedelta(seconds=1),
+    ):
         self._context_id = context_id
         self._platform_extension = platform_extension
+        self._cache = cache or _CachedHistory()
+        self._max_buffered_items = max_buffered_items
+        self._flush_interval = flush_interval
+        self._buffer: list[Message | Artifact] = []
+        self._flush_lock = asyncio.Lock()
+        self._scheduled_flush: asyncio.Task | None = None
+
+    async def _sync_history(self) -> list[Message | Artifact]:
+        # The platform is queried on every load (enforcing access with the request token), cached items are reused
+        # and only the items added since the last load are transferred
+        async with self._cache.lock, self._platform_extension.use_client():
+            if self._cache.last_item_id is None:
+                result = await Context.get_full_history(self._context_id)
+                self._cache.items = [item.data for item in result.items]
+                self._cache.last_item_id = result.next_page_token
+            else:
+                async for history_item in Context.list_all_history(self._context_id, since=self._cache.last_item_id):
+                    self._cache.items.append(history_item.data)
+                    self._cache.last_item_id = str(history_item.id)
+            return self._cache.items.copy()
 
     async def load_history(self) -> AsyncIterator[Message | Artifact]:
-        async with self._platform_extension.use_client():
-            async for history_item in Context.list_all_history(self._context_id):
-                yield history_item.data
+        await self.flush()  # read your own writes
+        for data in await self._sync_history():
+            yield data.model_copy(deep=True)
 
     async def store(self, data: Message | Artifact) -> None:
-        async with self._platform_extension.use_client():
-            await Context.add_history_item(self._context_id, data=data)
+        self._buffer.append(data)
+        if len(self._buffer) >= self._max_buffered_items:
+            await self.flush()
+        elif not self._scheduled_flush or self._scheduled_flush.done():
+            self._scheduled_flush = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_interval.total_seconds())
+        try:
+            await self.flush()
+        except Exception as ex:
+            # Items stay in the buffer, the next flush retries them
+            logger.warning(f"Failed to flush history of context {self._context_id}: {ex!r}")
+
+    async def flush(self) -> None:
+        """
+        Send buffered items to the platform in one request.
+
+        Flushes are serialized, so items are persisted in the order they were stored. When the request fails, the
+        items are kept in the buffer in front of any newer ones and the error is raised.
+        """
+        async with self._flush_lock:
+            if not self._buffer:
+                return
+            batch, self._buffer = self._buffer, []
+            try:
+                async with self._platform_extension.use_client():
+                    await Context.add_history_items(self._context_id, data=batch)
+            except BaseException:
+                self._buffer = batch + self._buffer
+                raise
@@ -18,6 +18,8 @@ class LoadedFile(Protocol):
     filename: str | None
     content_type: str
     file_size_bytes: int | None
+    etag: str | None
+    not_modified: bool
 
     @property
     def content(self) -> bytes: ...
@@ -82,6 +84,8 @@ class LoadedFileWithBytes(LoadedFile):
         self.filename = filename
         self.content_type = content_type or "application/octet-stream"
         self.file_size_bytes = len(content)
+        self.etag = None
+        self.not_modified = False
         self._content = content
         self._encoding = encoding or "utf-8"
 
@@ -148,6 +152,10 @@ class LoadedFileWithUri:
         self.file_size_bytes = file_size_bytes or int(response.headers.get("Content-Length", "0")) or None
         self.filename = filename or response_filename
         self.content_type = content_type or response_content_type or "application/octet-stream"
+        # ETag of the first response, a redirect target (e.g. object storage) does not know the platform ETag
+        first_response = response.history[0] if response.history else response
+        self.etag = first_response.headers.get("ETag") or response.headers.get("ETag")
+        self.not_modified = response.status_code == 304
         self._response = response
 
     @property
@@ -222,15 +230,33 @@ class PlatformFileUrl(AnyUrl):
 UriType = RootModel[PlatformFileUrl | HttpUrl]
 
 
+def conditional_headers(
+    byte_range: tuple[int, int | None] | None = None, if_none_match: str | None = None
+) -> dict[str, str]:
+    headers = {}
+    if byte_range:
+        start, end = byte_range
+        headers["Range"] = f"bytes={start}-{'' if end is None else end}"
+    if if_none_match:
+        headers["If-None-Match"] = if_none_match
+    return headers
+
+
 @asynccontextmanager
 async def load_file(
     part: FilePart,
     stream: bool = False,
     client: httpx.AsyncClient | None = None,
+    byte_range: tuple[int, int | None] | None = None,
+    if_none_match: str | None = None,
 ) -> AsyncIterator[LoadedFile]:
     """
     :param stream: if stream is set to False, 'content' and 'text' fields are immediately available.
         Otherwise, they are only available after calling the '(a)read' method.
+    :param byte_range: load only the inclusive (start, end) range of bytes, end=None reads until the end of file.
+        Servers that do not support ranges return the whole file.
+    :param if_none_match: ETag of a previously loaded content (`LoadedFile.etag`). If the content did not change,
+        the yielded file has `not_modified` set and no content.
     """
     match part.file:
         case FileWithUri(mime_type=content_type, name=filename, uri=uri):
@@ -238,7 +264,9 @@ async def load_file(
                 case PlatformFileUrl() as url:
                     from beeai_sdk.platform import File
 
-                    async with File.load_content(url.file_id, stream=stream) as file:
+                    async with File.load_content(
+                        url.file_id, stream=stream, byte_range=byte_range, if_none_match=if_none_match
+                    ) as file:
                         # override filename and content_type from part
                         if filename:
                             file.filename = filename
@@ -249,8 +277,10 @@ async def load_file(
                     async with AsyncExitStack() as stack:
                         if client is None:
                             client = await stack.enter_async_context(httpx.AsyncClient())
-                        async with client.stream("GET", uri) as response:
-                            response.raise_for_status()
+                        headers = conditional_headers(byte_range=byte_range, if_none_match=if_none_match)
+                        async with client.stream("GET", uri, headers=headers) as response:
+                            if response.status_code != 304:
+                                response.raise_for_status()
                             file = LoadedFileWithUri(response=response, filename=filename, content_type=content_type)
                             if not stream:
                                 await file.aread()
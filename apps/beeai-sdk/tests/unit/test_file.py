@@ -0,0 +1,28 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import httpx
+import pytest
+
+from beeai_sdk.util.file import LoadedFileWithUri
+
+pytestmark = pytest.mark.unit
+
+
+def test_loaded_file_keeps_etag_of_redirecting_response():
+    redirect = httpx.Response(
+        307,
+        headers={"ETag": '"sha256"', "Location": "http://object-storage/file"},
+        request=httpx.Request("GET", "http://platform/api/v1/files/1/content"),
+    )
+    response = httpx.Response(
+        200,
+        headers={"ETag": '"object-storage"'},
+        content=b"content",
+        request=httpx.Request("GET", "http://object-storage/file"),
+    )
+    response.history = [redirect]
+    assert LoadedFileWithUri(response=response).etag == '"sha256"'
+
+    response.history = []
+    assert LoadedFileWithUri(response=response).etag == '"object-storage"'
@@ -0,0 +1,144 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from a2a.types import Message, Part, Role, TextPart
+
+from beeai_sdk.a2a.extensions.services.platform import PlatformApiExtensionServer, PlatformApiExtensionSpec
+from beeai_sdk.platform.common import PaginatedResult
+from beeai_sdk.platform.context import Context, ContextHistoryItem
+from beeai_sdk.server.store.context_store import ContextStoreInstance
+from beeai_sdk.server.store.platform_context_store import PlatformContextStore
+
+pytestmark = pytest.mark.unit
+
+
+def message(text: str) -> Message:
+    return Message(message_id=text, role=Role.user, parts=[Part(root=TextPart(text=text))])
+
+
+class FakePlatformExtension(PlatformApiExtensionServer):
+    @asynccontextmanager
+    async def use_client(self):
+        yield
+
+
+class FakePlatformHistory:
+    def __init__(self, context_id: str):
+        self.context_id = context_id
+        self.items: list[ContextHistoryItem] = []
+        self.requests: list[str | None] = []
+        self.batches: list[list[str]] = []
+        self.fail_writes = False
+
+    def add(self, text: str) -> None:
+        self.items.append(
+            ContextHistoryItem(id=uuid4(), data=message(text), created_at=datetime.now(UTC), context_id=self.context_id)
+        )
+
+    async def add_history_items(self, context_id: str, *, data: list[Message], **kwargs) -> None:
+        if self.fail_writes:
+            raise RuntimeError("platform is unavailable")
+        self.batches.append([item.message_id for item in data])
+        for item in data:
+            self.add(item.message_id)
+
+    async def get_full_history(self, context_id: str, **kwargs) -> PaginatedResult[ContextHistoryItem]:
+        self.requests.append(None)
+        return PaginatedResult(
+            items=self.items.copy(),
+            total_count=len(self.items),
+            next_page_token=str(self.items[-1].id) if self.items else None,
+        )
+
+    async def list_all_history(self, context_id: str, since: str | None = None, **kwargs):
+        self.requests.append(since)
+        [index] = [i for i, item in enumerate(self.items) if str(item.id) == since]
+        for item in self.items[index + 1 :]:
+            yield item
+
+
+@pytest.fixture
+def history(monkeypatch) -> FakePlatformHistory:
+    history = FakePlatformHistory(str(uuid4()))
+    monkeypatch.setattr(Context, "get_full_history", history.get_full_history)
+    monkeypatch.setattr(Context, "list_all_history", history.list_all_history)
+    monkeypatch.setattr(Context, "add_history_items", history.add_history_items)
+    return history
+
+
+async def create(store: PlatformContextStore, context_id: str) -> ContextStoreInstance:
+    return await store.create(context_id, [FakePlatformExtension(PlatformApiExtensionSpec())])
+
+
+async def load(store: PlatformContextStore, context_id: str) -> list[str]:
+    instance = await create(store, context_id)
+    return [message.message_id async for message in instance.load_history()]  # pyright: ignore
+
+
+async def test_history_is_loaded_incrementally(history):
+    context_id = history.context_id
+    store = PlatformContextStore()
+
+    history.add("first")
+    history.add("second")
+    assert await load(store, context_id) == ["first", "second"]
+
+    history.add("third")
+    assert await load(store, context_id) == ["first", "second", "third"]
+    assert await load(store, context_id) == ["first", "second", "third"]
+
+    assert history.requests == [None, str(history.items[1].id), str(history.items[2].id)]
+
+
+async def test_stored_items_are_flushed_in_batches(history):
+    store = PlatformContextStore(max_buffered_items=3, flush_interval=timedelta(hours=1))
+    instance = await create(store, history.context_id)
+
+    for text in ["1", "2", "3", "4"]:
+        await instance.store(message(text))
+    assert history.batches == [["1", "2", "3"]]
+
+    await instance.flush()
+    assert history.batches == [["1", "2", "3"], ["4"]]
+    await instance.flush()
+    assert len(history.batches) == 2
+
+
+async def test_stored_items_are_flushed_after_interval(history):
+    store = PlatformContextStore(max_buffered_items=100, flush_interval=timedelta(milliseconds=10))
+    instance = await create(store, history.context_id)
+
+    await instance.store(message("1"))
+    await instance.store(message("2"))
+    assert not history.batches
+    await asyncio.sleep(0.1)
+    assert history.batches == [["1", "2"]]
+
+
+async def test_load_history_flushes_buffered_items(history):
+    store = PlatformContextStore(flush_interval=timedelta(hours=1))
+    instance = await create(store, history.context_id)
+
+    await instance.store(message("1"))
+    assert [item.message_id async for item in instance.load_history()] == ["1"]  # pyright: ignore
+
+
+async def test_failed_flush_keeps_items_in_order(history):
+    store = PlatformContextStore(flush_interval=timedelta(hours=1))
+    instance = await create(store, history.context_id)
+
+    await instance.store(message("1"))
+    history.fail_writes = True
+    with pytest.raises(RuntimeError):
+        await instance.flush()
+
+    history.fail_writes = False
+    await instance.store(message("2"))
+    await instance.flush()
+    assert history.batches == [["1", "2"]]
@@ -1,6 +1,7 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import argparse
 import asyncio
 import logging
 import os
@@ -52,6 +53,16 @@ def serve():
     )
 
 
+def worker():
+    """Run procrastinate workers in a dedicated process, use JOBS__API_QUEUES to stop processing them in the API."""
+    from beeai_server.run_workers import run_standalone_workers
+
+    parser = argparse.ArgumentParser(prog="beeai-worker", description="Run beeai-server job workers")
+    parser.add_argument("queues", nargs="*", help="Queues to process (default: all queues)")
+    args = parser.parse_args()
+    asyncio.run(run_standalone_workers(queues=args.queues or None))
+
+
 def migrate():
     from beeai_server.infrastructure.persistence.migrations.migrate import migrate as migrate_fn
 
@@ -9,6 +9,7 @@ import fastapi
 import fastapi.responses
 from a2a.types import AgentCard, TransportProtocol
 from a2a.utils import AGENT_CARD_WELL_KNOWN_PATH
+from cachetools import LRUCache
 from fastapi import Depends, Request
 
 from beeai_server.api.dependencies import (
@@ -21,6 +22,11 @@ from beeai_server.service_layer.services.a2a import A2AServerResponse
 
 _SUPPORTED_TRANSPORTS = [TransportProtocol.jsonrpc, TransportProtocol.http_json]
 
+# Rendered proxy cards keyed by provider and proxy base URL, together with the agent card they were rendered from.
+# The provider repository returns the same agent card instance until the card changes, so a changed card is detected
+# by identity and the proxy card is rendered again.
+_proxy_agent_cards: LRUCache[tuple[UUID, str], tuple[AgentCard, AgentCard]] = LRUCache(maxsize=1000)
+
 
 router = fastapi.APIRouter()
 
@@ -31,6 +37,14 @@ def _create_proxy_url(url: str, *, proxy_base: str) -> str:
 
 def create_proxy_agent_card(agent_card: AgentCard, *, provider_id: UUID, request: Request) -> AgentCard:
     proxy_base = str(request.url_for(proxy_request.__name__, provider_id=provider_id, path=""))
+    if (cached := _proxy_agent_cards.get((provider_id, proxy_base))) and cached[0] is agent_card:
+        return cached[1]
+    proxy_agent_card = _render_proxy_agent_card(agent_card, proxy_base=proxy_base)
+    _proxy_agent_cards[provider_id, proxy_base] = (agent_card, proxy_agent_card)
+    return proxy_agent_card
+
+
+def _render_proxy_agent_card(agent_card: AgentCard, *, proxy_base: str) -> AgentCard:
     proxy_interfaces = (
         [
             interface.model_copy(update={"url": _create_proxy_url(interface.url, proxy_base=proxy_base)})
@@ -85,9 +99,9 @@ async def proxy_request(
     provider_id: UUID,
     request: fastapi.requests.Request,
     a2a_proxy: A2AProxyServiceDependency,
-    _: Annotated[AuthorizedUser, Depends(RequiresPermissions(a2a_proxy={"*"}))],
+    user: Annotated[AuthorizedUser, Depends(RequiresPermissions(a2a_proxy={"*"}))],
     path: str = "",
 ):
-    client = await a2a_proxy.get_proxy_client(provider_id=provider_id)
+    client = await a2a_proxy.get_proxy_client(provider_id=provider_id, user=user.user)
     response = await client.send_request(method=request.method, url=f"/{path}", content=request.stream())
     return _to_fastapi(response)
@@ -15,10 +15,12 @@ from beeai_server.api.dependencies import (
     RequiresContextPermissionsPath,
     RequiresPermissions,
 )
-from beeai_server.api.schema.common import EntityModel, PaginationQuery
+from beeai_server.api.schema.common import EntityModel
 from beeai_server.api.schema.contexts import (
     ContextCreateRequest,
     ContextHistoryItemCreateRequest,
+    ContextHistoryItemsCreateRequest,
+    ContextHistoryQuery,
     ContextListQuery,
     ContextTokenCreateRequest,
     ContextTokenResponse,
@@ -111,11 +113,34 @@ async def add_context_history_item(
     await context_service.add_history_item(context_id=context_id, data=history_item_data.root, user=user.user)
 
 
+@router.post("/{context_id}/history:batch", status_code=status.HTTP_201_CREATED)
+async def add_context_history_items(
+    context_id: UUID,
+    request: ContextHistoryItemsCreateRequest,
+    context_service: ContextServiceDependency,
+    user: Annotated[AuthorizedUser, Depends(RequiresContextPermissionsPath(context_data={"write"}))],
+) -> None:
+    await context_service.add_history_items(context_id=context_id, data=request.items, user=user.user)
+
+
 @router.get("/{context_id}/history")
 async def list_context_history(
     context_id: UUID,
     context_service: ContextServiceDependency,
     user: Annotated[AuthorizedUser, Depends(RequiresContextPermissionsPath(context_data={"read"}))],
-    pagination: Annotated[PaginationQuery, Query()],
+    query: Annotated[ContextHistoryQuery, Query()],
+) -> PaginatedResult[ContextHistoryItem]:
+    return await context_service.list_history(context_id=context_id, user=user.user, pagination=query)
+
+
+@router.get("/{context_id}/history/full")
+async def get_full_context_history(
+    context_id: UUID,
+    context_service: ContextServiceDependency,
+    user: Annotated[AuthorizedUser, Depends(RequiresContextPermissionsPath(context_data={"read"}))],
 ) -> PaginatedResult[ContextHistoryItem]:
-    return await context_service.list_history(context_id=context_id, user=user.user, pagination=pagination)
+    """
+    Return the whole history in a single response, the next_page_token can be passed as `since` to
+    the history endpoint to fetch only the items added afterwards.
+    """
+    return await context_service.get_full_history(context_id=context_id, user=user.user)
@@ -3,42 +3,83 @@
 
 import logging
 from contextlib import AsyncExitStack
+from datetime import timedelta
 from typing import Annotated
 from uuid import UUID
 
 import fastapi
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import RedirectResponse, StreamingResponse
 
 from beeai_server.api.dependencies import (
+    ConfigurationDependency,
     FileServiceDependency,
     RequiresContextPermissions,
 )
 from beeai_server.api.schema.common import EntityModel
-from beeai_server.domain.models.file import AsyncFile, ExtractionStatus, File, TextExtraction
+from beeai_server.api.schema.files import WaitForExtractionsRequest
+from beeai_server.domain.models.common import PaginatedResult
+from beeai_server.domain.models.file import ExtractionStatus, File, FileDownloadMode, TextExtraction
 from beeai_server.domain.models.permissions import AuthorizedUser
 from beeai_server.service_layer.services.files import FileService
+from beeai_server.utils.fastapi import read_multipart_file
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-@router.post("", status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {"file": {"type": "string", "format": "binary"}},
+                        "required": ["file"],
+                    }
+                }
+            },
+        }
+    },
+)
 async def upload_file(
-    file: UploadFile,
+    request: fastapi.Request,
     file_service: FileServiceDependency,
     user: Annotated[AuthorizedUser, Depends(RequiresContextPermissions(files={"write"}))],
 ) -> EntityModel[File]:
+    # The body is parsed while it is being uploaded to the object storage instead of being spooled to disk first
+    try:
+        file = await read_multipart_file(request.stream(), request.headers.get("content-type", ""))
+    except ValueError as ex:
+        raise fastapi.HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(ex)) from ex
     if not file.filename or not file.content_type:
         raise fastapi.HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Missing filename or content type")
-    return EntityModel(
-        await file_service.upload_file(
-            file=AsyncFile(filename=file.filename, content_type=file.content_type, read=file.read, size=file.size),
-            user=user.user,
-            context_id=user.context_id,
-        )
+    return EntityModel(await file_service.upload_file(file=file, user=user.user, context_id=user.context_id))
+
+
+@router.post("/extractions/wait")
+async def wait_for_text_extractions(
+    request: WaitForExtractionsRequest,
+    file_service: FileServiceDependency,
+    user: Annotated[AuthorizedUser, Depends(RequiresContextPermissions(files={"read"}))],
+) -> PaginatedResult[TextExtraction]:
+    """Long-poll until text extractions of all files are finished or until the timeout.
+
+    Returns the current state of all extractions, callers should check the statuses and repeat the request
+    for extractions which are still pending or in progress.
+    """
+    extractions = await file_service.wait_for_extractions(
+        file_ids=request.file_ids,
+        user=user.user,
+        context_id=user.context_id,
+        timeout=timedelta(seconds=request.timeout_sec),
     )
+    return PaginatedResult(items=extractions, total_count=len(extractions))
 
 
 @router.get("/{file_id}")
@@ -50,10 +91,76 @@ async def get_file(
     return EntityModel(await file_service.get(file_id=file_id, user=user.user, context_id=user.context_id))
 
 
-async def _stream_file(*, file_service: FileService, user: AuthorizedUser, file_id: UUID) -> StreamingResponse:
+def _parse_byte_range(range_header: str, size: int) -> tuple[int, int] | None:
+    """
+    Parse a single "bytes" range into an inclusive (start, end) tuple.
+
+    Returns None if the header should be ignored (unsupported unit, invalid syntax or multiple ranges),
+    raises HTTP 416 if the range cannot be satisfied.
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_str, sep, end_str = spec.strip().partition("-")
+    if not sep or not (start_str.isdigit() or start_str == "") or not (end_str.isdigit() or end_str == ""):
+        return None
+    if not start_str:  # suffix range, e.g. "bytes=-500"
+        if not end_str:
+            return None
+        start, end = size - min(int(end_str), size), size - 1
+    else:
+        start = int(start_str)
+        if end_str and int(end_str) < start:
+            return None
+        end = min(int(end_str), size - 1) if end_str else size - 1
+    if start >= size:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
+def _etag_matches(etag: str, header: str) -> bool:
+    # If-None-Match uses the weak comparison
+    return any(tag.strip().removeprefix("W/") in {etag, "*"} for tag in header.split(","))
+
+
+async def _stream_file(
+    *,
+    request: fastapi.Request,
+    file_service: FileService,
+    user: AuthorizedUser,
+    file_id: UUID,
+    download_mode: FileDownloadMode,
+) -> fastapi.Response:
+    db_file = await file_service.get(file_id=file_id, user=user.user, context_id=user.context_id)
+    headers = {"Accept-Ranges": "bytes"}
+    etag = None
+    if db_file.content_sha256:
+        etag = headers["ETag"] = f'"{db_file.content_sha256}"'
+        if (if_none_match := request.headers.get("if-none-match")) and _etag_matches(etag, if_none_match):
+            return fastapi.Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if download_mode == FileDownloadMode.REDIRECT:
+        # Range and conditional headers are resent by the client and handled by the object storage
+        url = await file_service.get_download_url(file_id=file_id, user=user.user, context_id=user.context_id)
+        return RedirectResponse(
+            url=str(url),
+            status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+            headers={**headers, "Cache-Control": "no-store"},
+        )
+
+    byte_range = None
+    size = db_file.file_size_bytes
+    if_range = request.headers.get("if-range")
+    if (range_header := request.headers.get("range")) and size is not None and (not if_range or if_range == etag):
+        byte_range = _parse_byte_range(range_header, size)
+
     exit_stack = AsyncExitStack()
     file = await exit_stack.enter_async_context(
-        file_service.get_content(file_id=file_id, user=user.user, context_id=user.context_id)
+        file_service.get_content(file_id=file_id, user=user.user, context_id=user.context_id, byte_range=byte_range)
     )
 
     async def iter_file(chunk_size=8192):
@@ -63,31 +170,68 @@ async def _stream_file(*, file_service: FileService, user: AuthorizedUser, file_
         finally:
             await exit_stack.aclose()
 
-    return StreamingResponse(content=iter_file(), media_type=file.content_type)
+    if file.size is not None:
+        headers["Content-Length"] = str(file.size)
+    if byte_range:
+        start, end = byte_range
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        return StreamingResponse(
+            content=iter_file(),
+            status_code=status.HTTP_206_PARTIAL_CONTENT,
+            media_type=file.content_type,
+            headers=headers,
+        )
+    return StreamingResponse(content=iter_file(), media_type=file.content_type, headers=headers)
 
 
 @router.get("/{file_id}/content")
 async def get_file_content(
     file_id: UUID,
+    request: fastapi.Request,
     file_service: FileServiceDependency,
+    configuration: ConfigurationDependency,
     user: Annotated[AuthorizedUser, Depends(RequiresContextPermissions(files={"read"}))],
-) -> StreamingResponse:
-    return await _stream_file(file_service=file_service, user=user, file_id=file_id)
+    download_mode: Annotated[FileDownloadMode | None, Query()] = None,
+) -> fastapi.Response:
+    """
+    Download the file content.
+
+    Supports a single byte range (`Range` header, answered with 206) and conditional requests (`If-None-Match`,
+    answered with 304) using the strong `ETag` derived from the content sha256.
+    With the `redirect` download mode (default configurable on the server), the content is not streamed through
+    the API, the response is a temporary redirect to a short-lived presigned object storage URL.
+    """
+    return await _stream_file(
+        request=request,
+        file_service=file_service,
+        user=user,
+        file_id=file_id,
+        download_mode=download_mode or configuration.object_storage.download_mode,
+    )
 
 
 @router.get("/{file_id}/text_content")
 async def get_text_file_content(
     file_id: UUID,
+    request: fastapi.Request,
     file_service: FileServiceDependency,
+    configuration: ConfigurationDependency,
     user: Annotated[AuthorizedUser, Depends(RequiresContextPermissions(files={"read"}))],
-) -> StreamingResponse:
+    download_mode: Annotated[FileDownloadMode | None, Query()] = None,
+) -> fastapi.Response:
     extraction = await file_service.get_extraction(file_id=file_id, user=user.user, context_id=user.context_id)
     if not extraction.status == ExtractionStatus.COMPLETED or not extraction.extracted_file_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Extraction is not completed (status {extraction.status})",
         )
-    return await _stream_file(file_service=file_service, user=user, file_id=extraction.extracted_file_id)
+    return await _stream_file(
+        request=request,
+        file_service=file_service,
+        user=user,
+        file_id=extraction.extracted_file_id,
+        download_mode=download_mode or configuration.object_storage.download_mode,
+    )
 
 
 @router.delete("/{file_id}", status_code=fastapi.status.HTTP_204_NO_CONTENT)
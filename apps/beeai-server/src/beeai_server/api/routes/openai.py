@@ -10,19 +10,18 @@ from typing import Annotated, Any
 
 import fastapi
 import ibm_watsonx_ai
-import ibm_watsonx_ai.foundation_models.embeddings
+import ibm_watsonx_ai.foundation_models
 import openai
 import openai.pagination
 import openai.types.chat
 from fastapi import Depends, HTTPException
 from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
-from openai.types import CreateEmbeddingResponse
 from starlette.status import HTTP_400_BAD_REQUEST
 
 from beeai_server.api.dependencies import ModelProviderServiceDependency, RequiresPermissions
 from beeai_server.api.schema.openai import ChatCompletionRequest, EmbeddingsRequest, MultiformatEmbedding, OpenAIPage
-from beeai_server.domain.models.model_provider import Model, ModelProvider, ModelProviderType
+from beeai_server.domain.models.model_provider import Model, ModelProviderType
 from beeai_server.domain.models.permissions import AuthorizedUser
 
 router = fastapi.APIRouter()
@@ -223,76 +222,23 @@ async def _stream_openai(stream: AsyncGenerator, request_model_id: str) -> Async
         yield "data: [DONE]\n\n"
 
 
-def _get_provider_model_id(request_model_id: str, provider: ModelProvider):
-    return re.sub(rf"^{provider.type}:", "", request_model_id)
-
-
 @router.post("/embeddings")
 async def create_embedding(
     request: EmbeddingsRequest,
     model_provider_service: ModelProviderServiceDependency,
     _: typing.Annotated[AuthorizedUser, Depends(RequiresPermissions(embeddings={"*"}))],
 ):
-    provider = await model_provider_service.get_provider_by_model_id(model_id=request.model)
-    model_id = _get_provider_model_id(request.model, provider)
-
-    if not provider.supports_embedding:
-        raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail="Model does not support embeddings")
-
-    if provider.type == ModelProviderType.VOYAGE:
-        # Voyage does not support 'float' value: https://docs.voyageai.com/reference/embeddings-api
-        request.encoding_format = None if request.encoding_format == "float" else request.encoding_format
-
-    api_key = await model_provider_service.get_provider_api_key(model_provider_id=provider.id)
-
-    if provider.type == ModelProviderType.WATSONX:
-        watsonx_response = await run_in_threadpool(
-            ibm_watsonx_ai.foundation_models.embeddings.Embeddings(
-                model_id=model_id,
-                credentials=ibm_watsonx_ai.Credentials(url=str(provider.base_url), api_key=api_key),
-                project_id=provider.watsonx_project_id,
-                space_id=provider.watsonx_space_id,
-            ).generate,
-            inputs=[request.input] if isinstance(request.input, str) else request.input,
-        )
-        return openai.types.CreateEmbeddingResponse(
-            object="list",
-            model=watsonx_response["model_id"],
-            data=[
-                MultiformatEmbedding(
-                    object="embedding",
-                    index=i,
-                    embedding=(
-                        _float_list_to_base64(result["embedding"])
-                        if request.encoding_format == "base64"
-                        else typing.cast(list[float], result["embedding"])
-                    ),
-                )
-                for i, result in enumerate(watsonx_response.get("results", []))
-            ],
-            usage=openai.types.create_embedding_response.Usage(
-                prompt_tokens=watsonx_response.get("usage", {}).get("prompt_tokens", 0),
-                total_tokens=watsonx_response.get("usage", {}).get("total_tokens", 0),
-            ),
-        ).model_dump(mode="json") | {"beeai_proxy_version": BEEAI_PROXY_VERSION}
-    else:
-        result: CreateEmbeddingResponse = await openai.AsyncOpenAI(
-            api_key=api_key,
-            base_url=str(provider.base_url),
-            default_headers=({"RITS_API_KEY": api_key} if provider.type == ModelProviderType.RITS else {}),
-        ).embeddings.create(**(request.model_dump(mode="json", exclude_none=True) | {"model": model_id}))
-        # Despite the typing, OpenAI library does return str embeddings when base64 is requested
-        # However, some providers, like Ollama, silently don't support base64, so we have to convert
-        if request.encoding_format == "base64" and result.data and isinstance(result.data[0].embedding, list):
-            result.data = [
-                MultiformatEmbedding(
-                    object="embedding",
-                    index=embedding.index,
-                    embedding=_float_list_to_base64(embedding.embedding),
-                )
-                for embedding in result.data
-            ]
-        return result.model_dump(mode="json") | {"beeai_proxy_version": BEEAI_PROXY_VERSION}
+    result = await model_provider_service.create_embeddings(
+        model_id=request.model, inputs=[request.input] if isinstance(request.input, str) else request.input
+    )
+    if request.encoding_format == "base64":
+        result.data = [
+            MultiformatEmbedding(
+                object="embedding", index=embedding.index, embedding=_float_list_to_base64(embedding.embedding)
+            )
+            for embedding in result.data
+        ]
+    return result.model_dump(mode="json") | {"beeai_proxy_version": BEEAI_PROXY_VERSION}
 
 
 def _float_list_to_base64(embedding: list[float]) -> str:
@@ -14,6 +14,7 @@ from beeai_server.api.dependencies import (
 from beeai_server.api.schema.common import EntityModel
 from beeai_server.api.schema.vector_stores import (
     CreateVectorStoreRequest,
+    IngestRequest,
     SearchRequest,
 )
 from beeai_server.domain.models.common import PaginatedResult
@@ -21,6 +22,7 @@ from beeai_server.domain.models.permissions import AuthorizedUser
 from beeai_server.domain.models.vector_store import (
     VectorStore,
     VectorStoreDocument,
+    VectorStoreIngestion,
     VectorStoreItem,
     VectorStoreSearchResult,
 )
@@ -82,6 +84,42 @@ async def add_items(
     )
 
 
+@router.post("/{vector_store_id}/ingest", status_code=status.HTTP_202_ACCEPTED)
+async def ingest_files(
+    vector_store_id: UUID,
+    request: IngestRequest,
+    vector_store_service: VectorStoreServiceDependency,
+    user: Annotated[
+        AuthorizedUser, Depends(RequiresContextPermissions(vector_stores={"write"}, files={"read", "extract"}))
+    ],
+) -> EntityModel[VectorStoreIngestion]:
+    """Extract, chunk and embed files into the vector store in a background job."""
+    return EntityModel(
+        await vector_store_service.create_ingestion(
+            vector_store_id=vector_store_id,
+            file_ids=request.file_ids,
+            chunking=request.chunking,
+            user=user.user,
+            context_id=user.context_id,
+        )
+    )
+
+
+@router.get("/{vector_store_id}/ingestions/{ingestion_id}")
+async def get_ingestion(
+    vector_store_id: UUID,
+    ingestion_id: UUID,
+    vector_store_service: VectorStoreServiceDependency,
+    user: Annotated[AuthorizedUser, Depends(RequiresContextPermissions(vector_stores={"read"}))],
+) -> EntityModel[VectorStoreIngestion]:
+    """Get the status and progress of an ingestion."""
+    return EntityModel(
+        await vector_store_service.get_ingestion(
+            vector_store_id=vector_store_id, ingestion_id=ingestion_id, user=user.user, context_id=user.context_id
+        )
+    )
+
+
 @router.post("/{vector_store_id}/search")
 async def search_with_vector(
     vector_store_id: UUID,
@@ -5,12 +5,18 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from beeai_server.domain.models.common import TotalCount
+
 
 class PaginationQuery(BaseModel):
     limit: int = Field(default=40, ge=1, le=100)
-    page_token: UUID | None = None
+    page_token: str | None = Field(default=None, max_length=256)
     order: str = Field(default="desc", pattern="^(asc|desc)$")
     order_by: str = Field(default="created_at", pattern="^created_at|updated_at$")
+    total_count: TotalCount = Field(
+        default=TotalCount.EXACT,
+        description="Counting all items is expensive for long lists, it can be estimated or skipped (total_count=null)",
+    )
 
 
 class ErrorStreamResponseError(BaseModel, extra="allow"):
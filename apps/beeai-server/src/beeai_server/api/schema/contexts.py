@@ -20,6 +20,17 @@ class ContextListQuery(PaginationQuery):
     include_empty: bool = True
 
 
+class ContextHistoryQuery(PaginationQuery):
+    since: str | None = Field(
+        default=None,
+        max_length=256,
+        description=(
+            "Return only items created after the given item id or page token in ascending order, "
+            "used to fetch items added since the last load"
+        ),
+    )
+
+
 class ContextPermissionsGrant(BaseModel):
     files: list[Literal["read", "write", "extract", "*"]] = []
     vector_stores: list[Literal["read", "write", "extract", "*"]] = []
@@ -70,3 +81,11 @@ class ContextTokenResponse(BaseModel):
 
 class ContextHistoryItemCreateRequest(RootModel[ContextHistoryItemData]):
     root: ContextHistoryItemData
+
+
+class ContextHistoryItemsCreateRequest(BaseModel):
+    items: list[ContextHistoryItemData] = Field(
+        min_length=1,
+        max_length=1000,
+        description="Items are appended in the given order, all of them are stored or none",
+    )
@@ -3,7 +3,7 @@
 
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class FileResponse(BaseModel):
@@ -23,3 +23,10 @@ class FileUrlResponse(BaseModel):
     """Response schema for file URL."""
 
     url: str
+
+
+class WaitForExtractionsRequest(BaseModel):
+    """Request schema for waiting on text extractions."""
+
+    file_ids: list[UUID] = Field(min_length=1, max_length=100)
+    timeout_sec: float = Field(default=30, ge=0, le=60, description="Maximum time to wait for extractions to finish")
@@ -1,9 +1,12 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from beeai_server.domain.models.vector_store import ChunkingParameters
+
 
 class CreateVectorStoreRequest(BaseModel):
     """Request to create a new vector store."""
@@ -18,3 +21,10 @@ class SearchRequest(BaseModel):
 
     query_vector: list[float] = Field(description="Vector to search for")
     limit: int = Field(5, description="Maximum number of results to return", le=10)
+
+
+class IngestRequest(BaseModel):
+    """Request to extract, chunk and embed files into a vector store."""
+
+    file_ids: list[UUID] = Field(min_length=1, max_length=100, description="Files to ingest")
+    chunking: ChunkingParameters = Field(default_factory=ChunkingParameters)
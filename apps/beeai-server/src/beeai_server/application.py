@@ -27,12 +27,17 @@ from beeai_server.api.routes.user_feedback import router as user_feedback_router
 from beeai_server.api.routes.vector_stores import router as vector_stores_router
 from beeai_server.bootstrap import bootstrap_dependencies_sync
 from beeai_server.configuration import Configuration
+from beeai_server.domain.repositories.file import ITextExtractionBackend
+from beeai_server.domain.repositories.notifications import INotificationListener
 from beeai_server.exceptions import (
     DuplicateEntityError,
     ManifestLoadError,
     PlatformError,
 )
 from beeai_server.run_workers import run_workers
+from beeai_server.service_layer.deployment_manager import IProviderDeploymentManager
+from beeai_server.service_layer.services.a2a import A2AProxyService
+from beeai_server.service_layer.services.autoscaler import ProviderAutoscaler
 from beeai_server.service_layer.services.mcp import McpService
 from beeai_server.telemetry import INSTRUMENTATION_NAME, shutdown_telemetry
 
@@ -49,7 +54,9 @@ def extract_messages(exc):
 def register_global_exception_handlers(app: FastAPI):
     @app.exception_handler(PlatformError)
     async def entity_not_found_exception_handler(request, exc: ManifestLoadError | DuplicateEntityError):
-        return await http_exception_handler(request, HTTPException(status_code=exc.status_code, detail=str(exc)))
+        return await http_exception_handler(
+            request, HTTPException(status_code=exc.status_code, detail=str(exc), headers=exc.headers)
+        )
 
     @app.exception_handler(Exception)
     @app.exception_handler(HTTPException)
@@ -141,10 +148,28 @@ def app(*, dependency_overrides: Container | None = None) -> FastAPI:
 
     @asynccontextmanager
     @inject
-    async def lifespan(_app: FastAPI, procrastinate_app: procrastinate.App, mcp_service: McpService):
+    async def lifespan(
+        _app: FastAPI,
+        procrastinate_app: procrastinate.App,
+        mcp_service: McpService,
+        a2a_proxy: A2AProxyService,
+        provider_autoscaler: ProviderAutoscaler,
+        notification_listener: INotificationListener,
+        text_extraction_backend: ITextExtractionBackend,
+        deployment_manager: IProviderDeploymentManager,
+    ):
         try:
             register_telemetry()
-            async with procrastinate_app.open_async(), run_workers(app=procrastinate_app), mcp_service:
+            async with (
+                procrastinate_app.open_async(),
+                deployment_manager,
+                text_extraction_backend,
+                run_workers(app=procrastinate_app, queues=configuration.jobs.api_queues),
+                mcp_service,
+                a2a_proxy,
+                provider_autoscaler,
+                notification_listener,
+            ):
                 try:
                     yield
                 finally:
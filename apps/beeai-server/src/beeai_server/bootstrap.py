@@ -12,10 +12,14 @@ from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from beeai_server.api.auth import setup_jwks
 from beeai_server.configuration import Configuration, get_configuration
 from beeai_server.domain.repositories.file import IObjectStorageRepository, ITextExtractionBackend
+from beeai_server.domain.repositories.notifications import INotificationListener
 from beeai_server.infrastructure.kubernetes.provider_deployment_manager import KubernetesProviderDeploymentManager
 from beeai_server.infrastructure.object_storage.repository import S3ObjectStorageRepository
+from beeai_server.infrastructure.persistence.notifications import PostgresNotificationListener
 from beeai_server.infrastructure.persistence.unit_of_work import SqlAlchemyUnitOfWorkFactory
+from beeai_server.infrastructure.text_extraction.chain import ChainTextExtractionBackend
 from beeai_server.infrastructure.text_extraction.docling import DoclingTextExtractionBackend
+from beeai_server.infrastructure.text_extraction.local import LocalTextExtractionBackend
 from beeai_server.jobs.procrastinate import create_app
 from beeai_server.service_layer.deployment_manager import IProviderDeploymentManager
 from beeai_server.service_layer.unit_of_work import IUnitOfWorkFactory
@@ -58,16 +62,21 @@ async def bootstrap_dependencies(dependency_overrides: Container | None = None):
             manifest_template_dir=di[Configuration].provider.manifest_template_dir,
         ),
     )
-    _set_di(
-        IUnitOfWorkFactory,
-        SqlAlchemyUnitOfWorkFactory(setup_database_engine(di[Configuration]), di[Configuration]),
-    )
+    engine = setup_database_engine(di[Configuration])
+    _set_di(IUnitOfWorkFactory, SqlAlchemyUnitOfWorkFactory(engine, di[Configuration]))
+    _set_di(INotificationListener, PostgresNotificationListener(engine))
 
     # Register object storage repository and file service
     _set_di(IObjectStorageRepository, S3ObjectStorageRepository(di[Configuration]))
     _set_di(procrastinate.App, create_app())
 
-    _set_di(ITextExtractionBackend, DoclingTextExtractionBackend(di[Configuration].text_extraction))
+    extraction_config = di[Configuration].text_extraction
+    _set_di(
+        ITextExtractionBackend,
+        ChainTextExtractionBackend(
+            [LocalTextExtractionBackend(extraction_config), DoclingTextExtractionBackend(extraction_config)]
+        ),
+    )
 
     # Download JWKS
     _set_di("JWKS_CACHE", setup_jwks(di[Configuration]))
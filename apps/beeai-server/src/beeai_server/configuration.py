@@ -2,17 +2,20 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import base64
+import importlib.util
 import logging
 from collections import defaultdict
-from datetime import timedelta
+from datetime import time, timedelta
 from functools import cache
 from pathlib import Path
 from typing import Literal
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from pydantic import AnyUrl, BaseModel, Field, Secret, ValidationError, field_validator, model_validator
+from pydantic import AnyUrl, BaseModel, Field, PositiveInt, Secret, ValidationError, field_validator, model_validator
 from pydantic_core.core_schema import ValidationInfo
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from beeai_server.domain.models.file import FileDownloadMode
 from beeai_server.domain.models.registry import RegistryLocation
 from beeai_server.domain.models.user import UserRole
 
@@ -65,6 +68,9 @@ class OCIRegistryConfiguration(BaseModel, extra="allow"):
 class AgentRegistryConfiguration(BaseModel):
     locations: dict[str, RegistryLocation] = Field(default_factory=dict)
     sync_period_cron: str = Field(default="*/5 * * * *")  # every 10 minutes
+    sync_concurrency: PositiveInt = Field(
+        default=8, description="How many providers are added or upgraded at the same time during registry sync"
+    )
 
 
 class OidcProvider(BaseModel):
@@ -141,6 +147,12 @@ class ObjectStorageConfiguration(BaseModel):
     use_ssl: bool = False
     storage_limit_per_user_bytes: int = 1 * (1024 * 1024 * 1024)  # 1GiB
     max_single_file_size: int = 100 * (1024 * 1024)  # 100 MiB
+    multipart_part_size_bytes: int = Field(default=8 * (1024 * 1024), ge=5 * (1024 * 1024))  # S3 minimum is 5 MiB
+    multipart_max_concurrency: int = Field(default=4, ge=1)
+    download_mode: FileDownloadMode = FileDownloadMode.PROXY
+    # Endpoint reachable by API clients, used for presigned download URLs (defaults to endpoint_url)
+    public_endpoint_url: AnyUrl | None = None
+    presigned_download_expiration_sec: int = int(timedelta(minutes=5).total_seconds())
 
 
 class PersistenceConfiguration(BaseModel):
@@ -152,8 +164,34 @@ class PersistenceConfiguration(BaseModel):
     procrastinate_schema: str = Field(default="procrastinate", pattern=r"^[a-zA-Z0-9_]+$")
 
 
+class JobsConfiguration(BaseModel):
+    queue_concurrency: dict[str, PositiveInt] = Field(
+        default_factory=lambda: {
+            "text_extraction": 5,
+            "vector_store_ingestion": 2,
+            "generate_conversation_tile": 3,
+            "context_history_compaction": 1,
+            "toolkit_deletion": 1,
+            "cron:provider": 1,
+            "cron:cleanup": 1,
+        },
+        description="Number of jobs processed in parallel for each queue",
+    )
+    default_concurrency: int = Field(default=1, ge=1, description="Concurrency of queues missing in queue_concurrency")
+    api_queues: list[str] | None = Field(
+        default=None,
+        description="Queues processed inside the API process, None means all queues. "
+        "Use an empty list when all queues are processed by standalone worker processes (beeai-worker).",
+    )
+    metrics_interval_sec: int = Field(default=30, ge=1)
+
+
 class VectorStoresConfiguration(BaseModel):
     storage_limit_per_user_bytes: int = 1 * (1024 * 1024 * 1024)  # 1GiB
+    ingestion_embedding_batch_size: int = Field(default=64, ge=1, description="Chunks embedded in a single request")
+    ingestion_extraction_timeout_sec: int = Field(
+        default=30 * 60, ge=1, description="How long an ingestion waits for text extraction of a single file"
+    )
 
 
 class TelemetryConfiguration(BaseModel):
@@ -170,6 +208,95 @@ class DockerConfigJson(BaseModel):
     auths: dict[str, DockerConfigJsonAuth] = Field(default_factory=dict)
 
 
+class KeepWarmWindow(BaseModel):
+    days: set[int] = Field(default={0, 1, 2, 3, 4, 5, 6}, description="Days of week, 0 is Monday")
+    start: time
+    end: time
+    timezone: str = "UTC"
+
+    @field_validator("timezone")
+    @classmethod
+    def _validate_timezone(cls, value: str) -> str:
+        try:
+            ZoneInfo(value)
+        except ZoneInfoNotFoundError as ex:
+            raise ValueError(f"Unknown timezone: {value}") from ex
+        return value
+
+    @field_validator("days")
+    @classmethod
+    def _validate_days(cls, value: set[int]) -> set[int]:
+        if not value <= set(range(7)):
+            raise ValueError("Days of week must be between 0 (Monday) and 6 (Sunday)")
+        return value
+
+
+class KeepWarmPolicy(BaseModel):
+    min_warm_sec: int = Field(
+        default=0, ge=0, description="Provider is kept running at least this long after the last request"
+    )
+    windows: list[KeepWarmWindow] = Field(
+        default_factory=list, description="Provider is started ahead of these windows and kept running during them"
+    )
+
+
+class KeepWarmConfiguration(BaseModel):
+    enabled: bool = True
+    policies: dict[str, KeepWarmPolicy] = Field(
+        default_factory=dict, description="Keep-warm policies by provider ID or provider source (image or URL)"
+    )
+    lead_time_sec: int = Field(
+        default=int(timedelta(minutes=10).total_seconds()),
+        ge=0,
+        description="How long before a window or an expected request the provider is started",
+    )
+    prediction_enabled: bool = True
+    prediction_history_weeks: int = Field(
+        default=4, ge=1, description="Weeks of access history considered by the usage prediction"
+    )
+    prediction_min_weeks: int = Field(
+        default=3,
+        ge=1,
+        description="Provider is started for an hour of the week if it was used in that hour in at least this many weeks",
+    )
+
+
+class AutoscalingConfiguration(BaseModel):
+    """
+    The load is measured by the A2A proxy of each API server process. With more replicas of the API server, each would
+    scale the providers from its own partial view, autoscaling is therefore supported only with a single replica.
+    """
+
+    enabled: bool = False
+    api_server_replicas: PositiveInt = Field(
+        default=1, description="Number of API server replicas, autoscaling cannot be enabled with more than one"
+    )
+    min_replicas: PositiveInt = 1
+    max_replicas: PositiveInt = 3
+    target_in_flight_requests_per_replica: PositiveInt = Field(
+        default=10, description="Replicas are added when a replica serves more concurrent A2A requests than this"
+    )
+    tolerance: float = Field(
+        default=0.1, ge=0, lt=1, description="Load ratio deviation from the target which does not trigger scaling"
+    )
+    scale_down_stabilization_sec: int = Field(
+        default=int(timedelta(minutes=5).total_seconds()),
+        ge=0,
+        description="Replicas are removed only when the load stays low for this long",
+    )
+    interval_sec: float = Field(default=15, gt=0, description="How often the scaling decisions are made")
+
+    @model_validator(mode="after")
+    def replicas_validator(self):
+        if self.min_replicas > self.max_replicas:
+            raise ValueError("min_replicas must not be greater than max_replicas")
+        if self.enabled and self.api_server_replicas > 1:
+            raise ValueError(
+                "autoscaling requires a single API server replica, in-flight requests are counted per process"
+            )
+        return self
+
+
 class ManagedProviderConfiguration(BaseModel):
     auto_remove_enabled: bool = False
     manifest_template_dir: Path | None = None
@@ -177,6 +304,57 @@ class ManagedProviderConfiguration(BaseModel):
         default=False,
         description="Which network to use for self-registered providers - should be False when running in cluster",
     )
+    keep_warm: KeepWarmConfiguration = Field(default_factory=KeepWarmConfiguration)
+    autoscaling: AutoscalingConfiguration = Field(default_factory=AutoscalingConfiguration)
+
+
+class AdmissionLimits(BaseModel):
+    max_in_flight_requests: PositiveInt = Field(
+        default=100, description="Concurrent requests forwarded to a provider, further requests are queued"
+    )
+    max_queued_requests: int = Field(
+        default=1000, ge=0, description="Requests waiting for a provider, further requests are rejected with 503"
+    )
+
+
+class AdmissionControlConfiguration(AdmissionLimits):
+    enabled: bool = True
+    queue_timeout_sec: float = Field(
+        default=60, gt=0, description="Queued requests which are not admitted in time are rejected with 503"
+    )
+    retry_after_sec: PositiveInt = Field(default=5, description="Retry-After header of rejected requests")
+    providers: dict[str, AdmissionLimits] = Field(
+        default_factory=dict, description="Limits by provider ID or provider source (image or URL)"
+    )
+
+
+class A2AProxyConfiguration(BaseModel):
+    max_connections_per_provider: PositiveInt = 100
+    max_keepalive_connections_per_provider: int = Field(default=20, ge=0)
+    keepalive_expiry_sec: float = Field(
+        default=30, ge=0, description="Keep-alive connections idle for this long are closed"
+    )
+    client_idle_timeout_sec: int = Field(
+        default=int(timedelta(minutes=5).total_seconds()),
+        ge=1,
+        description="Connection pool of a provider which was not used for this long is closed",
+    )
+    last_accessed_flush_interval_sec: float = Field(
+        default=5, gt=0, description="Provider last access times are written to the database in batches this often"
+    )
+    network_provider_http2: bool = Field(
+        default=False,
+        description="Use HTTP/2 for unmanaged (network) providers, requires the httpx[http2] extra",
+    )
+    admission_control: AdmissionControlConfiguration = Field(default_factory=AdmissionControlConfiguration)
+
+    @field_validator("network_provider_http2")
+    @classmethod
+    def _validate_network_provider_http2(cls, value: bool) -> bool:
+        # httpx fails only when the first request is sent
+        if value and importlib.util.find_spec("h2") is None:
+            raise ValueError("HTTP/2 requires the 'h2' package, install httpx with the http2 extra")
+        return value
 
 
 class DoclingExtractionConfiguration(BaseModel):
@@ -184,10 +362,34 @@ class DoclingExtractionConfiguration(BaseModel):
     enabled: bool = False
     docling_service_url: str = "http://docling-serve:15001"
     processing_timeout_sec: int = int(timedelta(minutes=5).total_seconds())
+    version: str = "1"  # bump when upgrading docling-serve to invalidate cached extractions
+    local_extraction_enabled: bool = Field(
+        default=True, description="Extract simple formats (HTML, DOCX) in-process before falling back to docling"
+    )
+    local_max_workers: int = Field(default=2, ge=1)
+    local_max_file_size_bytes: int = 20 * 1024 * 1024  # 20MiB, larger documents are sent to docling
 
 
 class ContextConfiguration(BaseModel):
     resource_expire_after_days: int = 7  # Expires files and vector_stores attached to a context
+    resource_expiration_batch_size: PositiveInt = 200  # Contexts expired in one transaction
+    history_compaction_threshold: int = Field(
+        default=100, ge=1, description="Number of history items after the snapshot which triggers compaction"
+    )
+    history_snapshot_chunk_size: PositiveInt = Field(
+        default=500, description="Maximum number of compacted history items stored in a single database row"
+    )
+    history_compaction_grace_period_sec: int = Field(
+        default=60,
+        ge=0,
+        description="Only items older than this are compacted, so that items committed late are not skipped",
+    )
+    history_offload_threshold_bytes: int = Field(
+        default=64 * 1024,
+        ge=0,
+        description="History item payloads larger than this are stored in the object storage instead of the database",
+    )
+    history_offload_max_concurrency: PositiveInt = 10
 
 
 class FeatureConfiguration(BaseModel):
@@ -208,6 +410,7 @@ class Configuration(BaseSettings):
     oci_registry_docker_config_json: dict[int, DockerConfigJson] = {}
     telemetry: TelemetryConfiguration = Field(default_factory=TelemetryConfiguration)
     persistence: PersistenceConfiguration = Field(default_factory=PersistenceConfiguration)
+    jobs: JobsConfiguration = Field(default_factory=JobsConfiguration)
     object_storage: ObjectStorageConfiguration = Field(default_factory=ObjectStorageConfiguration)
     vector_stores: VectorStoresConfiguration = Field(default_factory=VectorStoresConfiguration)
     text_extraction: DoclingExtractionConfiguration = Field(default_factory=DoclingExtractionConfiguration)
@@ -216,6 +419,7 @@ class Configuration(BaseSettings):
     k8s_kubeconfig: Path | None = None
 
     provider: ManagedProviderConfiguration = Field(default_factory=ManagedProviderConfiguration)
+    a2a_proxy: A2AProxyConfiguration = Field(default_factory=A2AProxyConfiguration)
 
     platform_service_url: str = "beeai-platform-svc:8333"
     port: int = 8333
@@ -1,6 +1,7 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+from enum import StrEnum
 from textwrap import dedent
 from typing import Annotated
 from uuid import UUID
@@ -35,12 +36,22 @@ Metadata = Annotated[
 ]
 
 
+class TotalCount(StrEnum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"  # planner estimate, does not scan the matching rows
+    NONE = "none"
+
+
 class PaginatedResult[T: BaseModel](BaseModel):
     items: list[T]
-    total_count: int
+    total_count: int | None
     has_more: bool = False
+    next_cursor: str | None = Field(default=None, exclude=True)
 
     @computed_field
     @property
-    def next_page_token(self) -> UUID | None:
-        return getattr(self.items[-1], "id", None) if self.items else None
+    def next_page_token(self) -> str | None:
+        if self.next_cursor:
+            return self.next_cursor
+        id: UUID | None = getattr(self.items[-1], "id", None) if self.items else None
+        return id and str(id)
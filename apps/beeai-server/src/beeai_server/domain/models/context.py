@@ -19,6 +19,23 @@ class ContextHistoryItem(BaseModel):
     context_id: UUID
 
 
+class StoredContextHistoryItem(BaseModel):
+    """
+    History item as persisted, payloads larger than the offload threshold are kept in the object storage under
+    the item id (data is None) and loaded only when the item is read.
+    """
+
+    id: UUID
+    context_id: UUID
+    created_at: AwareDatetime
+    data: ContextHistoryItemData | None = None
+    offloaded_size: int | None = None
+
+    @property
+    def offloaded(self) -> bool:
+        return self.data is None
+
+
 class Context(BaseModel):
     """A context that groups files and vector stores for LLM proxy token generation."""
 
@@ -34,3 +51,11 @@ class TitleGenerationState(StrEnum):
     PENDING = "pending"
     COMPLETED = "completed"
     FAILED = "failed"
+
+
+class ContextHistorySnapshot(BaseModel):
+    """Compacted prefix of a long context history, stored in append-only chunks to be served without paging."""
+
+    context_id: UUID
+    items: list[StoredContextHistoryItem]
+    updated_at: AwareDatetime = Field(default_factory=utc_now)
@@ -15,6 +15,11 @@ class FileType(StrEnum):
     EXTRACTED_TEXT = "extracted_text"
 
 
+class FileDownloadMode(StrEnum):
+    PROXY = "proxy"  # content is streamed through the API server
+    REDIRECT = "redirect"  # client is redirected to a presigned object storage URL
+
+
 class ExtractionStatus(StrEnum):
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
@@ -25,6 +30,8 @@ class ExtractionStatus(StrEnum):
 
 class ExtractionMetadata(BaseModel, extra="allow"):
     backend: str
+    # Set when the text was reused from an extraction of a file with the same content
+    cached_from_extraction_id: str | None = None
 
 
 class FileMetadata(BaseModel, extra="allow"):
@@ -33,6 +40,11 @@ class FileMetadata(BaseModel, extra="allow"):
     content_length: int
 
 
+class UploadedObject(BaseModel):
+    size: int
+    sha256: str
+
+
 class AsyncFile(BaseModel):
     filename: str
     content_type: str
@@ -40,16 +52,33 @@ class AsyncFile(BaseModel):
     size: int | None = None
 
 
+class ExtractedFile(AsyncFile):
+    backend: str  # name of the extraction backend which produced the text
+
+
+class FileBlob(BaseModel):
+    """Stored object shared by all files of one user with identical content."""
+
+    id: UUID = Field(default_factory=uuid4)
+    content_sha256: str
+    size_bytes: int
+    ref_count: int = 1
+    created_by: UUID
+    created_at: AwareDatetime = Field(default_factory=utc_now)
+
+
 class File(BaseModel):
     id: UUID = Field(default_factory=uuid4)
     filename: str
     content_type: str = Field(max_length=256)
     file_size_bytes: int | None = None
+    content_sha256: str | None = None
     created_at: AwareDatetime = Field(default_factory=utc_now)
     created_by: UUID
     file_type: FileType = FileType.USER_UPLOAD
     parent_file_id: UUID | None = None
     context_id: UUID | None = None
+    blob_id: UUID = Field(default_factory=uuid4, exclude=True)
 
 
 class TextExtraction(BaseModel):
@@ -60,10 +89,15 @@ class TextExtraction(BaseModel):
     job_id: str | None = None
     error_message: str | None = None
     extraction_metadata: ExtractionMetadata | None = None
+    cache_key: str | None = Field(default=None, exclude=True)
     started_at: AwareDatetime | None = None
     finished_at: AwareDatetime | None = None
     created_at: AwareDatetime = Field(default_factory=utc_now)
 
+    @property
+    def finished(self) -> bool:
+        return self.status in {ExtractionStatus.COMPLETED, ExtractionStatus.FAILED, ExtractionStatus.CANCELLED}
+
     def set_started(self, job_id: str) -> None:
         """Mark extraction as started with job ID."""
         self.status = ExtractionStatus.IN_PROGRESS
@@ -31,7 +31,7 @@ from beeai_server.domain.constants import DOCKER_MANIFEST_LABEL_NAME, REQUIRED_E
 from beeai_server.domain.models.registry import RegistryLocation
 from beeai_server.domain.utils import bridge_k8s_to_localhost, bridge_localhost_to_k8s
 from beeai_server.exceptions import MissingConfigurationError
-from beeai_server.utils.docker import DockerImageID, get_registry_image_config_and_labels
+from beeai_server.utils.docker import DockerImageID, get_registry_image_config_and_labels, get_registry_image_digest
 from beeai_server.utils.utils import utc_now
 
 logger = logging.getLogger(__name__)
@@ -49,6 +49,10 @@ class DockerImageProviderLocation(RootModel):
     def is_on_host(self) -> bool:
         return False
 
+    async def get_fingerprint(self) -> str:
+        """Digest of the image manifest, changes whenever the tag is pushed again."""
+        return await get_registry_image_digest(self.root)
+
     @inject
     async def load_agent_card(self) -> AgentCard:
         from a2a.types import AgentCard
@@ -86,6 +90,16 @@ class NetworkProviderLocation(RootModel):
         location_digest = hashlib.sha256(str(self.root).encode()).digest()
         return UUID(bytes=location_digest[:16])
 
+    async def get_fingerprint(self) -> str:
+        """ETag of the agent card or its content digest if the provider does not send one."""
+        async with AsyncClient() as client:
+            try:
+                response = await client.get(f"{str(self.root).rstrip('/')}{AGENT_CARD_WELL_KNOWN_PATH}", timeout=1)
+                response.raise_for_status()
+            except Exception as ex:
+                raise ValueError(f"Unable to load agents from location: {self.root}: {ex}") from ex
+        return response.headers.get("etag") or f"sha256:{hashlib.sha256(response.content).hexdigest()}"
+
     async def load_agent_card(self) -> AgentCard:
         from a2a.types import AgentCard
 
@@ -115,6 +129,8 @@ class Provider(BaseModel):
     created_at: AwareDatetime = Field(default_factory=utc_now)
     last_active_at: AwareDatetime = Field(default_factory=utc_now)
     agent_card: AgentCard
+    # Manifest digest or ETag of the source when it was loaded, managed providers are deployed pinned to the digest
+    source_fingerprint: str | None = None
 
     @model_validator(mode="after")
     def auto_remove_only_unmanaged(self):
@@ -5,7 +5,7 @@ from enum import StrEnum
 from typing import Literal
 from uuid import UUID, uuid4
 
-from pydantic import AwareDatetime, BaseModel, Field
+from pydantic import AwareDatetime, BaseModel, Field, model_validator
 
 from beeai_server.domain.models.common import Metadata
 from beeai_server.utils.utils import utc_now
@@ -73,3 +73,73 @@ class VectorStoreSearchResult(BaseModel):
 
     item: VectorStoreItem
     score: float
+
+
+class IngestionStatus(StrEnum):
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class ChunkingParameters(BaseModel):
+    """Parameters of the recursive character text splitter, sizes are in characters."""
+
+    chunk_size: int = Field(default=1000, gt=0, le=100_000)
+    chunk_overlap: int = Field(default=200, ge=0)
+    separators: list[str] = Field(default_factory=lambda: ["\n\n", "\n", " ", ""], min_length=1)
+
+    @model_validator(mode="after")
+    def validate_overlap(self) -> "ChunkingParameters":
+        if self.chunk_overlap >= self.chunk_size:
+            raise ValueError("chunk_overlap must be smaller than chunk_size")
+        return self
+
+
+class IngestionProgress(BaseModel):
+    total_files: int = 0
+    processed_files: int = 0
+    embedded_chunks: int = 0
+
+
+class VectorStoreIngestion(BaseModel):
+    """Server-side job extracting, chunking and embedding files into a vector store."""
+
+    id: UUID = Field(default_factory=uuid4)
+    vector_store_id: UUID
+    file_ids: list[UUID]
+    chunking: ChunkingParameters = Field(default_factory=ChunkingParameters)
+    status: IngestionStatus = IngestionStatus.PENDING
+    progress: IngestionProgress = Field(default_factory=IngestionProgress)
+    job_id: str | None = None
+    error_message: str | None = None
+    created_by: UUID
+    context_id: UUID | None = None
+    started_at: AwareDatetime | None = None
+    finished_at: AwareDatetime | None = None
+    created_at: AwareDatetime = Field(default_factory=utc_now)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in {IngestionStatus.COMPLETED, IngestionStatus.FAILED, IngestionStatus.CANCELLED}
+
+    def set_started(self, job_id: str) -> None:
+        self.status = IngestionStatus.IN_PROGRESS
+        self.job_id = job_id
+        self.started_at = utc_now()
+        self.error_message = None
+        self.progress = IngestionProgress(total_files=len(self.file_ids))
+
+    def set_completed(self) -> None:
+        self.status = IngestionStatus.COMPLETED
+        self.finished_at = utc_now()
+
+    def set_failed(self, error_message: str) -> None:
+        self.status = IngestionStatus.FAILED
+        self.error_message = error_message
+        self.finished_at = utc_now()
+
+    def set_cancelled(self) -> None:
+        self.status = IngestionStatus.CANCELLED
+        self.finished_at = utc_now()
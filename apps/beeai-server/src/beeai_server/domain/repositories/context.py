@@ -1,13 +1,19 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
-from collections.abc import AsyncIterator
+import builtins
+from collections.abc import AsyncIterator, Iterable, Sequence
 from datetime import datetime
 from typing import Protocol
 from uuid import UUID
 
-from beeai_server.domain.models.common import PaginatedResult
-from beeai_server.domain.models.context import Context, ContextHistoryItem, TitleGenerationState
+from beeai_server.domain.models.common import PaginatedResult, TotalCount
+from beeai_server.domain.models.context import (
+    Context,
+    ContextHistorySnapshot,
+    StoredContextHistoryItem,
+    TitleGenerationState,
+)
 
 
 class IContextRepository(Protocol):
@@ -20,12 +26,18 @@ class IContextRepository(Protocol):
         self,
         user_id: UUID | None = None,
         limit: int = 20,
-        page_token: UUID | None = None,
+        page_token: str | None = None,
         order: str = "desc",
         order_by: str = "created_at",
         include_empty: bool = True,
+        total_count: TotalCount = TotalCount.EXACT,
     ) -> PaginatedResult: ...
 
+    async def list_expired_resource_context_ids(
+        self, *, last_active_before: datetime, limit: int
+    ) -> builtins.list[UUID]: ...
+    async def mark_resources_expired(self, *, context_ids: Iterable[UUID]) -> None: ...
+
     async def create(self, *, context: Context) -> None: ...
     async def get(self, *, context_id: UUID, user_id: UUID | None = None) -> Context: ...
     async def delete(self, *, context_id: UUID, user_id: UUID | None = None) -> int: ...
@@ -33,13 +45,31 @@ class IContextRepository(Protocol):
     async def update_title(
         self, *, context_id: UUID, title: str | None = None, generation_state: TitleGenerationState
     ) -> None: ...
-    async def add_history_item(self, *, context_id: UUID, history_item: ContextHistoryItem) -> None: ...
+    async def add_history_items(
+        self, *, context_id: UUID, history_items: Sequence[StoredContextHistoryItem]
+    ) -> None: ...
     async def list_history(
         self,
         *,
         context_id: UUID,
-        page_token: UUID | None = None,
+        page_token: str | None = None,
         limit: int = 20,
         order_by: str = "created_at",
         order="desc",
-    ) -> PaginatedResult[ContextHistoryItem]: ...
+        total_count: TotalCount = TotalCount.EXACT,
+    ) -> PaginatedResult[StoredContextHistoryItem]: ...
+    async def list_history_after(
+        self,
+        *,
+        context_id: UUID,
+        after_item: StoredContextHistoryItem | None = None,
+        created_before: datetime | None = None,
+    ) -> builtins.list[StoredContextHistoryItem]: ...
+    async def list_offloaded_history_item_ids(
+        self, *, context_id: UUID | None = None, user_id: UUID | None = None
+    ) -> builtins.list[UUID]: ...
+    async def get_history_snapshot(self, *, context_id: UUID) -> ContextHistorySnapshot | None: ...
+    async def get_last_snapshot_history_item(self, *, context_id: UUID) -> StoredContextHistoryItem | None: ...
+    async def append_history_snapshot(
+        self, *, context_id: UUID, items: Sequence[StoredContextHistoryItem], chunk_size: int
+    ) -> None: ...
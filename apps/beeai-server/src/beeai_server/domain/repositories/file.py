@@ -1,15 +1,28 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
-from collections.abc import AsyncIterator
+import builtins
+from collections.abc import AsyncIterator, Iterable
 from contextlib import asynccontextmanager
 from datetime import timedelta
-from typing import Protocol, runtime_checkable
+from typing import Protocol, Self, runtime_checkable
 from uuid import UUID
 
 from pydantic import AnyUrl, HttpUrl
 
-from beeai_server.domain.models.file import AsyncFile, File, FileMetadata, FileType, TextExtraction
+from beeai_server.domain.models.file import (
+    AsyncFile,
+    ExtractedFile,
+    File,
+    FileBlob,
+    FileMetadata,
+    FileType,
+    TextExtraction,
+    UploadedObject,
+)
+
+# Notification channel of finished text extractions, the payload is the file id
+EXTRACTION_FINISHED_CHANNEL = "text_extraction_finished"
 
 
 class IFileRepository(Protocol):
@@ -17,6 +30,10 @@ class IFileRepository(Protocol):
         yield  # type: ignore
 
     async def create(self, *, file: File) -> None: ...
+    async def acquire_blob(self, *, blob: FileBlob) -> FileBlob: ...
+    async def delete_unreferenced_blobs(self, *, blob_ids: Iterable[UUID]) -> builtins.list[UUID]: ...
+    async def unreferenced_blobs_usage(self, *, blob_ids: Iterable[UUID]) -> int: ...
+
     async def total_usage(self, *, user_id: UUID | None = None) -> int: ...
     async def get(
         self,
@@ -27,33 +44,63 @@ class IFileRepository(Protocol):
         file_type: FileType | None = None,
     ) -> File: ...
     async def delete(
-        self, *, file_id: UUID | None = None, user_id: UUID | None = None, context_id: UUID | None = None
-    ) -> int: ...
+        self,
+        *,
+        file_id: UUID | None = None,
+        user_id: UUID | None = None,
+        context_id: UUID | None = None,
+        context_ids: Iterable[UUID] | None = None,
+    ) -> builtins.list[UUID]: ...
 
     # Text extraction methods
     async def create_extraction(self, *, extraction: TextExtraction) -> None: ...
     async def get_extraction_by_file_id(
         self, *, file_id: UUID, user_id: UUID | None = None, context_id: UUID | None = None
     ) -> TextExtraction: ...
+    async def list_extractions(
+        self, *, file_ids: builtins.list[UUID], user_id: UUID | None = None, context_id: UUID | None = None
+    ) -> builtins.list[TextExtraction]: ...
+    async def get_extraction_by_cache_key(self, *, cache_key: str, user_id: UUID) -> TextExtraction: ...
     async def update_extraction(self, *, extraction: TextExtraction) -> None: ...
     async def delete_extraction(self, *, extraction_id: UUID) -> int: ...
 
 
 @runtime_checkable
 class IObjectStorageRepository(Protocol):
-    async def upload_file(self, *, file_id: UUID, file: AsyncFile) -> int: ...
+    async def upload_file(self, *, file_id: UUID, file: AsyncFile) -> UploadedObject: ...
 
     @asynccontextmanager
-    async def get_file(self, *, file_id: UUID) -> AsyncIterator[AsyncFile]:
+    async def get_file(self, *, file_id: UUID, byte_range: tuple[int, int] | None = None) -> AsyncIterator[AsyncFile]:
         yield  # type: ignore
 
     async def delete_files(self, *, file_ids: list[UUID]) -> None: ...
     async def get_file_url(self, *, file_id: UUID) -> HttpUrl: ...
+    async def get_download_url(
+        self, *, file_id: UUID, filename: str, content_type: str, expires_in: timedelta
+    ) -> HttpUrl: ...
     async def get_file_metadata(self, *, file_id: UUID) -> FileMetadata: ...
 
 
 @runtime_checkable
 class ITextExtractionBackend(Protocol):
+    @property
+    def name(self) -> str: ...
+
+    # Identifies the backend, its version and options, results with the same key are interchangeable
+    @property
+    def cache_key(self) -> str: ...
+
+    async def __aenter__(self) -> Self: ...
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Release resources held by the backend, e.g. worker processes."""
+        ...
+
     @asynccontextmanager
-    async def extract_text(self, *, file_url: AnyUrl, timeout: timedelta | None = None) -> AsyncIterator[AsyncFile]:  # noqa: ASYNC109
+    async def extract_text(
+        self,
+        *,
+        file_url: AnyUrl,
+        content_type: str | None = None,
+        timeout: timedelta | None = None,  # noqa: ASYNC109
+    ) -> AsyncIterator[ExtractedFile]:
         yield ...  # pyright: ignore [reportReturnType]
@@ -0,0 +1,15 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from contextlib import AbstractAsyncContextManager
+from typing import Protocol, Self
+
+
+class INotificationListener(Protocol):
+    def subscribe(self, channel: str) -> AbstractAsyncContextManager[asyncio.Queue[str]]:
+        """Receive payloads of notifications sent to the channel while the subscription is active."""
+        ...
+
+    async def __aenter__(self) -> Self: ...
+    async def __aexit__(self, exc_type, exc, tb) -> None: ...
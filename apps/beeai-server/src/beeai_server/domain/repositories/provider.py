@@ -1,7 +1,8 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterable, Mapping
+from datetime import datetime
 from typing import Protocol, runtime_checkable
 from uuid import UUID
 
@@ -15,7 +16,20 @@ class IProviderRepository(Protocol):
 
     async def create(self, *, provider: Provider) -> None: ...
     async def update(self, *, provider: Provider) -> None: ...
+    async def update_source_fingerprints(self, *, fingerprints: Mapping[UUID, str]) -> None: ...
 
     async def get(self, *, provider_id: UUID) -> Provider: ...
     async def delete(self, *, provider_id: UUID) -> int: ...
-    async def update_last_accessed(self, *, provider_id: UUID) -> None: ...
+    async def update_last_accessed(self, *, last_accessed: Mapping[UUID, datetime]) -> None:
+        """
+        Move last_active_at of the providers forward, timestamps older than the stored ones are ignored.
+
+        The hour of each access is recorded in the access history as well.
+        """
+        ...
+
+    async def count_access_hours(self, *, hours: Iterable[datetime]) -> dict[UUID, int]:
+        """Count in how many of the given hours each provider was accessed."""
+        ...
+
+    async def delete_access_hours(self, *, before: datetime) -> int: ...
@@ -9,6 +9,7 @@ from beeai_server.domain.models.vector_store import (
     VectorStore,
     VectorStoreDocument,
     VectorStoreDocumentInfo,
+    VectorStoreIngestion,
     VectorStoreItem,
     VectorStoreSearchResult,
 )
@@ -25,16 +26,26 @@ class IVectorStoreRepository(Protocol):
         self, *, vector_store_id: UUID, user_id: UUID | None = None, context_id: UUID | None = None
     ) -> VectorStore: ...
     async def delete(
-        self, *, vector_store_id: UUID | None = None, user_id: UUID | None = None, context_id: UUID | None = None
+        self,
+        *,
+        vector_store_id: UUID | None = None,
+        user_id: UUID | None = None,
+        context_id: UUID | None = None,
+        context_ids: Iterable[UUID] | None = None,
     ) -> int: ...
     async def update_last_accessed(self, *, vector_store_ids: Iterable[UUID]) -> None: ...
     async def upsert_documents(self, *, documents: Iterable[VectorStoreDocument]) -> None: ...
-    async def total_usage(self, *, user_id: UUID | None = None) -> int: ...
+    async def total_usage(self, *, user_id: UUID | None = None, context_ids: Iterable[UUID] | None = None) -> int: ...
 
     async def list_documents(self, *, vector_store_id: UUID) -> AsyncIterator[VectorStoreDocument]:
         yield ...  # type: ignore
 
     async def remove_documents(self, *, vector_store_id: UUID, document_ids: Iterable[str]) -> int: ...
+    async def create_ingestion(self, *, ingestion: VectorStoreIngestion) -> None: ...
+    async def get_ingestion(
+        self, *, ingestion_id: UUID, user_id: UUID | None = None, context_id: UUID | None = None
+    ) -> VectorStoreIngestion: ...
+    async def update_ingestion(self, *, ingestion: VectorStoreIngestion) -> None: ...
 
 
 class IVectorDatabaseRepository(Protocol):
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 
 
 class PlatformError(Exception):
+    headers: dict[str, str] | None = None
+
     def __init__(self, message: str | None = None, status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR):
         self.status_code = status_code
         super().__init__(message or "An unexpected platform error occurred")
@@ -118,3 +120,15 @@ def retry_if_exception_grp_type(*exception_types: type[BaseException]) -> retry_
 class GatewayError(PlatformError):
     def __init__(self, message: str | None = None, status_code: int = status.HTTP_502_BAD_GATEWAY):
         super().__init__(message, status_code)
+
+
+class ProviderOverloadedError(PlatformError):
+    def __init__(
+        self,
+        provider_id: UUID,
+        retry_after_sec: int,
+        message: str | None = None,
+        status_code: int = status.HTTP_503_SERVICE_UNAVAILABLE,
+    ):
+        self.headers = {"Retry-After": str(retry_after_sec)}
+        super().__init__(message or f"Provider {provider_id} is overloaded, retry later", status_code)
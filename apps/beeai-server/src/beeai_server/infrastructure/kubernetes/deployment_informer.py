@@ -0,0 +1,168 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from datetime import timedelta
+from typing import Any, NamedTuple
+
+import kr8s
+
+from beeai_server.domain.models.provider import ProviderDeploymentState
+
+logger = logging.getLogger(__name__)
+
+
+def deployment_state(deployment: dict[str, Any]) -> ProviderDeploymentState:
+    status = deployment.get("status") or {}
+    if status.get("availableReplicas", 0) > 0:
+        return ProviderDeploymentState.RUNNING
+    if status.get("replicas", 0) == 0:
+        return ProviderDeploymentState.READY
+    return ProviderDeploymentState.STARTING
+
+
+class DeploymentStatus(NamedTuple):
+    state: ProviderDeploymentState
+    replicas: int  # desired number of replicas (spec)
+    deployment_hash: str | None = None
+
+    @classmethod
+    def from_deployment(cls, deployment: dict[str, Any]) -> "DeploymentStatus":
+        return cls(
+            state=deployment_state(deployment),
+            replicas=(deployment.get("spec") or {}).get("replicas", 1),
+            deployment_hash=(deployment["metadata"].get("labels") or {}).get("deployment-hash"),
+        )
+
+
+class WatchExpiredError(Exception):
+    """The resourceVersion the watch started from is no longer available, a full resync is required."""
+
+
+class DeploymentStateInformer:
+    """
+    In-memory cache of deployment states fed by a single watch stream per namespace.
+
+    The deployments are listed once to get a consistent snapshot and its resourceVersion, then changes are watched
+    from that version. When the watch expires (410 Gone) or fails, the deployments are listed again and the cache is
+    replaced as a whole. The informer is started by the first lookup, lookups wait only for the initial sync.
+
+    The cache is live only while the watch is running. Until the deployments are listed again after a failure, the
+    cache may miss changes and `peek` does not return it.
+    """
+
+    def __init__(
+        self,
+        api_factory: Callable[[], Awaitable[kr8s.asyncio.Api]],
+        label_selector: dict[str, str],
+        watch_timeout: timedelta = timedelta(minutes=5),
+        retry_backoff: timedelta = timedelta(seconds=1),
+        max_retry_backoff: timedelta = timedelta(seconds=30),
+    ):
+        self._api_factory = api_factory
+        self._label_selector = label_selector
+        self._watch_timeout = watch_timeout
+        self._retry_backoff = retry_backoff
+        self._max_retry_backoff = max_retry_backoff
+        self._deployments: dict[str, DeploymentStatus] = {}
+        self._synced = asyncio.Event()
+        self._live = False
+        self._task: asyncio.Task | None = None
+        self._last_error: BaseException | None = None
+
+    async def _list(self, api: kr8s.asyncio.Api) -> str:
+        async with api.async_get_kind("deployment", label_selector=self._label_selector) as (_, response):
+            deployment_list = response.json()
+        self._deployments = {
+            deployment["metadata"]["name"]: DeploymentStatus.from_deployment(deployment)
+            for deployment in deployment_list["items"]
+        }
+        self._synced.set()
+        self._live = True
+        return deployment_list["metadata"]["resourceVersion"]
+
+    async def _watch(self, api: kr8s.asyncio.Api, resource_version: str) -> str:
+        params = {
+            "resourceVersion": resource_version,
+            "allowWatchBookmarks": "true",
+            "timeoutSeconds": str(int(self._watch_timeout.total_seconds())),
+        }
+        try:
+            async with api.async_get_kind(
+                "deployment", label_selector=self._label_selector, params=params, watch=True, timeout=None
+            ) as (_, response):
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    event = json.loads(line)
+                    obj = event["object"]
+                    if event["type"] == "ERROR":
+                        if obj.get("code") == 410:
+                            raise WatchExpiredError(obj.get("message", "Watch expired"))
+                        raise RuntimeError(f"Deployment watch failed: {obj.get('message', obj)}")
+                    resource_version = obj["metadata"]["resourceVersion"]
+                    match event["type"]:
+                        case "ADDED" | "MODIFIED":
+                            self._deployments[obj["metadata"]["name"]] = DeploymentStatus.from_deployment(obj)
+                        case "DELETED":
+                            self._deployments.pop(obj["metadata"]["name"], None)
+        except kr8s.ServerError as ex:
+            if ex.response is not None and ex.response.status_code == 410:
+                raise WatchExpiredError(str(ex)) from ex
+            raise
+        return resource_version
+
+    async def _run(self) -> None:
+        backoff = self._retry_backoff
+        while True:
+            try:
+                api = await self._api_factory()
+                resource_version = await self._list(api)
+                while True:
+                    # The stream ends regularly when the server side timeout elapses, continue where it stopped
+                    resource_version = await self._watch(api, resource_version)
+                    backoff = self._retry_backoff
+            except WatchExpiredError:
+                self._live = False
+                logger.info("Deployment watch expired, resyncing")
+            except Exception as ex:
+                self._live = False
+                self._last_error = ex
+                logger.warning(f"Deployment watch failed, resyncing in {backoff.total_seconds()}s: {ex!r}")
+                await asyncio.sleep(backoff.total_seconds())
+                backoff = min(backoff * 2, self._max_retry_backoff)
+
+    def _ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def get(self, names: list[str], timeout: timedelta = timedelta(seconds=30)) -> list[DeploymentStatus | None]:  # noqa: ASYNC109
+        self._ensure_started()
+        if not self._synced.is_set():
+            try:
+                async with asyncio.timeout(timeout.total_seconds()):
+                    await self._synced.wait()
+            except TimeoutError as ex:
+                raise RuntimeError("Deployment states are not synced with Kubernetes") from self._last_error or ex
+        return [self._deployments.get(name) for name in names]
+
+    def peek(self, names: list[str]) -> list[DeploymentStatus | None] | None:
+        """Cached states without waiting, None unless the cache is live (synced and the watch is running)."""
+        self._ensure_started()
+        if not self._live:
+            return None
+        return [self._deployments.get(name) for name in names]
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._live = False
+        self._synced.clear()
+        self._deployments = {}
@@ -3,17 +3,20 @@
 
 import asyncio
 import base64
+import copy
 import hashlib
 import json
 import logging
 import re
 from asyncio import TaskGroup
+from collections import defaultdict
 from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
 from datetime import timedelta
 from enum import StrEnum
 from pathlib import Path
-from typing import Any, Final
+from typing import Any, Final, Self
 from uuid import UUID
 
 import anyio
@@ -27,6 +30,7 @@ from pydantic import HttpUrl
 from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_delay, wait_fixed
 
 from beeai_server.domain.models.provider import Provider, ProviderDeploymentState
+from beeai_server.infrastructure.kubernetes.deployment_informer import DeploymentStateInformer
 from beeai_server.service_layer.deployment_manager import IProviderDeploymentManager, global_provider_variables
 from beeai_server.utils.logs_container import LogsContainer, ProcessLogMessage, ProcessLogType
 from beeai_server.utils.utils import extract_messages
@@ -47,6 +51,16 @@ TEMPLATE_KIND_TO_FILE_NAME: Final = {
 }
 
 DEFAULT_TEMPLATE_DIR: Final = Path(__file__).parent / "default_templates"
+MANAGED_BY_LABEL: Final = {"managedBy": "beeai-platform"}
+
+
+@dataclass(frozen=True)
+class ProviderManifests:
+    inputs_digest: str
+    service: dict[str, Any]
+    secret: dict[str, Any]
+    deployment: dict[str, Any]
+    deployment_hash: str
 
 
 class KubernetesProviderDeploymentManager(IProviderDeploymentManager):
@@ -56,9 +70,18 @@ class KubernetesProviderDeploymentManager(IProviderDeploymentManager):
         manifest_template_dir: Path | None = None,
     ):
         self._api_factory = api_factory
-        self._create_lock = asyncio.Lock()
+        self._create_locks: defaultdict[UUID, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._template_dir = anyio.Path(manifest_template_dir or DEFAULT_TEMPLATE_DIR)
-        self._templates: dict[TemplateKind, str] = {}
+        self._templates: dict[TemplateKind, Template] = {}
+        self._manifests: dict[UUID, ProviderManifests] = {}
+        self._informer = DeploymentStateInformer(api_factory=api_factory, label_selector=MANAGED_BY_LABEL)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        # Stops the deployment watch, the informer is started again by the next lookup
+        await self._informer.close()
 
     @asynccontextmanager
     async def api(self) -> AsyncIterator[kr8s.asyncio.Api]:
@@ -67,9 +90,57 @@ class KubernetesProviderDeploymentManager(IProviderDeploymentManager):
 
     async def _render_template(self, kind: TemplateKind, **variables) -> dict[str, Any]:
         if kind not in self._templates:
-            self._templates[kind] = await (self._template_dir / TEMPLATE_KIND_TO_FILE_NAME[kind]).read_text()
-        template = self._templates[kind]
-        return yaml.safe_load(Template(template).render(**variables))
+            source = await (self._template_dir / TEMPLATE_KIND_TO_FILE_NAME[kind]).read_text()
+            self._templates[kind] = Template(source)
+        return yaml.safe_load(self._templates[kind].render(**variables))
+
+    async def _render_manifests(self, provider: Provider, env: dict[str, str]) -> ProviderManifests:
+        """Render manifests of the provider, they are re-rendered only when the image or the variables change."""
+        image = str(provider.source.root)
+        if provider.source_fingerprint and provider.source_fingerprint.startswith("sha256:"):
+            # Pin the image to the manifest digest, a re-pushed tag changes the deployment hash and rolls the pods
+            image = f"{image}@{provider.source_fingerprint}"
+        inputs_digest = hashlib.sha256(json.dumps({"image": image, "env": env}, sort_keys=True).encode()).hexdigest()
+        if (manifests := self._manifests.get(provider.id)) and manifests.inputs_digest == inputs_digest:
+            return manifests
+
+        label = self._get_k8s_name(provider.id)
+        service = Service(
+            await self._render_template(
+                TemplateKind.SVC,
+                provider_service_name=self._get_k8s_name(provider.id, kind=TemplateKind.SVC),
+                provider_app_label=label,
+            )
+        )
+        secret = Secret(
+            await self._render_template(
+                TemplateKind.SECRET,
+                provider_secret_name=self._get_k8s_name(provider.id, TemplateKind.SECRET),
+                provider_app_label=label,
+                secret_data={key: base64.b64encode(value.encode()).decode() for key, value in env.items()},
+            )
+        )
+        deployment_manifest = await self._render_template(
+            TemplateKind.DEPLOY,
+            provider_deployment_name=self._get_k8s_name(provider.id, TemplateKind.DEPLOY),
+            provider_app_label=label,
+            image=image,
+            provider_secret_name=self._get_k8s_name(provider.id, TemplateKind.SECRET),
+        )
+        combined_manifest = json.dumps(
+            {"service": service.raw, "secret": secret.raw, "deployment": deployment_manifest}
+        )
+        deployment_hash = hashlib.sha256(combined_manifest.encode()).hexdigest()[:63]
+        deployment_manifest["metadata"]["labels"]["deployment-hash"] = deployment_hash
+
+        self._manifests[provider.id] = manifests = ProviderManifests(
+            inputs_digest=inputs_digest,
+            service=service.raw.to_dict(),
+            secret=secret.raw.to_dict(),
+            deployment=deployment_manifest,
+            deployment_hash=deployment_hash,
+        )
+        return manifests
 
     def _get_k8s_name(self, provider_id: UUID, kind: TemplateKind | None = None):
         return f"beeai-provider-{provider_id}" + (f"-{kind}" if kind else "")
@@ -85,43 +156,26 @@ class KubernetesProviderDeploymentManager(IProviderDeploymentManager):
         if not provider.managed:
             raise ValueError("Attempted to update provider not managed by Kubernetes")
 
-        async with self.api() as api:
-            label = self._get_k8s_name(provider.id)
-
-            service = Service(
-                await self._render_template(
-                    TemplateKind.SVC,
-                    provider_service_name=self._get_k8s_name(provider.id, kind=TemplateKind.SVC),
-                    provider_app_label=label,
-                ),
-                api=api,
-            )
-            env = {**(env or {}), **global_provider_variables()}
-            secret = Secret(
-                await self._render_template(
-                    TemplateKind.SECRET,
-                    provider_secret_name=self._get_k8s_name(provider.id, TemplateKind.SECRET),
-                    provider_app_label=label,
-                    secret_data={key: base64.b64encode(value.encode()).decode() for key, value in env.items()},
-                ),
-                api=api,
-            )
+        env = {**(env or {}), **global_provider_variables()}
+        manifests = await self._render_manifests(provider, env)
 
-            deployment_manifest = await self._render_template(
-                TemplateKind.DEPLOY,
-                provider_deployment_name=self._get_k8s_name(provider.id, TemplateKind.DEPLOY),
-                provider_app_label=label,
-                image=str(provider.source.root),
-                provider_secret_name=self._get_k8s_name(provider.id, TemplateKind.SECRET),
-            )
-            combined_manifest = json.dumps(
-                {"service": service.raw, "secret": secret.raw, "deployment": deployment_manifest}
-            )
-            deployment_hash = hashlib.sha256(combined_manifest.encode()).hexdigest()[:63]
-            deployment_manifest["metadata"]["labels"]["deployment-hash"] = deployment_hash
+        # Fast path without any API calls, taken only while the informer cache follows the live deployments
+        cached = self._informer.peek([self._get_k8s_name(provider.id, TemplateKind.DEPLOY)])
+        if (
+            cached
+            and (deployment_status := cached[0])
+            and deployment_status.deployment_hash == manifests.deployment_hash
+            and deployment_status.replicas
+        ):
+            return False  # Deployment was not modified
 
-            deployment = Deployment(deployment_manifest, api=api)
-            async with self._create_lock:
+        async with self.api() as api:
+            # Objects are created from copies, kr8s updates their raw manifests with the API responses
+            service = Service(copy.deepcopy(manifests.service), api=api)
+            secret = Secret(copy.deepcopy(manifests.secret), api=api)
+            deployment = Deployment(copy.deepcopy(manifests.deployment), api=api)
+            deployment_hash = manifests.deployment_hash
+            async with self._create_locks[provider.id]:
                 try:
                     existing_deployment = await Deployment.get(deployment.metadata.name, api=api)
                     if existing_deployment.metadata.labels["deployment-hash"] == deployment_hash:
@@ -152,6 +206,7 @@ class KubernetesProviderDeploymentManager(IProviderDeploymentManager):
                 return True
 
     async def delete(self, *, provider_id: UUID) -> None:
+        self._manifests.pop(provider_id, None)
         with suppress(kr8s.NotFoundError):
             async with self.api() as api:
                 deploy = await Deployment.get(name=self._get_k8s_name(provider_id, TemplateKind.DEPLOY), api=api)
@@ -173,7 +228,7 @@ class KubernetesProviderDeploymentManager(IProviderDeploymentManager):
         async with self.api() as api, TaskGroup() as tg:
             async for deployment in kr8s.asyncio.get(
                 kind="deployment",
-                label_selector={"managedBy": "beeai-platform"},
+                label_selector=MANAGED_BY_LABEL,
                 api=api,
             ):
                 provider_id = self._get_provider_id_from_name(deployment.metadata.name, TemplateKind.DEPLOY)
@@ -182,15 +237,16 @@ class KubernetesProviderDeploymentManager(IProviderDeploymentManager):
         if errors:
             raise ExceptionGroup("Exceptions occurred when removing orphaned providers", errors)
 
-    async def scale_down(self, *, provider_id: UUID) -> None:
+    async def scale(self, *, provider_id: UUID, replicas: int) -> None:
         async with self.api() as api:
             deploy = await Deployment.get(name=self._get_k8s_name(provider_id, TemplateKind.DEPLOY), api=api)
-            await deploy.scale(0)
+            await deploy.scale(replicas)
+
+    async def scale_down(self, *, provider_id: UUID) -> None:
+        await self.scale(provider_id=provider_id, replicas=0)
 
     async def scale_up(self, *, provider_id: UUID) -> None:
-        async with self.api() as api:
-            deploy = await Deployment.get(name=self._get_k8s_name(provider_id, TemplateKind.DEPLOY), api=api)
-            await deploy.scale(1)
+        await self.scale(provider_id=provider_id, replicas=1)
 
     async def wait_for_startup(self, *, provider_id: UUID, timeout: timedelta) -> None:  # noqa: ASYNC109 (the timeout actually corresponds to kubernetes timeout)
         async with self.api() as api:
@@ -212,30 +268,16 @@ class KubernetesProviderDeploymentManager(IProviderDeploymentManager):
                         resp.raise_for_status()
 
     async def state(self, *, provider_ids: list[UUID]) -> list[ProviderDeploymentState]:
-        async with self.api() as api:
-            deployments = {
-                self._get_provider_id_from_name(deployment.metadata.name, TemplateKind.DEPLOY): deployment
-                async for deployment in kr8s.asyncio.get(
-                    kind="deployment",
-                    label_selector={"managedBy": "beeai-platform"},
-                    api=api,
-                )
-            }
-            provider_ids_set = set(provider_ids)
-            deployments = {provider_id: d for provider_id, d in deployments.items() if provider_id in provider_ids_set}
-            states = []
-            for provider_id in provider_ids:
-                deployment = deployments.get(provider_id)
-                if not deployment:
-                    state = ProviderDeploymentState.MISSING
-                elif deployment.status.get("availableReplicas", 0) > 0:
-                    state = ProviderDeploymentState.RUNNING
-                elif deployment.status.get("replicas", 0) == 0:
-                    state = ProviderDeploymentState.READY
-                else:
-                    state = ProviderDeploymentState.STARTING
-                states.append(state)
-            return states
+        deployments = await self._informer.get(
+            [self._get_k8s_name(provider_id, TemplateKind.DEPLOY) for provider_id in provider_ids]
+        )
+        return [deployment.state if deployment else ProviderDeploymentState.MISSING for deployment in deployments]
+
+    async def replicas(self, *, provider_ids: list[UUID]) -> list[int | None]:
+        deployments = await self._informer.get(
+            [self._get_k8s_name(provider_id, TemplateKind.DEPLOY) for provider_id in provider_ids]
+        )
+        return [deployment.replicas if deployment else None for deployment in deployments]
 
     async def get_provider_url(self, *, provider_id: UUID) -> HttpUrl:
         return HttpUrl(f"http://{self._get_k8s_name(provider_id, TemplateKind.SVC)}:8000")
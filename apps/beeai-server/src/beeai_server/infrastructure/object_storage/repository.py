@@ -1,20 +1,23 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import hashlib
 import logging
 from collections.abc import AsyncIterator
-from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, suppress
+from datetime import timedelta
 from typing import Any
+from urllib.parse import quote
 from uuid import UUID
 
 import aioboto3
-import aioboto3.s3.inject
 from botocore.exceptions import ClientError
 from kink import inject
-from pydantic import HttpUrl
+from pydantic import AnyUrl, HttpUrl
 
 from beeai_server.configuration import Configuration
-from beeai_server.domain.models.file import AsyncFile, FileMetadata
+from beeai_server.domain.models.file import AsyncFile, FileMetadata, UploadedObject
 from beeai_server.domain.repositories.file import IObjectStorageRepository
 from beeai_server.exceptions import EntityNotFoundError
 
@@ -28,11 +31,11 @@ class S3ObjectStorageRepository(IObjectStorageRepository):
     def __init__(self, configuration: Configuration):
         self.config = configuration.object_storage
 
-    def _get_client(self) -> AbstractAsyncContextManager[Any]:
+    def _get_client(self, endpoint_url: AnyUrl | None = None) -> AbstractAsyncContextManager[Any]:
         session = aioboto3.Session()
         return session.client(  # pyright: ignore [reportReturnType]
             "s3",
-            endpoint_url=str(self.config.endpoint_url),
+            endpoint_url=str(endpoint_url or self.config.endpoint_url),
             aws_access_key_id=self.config.access_key_id.get_secret_value(),
             aws_secret_access_key=self.config.access_key_secret.get_secret_value(),
             region_name=self.config.region,
@@ -42,30 +45,98 @@ class S3ObjectStorageRepository(IObjectStorageRepository):
     def _get_object_key(self, file_id: UUID) -> str:
         return f"files/{file_id}"
 
-    async def upload_file(self, *, file_id: UUID, file: AsyncFile) -> int:
+    async def upload_file(self, *, file_id: UUID, file: AsyncFile) -> UploadedObject:
+        """
+        Stream the file into the bucket without buffering it whole or querying the object afterward.
+
+        Parts of `multipart_part_size_bytes` are read sequentially (hashing and counting the bytes locally) and
+        uploaded concurrently, with at most `multipart_max_concurrency` parts in flight. Files that fit into a single
+        part are stored with a plain put_object.
+        """
         object_key = self._get_object_key(file_id)
+        part_size = self.config.multipart_part_size_bytes
+        sha256 = hashlib.sha256()
+        size = 0
+
+        async def read_part() -> bytes:
+            nonlocal size
+            buffer = bytearray()
+            while len(buffer) < part_size and (chunk := await file.read(part_size - len(buffer))):
+                buffer.extend(chunk)
+            sha256.update(buffer)
+            size += len(buffer)
+            return bytes(buffer)
+
+        extra_args = {"ContentType": file.content_type, "Metadata": {"filename": file.filename}}
         async with self._get_client() as client:
-            await client.upload_fileobj(
-                file,
-                self.config.bucket_name,
-                object_key,
-                ExtraArgs={"ContentType": file.content_type, "Metadata": {"filename": file.filename}},
-            )
-            result = await client.head_object(Bucket=self.config.bucket_name, Key=object_key)
-            return result["ContentLength"]
+            part = await read_part()
+            if len(part) < part_size:
+                await client.put_object(Bucket=self.config.bucket_name, Key=object_key, Body=part, **extra_args)
+                return UploadedObject(size=size, sha256=sha256.hexdigest())
+
+            upload = await client.create_multipart_upload(Bucket=self.config.bucket_name, Key=object_key, **extra_args)
+            upload_id = upload["UploadId"]
+
+            async def upload_part(part_number: int, body: bytes) -> dict[str, Any]:
+                response = await client.upload_part(
+                    Bucket=self.config.bucket_name,
+                    Key=object_key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                )
+                return {"ETag": response["ETag"], "PartNumber": part_number}
+
+            pending: set[asyncio.Task[dict[str, Any]]] = set()
+            completed_parts: list[dict[str, Any]] = []
+            try:
+                part_number = 1
+                while part:
+                    if len(pending) >= self.config.multipart_max_concurrency:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        completed_parts.extend(task.result() for task in done)
+                    pending.add(asyncio.create_task(upload_part(part_number, part)))
+                    part_number += 1
+                    part = await read_part()
+                if pending:
+                    completed_parts.extend(await asyncio.gather(*pending))
+                    pending = set()
+                await client.complete_multipart_upload(
+                    Bucket=self.config.bucket_name,
+                    Key=object_key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": sorted(completed_parts, key=lambda p: p["PartNumber"])},
+                )
+            except BaseException:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                with suppress(Exception):
+                    await client.abort_multipart_upload(
+                        Bucket=self.config.bucket_name, Key=object_key, UploadId=upload_id
+                    )
+                raise
+            return UploadedObject(size=size, sha256=sha256.hexdigest())
 
     @asynccontextmanager
-    async def get_file(self, *, file_id: UUID) -> AsyncIterator[AsyncFile]:
+    async def get_file(self, *, file_id: UUID, byte_range: tuple[int, int] | None = None) -> AsyncIterator[AsyncFile]:
         object_key = self._get_object_key(file_id)
         async with self._get_client() as client:
             try:
-                response = await client.get_object(Bucket=self.config.bucket_name, Key=object_key)
+                response = await client.get_object(
+                    Bucket=self.config.bucket_name,
+                    Key=object_key,
+                    **({"Range": "bytes={}-{}".format(*byte_range)} if byte_range else {}),
+                )
 
                 async def read(amount: int = 8192) -> bytes:
                     return await response["Body"].read(amount)
 
                 yield AsyncFile(
-                    filename=response["Metadata"]["filename"], content_type=response["ContentType"], read=read
+                    filename=response["Metadata"]["filename"],
+                    content_type=response["ContentType"],
+                    read=read,
+                    size=response["ContentLength"],
                 )
 
             except ClientError as e:
@@ -115,6 +186,24 @@ class S3ObjectStorageRepository(IObjectStorageRepository):
                     raise EntityNotFoundError(entity="file", id=file_id) from e
                 raise
 
+    async def get_download_url(
+        self, *, file_id: UUID, filename: str, content_type: str, expires_in: timedelta
+    ) -> HttpUrl:
+        # Presigning is a local operation, the URL is signed for the endpoint the client will use
+        async with self._get_client(endpoint_url=self.config.public_endpoint_url) as client:
+            url = await client.generate_presigned_url(
+                "get_object",
+                Params={
+                    "Bucket": self.config.bucket_name,
+                    "Key": self._get_object_key(file_id),
+                    # Deduplicated objects might have been uploaded under a different name or content type
+                    "ResponseContentType": content_type,
+                    "ResponseContentDisposition": f"inline; filename*=UTF-8''{quote(filename)}",
+                },
+                ExpiresIn=int(expires_in.total_seconds()),
+            )
+            return HttpUrl(url)
+
     async def get_file_metadata(self, *, file_id: UUID) -> FileMetadata:
         object_key = self._get_object_key(file_id)
         async with self._get_client() as client:
@@ -0,0 +1,57 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""empty message
+
+Revision ID: 9c4e2b7d1a05
+Revises: 3f6a1c2d9e47
+Create Date: 2025-09-16 14:02:51.730415
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4e2b7d1a05"
+down_revision: str | None = "3f6a1c2d9e47"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "file_blobs",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("content_sha256", sa.String(length=64), nullable=True),
+        sa.Column("size_bytes", sa.Integer(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False),
+        sa.Column("created_by", sa.UUID(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["created_by"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("created_by", "content_sha256", name="uq_file_blobs_created_by_content_sha256"),
+    )
+    op.add_column("files", sa.Column("blob_id", sa.UUID(), nullable=True))
+
+    # Existing objects are stored under the file id, each file gets its own blob
+    op.execute(
+        """
+        INSERT INTO file_blobs (id, content_sha256, size_bytes, ref_count, created_by, created_at)
+        SELECT id, NULL, COALESCE(file_size_bytes, 0), 1, created_by, created_at FROM files
+        """
+    )
+    op.execute("UPDATE files SET blob_id = id")
+
+    op.alter_column("files", "blob_id", nullable=False)
+    op.create_foreign_key("files_blob_id_fkey", "files", "file_blobs", ["blob_id"], ["id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("files_blob_id_fkey", "files", type_="foreignkey")
+    op.drop_column("files", "blob_id")
+    op.drop_table("file_blobs")
@@ -0,0 +1,39 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""offload large context history payloads, compress data with lz4
+
+Revision ID: e4b7c2a9d815
+Revises: c81b5e3d7a46
+Create Date: 2025-09-26 09:41:17.284503
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b7c2a9d815"
+down_revision: str | None = "c81b5e3d7a46"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("context_history", sa.Column("offloaded_size", sa.Integer(), nullable=True))
+    # The column is kept as JSON, a conversion to JSONB would rewrite the table under an exclusive lock and JSONB
+    # rejects \u0000 accepted by JSON. Existing payloads are not offloaded.
+    op.alter_column("context_history", "data", existing_type=sa.JSON(), nullable=True)
+    # Only values written from now on are compressed with lz4, existing ones keep pglz until rewritten
+    op.execute("ALTER TABLE context_history ALTER COLUMN data SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE context_history ALTER COLUMN data SET COMPRESSION DEFAULT")
+    op.execute("DELETE FROM context_history WHERE data IS NULL")
+    op.alter_column("context_history", "data", existing_type=sa.JSON(), nullable=False)
+    op.drop_column("context_history", "offloaded_size")
@@ -0,0 +1,65 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""store context history snapshots in chunks
+
+Revision ID: e76d6064296d
+Revises: e4a7c1d5b2f9
+Create Date: 2025-10-06 10:21:37.482915
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e76d6064296d"
+down_revision: str | None = "e4a7c1d5b2f9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "context_history_snapshot_chunks",
+        sa.Column("context_id", sa.UUID(), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("items", sa.JSON(), nullable=False),
+        sa.Column("item_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["context_id"], ["contexts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("context_id", "seq"),
+    )
+    # Existing snapshots become the first chunk, the next compaction appends a new one
+    op.execute(
+        """
+        INSERT INTO context_history_snapshot_chunks (context_id, seq, items, item_count, created_at)
+        SELECT context_id, 0, items, item_count, updated_at FROM context_history_snapshots
+        """
+    )
+    op.drop_table("context_history_snapshots")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_table(
+        "context_history_snapshots",
+        sa.Column("context_id", sa.UUID(), nullable=False),
+        sa.Column("items", sa.JSON(), nullable=False),
+        sa.Column("item_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["context_id"], ["contexts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("context_id"),
+    )
+    op.execute(
+        """
+        INSERT INTO context_history_snapshots (context_id, items, item_count, updated_at)
+        SELECT chunks.context_id, json_agg(item.value ORDER BY chunks.seq, item.ordinality), count(*), max(created_at)
+        FROM context_history_snapshot_chunks AS chunks, json_array_elements(chunks.items) WITH ORDINALITY AS item
+        GROUP BY chunks.context_id
+        """
+    )
+    op.drop_table("context_history_snapshot_chunks")
@@ -0,0 +1,82 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from typing import Any, Self
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from beeai_server.domain.repositories.notifications import INotificationListener
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresNotificationListener(INotificationListener):
+    """
+    Fans out Postgres NOTIFY messages to in-process subscribers.
+
+    A single connection per process is used for LISTEN, it is opened with the first subscription. If the connection
+    is lost, active subscribers stop receiving notifications (they should fall back to reading the current state when
+    they time out) and the connection is reopened by the next subscription.
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self._engine = engine
+        self._lock = asyncio.Lock()
+        self._connection: AsyncConnection | None = None
+        self._driver_connection: Any = None
+        self._subscribers: defaultdict[str, set[asyncio.Queue[str]]] = defaultdict(set)
+        self._listening: set[str] = set()
+
+    def _on_notification(self, _connection: Any, _pid: int, channel: str, payload: str) -> None:
+        for queue in self._subscribers.get(channel, ()):
+            queue.put_nowait(payload)
+
+    def _on_termination(self, _connection: Any) -> None:
+        logger.warning("Notification listener connection was terminated")
+        self._driver_connection = None
+        self._listening.clear()
+
+    async def _ensure_listening(self, channel: str) -> None:
+        if self._driver_connection is None:
+            if self._connection:
+                with suppress(Exception):
+                    await self._connection.close()
+            self._connection = await self._engine.connect()
+            raw_connection = await self._connection.get_raw_connection()
+            self._driver_connection = raw_connection.driver_connection
+            self._driver_connection.add_termination_listener(self._on_termination)
+        if channel not in self._listening:
+            await self._driver_connection.add_listener(channel, self._on_notification)
+            self._listening.add(channel)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[asyncio.Queue[str]]:
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        async with self._lock:
+            await self._ensure_listening(channel)
+            self._subscribers[channel].add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers[channel].discard(queue)
+            if not self._subscribers[channel]:
+                del self._subscribers[channel]
+
+    async def close(self) -> None:
+        async with self._lock:
+            self._listening.clear()
+            self._driver_connection = None
+            if self._connection:
+                await self._connection.close()
+                self._connection = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
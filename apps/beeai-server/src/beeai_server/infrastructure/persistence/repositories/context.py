@@ -1,9 +1,10 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
-from collections.abc import AsyncIterator
+import builtins
+from collections.abc import AsyncIterator, Iterable, Sequence
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from kink import inject
 from pydantic import TypeAdapter
@@ -13,17 +14,26 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Index,
+    Integer,
     Row,
     Table,
     delete,
+    func,
+    or_,
     select,
+    tuple_,
     update,
 )
 from sqlalchemy import UUID as SQL_UUID
 from sqlalchemy.ext.asyncio import AsyncConnection
 
-from beeai_server.domain.models.common import Metadata, PaginatedResult
-from beeai_server.domain.models.context import Context, ContextHistoryItem, TitleGenerationState
+from beeai_server.domain.models.common import Metadata, PaginatedResult, TotalCount
+from beeai_server.domain.models.context import (
+    Context,
+    ContextHistorySnapshot,
+    StoredContextHistoryItem,
+    TitleGenerationState,
+)
 from beeai_server.domain.repositories.context import IContextRepository
 from beeai_server.exceptions import EntityNotFoundError
 from beeai_server.infrastructure.persistence.repositories.db_metadata import metadata
@@ -39,6 +49,12 @@ contexts_table = Table(
     Column("last_active_at", DateTime(timezone=True), nullable=True),
     Column("created_by", ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
     Column("metadata", JSON, nullable=True),
+    # Checkpoint of the resource expiration, resources are expired again only after the context is used again
+    Column("resources_expired_at", DateTime(timezone=True), nullable=True),
+    Index("idx_contexts_last_active_at", "last_active_at"),
+    # Keyset pagination of user contexts
+    Index("idx_contexts_created_by_created_at_id", "created_by", "created_at", "id"),
+    Index("idx_contexts_created_by_updated_at_id", "created_by", "updated_at", "id"),
 )
 
 context_history_table = Table(
@@ -47,8 +63,21 @@ context_history_table = Table(
     Column("id", SQL_UUID, primary_key=True),
     Column("context_id", ForeignKey("contexts.id", ondelete="CASCADE"), nullable=False),
     Column("created_at", DateTime(timezone=True), nullable=False),
-    Column("data", JSON, nullable=False),
-    Index("idx_context_history_context_id", "context_id"),
+    # Compressed with lz4 (set in the migration), NULL when the payload is offloaded to the object storage
+    Column("data", JSON, nullable=True),
+    Column("offloaded_size", Integer, nullable=True),
+    Index("idx_context_history_context_id_created_at_id", "context_id", "created_at", "id"),
+)
+
+# Compacted history is appended in chunks, so that a compaction writes only the newly compacted items
+context_history_snapshot_chunks_table = Table(
+    "context_history_snapshot_chunks",
+    metadata,
+    Column("context_id", ForeignKey("contexts.id", ondelete="CASCADE"), primary_key=True),
+    Column("seq", Integer, primary_key=True),
+    Column("items", JSON, nullable=False),
+    Column("item_count", Integer, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
 )
 
 
@@ -70,14 +99,42 @@ class SqlAlchemyContextRepository(IContextRepository):
         async for row in await self._connection.stream(query):
             yield self._row_to_context(row)
 
+    async def list_expired_resource_context_ids(
+        self, *, last_active_before: datetime, limit: int
+    ) -> builtins.list[UUID]:
+        query = (
+            select(contexts_table.c.id)
+            .where(
+                contexts_table.c.last_active_at < last_active_before,
+                or_(
+                    contexts_table.c.resources_expired_at.is_(None),
+                    contexts_table.c.resources_expired_at < contexts_table.c.last_active_at,
+                ),
+            )
+            .order_by(contexts_table.c.last_active_at)
+            .limit(limit)
+            # Concurrent runs process disjoint batches
+            .with_for_update(skip_locked=True)
+        )
+        return list((await self._connection.execute(query)).scalars())
+
+    async def mark_resources_expired(self, *, context_ids: Iterable[UUID]) -> None:
+        query = (
+            contexts_table.update()
+            .where(contexts_table.c.id.in_(list(context_ids)))
+            .values(resources_expired_at=utc_now())
+        )
+        await self._connection.execute(query)
+
     async def list_paginated(
         self,
         user_id: UUID | None = None,
         limit: int = 20,
-        page_token: UUID | None = None,
+        page_token: str | None = None,
         order: str = "desc",
         order_by: str = "created_at",
         include_empty: bool = True,
+        total_count: TotalCount = TotalCount.EXACT,
     ) -> PaginatedResult:
         query = contexts_table.select()
         if user_id is not None:
@@ -97,12 +154,14 @@ class SqlAlchemyContextRepository(IContextRepository):
             after_cursor=page_token,
             order=order,
             order_column=getattr(contexts_table.c, order_by),
+            total_count=total_count,
         )
 
         return PaginatedResult(
             items=[self._row_to_context(row) for row in result.items],
             total_count=result.total_count,
             has_more=result.has_more,
+            next_cursor=result.next_cursor,
         )
 
     async def create(self, *, context: Context) -> None:
@@ -158,12 +217,18 @@ class SqlAlchemyContextRepository(IContextRepository):
         )
         await self._connection.execute(query)
 
-    async def add_history_item(self, *, context_id: UUID, history_item: ContextHistoryItem) -> None:
+    async def add_history_items(self, *, context_id: UUID, history_items: Sequence[StoredContextHistoryItem]) -> None:
         query = context_history_table.insert().values(
-            id=uuid4(),
-            context_id=history_item.context_id,
-            created_at=history_item.created_at,
-            data=history_item.data.model_dump(),
+            [
+                {
+                    "id": history_item.id,
+                    "context_id": history_item.context_id,
+                    "created_at": history_item.created_at,
+                    "data": history_item.data.model_dump() if history_item.data else None,
+                    "offloaded_size": history_item.offloaded_size,
+                }
+                for history_item in history_items
+            ]
         )
         await self._connection.execute(query)
 
@@ -171,11 +236,12 @@ class SqlAlchemyContextRepository(IContextRepository):
         self,
         *,
         context_id: UUID,
-        page_token: UUID | None = None,
+        page_token: str | None = None,
         limit: int = 20,
         order_by: str = "created_at",
         order="desc",
-    ) -> PaginatedResult[ContextHistoryItem]:
+        total_count: TotalCount = TotalCount.EXACT,
+    ) -> PaginatedResult[StoredContextHistoryItem]:
         query = context_history_table.select().where(context_history_table.c.context_id == context_id)
         result = await cursor_paginate(
             connection=self._connection,
@@ -185,19 +251,96 @@ class SqlAlchemyContextRepository(IContextRepository):
             order_column=getattr(context_history_table.c, order_by),
             order=order,
             limit=limit,
+            total_count=total_count,
         )
         return PaginatedResult(
             items=[self._row_to_context_history_item(item) for item in result.items],
             total_count=result.total_count,
             has_more=result.has_more,
+            next_cursor=result.next_cursor,
+        )
+
+    async def list_history_after(
+        self,
+        *,
+        context_id: UUID,
+        after_item: StoredContextHistoryItem | None = None,
+        created_before: datetime | None = None,
+    ) -> builtins.list[StoredContextHistoryItem]:
+        query = context_history_table.select().where(context_history_table.c.context_id == context_id)
+        if after_item:
+            keyset = tuple_(context_history_table.c.created_at, context_history_table.c.id)
+            query = query.where(keyset > tuple_(after_item.created_at, after_item.id))
+        if created_before:
+            query = query.where(context_history_table.c.created_at < created_before)
+        query = query.order_by(context_history_table.c.created_at.asc(), context_history_table.c.id.asc())
+        result = await self._connection.execute(query)
+        return [self._row_to_context_history_item(row) for row in result.fetchall()]
+
+    async def list_offloaded_history_item_ids(
+        self, *, context_id: UUID | None = None, user_id: UUID | None = None
+    ) -> builtins.list[UUID]:
+        if context_id is None and user_id is None:
+            raise ValueError("At least one filter parameter must be provided")
+        query = select(context_history_table.c.id).where(context_history_table.c.data.is_(None))
+        if context_id is not None:
+            query = query.where(context_history_table.c.context_id == context_id)
+        if user_id is not None:
+            user_contexts = select(contexts_table.c.id).where(contexts_table.c.created_by == user_id)
+            query = query.where(context_history_table.c.context_id.in_(user_contexts))
+        return list((await self._connection.execute(query)).scalars())
+
+    async def get_history_snapshot(self, *, context_id: UUID) -> ContextHistorySnapshot | None:
+        chunks = context_history_snapshot_chunks_table
+        query = chunks.select().where(chunks.c.context_id == context_id).order_by(chunks.c.seq)
+        if not (rows := (await self._connection.execute(query)).fetchall()):
+            return None
+        return ContextHistorySnapshot(
+            context_id=context_id,
+            items=[item for row in rows for item in row.items],
+            updated_at=rows[-1].created_at,
+        )
+
+    async def get_last_snapshot_history_item(self, *, context_id: UUID) -> StoredContextHistoryItem | None:
+        chunks = context_history_snapshot_chunks_table
+        query = (
+            select(chunks.c["items"]).where(chunks.c.context_id == context_id).order_by(chunks.c.seq.desc()).limit(1)
+        )
+        if not (items := await self._connection.scalar(query)):
+            return None
+        return StoredContextHistoryItem.model_validate(items[-1])
+
+    async def append_history_snapshot(
+        self, *, context_id: UUID, items: Sequence[StoredContextHistoryItem], chunk_size: int
+    ) -> None:
+        chunks = context_history_snapshot_chunks_table
+        last_seq = await self._connection.scalar(
+            select(func.max(chunks.c.seq)).where(chunks.c.context_id == context_id)
+        )
+        first_seq = 0 if last_seq is None else last_seq + 1
+        created_at = utc_now()
+        item_chunks = [items[offset : offset + chunk_size] for offset in range(0, len(items), chunk_size)]
+        await self._connection.execute(
+            chunks.insert(),
+            [
+                {
+                    "context_id": context_id,
+                    "seq": first_seq + i,
+                    "items": [item.model_dump(mode="json") for item in chunk],
+                    "item_count": len(chunk),
+                    "created_at": created_at,
+                }
+                for i, chunk in enumerate(item_chunks)
+            ],
         )
 
-    def _row_to_context_history_item(self, row: Row) -> ContextHistoryItem:
-        return ContextHistoryItem(
+    def _row_to_context_history_item(self, row: Row) -> StoredContextHistoryItem:
+        return StoredContextHistoryItem(
             id=row.id,
             data=row.data,
             context_id=row.context_id,
             created_at=row.created_at,
+            offloaded_size=row.offloaded_size,
         )
 
     def _row_to_context(self, row: Row) -> Context:
@@ -1,7 +1,9 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
-from collections.abc import AsyncIterator
+import builtins
+from collections import Counter
+from collections.abc import AsyncIterator, Iterable
 from typing import cast
 from uuid import UUID
 
@@ -11,23 +13,41 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Row,
     String,
     Table,
     Text,
+    UniqueConstraint,
+    and_,
+    bindparam,
     func,
+    or_,
     select,
 )
 from sqlalchemy import UUID as SQL_UUID
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncConnection
 
-from beeai_server.domain.models.file import ExtractionStatus, File, FileType, TextExtraction
-from beeai_server.domain.repositories.file import IFileRepository
+from beeai_server.domain.models.file import ExtractionStatus, File, FileBlob, FileType, TextExtraction
+from beeai_server.domain.repositories.file import EXTRACTION_FINISHED_CHANNEL, IFileRepository
 from beeai_server.exceptions import EntityNotFoundError
 from beeai_server.infrastructure.persistence.repositories.db_metadata import metadata
 from beeai_server.infrastructure.persistence.repositories.utils import sql_enum
 
+file_blobs_table = Table(
+    "file_blobs",
+    metadata,
+    Column("id", SQL_UUID, primary_key=True),
+    Column("content_sha256", String(64), nullable=True),
+    Column("size_bytes", Integer, nullable=False),
+    Column("ref_count", Integer, nullable=False),
+    Column("created_by", ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    UniqueConstraint("created_by", "content_sha256", name="uq_file_blobs_created_by_content_sha256"),
+)
+
 files_table = Table(
     "files",
     metadata,
@@ -35,11 +55,13 @@ files_table = Table(
     Column("filename", String(256), nullable=False),
     Column("content_type", String(256), nullable=False),
     Column("file_size_bytes", Integer, nullable=True),
+    Column("content_sha256", String(64), nullable=True),
     Column("created_at", DateTime(timezone=True), nullable=False),
     Column("created_by", ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
     Column("file_type", sql_enum(FileType, name="file_type"), nullable=False),
     Column("parent_file_id", ForeignKey("files.id", ondelete="CASCADE"), nullable=True),
     Column("context_id", ForeignKey("contexts.id", ondelete="CASCADE"), nullable=True),
+    Column("blob_id", ForeignKey("file_blobs.id"), nullable=False),
 )
 
 text_extractions_table = Table(
@@ -52,9 +74,11 @@ text_extractions_table = Table(
     Column("job_id", String(255), nullable=True),
     Column("error_message", Text, nullable=True),
     Column("extraction_metadata", JSON, nullable=True),
+    Column("cache_key", String(64), nullable=True),
     Column("started_at", DateTime(timezone=True), nullable=True),
     Column("finished_at", DateTime(timezone=True), nullable=True),
     Column("created_at", DateTime(timezone=True), nullable=False),
+    Index("idx_text_extractions_cache_key", "cache_key"),
 )
 
 
@@ -71,12 +95,44 @@ class SqlAlchemyFileRepository(IFileRepository):
             created_at=file.created_at,
             created_by=file.created_by,
             file_size_bytes=file.file_size_bytes,
+            content_sha256=file.content_sha256,
             file_type=file.file_type,
             parent_file_id=file.parent_file_id,
             context_id=file.context_id,
+            blob_id=file.blob_id,
         )
         await self.connection.execute(query)
 
+    async def acquire_blob(self, *, blob: FileBlob) -> FileBlob:
+        query = insert(file_blobs_table).values(
+            id=blob.id,
+            content_sha256=blob.content_sha256,
+            size_bytes=blob.size_bytes,
+            ref_count=blob.ref_count,
+            created_by=blob.created_by,
+            created_at=blob.created_at,
+        )
+        query = query.on_conflict_do_update(
+            index_elements=["created_by", "content_sha256"],
+            set_={"ref_count": file_blobs_table.c.ref_count + query.excluded.ref_count},
+        ).returning(file_blobs_table)
+        row = (await self.connection.execute(query)).one()
+        return FileBlob.model_validate(row._asdict())
+
+    async def delete_unreferenced_blobs(self, *, blob_ids: Iterable[UUID]) -> builtins.list[UUID]:
+        query = (
+            file_blobs_table.delete()
+            .where(file_blobs_table.c.id.in_(set(blob_ids)), file_blobs_table.c.ref_count <= 0)
+            .returning(file_blobs_table.c.id)
+        )
+        return list((await self.connection.execute(query)).scalars())
+
+    async def unreferenced_blobs_usage(self, *, blob_ids: Iterable[UUID]) -> int:
+        query = select(func.coalesce(func.sum(file_blobs_table.c.size_bytes), 0)).where(
+            file_blobs_table.c.id.in_(set(blob_ids)), file_blobs_table.c.ref_count <= 0
+        )
+        return cast(int, await self.connection.scalar(query))
+
     def _to_file(self, row: Row):
         return File.model_validate(
             {
@@ -86,16 +142,19 @@ class SqlAlchemyFileRepository(IFileRepository):
                 "created_at": row.created_at,
                 "created_by": row.created_by,
                 "file_size_bytes": row.file_size_bytes,
+                "content_sha256": row.content_sha256,
                 "file_type": row.file_type,
                 "parent_file_id": row.parent_file_id,
                 "context_id": row.context_id,
+                "blob_id": row.blob_id,
             }
         )
 
     async def total_usage(self, *, user_id: UUID | None = None) -> int:
-        query = select(func.coalesce(func.sum(files_table.c.file_size_bytes), 0))
+        # Deduplicated content is counted only once
+        query = select(func.coalesce(func.sum(file_blobs_table.c.size_bytes), 0))
         if user_id:
-            query = query.where(files_table.c.created_by == user_id)
+            query = query.where(file_blobs_table.c.created_by == user_id)
         return cast(int, await self.connection.scalar(query))
 
     async def get(
@@ -119,8 +178,14 @@ class SqlAlchemyFileRepository(IFileRepository):
         return self._to_file(row)
 
     async def delete(
-        self, *, file_id: UUID | None = None, user_id: UUID | None = None, context_id: UUID | None = None
-    ) -> int:
+        self,
+        *,
+        file_id: UUID | None = None,
+        user_id: UUID | None = None,
+        context_id: UUID | None = None,
+        context_ids: Iterable[UUID] | None = None,
+    ) -> builtins.list[UUID]:
+        """Delete the files and release their blobs, returns the blob ids of the deleted files."""
         query = files_table.delete()
 
         conditions = []
@@ -128,18 +193,31 @@ class SqlAlchemyFileRepository(IFileRepository):
             conditions.append(files_table.c.id == file_id)
         if context_id is not None:
             conditions.append(files_table.c.context_id == context_id)
+        if context_ids is not None:
+            conditions.append(files_table.c.context_id.in_(list(context_ids)))
         if user_id is not None:
             conditions.append(files_table.c.created_by == user_id)
 
         if not conditions:
             raise ValueError("At least one filter parameter must be provided")
 
-        for condition in conditions:
-            query = query.where(condition)
-        result = await self.connection.execute(query)
-        if not result.rowcount:
+        # Files extracted from the deleted files would be removed by cascade, delete them explicitly to release blobs
+        condition = and_(*conditions)
+        query = query.where(
+            or_(condition, files_table.c.parent_file_id.in_(select(files_table.c.id).where(condition).correlate(None)))
+        ).returning(files_table.c.blob_id)
+        blob_ids = list((await self.connection.execute(query)).scalars())
+        if not blob_ids:
             raise EntityNotFoundError("file", file_id or "file to delete")
-        return result.rowcount
+
+        released = Counter(blob_ids)
+        await self.connection.execute(
+            file_blobs_table.update()
+            .where(file_blobs_table.c.id == bindparam("blob_id"))
+            .values(ref_count=file_blobs_table.c.ref_count - bindparam("released")),
+            [{"blob_id": blob_id, "released": count} for blob_id, count in released.items()],
+        )
+        return blob_ids
 
     async def list(self, *, user_id: UUID | None = None, context_id: UUID | None = None) -> AsyncIterator[File]:
         query = files_table.select().where(files_table.c.file_type == FileType.USER_UPLOAD)
@@ -160,6 +238,7 @@ class SqlAlchemyFileRepository(IFileRepository):
                 "job_id": row.job_id,
                 "error_message": row.error_message,
                 "extraction_metadata": row.extraction_metadata,
+                "cache_key": row.cache_key,
                 "started_at": row.started_at,
                 "finished_at": row.finished_at,
                 "created_at": row.created_at,
@@ -176,11 +255,13 @@ class SqlAlchemyFileRepository(IFileRepository):
             job_id=extraction.job_id,
             error_message=extraction.error_message,
             extraction_metadata=extraction_metadata and extraction_metadata.model_dump(mode="json"),
+            cache_key=extraction.cache_key,
             started_at=extraction.started_at,
             finished_at=extraction.finished_at,
             created_at=extraction.created_at,
         )
         await self.connection.execute(query)
+        await self._notify_if_finished(extraction)
 
     async def get_extraction_by_file_id(
         self, *, file_id: UUID, user_id: UUID | None = None, context_id: UUID | None = None
@@ -198,7 +279,39 @@ class SqlAlchemyFileRepository(IFileRepository):
             raise EntityNotFoundError(entity="text_extraction", id=file_id, attribute="file_id")
         return self._to_text_extraction(row)
 
+    async def list_extractions(
+        self, *, file_ids: builtins.list[UUID], user_id: UUID | None = None, context_id: UUID | None = None
+    ) -> builtins.list[TextExtraction]:
+        query = text_extractions_table.select().where(text_extractions_table.c.file_id.in_(file_ids))
+        if context_id or user_id:
+            query = query.join(files_table, text_extractions_table.c.file_id == files_table.c.id)
+        if context_id:
+            query = query.where(files_table.c.context_id == context_id)
+        if user_id:
+            query = query.where(files_table.c.created_by == user_id)
+
+        result = await self.connection.execute(query)
+        return [self._to_text_extraction(row) for row in result.fetchall()]
+
+    async def get_extraction_by_cache_key(self, *, cache_key: str, user_id: UUID) -> TextExtraction:
+        query = (
+            text_extractions_table.select()
+            .join(files_table, text_extractions_table.c.file_id == files_table.c.id)
+            .where(
+                text_extractions_table.c.cache_key == cache_key,
+                text_extractions_table.c.status == ExtractionStatus.COMPLETED,
+                text_extractions_table.c.extracted_file_id.is_not(None),
+                files_table.c.created_by == user_id,
+            )
+            .limit(1)
+        )
+        result = await self.connection.execute(query)
+        if not (row := result.fetchone()):
+            raise EntityNotFoundError(entity="text_extraction", id=cache_key, attribute="cache_key")
+        return self._to_text_extraction(row)
+
     async def update_extraction(self, *, extraction: TextExtraction) -> None:
+        extraction_metadata = extraction.extraction_metadata
         query = (
             text_extractions_table.update()
             .where(text_extractions_table.c.file_id == extraction.file_id)
@@ -207,12 +320,19 @@ class SqlAlchemyFileRepository(IFileRepository):
                 status=extraction.status,
                 job_id=extraction.job_id,
                 error_message=extraction.error_message,
-                extraction_metadata=extraction.extraction_metadata,
+                extraction_metadata=extraction_metadata and extraction_metadata.model_dump(mode="json"),
+                cache_key=extraction.cache_key,
                 started_at=extraction.started_at,
                 finished_at=extraction.finished_at,
             )
         )
         await self.connection.execute(query)
+        await self._notify_if_finished(extraction)
+
+    async def _notify_if_finished(self, extraction: TextExtraction) -> None:
+        # The notification is delivered to listeners only when the transaction is committed
+        if extraction.finished:
+            await self.connection.execute(select(func.pg_notify(EXTRACTION_FINISHED_CHANNEL, str(extraction.file_id))))
 
     async def delete_extraction(self, *, extraction_id: UUID) -> int:
         query = text_extractions_table.delete().where(text_extractions_table.c.id == extraction_id)
@@ -1,22 +1,40 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
-from collections.abc import AsyncIterator
-from datetime import timedelta
-from typing import Any
+from collections.abc import AsyncIterator, Iterable, Mapping
+from datetime import UTC, datetime, timedelta
+from typing import Any, ClassVar
 from uuid import UUID
 
-from sqlalchemy import JSON, Boolean, Column, DateTime, Integer, Row, String, Table
+from a2a.types import AgentCard
+from cachetools import LRUCache
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Row,
+    String,
+    Table,
+    Text,
+    cast,
+    column,
+    func,
+    values,
+)
 from sqlalchemy import UUID as SQL_UUID
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncConnection
-from sqlalchemy.sql import delete, select
+from sqlalchemy.sql import Select, delete, select
 
 from beeai_server.domain.models.provider import Provider
 from beeai_server.domain.repositories.provider import IProviderRepository
 from beeai_server.exceptions import DuplicateEntityError, EntityNotFoundError
 from beeai_server.infrastructure.persistence.repositories.db_metadata import metadata
-from beeai_server.utils.utils import utc_now
 
 providers_table = Table(
     "providers",
@@ -29,14 +47,30 @@ providers_table = Table(
     Column("created_at", DateTime(timezone=True), nullable=False),
     Column("last_active_at", DateTime(timezone=True), nullable=False),
     Column("agent_card", JSON, nullable=False),
+    # Manifest digest or ETag of the source, used by the registry sync to skip unchanged providers
+    Column("source_fingerprint", String(256), nullable=True),
+)
+
+# Hours (truncated UTC timestamps) in which each provider received at least one request
+provider_access_hours_table = Table(
+    "provider_access_hours",
+    metadata,
+    Column("provider_id", ForeignKey("providers.id", ondelete="CASCADE"), primary_key=True),
+    Column("hour", DateTime(timezone=True), primary_key=True),
+    Index("idx_provider_access_hours_hour", "hour"),
 )
 
 
 class SqlAlchemyProviderRepository(IProviderRepository):
+    # Validated agent cards shared by all repository instances in the process, keyed by provider ID. The digest of
+    # the stored card is checked on every read, so changes made by other processes are picked up as well.
+    _agent_cards: ClassVar[LRUCache[UUID, tuple[str, AgentCard]]] = LRUCache(maxsize=1000)
+
     def __init__(self, connection: AsyncConnection):
         self.connection = connection
 
     async def create(self, *, provider: Provider) -> None:
+        self._agent_cards.pop(provider.id, None)
         query = providers_table.insert().values(self._to_row(provider))
         if provider.auto_remove:
             await self.connection.execute(providers_table.delete().where(providers_table.c.id == provider.id))
@@ -46,9 +80,23 @@ class SqlAlchemyProviderRepository(IProviderRepository):
             raise DuplicateEntityError(entity="provider", field="source", value=str(provider.source.root)) from e
 
     async def update(self, *, provider: Provider) -> None:
+        self._agent_cards.pop(provider.id, None)
         query = providers_table.update().where(providers_table.c.id == provider.id).values(self._to_row(provider))
         await self.connection.execute(query)
 
+    async def update_source_fingerprints(self, *, fingerprints: Mapping[UUID, str]) -> None:
+        if not fingerprints:
+            return
+        updated = values(column("id", SQL_UUID), column("source_fingerprint", String), name="updated").data(
+            list(fingerprints.items())
+        )
+        query = (
+            providers_table.update()
+            .where(providers_table.c.id == updated.c.id)
+            .values(source_fingerprint=updated.c.source_fingerprint)
+        )
+        await self.connection.execute(query)
+
     def _to_row(self, provider: Provider) -> dict[str, Any]:
         return {
             "id": provider.id,
@@ -61,8 +109,20 @@ class SqlAlchemyProviderRepository(IProviderRepository):
             "agent_card": provider.agent_card.model_dump(mode="json"),
             "created_at": provider.created_at,
             "last_active_at": provider.last_active_at,
+            "source_fingerprint": provider.source_fingerprint,
         }
 
+    def _select(self) -> Select:
+        agent_card_digest = func.md5(cast(providers_table.c.agent_card, Text)).label("agent_card_digest")
+        return select(providers_table, agent_card_digest)
+
+    def _get_agent_card(self, row: Row) -> AgentCard:
+        if (cached := self._agent_cards.get(row.id)) and cached[0] == row.agent_card_digest:
+            return cached[1]
+        agent_card = AgentCard.model_validate(row.agent_card)
+        self._agent_cards[row.id] = (row.agent_card_digest, agent_card)
+        return agent_card
+
     def _to_provider(self, row: Row) -> Provider:
         return Provider.model_validate(
             {
@@ -75,23 +135,65 @@ class SqlAlchemyProviderRepository(IProviderRepository):
                 "auto_remove": row.auto_remove,
                 "last_active_at": row.last_active_at,
                 "created_at": row.created_at,
-                "agent_card": row.agent_card,
+                "agent_card": self._get_agent_card(row),
+                "source_fingerprint": row.source_fingerprint,
             }
         )
 
     async def get(self, *, provider_id: UUID) -> Provider:
-        query = select(providers_table).where(providers_table.c.id == provider_id)
+        query = self._select().where(providers_table.c.id == provider_id)
         result = await self.connection.execute(query)
         if not (row := result.fetchone()):
             raise EntityNotFoundError(entity="provider", id=provider_id)
 
         return self._to_provider(row)
 
-    async def update_last_accessed(self, *, provider_id: UUID) -> None:
-        query = providers_table.update().where(providers_table.c.id == provider_id).values(last_active_at=utc_now())
+    async def update_last_accessed(self, *, last_accessed: Mapping[UUID, datetime]) -> None:
+        if not last_accessed:
+            return
+        accessed = values(
+            column("id", SQL_UUID),
+            column("last_active_at", DateTime(timezone=True)),
+            column("hour", DateTime(timezone=True)),
+            name="accessed",
+        ).data(
+            [
+                (provider_id, accessed_at, accessed_at.astimezone(UTC).replace(minute=0, second=0, microsecond=0))
+                for provider_id, accessed_at in last_accessed.items()
+            ]
+        )
+        query = (
+            providers_table.update()
+            .where(providers_table.c.id == accessed.c.id)
+            .values(last_active_at=func.greatest(providers_table.c.last_active_at, accessed.c.last_active_at))
+        )
+        await self.connection.execute(query)
+
+        # Join with providers to skip providers deleted in the meantime
+        hours = select(accessed.c.id, accessed.c.hour).join(providers_table, providers_table.c.id == accessed.c.id)
+        query = (
+            insert(provider_access_hours_table)
+            .from_select(["provider_id", "hour"], hours)
+            .on_conflict_do_nothing(index_elements=["provider_id", "hour"])
+        )
         await self.connection.execute(query)
 
+    async def count_access_hours(self, *, hours: Iterable[datetime]) -> dict[UUID, int]:
+        query = (
+            select(provider_access_hours_table.c.provider_id, func.count().label("access_count"))
+            .where(provider_access_hours_table.c.hour.in_(list(hours)))
+            .group_by(provider_access_hours_table.c.provider_id)
+        )
+        result = await self.connection.execute(query)
+        return {row.provider_id: row.access_count for row in result}
+
+    async def delete_access_hours(self, *, before: datetime) -> int:
+        query = delete(provider_access_hours_table).where(provider_access_hours_table.c.hour < before)
+        result = await self.connection.execute(query)
+        return result.rowcount
+
     async def delete(self, *, provider_id: UUID) -> int:
+        self._agent_cards.pop(provider_id, None)
         query = delete(providers_table).where(providers_table.c.id == provider_id)
         result = await self.connection.execute(query)
         if not result.rowcount:
@@ -99,7 +201,7 @@ class SqlAlchemyProviderRepository(IProviderRepository):
         return result.rowcount
 
     async def list(self, *, auto_remove_filter: bool | None = None) -> AsyncIterator[Provider]:
-        query = providers_table.select()
+        query = self._select()
         if auto_remove_filter is not None:
             query = query.where(providers_table.c.auto_remove == auto_remove_filter)
         async for row in await self.connection.stream(query):
@@ -1,13 +1,21 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import base64
+import json
 from collections.abc import Sequence
+from datetime import datetime
 from enum import StrEnum
 from typing import NamedTuple
 from uuid import UUID
 
-from sqlalchemy import Column, Enum, Row, Select, func, select
+from fastapi import status
+from sqlalchemy import ClauseElement, Column, Enum, Executable, Row, Select, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.ext.compiler import compiles
+
+from beeai_server.domain.models.common import TotalCount
+from beeai_server.exceptions import PlatformError
 
 
 def sql_enum(enum: type[StrEnum], **kwargs) -> Enum:
@@ -16,8 +24,53 @@ def sql_enum(enum: type[StrEnum], **kwargs) -> Enum:
 
 class CursorPaginationResult(NamedTuple):
     items: Sequence[Row]
-    total_count: int
+    total_count: int | None
     has_more: bool
+    next_cursor: str | None = None
+
+
+def encode_cursor(order_value: datetime, id: UUID) -> str:
+    """Opaque page token carrying the (order column, id) keyset of the last row of a page."""
+    payload = json.dumps([order_value.isoformat(), str(id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        order_value, id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return datetime.fromisoformat(order_value), UUID(id)
+    except Exception as ex:
+        raise PlatformError(f"Invalid page token: {cursor}", status_code=status.HTTP_400_BAD_REQUEST) from ex
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler, **kwargs) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kwargs)}"
+
+
+async def estimate_count(connection: AsyncConnection, query: Select) -> int:
+    """Row count estimated by the query planner, it does not execute the query."""
+    plan = (await connection.execute(_Explain(query))).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def _count(connection: AsyncConnection, query: Select, total_count: TotalCount) -> int | None:
+    match total_count:
+        case TotalCount.EXACT:
+            return (await connection.execute(select(func.count()).select_from(query.subquery()))).scalar() or 0
+        case TotalCount.ESTIMATED:
+            return await estimate_count(connection, query)
+        case TotalCount.NONE:
+            return None
 
 
 async def cursor_paginate(
@@ -26,45 +79,36 @@ async def cursor_paginate(
     order_column: Column,
     id_column: Column,
     limit: int,
-    after_cursor: UUID | None = None,
+    after_cursor: str | UUID | None = None,
     order: str = "desc",
+    total_count: TotalCount = TotalCount.EXACT,
 ) -> CursorPaginationResult:
     """
-    Implements cursor-based pagination for non-unique columns.
+    Implements keyset pagination for non-unique columns.
 
-    For non-unique columns, we use a composite cursor approach:
-    - Primary cursor: the order column value
-    - Secondary cursor: the ID for tie-breaking
+    Rows are ordered by the (order column, id) pair, the id breaks ties between rows with the same value in the order
+    column. The returned next_cursor encodes this pair for the last row, so the next page is a single range scan of
+    an index on (..., order column, id) without looking up the cursor row. A bare id from older page tokens is still
+    accepted, it costs an extra lookup.
 
-    This ensures stable, consistent pagination even when multiple rows
-    have the same value in the order column.
+    Counting all matching rows is O(total rows) on every page, total_count allows to estimate or skip it.
     """
-
-    # Apply cursor filtering if after_cursor is provided
-    if after_cursor:
-        # Get the cursor row's order column value and ID
-        cursor_query = select(order_column, id_column).where(id_column == after_cursor)
-        cursor_result = await connection.execute(cursor_query)
-        cursor_row = cursor_result.fetchone()
-
-        if cursor_row:
-            cursor_order_value = cursor_row[0]  # order column value
-            cursor_id = cursor_row[1]  # ID value
-
-            if order == "desc":
-                # For descending: include rows where order_col < cursor_value
-                # OR (order_col = cursor_value AND id < cursor_id)
-                query = query.where(
-                    (order_column < cursor_order_value)
-                    | ((order_column == cursor_order_value) & (id_column < cursor_id))
-                )
-            else:
-                # For ascending: include rows where order_col > cursor_value
-                # OR (order_col = cursor_value AND id > cursor_id)
-                query = query.where(
-                    (order_column > cursor_order_value)
-                    | ((order_column == cursor_order_value) & (id_column > cursor_id))
-                )
+    cursor: tuple[datetime, UUID] | None = None
+    if isinstance(after_cursor, str):
+        try:
+            after_cursor = UUID(after_cursor)
+        except ValueError:
+            cursor = decode_cursor(after_cursor)
+    if isinstance(after_cursor, UUID):
+        cursor_result = await connection.execute(select(order_column, id_column).where(id_column == after_cursor))
+        if cursor_row := cursor_result.fetchone():
+            cursor = (cursor_row[0], cursor_row[1])
+
+    count_query = query
+    if cursor:
+        # Row value comparison is satisfied by a range scan of the composite index
+        keyset = tuple_(order_column, id_column)
+        query = query.where(keyset < tuple_(*cursor) if order == "desc" else keyset > tuple_(*cursor))
 
     # Apply ordering with tie-breaking by ID
     if order == "desc":
@@ -73,19 +117,14 @@ async def cursor_paginate(
         query = query.order_by(order_column.asc(), id_column.asc())
 
     # Fetch one more than limit to determine if there are more results
-    count_query_base = query.order_by(None)
-    query = query.limit(limit + 1)
-
-    # Execute query
-    result = await connection.execute(query)
+    result = await connection.execute(query.limit(limit + 1))
     rows = result.fetchall()
-
     has_more = len(rows) > limit
-
-    # Reset the limit and order for count query
-    count_query = select(func.count()).select_from(count_query_base.subquery())
-
-    count_result = await connection.execute(count_query)
-    total_count = count_result.scalar() or 0
-
-    return CursorPaginationResult(items=rows[:limit], total_count=total_count, has_more=has_more)
+    rows = rows[:limit]
+
+    return CursorPaginationResult(
+        items=rows,
+        total_count=await _count(connection, count_query, total_count),
+        has_more=has_more,
+        next_cursor=encode_cursor(rows[-1]._mapping[order_column], rows[-1]._mapping[id_column]) if rows else None,
+    )
@@ -7,28 +7,37 @@ from uuid import UUID
 
 from kink import inject
 from sqlalchemy import (
-    UUID as SQL_UUID,
-)
-from sqlalchemy import (
+    JSON,
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     PrimaryKeyConstraint,
     Row,
     String,
     Table,
+    Text,
     func,
     select,
 )
+from sqlalchemy import (
+    UUID as SQL_UUID,
+)
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncConnection
 
-from beeai_server.domain.models.vector_store import VectorStore, VectorStoreDocument
+from beeai_server.domain.models.vector_store import (
+    IngestionStatus,
+    VectorStore,
+    VectorStoreDocument,
+    VectorStoreIngestion,
+)
 from beeai_server.domain.repositories.vector_store import IVectorStoreRepository
 from beeai_server.exceptions import DuplicateEntityError, EntityNotFoundError
 from beeai_server.infrastructure.persistence.repositories.db_metadata import metadata
+from beeai_server.infrastructure.persistence.repositories.utils import sql_enum
 from beeai_server.utils.utils import utc_now
 
 # Main table for vector stores
@@ -56,6 +65,25 @@ vector_store_documents_table = Table(
     PrimaryKeyConstraint("id", "vector_store_id", name="vector_store_documents_pk"),
 )
 
+vector_store_ingestions_table = Table(
+    "vector_store_ingestions",
+    metadata,
+    Column("id", SQL_UUID, primary_key=True),
+    Column("vector_store_id", ForeignKey("vector_stores.id", ondelete="CASCADE"), nullable=False),
+    Column("file_ids", JSON, nullable=False),
+    Column("chunking", JSON, nullable=False),
+    Column("status", sql_enum(IngestionStatus, name="ingestion_status"), nullable=False),
+    Column("progress", JSON, nullable=False),
+    Column("job_id", String(255), nullable=True),
+    Column("error_message", Text, nullable=True),
+    Column("created_by", ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+    Column("context_id", ForeignKey("contexts.id", ondelete="CASCADE"), nullable=True),
+    Column("started_at", DateTime(timezone=True), nullable=True),
+    Column("finished_at", DateTime(timezone=True), nullable=True),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Index("idx_vector_store_ingestions_vector_store_id", "vector_store_id"),
+)
+
 
 @inject
 class SqlAlchemyVectorStoreRepository(IVectorStoreRepository):
@@ -156,7 +184,12 @@ class SqlAlchemyVectorStoreRepository(IVectorStoreRepository):
         return self._to_vector_store(row)
 
     async def delete(
-        self, *, vector_store_id: UUID | None = None, user_id: UUID | None = None, context_id: UUID | None = None
+        self,
+        *,
+        vector_store_id: UUID | None = None,
+        user_id: UUID | None = None,
+        context_id: UUID | None = None,
+        context_ids: Iterable[UUID] | None = None,
     ) -> int:
         query = vector_stores_table.delete()
 
@@ -165,6 +198,8 @@ class SqlAlchemyVectorStoreRepository(IVectorStoreRepository):
             conditions.append(vector_stores_table.c.id == vector_store_id)
         if context_id is not None:
             conditions.append(vector_stores_table.c.context_id == context_id)
+        if context_ids is not None:
+            conditions.append(vector_stores_table.c.context_id.in_(list(context_ids)))
         if user_id is not None:
             conditions.append(vector_stores_table.c.created_by == user_id)
 
@@ -221,13 +256,17 @@ class SqlAlchemyVectorStoreRepository(IVectorStoreRepository):
             ) from e
         await self.update_last_accessed(vector_store_ids={d.vector_store_id for d in documents})
 
-    async def total_usage(self, *, user_id: UUID | None = None) -> int:
+    async def total_usage(self, *, user_id: UUID | None = None, context_ids: Iterable[UUID] | None = None) -> int:
         query = select(func.coalesce(func.sum(vector_store_documents_table.c.usage_bytes), 0))
-        if user_id:
+        if user_id or context_ids is not None:
             query = query.join(
                 vector_stores_table,
                 vector_stores_table.c.id == vector_store_documents_table.c.vector_store_id,
-            ).where(vector_stores_table.c.created_by == user_id)
+            )
+        if user_id:
+            query = query.where(vector_stores_table.c.created_by == user_id)
+        if context_ids is not None:
+            query = query.where(vector_stores_table.c.context_id.in_(list(context_ids)))
         return cast(int, await self.connection.scalar(query))
 
     async def list_documents(self, *, vector_store_id: UUID) -> AsyncIterator[VectorStoreDocument]:
@@ -245,3 +284,69 @@ class SqlAlchemyVectorStoreRepository(IVectorStoreRepository):
 
         result = await self.connection.execute(query)
         return result.rowcount
+
+    def _to_ingestion(self, row: Row) -> VectorStoreIngestion:
+        return VectorStoreIngestion.model_validate(
+            {
+                "id": row.id,
+                "vector_store_id": row.vector_store_id,
+                "file_ids": row.file_ids,
+                "chunking": row.chunking,
+                "status": row.status,
+                "progress": row.progress,
+                "job_id": row.job_id,
+                "error_message": row.error_message,
+                "created_by": row.created_by,
+                "context_id": row.context_id,
+                "started_at": row.started_at,
+                "finished_at": row.finished_at,
+                "created_at": row.created_at,
+            }
+        )
+
+    async def create_ingestion(self, *, ingestion: VectorStoreIngestion) -> None:
+        query = vector_store_ingestions_table.insert().values(
+            id=ingestion.id,
+            vector_store_id=ingestion.vector_store_id,
+            file_ids=[str(file_id) for file_id in ingestion.file_ids],
+            chunking=ingestion.chunking.model_dump(mode="json"),
+            status=ingestion.status,
+            progress=ingestion.progress.model_dump(mode="json"),
+            job_id=ingestion.job_id,
+            error_message=ingestion.error_message,
+            created_by=ingestion.created_by,
+            context_id=ingestion.context_id,
+            started_at=ingestion.started_at,
+            finished_at=ingestion.finished_at,
+            created_at=ingestion.created_at,
+        )
+        await self.connection.execute(query)
+
+    async def get_ingestion(
+        self, *, ingestion_id: UUID, user_id: UUID | None = None, context_id: UUID | None = None
+    ) -> VectorStoreIngestion:
+        query = vector_store_ingestions_table.select().where(vector_store_ingestions_table.c.id == ingestion_id)
+        if user_id:
+            query = query.where(vector_store_ingestions_table.c.created_by == user_id)
+        if context_id:
+            query = query.where(vector_store_ingestions_table.c.context_id == context_id)
+
+        result = await self.connection.execute(query)
+        if not (row := result.fetchone()):
+            raise EntityNotFoundError(entity="vector_store_ingestion", id=ingestion_id)
+        return self._to_ingestion(row)
+
+    async def update_ingestion(self, *, ingestion: VectorStoreIngestion) -> None:
+        query = (
+            vector_store_ingestions_table.update()
+            .where(vector_store_ingestions_table.c.id == ingestion.id)
+            .values(
+                status=ingestion.status,
+                progress=ingestion.progress.model_dump(mode="json"),
+                job_id=ingestion.job_id,
+                error_message=ingestion.error_message,
+                started_at=ingestion.started_at,
+                finished_at=ingestion.finished_at,
+            )
+        )
+        await self.connection.execute(query)
@@ -0,0 +1,71 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import logging
+from collections.abc import AsyncIterator, Sequence
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import timedelta
+from typing import Self
+
+from pydantic import AnyUrl
+
+from beeai_server.domain.models.file import ExtractedFile
+from beeai_server.domain.repositories.file import ITextExtractionBackend
+
+logger = logging.getLogger(__name__)
+
+
+class UnsupportedDocumentError(Exception):
+    """Raised by an extraction backend that cannot handle the document, the next backend in the chain is tried."""
+
+
+class ChainTextExtractionBackend(ITextExtractionBackend):
+    """Tries the backends in order until one of them accepts the document."""
+
+    def __init__(self, backends: Sequence[ITextExtractionBackend]):
+        if not backends:
+            raise ValueError("At least one extraction backend is required")
+        self._backends = backends
+        self._exit_stack = AsyncExitStack()
+
+    @property
+    def name(self) -> str:
+        return "+".join(backend.name for backend in self._backends)
+
+    async def __aenter__(self) -> Self:
+        async with AsyncExitStack() as stack:
+            for backend in self._backends:
+                await stack.enter_async_context(backend)
+            self._exit_stack = stack.pop_all()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self._exit_stack.__aexit__(exc_type, exc, tb)
+
+    @property
+    def cache_key(self) -> str:
+        return json.dumps([json.loads(backend.cache_key) for backend in self._backends])
+
+    @asynccontextmanager
+    async def extract_text(
+        self,
+        *,
+        file_url: AnyUrl,
+        content_type: str | None = None,
+        timeout: timedelta | None = None,  # noqa: ASYNC109
+    ) -> AsyncIterator[ExtractedFile]:
+        errors = []
+        for backend in self._backends:
+            async with AsyncExitStack() as stack:
+                try:
+                    extracted_file = await stack.enter_async_context(
+                        backend.extract_text(file_url=file_url, content_type=content_type, timeout=timeout)
+                    )
+                except UnsupportedDocumentError as ex:
+                    logger.debug(f"Extraction backend {backend.name} skipped the document: {ex}")
+                    errors.append(f"{backend.name}: {ex}")
+                    continue
+                yield extracted_file
+                return
+        raise UnsupportedDocumentError(f"No extraction backend can handle the document ({'; '.join(errors)})")
@@ -1,26 +1,53 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import json
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from datetime import timedelta
+from typing import Any, ClassVar, Self
 
 from httpx import AsyncClient
 from pydantic import AnyUrl
 
 from beeai_server.configuration import DoclingExtractionConfiguration
-from beeai_server.domain.models.file import AsyncFile
+from beeai_server.domain.models.file import ExtractedFile
 from beeai_server.domain.repositories.file import ITextExtractionBackend
 from beeai_server.utils.utils import extract_string_value_stream
 
 
 class DoclingTextExtractionBackend(ITextExtractionBackend):
+    _conversion_options: ClassVar[dict[str, Any]] = {"to_formats": ["md"], "image_export_mode": "placeholder"}
+
     def __init__(self, config: DoclingExtractionConfiguration):
         self._config = config
         self._enabled = config.enabled
 
+    @property
+    def name(self) -> str:
+        return self._config.backend
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        pass
+
+    @property
+    def cache_key(self) -> str:
+        return json.dumps(
+            {"backend": self.name, "version": self._config.version, "options": self._conversion_options},
+            sort_keys=True,
+        )
+
     @asynccontextmanager
-    async def extract_text(self, *, file_url: AnyUrl, timeout: timedelta | None = None) -> AsyncIterator[AsyncFile]:  # noqa: ASYNC109
+    async def extract_text(
+        self,
+        *,
+        file_url: AnyUrl,
+        content_type: str | None = None,
+        timeout: timedelta | None = None,  # noqa: ASYNC109
+    ) -> AsyncIterator[ExtractedFile]:
         if not self._enabled:
             raise RuntimeError(
                 "Docling extraction backend is not enabled, please check the documentation how to enable it"
@@ -33,11 +60,7 @@ class DoclingTextExtractionBackend(ITextExtractionBackend):
                 "POST",
                 "/v1/convert/source",
                 json={
-                    "options": {
-                        "to_formats": ["md"],
-                        "document_timeout": timeout.total_seconds(),
-                        "image_export_mode": "placeholder",
-                    },
+                    "options": {**self._conversion_options, "document_timeout": timeout.total_seconds()},
                     "sources": [{"kind": "http", "url": str(file_url)}],
                 },
             ) as response,
@@ -54,9 +77,10 @@ class DoclingTextExtractionBackend(ITextExtractionBackend):
                     return text_chunk.encode("utf-8")
                 return b""
 
-            yield AsyncFile(
+            yield ExtractedFile(
                 filename="extracted_text.md",
                 content_type="text/markdown",
                 read=read,
                 size=None,  # size is unknown beforehand
+                backend=self.name,
             )
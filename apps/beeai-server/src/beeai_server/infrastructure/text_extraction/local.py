@@ -0,0 +1,219 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import json
+import multiprocessing
+import re
+import zipfile
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from html.parser import HTMLParser
+from io import BytesIO
+from typing import ClassVar, Self
+from xml.etree import ElementTree
+
+from httpx import AsyncClient
+from pydantic import AnyUrl
+
+from beeai_server.configuration import DoclingExtractionConfiguration
+from beeai_server.domain.models.file import ExtractedFile
+from beeai_server.domain.repositories.file import ITextExtractionBackend
+from beeai_server.infrastructure.text_extraction.chain import UnsupportedDocumentError
+
+# Parsers run in worker processes, they must be module level functions taking and returning picklable values
+
+
+class _HtmlToMarkdownParser(HTMLParser):
+    _skipped_tags: ClassVar[set[str]] = {"script", "style", "head", "noscript", "template", "svg"}
+    _block_tags: ClassVar[set[str]] = {
+        "p", "div", "section", "article", "header", "footer", "main", "aside", "nav", "ul", "ol", "table", "tr",
+        "blockquote", "pre", "form", "br", "hr",
+    }  # fmt: skip
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.lines: list[str] = []
+        self._line: list[str] = []
+        self._skip_depth = 0
+
+    def _flush(self) -> None:
+        if line := " ".join("".join(self._line).split()):
+            self.lines.append(line)
+        self._line = []
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag in self._skipped_tags:
+            self._skip_depth += 1
+        elif tag in self._block_tags:
+            self._flush()
+        elif tag == "li":
+            self._flush()
+            self._line.append("- ")
+        elif re.fullmatch(r"h[1-6]", tag):
+            self._flush()
+            self._line.append("#" * int(tag[1]) + " ")
+        elif tag in {"td", "th"}:
+            self._line.append(" | ")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self._skipped_tags:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+        elif tag in self._block_tags or tag == "li" or re.fullmatch(r"h[1-6]", tag):
+            self._flush()
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self._line.append(data)
+
+
+def extract_html(content: bytes) -> str:
+    parser = _HtmlToMarkdownParser()
+    parser.feed(content.decode("utf-8", errors="replace"))
+    parser.close()
+    parser._flush()
+    return "\n\n".join(parser.lines)
+
+
+_WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+# Limit of the decompressed document body, the download size limit does not protect against zip bombs
+_MAX_DOCX_DOCUMENT_SIZE = 100 * 1024 * 1024
+
+
+def extract_docx(content: bytes) -> str:
+    with zipfile.ZipFile(BytesIO(content)) as archive:
+        if archive.getinfo("word/document.xml").file_size > _MAX_DOCX_DOCUMENT_SIZE:
+            raise ValueError(f"Document body is larger than {_MAX_DOCX_DOCUMENT_SIZE} bytes")
+        # The declared size can be forged, the read is bounded as well
+        with archive.open("word/document.xml") as document_file:
+            document_xml = document_file.read(_MAX_DOCX_DOCUMENT_SIZE + 1)
+        if len(document_xml) > _MAX_DOCX_DOCUMENT_SIZE:
+            raise ValueError(f"Document body is larger than {_MAX_DOCX_DOCUMENT_SIZE} bytes")
+        document = ElementTree.fromstring(document_xml)
+
+    paragraphs = []
+    for paragraph in document.iter(f"{_WORD_NAMESPACE}p"):
+        text = []
+        for element in paragraph.iter():
+            if element.tag == f"{_WORD_NAMESPACE}t":
+                text.append(element.text or "")
+            elif element.tag == f"{_WORD_NAMESPACE}tab":
+                text.append("\t")
+            elif element.tag in {f"{_WORD_NAMESPACE}br", f"{_WORD_NAMESPACE}cr"}:
+                text.append("\n")
+        if not (line := "".join(text).strip()):
+            continue
+
+        style = paragraph.find(f"{_WORD_NAMESPACE}pPr/{_WORD_NAMESPACE}pStyle")
+        style_name = style.get(f"{_WORD_NAMESPACE}val", "") if style is not None else ""
+        if style_name == "Title":
+            line = f"# {line}"
+        elif heading := re.fullmatch(r"Heading([1-6])", style_name):
+            line = f"{'#' * int(heading.group(1))} {line}"
+        elif paragraph.find(f"{_WORD_NAMESPACE}pPr/{_WORD_NAMESPACE}numPr") is not None:
+            line = f"- {line}"
+        paragraphs.append(line)
+    return "\n\n".join(paragraphs)
+
+
+PARSERS: dict[str, Callable[[bytes], str]] = {
+    "text/html": extract_html,
+    "application/xhtml+xml": extract_html,
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": extract_docx,
+}
+
+
+class LocalTextExtractionBackend(ITextExtractionBackend):
+    """
+    Extracts text from simple document formats in a process pool, without a round-trip to docling.
+
+    Documents which are not supported, too large or do not contain any text are left to the next backend.
+    """
+
+    version: ClassVar[str] = "1"  # bump when the parsers change to invalidate cached extractions
+
+    def __init__(self, config: DoclingExtractionConfiguration):
+        self._enabled = config.local_extraction_enabled
+        self._max_workers = config.local_max_workers
+        self._max_file_size = config.local_max_file_size_bytes
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def name(self) -> str:
+        return "local"
+
+    @property
+    def cache_key(self) -> str:
+        return json.dumps({"backend": self.name, "version": self.version}, sort_keys=True)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if not self._executor:
+            # Forking a process running an event loop with threads is not safe
+            self._executor = ProcessPoolExecutor(self._max_workers, mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if executor := self._executor:
+            self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _download(self, file_url: AnyUrl, timeout: timedelta) -> bytes:  # noqa: ASYNC109
+        content = bytearray()
+        async with (
+            AsyncClient(timeout=timeout.total_seconds()) as client,
+            client.stream("GET", str(file_url)) as response,
+        ):
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                content.extend(chunk)
+                if len(content) > self._max_file_size:
+                    raise UnsupportedDocumentError(f"Document is larger than {self._max_file_size} bytes")
+        return bytes(content)
+
+    @asynccontextmanager
+    async def extract_text(
+        self,
+        *,
+        file_url: AnyUrl,
+        content_type: str | None = None,
+        timeout: timedelta | None = None,  # noqa: ASYNC109
+    ) -> AsyncIterator[ExtractedFile]:
+        media_type = (content_type or "").split(";")[0].strip().lower()
+        if not self._enabled or not (parser := PARSERS.get(media_type)):
+            raise UnsupportedDocumentError(f"Content type {content_type} is not supported")
+
+        timeout = timeout or timedelta(minutes=5)
+        async with asyncio.timeout(timeout.total_seconds()):
+            content = await self._download(file_url, timeout)
+            executor = self._get_executor()
+            try:
+                text = await asyncio.get_running_loop().run_in_executor(executor, parser, content)
+            except BrokenProcessPool as ex:
+                # A worker died (e.g. killed by the OOM killer), the pool is unusable and is replaced on the next call
+                if self._executor is executor:
+                    self._executor = None
+                    executor.shutdown(wait=False, cancel_futures=True)
+                raise UnsupportedDocumentError(f"Parser worker process terminated abruptly: {ex!r}") from ex
+            except Exception as ex:
+                raise UnsupportedDocumentError(f"Failed to parse the document: {ex!r}") from ex
+        if not text.strip():
+            raise UnsupportedDocumentError("Document does not contain any text")
+
+        buffer = BytesIO(text.encode("utf-8"))
+
+        async def read(size: int = -1) -> bytes:
+            return buffer.read(size)
+
+        yield ExtractedFile(
+            filename="extracted_text.md",
+            content_type="text/markdown",
+            read=read,
+            size=buffer.getbuffer().nbytes,
+            backend=self.name,
+        )
@@ -10,13 +10,12 @@ import httpx
 from a2a.utils import AGENT_CARD_WELL_KNOWN_PATH
 from kink import inject
 from procrastinate import Blueprint
-from pydantic import RootModel
 
 from beeai_server import get_configuration
-from beeai_server.configuration import Configuration
-from beeai_server.domain.models.provider import ProviderLocation
 from beeai_server.exceptions import EntityNotFoundError
+from beeai_server.service_layer.services.keep_warm import KeepWarmService
 from beeai_server.service_layer.services.provider import ProviderService
+from beeai_server.service_layer.services.registry import RegistrySyncService
 from beeai_server.service_layer.unit_of_work import IUnitOfWorkFactory
 from beeai_server.utils.utils import extract_messages
 
@@ -32,71 +31,28 @@ async def scale_down_providers(timestamp: int, service: ProviderService):
     await service.scale_down_providers()
 
 
-# TODO: Can't use DI here because it's not initialized yet
-@blueprint.periodic(cron=get_configuration().agent_registry.sync_period_cron)
-@blueprint.task(queueing_lock="check_registry", queue="cron:provider")
+@blueprint.periodic(cron="*/1 * * * *")
+@blueprint.task(queueing_lock="warm_providers", queue="cron:provider")
 @inject
-async def check_registry(timestamp: int, configuration: Configuration, provider_service: ProviderService):
-    if not configuration.agent_registry.locations:
-        return
+async def warm_providers(timestamp: int, service: KeepWarmService):
+    if started := await service.warm_providers():
+        logger.info(f"Pre-warmed providers: {started}")
 
-    registry_by_provider_id = {}
-    desired_providers = {}
-    errors = []
 
-    try:
-        await provider_service.remove_orphaned_providers()
-    except Exception as ex:
-        errors.extend(ex.exceptions if isinstance(ex, ExceptionGroup) else [ex])
+@blueprint.periodic(cron="15 3 * * *")
+@blueprint.task(queueing_lock="remove_old_provider_access_history", queue="cron:provider")
+@inject
+async def remove_old_provider_access_history(timestamp: int, service: KeepWarmService):
+    deleted = await service.remove_old_access_history()
+    logger.info(f"Deleted {deleted} provider access history entries")
 
-    for registry in configuration.agent_registry.locations.values():
-        for provider_location in await registry.load():
-            try:
-                provider_id = RootModel[ProviderLocation](root=provider_location).root.provider_id
-                desired_providers[provider_id] = provider_location
-                registry_by_provider_id[provider_id] = registry
-            except ValueError as e:
-                errors.append(e)
-
-    managed_providers = {
-        provider.id: provider for provider in await provider_service.list_providers() if provider.registry
-    }
-
-    new_providers = desired_providers.keys() - managed_providers.keys()
-    old_providers = managed_providers.keys() - desired_providers.keys()
-    existing_providers = managed_providers.keys() & desired_providers.keys()
-
-    # Remove old providers - to prevent agent name collisions
-    for provider_id in old_providers:
-        provider = managed_providers[provider_id]
-        try:
-            await provider_service.delete_provider(provider_id=provider.id)
-            logger.info(f"Removed provider {provider.source}")
-        except Exception as ex:
-            errors.append(RuntimeError(f"[{provider.source}]: Failed to remove provider: {ex}"))
-
-    for provider_id in new_providers:
-        provider_location = desired_providers[provider_id]
-        try:
-            await provider_service.create_provider(
-                location=provider_location,
-                registry=registry_by_provider_id[provider_id],
-            )
-            logger.info(f"Added provider {provider_location}")
-        except Exception as ex:
-            errors.append(RuntimeError(f"[{provider_location}]: Failed to add provider: {ex}"))
-
-    for provider_id in existing_providers:
-        provider_location = desired_providers[provider_id]
-        try:
-            result = await provider_service.upgrade_provider(provider_id=provider_id, location=provider_location)
-            if managed_providers[provider_id].source.root != result.source.root:
-                logger.info(f"Upgraded provider {provider_location}")
-        except Exception as ex:
-            errors.append(RuntimeError(f"[{provider_location}]: Failed to add provider: {ex}"))
-
-    if errors:
-        raise ExceptionGroup("Exceptions occurred when reloading providers", errors)
+
+# TODO: Can't use DI here because it's not initialized yet
+@blueprint.periodic(cron=get_configuration().agent_registry.sync_period_cron)
+@blueprint.task(queueing_lock="check_registry", queue="cron:provider")
+@inject
+async def check_registry(timestamp: int, service: RegistrySyncService):
+    await service.sync()
 
 
 if get_configuration().provider.auto_remove_enabled:
@@ -0,0 +1,156 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+import procrastinate
+from opentelemetry.metrics import CallbackOptions, Meter, Observation, get_meter
+
+from beeai_server.telemetry import INSTRUMENTATION_NAME
+
+logger = logging.getLogger(__name__)
+
+# Jobs ready to run (todo) or running (doing) per queue, jobs scheduled in the future are not counted
+QUEUE_DEPTH_QUERY = """
+SELECT
+    j.queue_name,
+    j.status::text AS status,
+    count(*) AS jobs,
+    max(extract(epoch FROM now() - greatest(d.at, j.scheduled_at))) FILTER (WHERE j.status = 'todo') AS oldest_age
+FROM procrastinate_jobs j
+LEFT JOIN LATERAL (
+    SELECT e.at FROM procrastinate_events e
+    WHERE e.job_id = j.id AND e.type IN ('deferred', 'deferred_for_retry', 'retried')
+    ORDER BY e.id DESC
+    LIMIT 1
+) d ON true
+WHERE j.queue_name = ANY(%(queues)s)
+  AND (j.status = 'doing' OR (j.status = 'todo' AND (j.scheduled_at IS NULL OR j.scheduled_at <= now())))
+GROUP BY j.queue_name, j.status
+"""
+
+# Time between the job becoming ready and its start (started events) and the duration of a job run (other events)
+JOB_EVENTS_QUERY = """
+SELECT
+    e.id,
+    j.queue_name,
+    e.type::text AS type,
+    extract(epoch FROM e.at - CASE WHEN e.type = 'started' THEN greatest(p.at, j.scheduled_at) ELSE p.at END)
+        AS elapsed
+FROM procrastinate_events e
+JOIN procrastinate_jobs j ON j.id = e.job_id
+JOIN LATERAL (
+    SELECT prev.at FROM procrastinate_events prev
+    WHERE prev.job_id = e.job_id
+      AND prev.id < e.id
+      AND prev.type IN ('deferred', 'deferred_for_retry', 'retried', 'started')
+      AND (prev.type = 'started') = (e.type <> 'started')
+    ORDER BY prev.id DESC
+    LIMIT 1
+) p ON true
+WHERE e.id > %(after_id)s
+  AND e.type IN ('started', 'succeeded', 'failed', 'aborted', 'deferred_for_retry')
+  AND j.queue_name = ANY(%(queues)s)
+ORDER BY e.id
+LIMIT %(limit)s
+"""
+
+LAST_EVENT_ID_QUERY = "SELECT coalesce(max(id), 0) AS id FROM procrastinate_events"
+
+JOB_STATUS_BY_EVENT = {
+    "succeeded": "succeeded",
+    "failed": "failed",
+    "aborted": "aborted",
+    "deferred_for_retry": "retry",
+}
+
+
+class JobQueueMetrics:
+    """
+    Periodically samples the procrastinate tables and reports per-queue metrics:
+      - job_queue_depth: number of todo (ready to run) and doing jobs
+      - job_queue_oldest_age_seconds: how long the oldest ready job has been waiting
+      - job_wait_seconds: time between a job becoming ready and its start
+      - job_duration_seconds: duration of job runs by outcome
+
+    Each process should report metrics only for the queues it processes, otherwise the histograms are duplicated.
+    """
+
+    def __init__(
+        self,
+        app: procrastinate.App,
+        queues: Iterable[str],
+        interval_sec: float = 30,
+        batch_size: int = 1000,
+        meter: Meter | None = None,
+    ):
+        self._app = app
+        self._queues = sorted(queues)
+        self._interval_sec = interval_sec
+        self._batch_size = batch_size
+        self._last_event_id: int | None = None
+        self._depth: dict[tuple[str, str], int] = {}
+        self._oldest_age: dict[str, float] = {}
+
+        meter = meter or get_meter(INSTRUMENTATION_NAME)
+        meter.create_observable_gauge("job_queue_depth", callbacks=[self._observe_depth])
+        meter.create_observable_gauge("job_queue_oldest_age_seconds", callbacks=[self._observe_oldest_age], unit="s")
+        self._wait_histogram = meter.create_histogram("job_wait_seconds", unit="s")
+        self._duration_histogram = meter.create_histogram("job_duration_seconds", unit="s")
+
+    def _observe_depth(self, options: CallbackOptions) -> Iterable[Observation]:
+        for (queue, status), jobs in self._depth.items():
+            yield Observation(value=jobs, attributes={"queue": queue, "status": status})
+
+    def _observe_oldest_age(self, options: CallbackOptions) -> Iterable[Observation]:
+        for queue, age in self._oldest_age.items():
+            yield Observation(value=age, attributes={"queue": queue})
+
+    async def _query(self, query: str, **arguments: Any) -> list[dict[str, Any]]:
+        return await self._app.connector.execute_query_all_async(query, **arguments)  # pyright: ignore [reportArgumentType]
+
+    async def collect(self) -> None:
+        depth = {(queue, status): 0 for queue in self._queues for status in ("todo", "doing")}
+        oldest_age = dict.fromkeys(self._queues, 0.0)
+        for row in await self._query(QUEUE_DEPTH_QUERY, queues=self._queues):
+            depth[row["queue_name"], row["status"]] = row["jobs"]
+            if row["oldest_age"] is not None:
+                oldest_age[row["queue_name"]] = max(float(row["oldest_age"]), 0.0)
+        self._depth, self._oldest_age = depth, oldest_age
+
+        if self._last_event_id is None:
+            # Do not replay the whole job history on startup
+            [row] = await self._query(LAST_EVENT_ID_QUERY)
+            self._last_event_id = row["id"]
+            return
+
+        while rows := await self._query(
+            JOB_EVENTS_QUERY, queues=self._queues, after_id=self._last_event_id, limit=self._batch_size
+        ):
+            for row in rows:
+                self._record_event(row)
+            self._last_event_id = rows[-1]["id"]
+            if len(rows) < self._batch_size:
+                break
+
+    def _record_event(self, row: dict[str, Any]) -> None:
+        if row["elapsed"] is None:
+            return
+        elapsed = max(float(row["elapsed"]), 0.0)
+        if row["type"] == "started":
+            self._wait_histogram.record(elapsed, attributes={"queue": row["queue_name"]})
+        else:
+            self._duration_histogram.record(
+                elapsed, attributes={"queue": row["queue_name"], "status": JOB_STATUS_BY_EVENT[row["type"]]}
+            )
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.collect()
+            except Exception as ex:
+                logger.warning(f"Failed to collect job queue metrics: {ex!r}")
+            await asyncio.sleep(self._interval_sec)
@@ -12,6 +12,7 @@ from beeai_server.jobs.crons.provider import blueprint as provider_crons
 from beeai_server.jobs.tasks.context import blueprint as context_tasks
 from beeai_server.jobs.tasks.file import blueprint as file_tasks
 from beeai_server.jobs.tasks.mcp import blueprint as mcp_tasks
+from beeai_server.jobs.tasks.vector_store import blueprint as vector_store_tasks
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,7 @@ def create_app(configuration: Configuration) -> procrastinate.App:
     app.add_tasks_from(blueprint=file_tasks, namespace="text_extraction")
     app.add_tasks_from(blueprint=mcp_tasks, namespace="toolkit_deletion")
     app.add_tasks_from(blueprint=context_tasks, namespace="context_tasks")
+    app.add_tasks_from(blueprint=vector_store_tasks, namespace="vector_store_ingestion")
     app.add_tasks_from(blueprint=provider_crons, namespace="cron_provider")
     app.add_tasks_from(blueprint=cleanup_crons, namespace="cron_cleanup")
     return app
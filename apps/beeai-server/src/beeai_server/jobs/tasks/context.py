@@ -15,3 +15,9 @@ blueprint = Blueprint()
 @inject
 async def generate_conversation_title(context_id: str, context_service: ContextService):
     await context_service.generate_conversation_title(context_id=UUID(context_id))
+
+
+@blueprint.task(queue="context_history_compaction")
+@inject
+async def compact_context_history(context_id: str, context_service: ContextService):
+    await context_service.compact_history(context_id=UUID(context_id))
@@ -0,0 +1,17 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from uuid import UUID
+
+from kink import inject
+from procrastinate import Blueprint, JobContext
+
+from beeai_server.service_layer.services.vector_stores import VectorStoreService
+
+blueprint = Blueprint()
+
+
+@blueprint.task(queue="vector_store_ingestion", pass_context=True)
+@inject
+async def ingest_files(context: JobContext, ingestion_id: str, vector_store_service: VectorStoreService):
+    await vector_store_service.ingest(ingestion_id=UUID(ingestion_id), job_id=str(context.job.id))
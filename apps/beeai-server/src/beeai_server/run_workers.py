@@ -3,32 +3,100 @@
 
 import asyncio
 import logging
+import signal
+from collections.abc import Iterable
 from contextlib import asynccontextmanager
 
 import procrastinate
-from kink import inject
+from kink import di, inject
+
+from beeai_server.bootstrap import bootstrap_dependencies
+from beeai_server.configuration import Configuration, JobsConfiguration
+from beeai_server.domain.repositories.file import ITextExtractionBackend
+from beeai_server.domain.repositories.notifications import INotificationListener
+from beeai_server.jobs.metrics import JobQueueMetrics
+from beeai_server.service_layer.deployment_manager import IProviderDeploymentManager
+from beeai_server.telemetry import shutdown_telemetry
 
 logger = logging.getLogger(__name__)
 
+BUILTIN_QUEUE = "builtin"
+
+
+def resolve_queue_concurrency(
+    app: procrastinate.App, configuration: JobsConfiguration, queues: Iterable[str] | None = None
+) -> dict[str, int]:
+    """Concurrency of each selected queue, None selects all configured queues and queues of registered tasks."""
+    known_queues = {task.queue for task in app.tasks.values() if task.queue != BUILTIN_QUEUE}
+    known_queues |= configuration.queue_concurrency.keys()
+    selected_queues = known_queues if queues is None else set(queues)
+    if unknown_queues := selected_queues - known_queues:
+        raise ValueError(f"Unknown queues: {sorted(unknown_queues)}, available queues: {sorted(known_queues)}")
+    return {
+        queue: configuration.queue_concurrency.get(queue, configuration.default_concurrency)
+        for queue in sorted(selected_queues)
+    }
+
 
 @asynccontextmanager
 @inject
-async def run_workers(app: procrastinate.App):
-    worker = asyncio.create_task(
-        app.run_worker_async(
-            install_signal_handlers=False,
-            concurrency=10,  # TODO finetune per-queue concurrency
+async def run_workers(app: procrastinate.App, configuration: Configuration, queues: Iterable[str] | None = None):
+    """Run a worker for each selected queue, so that a burst of jobs in one queue does not starve the others."""
+    queue_concurrency = resolve_queue_concurrency(app, configuration.jobs, queues)
+    if not queue_concurrency:
+        logger.info("No queues selected, procrastinate workers are disabled in this process")
+        yield
+        return
+
+    workers = [
+        asyncio.create_task(
+            app.run_worker_async(
+                queues=[queue],
+                concurrency=concurrency,
+                name=f"worker-{queue}",
+                install_signal_handlers=False,
+            )
         )
+        for queue, concurrency in queue_concurrency.items()
+    ]
+    metrics = JobQueueMetrics(
+        app, queues=queue_concurrency.keys(), interval_sec=configuration.jobs.metrics_interval_sec
     )
-    logger.info(f"Starting procrastinate workers for tasks: {app.tasks.keys()}")
+    metrics_task = asyncio.create_task(metrics.run())
+    logger.info(f"Starting procrastinate workers for queues: {queue_concurrency}")
     try:
         yield
     finally:
         logger.info("Stopping procrastinate workers")
-        worker.cancel()
-        try:
-            await asyncio.wait_for(worker, timeout=10)
-        except TimeoutError:
+        metrics_task.cancel()
+        for worker in workers:
+            worker.cancel()
+        _, pending = await asyncio.wait(workers, timeout=10)
+        if pending:
             logger.info("Procrastinate workers did not terminate gracefully")
-        except asyncio.CancelledError:
+        else:
             logger.info("Procrastinate workers did terminate successfully")
+
+
+async def run_standalone_workers(queues: Iterable[str] | None = None):
+    """Entrypoint for dedicated worker processes, runs until SIGINT or SIGTERM."""
+    await bootstrap_dependencies()
+    app = di[procrastinate.App]
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        # Jobs can wait for notifications, e.g. ingestion waiting for text extraction
+        async with (
+            app.open_async(),
+            di[INotificationListener],
+            di[IProviderDeploymentManager],
+            di[ITextExtractionBackend],
+            run_workers(app=app, queues=queues),
+        ):
+            await stop.wait()
+    finally:
+        shutdown_telemetry()
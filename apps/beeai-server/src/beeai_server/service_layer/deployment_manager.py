@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from datetime import timedelta
-from typing import Protocol
+from typing import Protocol, Self
 from uuid import UUID
 
 from kink import inject
@@ -24,10 +24,17 @@ def global_provider_variables(configuration: Configuration):
 
 
 class IProviderDeploymentManager(Protocol):
+    async def __aenter__(self) -> Self: ...
+    async def __aexit__(self, exc_type, exc, tb) -> None: ...
     async def create_or_replace(self, *, provider: Provider, env: dict[str, str] | None = None) -> bool: ...
     async def delete(self, *, provider_id: UUID) -> None: ...
     async def remove_orphaned_providers(self, existing_providers: list[UUID]) -> None: ...
     async def state(self, *, provider_ids: list[UUID]) -> list[ProviderDeploymentState]: ...
+    async def replicas(self, *, provider_ids: list[UUID]) -> list[int | None]:
+        """Desired number of replicas of the provider deployments, None for missing deployments."""
+        ...
+
+    async def scale(self, *, provider_id: UUID, replicas: int) -> None: ...
     async def scale_down(self, *, provider_id: UUID) -> None: ...
     async def scale_up(self, *, provider_id: UUID) -> None: ...
     async def wait_for_startup(self, *, provider_id: UUID, timeout: timedelta) -> None: ...  # noqa: ASYNC109 (the timeout actually corresponds to kubernetes timeout)
@@ -1,23 +1,38 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
 import functools
 import logging
-from collections.abc import AsyncIterable
-from contextlib import AsyncExitStack
-from datetime import timedelta
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from typing import Any, NamedTuple, cast
 from uuid import UUID
 
 import httpx
 from httpx import AsyncByteStream
 from kink import inject
+from opentelemetry.metrics import Meter, get_meter
 from structlog.contextvars import bind_contextvars, unbind_contextvars
 
-from beeai_server.configuration import Configuration
-from beeai_server.domain.models.provider import ProviderDeploymentState
+from beeai_server.configuration import (
+    A2AProxyConfiguration,
+    AdmissionControlConfiguration,
+    AdmissionLimits,
+    Configuration,
+)
+from beeai_server.domain.models.provider import Provider, ProviderDeploymentState
+from beeai_server.domain.models.user import User
+from beeai_server.domain.repositories.env import EnvStoreEntity
+from beeai_server.exceptions import ProviderOverloadedError
 from beeai_server.service_layer.deployment_manager import IProviderDeploymentManager
 from beeai_server.service_layer.services.users import UserService
 from beeai_server.service_layer.unit_of_work import IUnitOfWorkFactory
+from beeai_server.telemetry import INSTRUMENTATION_NAME
+from beeai_server.utils.utils import cancel_task, utc_now
 
 logger = logging.getLogger(__name__)
 
@@ -30,9 +45,222 @@ class A2AServerResponse(NamedTuple):
     media_type: str
 
 
+@dataclass
+class PooledClient:
+    client: httpx.AsyncClient
+    base_url: str
+    last_used: float
+    active_requests: int = 0
+    peak_requests: int = 0
+    evicted: bool = False
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[httpx.AsyncClient]:
+        self.active_requests += 1
+        self.peak_requests = max(self.peak_requests, self.active_requests)
+        try:
+            yield self.client
+        finally:
+            self.active_requests -= 1
+            self.last_used = time.monotonic()
+            if self.evicted and not self.active_requests:
+                await self.client.aclose()
+
+
+class ProviderClientPool:
+    """
+    One long-lived httpx client per provider, so that proxied requests reuse keep-alive connections to the agent.
+
+    Clients which were not used for longer than the idle timeout are closed by the next lookup. A client which fails
+    to connect is evicted, the provider was most likely scaled to zero or removed (possibly by another process) and
+    the next request creates a new client.
+    """
+
+    def __init__(self, config: A2AProxyConfiguration):
+        self._config = config
+        self._clients: dict[UUID, PooledClient] = {}
+        self._lock = asyncio.Lock()
+
+    def _create_client(self, base_url: str, http2: bool) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=base_url,
+            timeout=None,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=self._config.max_connections_per_provider,
+                max_keepalive_connections=self._config.max_keepalive_connections_per_provider,
+                keepalive_expiry=self._config.keepalive_expiry_sec,
+            ),
+        )
+
+    async def get(self, *, provider_id: UUID, base_url: str, http2: bool = False) -> PooledClient:
+        async with self._lock:
+            now = time.monotonic()
+            idle = [
+                pid
+                for pid, pooled in self._clients.items()
+                if not pooled.active_requests and now - pooled.last_used > self._config.client_idle_timeout_sec
+            ]
+            if (pooled := self._clients.get(provider_id)) and pooled.base_url != base_url:
+                idle.append(provider_id)
+            for pid in idle:
+                pooled = self._clients.pop(pid)
+                pooled.evicted = True
+                if not pooled.active_requests:
+                    await pooled.client.aclose()
+            if provider_id not in self._clients:
+                self._clients[provider_id] = PooledClient(
+                    client=self._create_client(base_url, http2), base_url=base_url, last_used=now
+                )
+            return self._clients[provider_id]
+
+    @asynccontextmanager
+    async def lease(self, *, provider_id: UUID, base_url: str, http2: bool = False) -> AsyncIterator[httpx.AsyncClient]:
+        """Client of the provider held for a single request, it is not evicted while the request is in flight."""
+        pooled = await self.get(provider_id=provider_id, base_url=base_url, http2=http2)
+        try:
+            async with pooled.lease() as client:
+                yield client
+        except httpx.ConnectError:
+            await self._evict(provider_id, pooled)
+            raise
+
+    async def _evict(self, provider_id: UUID, pooled: PooledClient) -> None:
+        """Remove the client from the pool, it is closed once the requests in flight finish."""
+        async with self._lock:
+            if self._clients.get(provider_id) is pooled:
+                del self._clients[provider_id]
+            pooled.evicted = True
+            if not pooled.active_requests:
+                await pooled.client.aclose()
+
+    async def remove(self, *, provider_id: UUID) -> None:
+        if pooled := self._clients.get(provider_id):
+            await self._evict(provider_id, pooled)
+
+    def take_in_flight_requests(self) -> dict[UUID, int]:
+        """Peak number of concurrent requests per provider since the previous call."""
+        in_flight = {provider_id: pooled.peak_requests for provider_id, pooled in self._clients.items()}
+        for pooled in self._clients.values():
+            pooled.peak_requests = pooled.active_requests
+        return in_flight
+
+    async def close(self) -> None:
+        async with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+            for pooled in clients:
+                await pooled.client.aclose()
+
+
+@dataclass
+class AdmissionQueue:
+    in_flight: int = 0
+    queued: int = 0
+    waiters: OrderedDict[UUID, deque[asyncio.Future[None]]] = field(default_factory=OrderedDict)
+
+
+class ProviderAdmissionController:
+    """
+    Limits the number of concurrent requests forwarded to a provider.
+
+    Requests over the limit wait in a queue of the provider until a running request finishes. Queued requests are
+    admitted round-robin across users, so that a single user cannot starve the others. When the queue is full or the
+    request waits longer than the queue timeout, it is rejected with 503 and a Retry-After header.
+    """
+
+    def __init__(self, config: AdmissionControlConfiguration, meter: Meter):
+        self._config = config
+        self._queues: dict[UUID, AdmissionQueue] = {}
+        self._queue_wait = meter.create_histogram("a2a_proxy_queue_wait_seconds", unit="s")
+        self._rejected = meter.create_counter("a2a_proxy_rejected_requests")
+
+    def _get_limits(self, provider: Provider) -> AdmissionLimits:
+        return (
+            self._config.providers.get(str(provider.id))
+            or self._config.providers.get(str(provider.source.root))
+            or self._config
+        )
+
+    def _reject(self, provider: Provider, reason: str) -> ProviderOverloadedError:
+        self._rejected.add(1, {"reason": reason})
+        return ProviderOverloadedError(provider_id=provider.id, retry_after_sec=self._config.retry_after_sec)
+
+    def _release(self, provider_id: UUID, queue: AdmissionQueue) -> None:
+        while queue.waiters:
+            # The slot is handed over to the next user in the round, the user goes to the end of the round
+            user_id, waiters = next(iter(queue.waiters.items()))
+            waiter = waiters.popleft()
+            queue.queued -= 1
+            if waiters:
+                queue.waiters.move_to_end(user_id)
+            else:
+                del queue.waiters[user_id]
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        queue.in_flight -= 1
+        if not queue.in_flight:
+            self._queues.pop(provider_id, None)
+
+    async def _wait(self, provider: Provider, user_id: UUID, queue: AdmissionQueue) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        queue.waiters.setdefault(user_id, deque()).append(waiter)
+        queue.queued += 1
+        try:
+            async with asyncio.timeout(self._config.queue_timeout_sec):
+                await waiter
+        except BaseException as ex:
+            if waiter.done() and not waiter.cancelled():
+                self._release(provider.id, queue)  # admitted in the meantime, pass the slot on
+            else:
+                waiter.cancel()
+                # The cancelled waiter may have been dequeued already by a release in the same iteration
+                waiters = queue.waiters.get(user_id)
+                if waiters is not None and waiter in waiters:
+                    waiters.remove(waiter)
+                    queue.queued -= 1
+                    if not waiters:
+                        del queue.waiters[user_id]
+            if isinstance(ex, TimeoutError):
+                raise self._reject(provider, "queue_timeout") from ex
+            raise
+
+    @asynccontextmanager
+    async def admit(self, *, provider: Provider, user_id: UUID) -> AsyncIterator[None]:
+        if not self._config.enabled:
+            yield
+            return
+
+        limits = self._get_limits(provider)
+        queue = self._queues.setdefault(provider.id, AdmissionQueue())
+        start = time.monotonic()
+        if queue.in_flight < limits.max_in_flight_requests and not queue.queued:
+            queue.in_flight += 1
+        elif queue.queued >= limits.max_queued_requests:
+            raise self._reject(provider, "queue_full")
+        else:
+            outcome = "error"
+            try:
+                await self._wait(provider, user_id, queue)
+                outcome = "admitted"
+            finally:
+                self._queue_wait.record(time.monotonic() - start, {"outcome": outcome})
+        try:
+            yield
+        finally:
+            self._release(provider.id, queue)
+
+
 class ProxyClient:
-    def __init__(self, client: httpx.AsyncClient):
-        self._client = client
+    def __init__(
+        self,
+        lease: Callable[[], AbstractAsyncContextManager[httpx.AsyncClient]],
+        admit: Callable[[], AbstractAsyncContextManager[None]] | None = None,
+    ):
+        # The client is leased only once the request is admitted, a queued request does not keep an idle client alive
+        # and a client closed while the request was queued (e.g. after a provider restart) is not used
+        self._lease = lease
+        self._admit = admit
 
     @functools.wraps(httpx.AsyncClient.stream)
     async def send_request(*args, **kwargs) -> A2AServerResponse:
@@ -40,7 +268,9 @@ class ProxyClient:
         rest_args: tuple[Any, ...] = args[1:]
         exit_stack = AsyncExitStack()
         try:
-            client = await exit_stack.enter_async_context(self._client)
+            if self._admit:
+                await exit_stack.enter_async_context(self._admit())
+            client = await exit_stack.enter_async_context(self._lease())
             resp: httpx.Response = await exit_stack.enter_async_context(client.stream(*rest_args, **kwargs))
 
             try:
@@ -70,8 +300,9 @@ class ProxyClient:
                     return A2AServerResponse(stream=None, content=resp.content, **common)
                 finally:
                     await exit_stack.pop_all().aclose()
-        except BaseException:
-            await exit_stack.pop_all().aclose()
+        except BaseException as ex:
+            # The error is passed to the lease, a client which failed to connect is evicted from the pool
+            await exit_stack.__aexit__(type(ex), ex, ex.__traceback__)
             raise
 
 
@@ -85,50 +316,150 @@ class A2AProxyService:
         uow: IUnitOfWorkFactory,
         user_service: UserService,
         configuration: Configuration,
+        meter: Meter | None = None,
     ):
         self._deploy_manager = provider_deployment_manager
         self._uow = uow
         self._user_service = user_service
         self._config = configuration
+        self._clients = ProviderClientPool(configuration.a2a_proxy)
+        self._last_accessed: dict[UUID, datetime] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._startups: dict[UUID, asyncio.Task[None]] = {}
+        meter = meter or get_meter(INSTRUMENTATION_NAME)
+        self._admission = ProviderAdmissionController(configuration.a2a_proxy.admission_control, meter)
+        self._cold_start_duration = meter.create_histogram("provider_cold_start_duration_seconds", unit="s")
+        self._queued_requests = meter.create_up_down_counter("provider_cold_start_queued_requests")
+
+    def _record_access(self, provider_id: UUID) -> None:
+        # Access times are only needed to find idle providers, writing them on each request would contend on the row
+        self._last_accessed[provider_id] = utc_now()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def flush_last_accessed(self) -> None:
+        last_accessed, self._last_accessed = self._last_accessed, {}
+        if not last_accessed:
+            return
+        try:
+            async with self._uow() as uow:
+                await uow.providers.update_last_accessed(last_accessed=last_accessed)
+                await uow.commit()
+        except Exception:
+            for provider_id, accessed_at in last_accessed.items():
+                self._last_accessed[provider_id] = max(accessed_at, self._last_accessed.get(provider_id, accessed_at))
+            raise
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._config.a2a_proxy.last_accessed_flush_interval_sec)
+            try:
+                await self.flush_last_accessed()
+            except Exception as ex:
+                logger.warning(f"Failed to update provider last access times: {ex!r}")
 
-    async def get_proxy_client(self, *, provider_id: UUID) -> ProxyClient:
+    async def release_provider(self, *, provider_id: UUID) -> None:
+        """Close pooled connections to a provider which was removed."""
+        await self._clients.remove(provider_id=provider_id)
+
+    def take_in_flight_requests(self) -> dict[UUID, int]:
+        """Peak number of concurrent requests proxied to each provider by this process since the previous call."""
+        return self._clients.take_in_flight_requests()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await cancel_task(self._flush_task)
+        try:
+            await self.flush_last_accessed()
+        except Exception as ex:
+            logger.warning(f"Failed to update provider last access times: {ex!r}")
+        await self._clients.close()
+
+    async def _start_provider(self, provider: Provider) -> None:
+        start = time.monotonic()
+        [state] = await self._deploy_manager.state(provider_ids=[provider.id])
+        should_wait = False
+        match state:
+            case ProviderDeploymentState.ERROR:
+                raise RuntimeError("Provider is in an error state")
+            case (
+                ProviderDeploymentState.MISSING
+                | ProviderDeploymentState.RUNNING
+                | ProviderDeploymentState.STARTING
+                | ProviderDeploymentState.READY
+            ):
+                async with self._uow() as uow:
+                    env = await uow.env.get_all(parent_entity=EnvStoreEntity.PROVIDER, parent_entity_ids=[provider.id])
+                modified = await self._deploy_manager.create_or_replace(provider=provider, env=env[provider.id])
+                should_wait = modified or state != ProviderDeploymentState.RUNNING
+            case _:
+                raise ValueError(f"Unknown provider state: {state}")
+        if should_wait:
+            # Pooled connections (if any) point to pods which are no longer running
+            await self._clients.remove(provider_id=provider.id)
+            logger.info("Waiting for provider to start up...")
+            outcome = "error"
+            try:
+                await self._deploy_manager.wait_for_startup(provider_id=provider.id, timeout=self.STARTUP_TIMEOUT)
+                outcome = "success"
+            finally:
+                self._cold_start_duration.record(time.monotonic() - start, {"outcome": outcome})
+            logger.info("Provider is ready...")
+
+    def _startup_done(self, provider_id: UUID, startup: asyncio.Task) -> None:
+        self._startups.pop(provider_id, None)
+        if not startup.cancelled() and (ex := startup.exception()):
+            logger.warning(f"Provider {provider_id} failed to start: {ex!r}")
+
+    async def _ensure_started(self, provider: Provider) -> None:
+        """
+        Checks the deployment of the provider and starts it if needed.
+
+        Concurrent requests for the same provider share a single startup, each of them waits for it until its own
+        deadline. The startup is not cancelled when a waiting request is (e.g. client disconnected).
+        """
+        startup = self._startups.get(provider.id)
+        queued = startup is not None
+        if startup is None:
+            startup = self._startups[provider.id] = asyncio.create_task(self._start_provider(provider))
+            startup.add_done_callback(functools.partial(self._startup_done, provider.id))
+        else:
+            self._queued_requests.add(1)
+        try:
+            async with asyncio.timeout(self.STARTUP_TIMEOUT.total_seconds()):
+                await asyncio.shield(startup)
+        finally:
+            if queued:
+                self._queued_requests.add(-1)
+
+    async def get_proxy_client(self, *, provider_id: UUID, user: User) -> ProxyClient:
+        """
+        Return a client for proxying a single request to the provider, starting the provider if needed.
+
+        The request is subject to the admission control of the provider before the upstream connection is opened.
+        """
         try:
             bind_contextvars(provider=provider_id)
 
             async with self._uow() as uow:
                 provider = await uow.providers.get(provider_id=provider_id)
-                await uow.providers.update_last_accessed(provider_id=provider_id)
-                await uow.commit()
+            self._record_access(provider_id)
+            admit = functools.partial(self._admission.admit, provider=provider, user_id=user.id)
 
             if not provider.managed:
-                return ProxyClient(httpx.AsyncClient(base_url=str(provider.source.root), timeout=None))
+                lease = functools.partial(
+                    self._clients.lease,
+                    provider_id=provider.id,
+                    base_url=str(provider.source.root),
+                    http2=self._config.a2a_proxy.network_provider_http2,
+                )
+                return ProxyClient(lease, admit)
 
             provider_url = await self._deploy_manager.get_provider_url(provider_id=provider.id)
-            [state] = await self._deploy_manager.state(provider_ids=[provider.id])
-            should_wait = False
-            match state:
-                case ProviderDeploymentState.ERROR:
-                    raise RuntimeError("Provider is in an error state")
-                case (
-                    ProviderDeploymentState.MISSING
-                    | ProviderDeploymentState.RUNNING
-                    | ProviderDeploymentState.STARTING
-                    | ProviderDeploymentState.READY
-                ):
-                    async with self._uow() as uow:
-                        from beeai_server.domain.repositories.env import EnvStoreEntity
-
-                        env = await uow.env.get_all(
-                            parent_entity=EnvStoreEntity.PROVIDER, parent_entity_ids=[provider.id]
-                        )
-                    modified = await self._deploy_manager.create_or_replace(provider=provider, env=env[provider.id])
-                    should_wait = modified or state != ProviderDeploymentState.RUNNING
-                case _:
-                    raise ValueError(f"Unknown provider state: {state}")
-            if should_wait:
-                logger.info("Waiting for provider to start up...")
-                await self._deploy_manager.wait_for_startup(provider_id=provider.id, timeout=self.STARTUP_TIMEOUT)
-                logger.info("Provider is ready...")
-            return ProxyClient(httpx.AsyncClient(base_url=str(provider_url), timeout=None))
+            await self._ensure_started(provider)
+            lease = functools.partial(self._clients.lease, provider_id=provider.id, base_url=str(provider_url))
+            return ProxyClient(lease, admit)
         finally:
             unbind_contextvars("provider")
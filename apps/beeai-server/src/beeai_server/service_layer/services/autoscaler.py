@@ -0,0 +1,156 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import logging
+import math
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable
+from typing import NamedTuple
+from uuid import UUID
+
+from kink import inject
+from opentelemetry.metrics import CallbackOptions, Meter, Observation, get_meter
+
+from beeai_server.configuration import Configuration
+from beeai_server.service_layer.deployment_manager import IProviderDeploymentManager
+from beeai_server.service_layer.services.a2a import A2AProxyService
+from beeai_server.telemetry import INSTRUMENTATION_NAME
+from beeai_server.utils.utils import cancel_task
+
+logger = logging.getLogger(__name__)
+
+
+class ScalingDecision(NamedTuple):
+    provider_id: UUID
+    in_flight_requests: int
+    current_replicas: int
+    desired_replicas: int
+
+
+@inject
+class ProviderAutoscaler:
+    """
+    Scales running managed providers between the configured bounds based on in-flight A2A requests.
+
+    The desired number of replicas is the peak number of concurrent requests since the previous evaluation divided by
+    the target per replica. Replicas are added immediately, but removed only to the highest recommendation within the
+    stabilization window, so that a short lull does not cause flapping. Scaling from and to zero is left to the
+    cold start and idle scale down.
+
+    The load is measured by the A2A proxy of this process, the autoscaler runs in the API server lifespan. It is
+    therefore supported only with a single API server replica, which is enforced by the configuration.
+    """
+
+    def __init__(
+        self,
+        deployment_manager: IProviderDeploymentManager,
+        a2a_proxy: A2AProxyService,
+        configuration: Configuration,
+        meter: Meter | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._deployment_manager = deployment_manager
+        self._a2a_proxy = a2a_proxy
+        self._config = configuration.provider.autoscaling
+        self._clock = clock
+        self._recommendations: defaultdict[UUID, deque[tuple[float, int]]] = defaultdict(deque)
+        self._desired_replicas: dict[UUID, int] = {}
+        self._task: asyncio.Task | None = None
+        meter = meter or get_meter(INSTRUMENTATION_NAME)
+        self._decisions = meter.create_counter("provider_autoscaler_decisions")
+        meter.create_observable_gauge("provider_autoscaler_desired_replicas", callbacks=[self._observe_replicas])
+
+    def _observe_replicas(self, _options: CallbackOptions) -> Iterable[Observation]:
+        return [
+            Observation(replicas, {"provider_id": str(provider_id)})
+            for provider_id, replicas in self._desired_replicas.items()
+        ]
+
+    def recommend(self, *, provider_id: UUID, current_replicas: int, in_flight_requests: int) -> int:
+        config = self._config
+        load_ratio = in_flight_requests / (current_replicas * config.target_in_flight_requests_per_replica)
+        if abs(load_ratio - 1) <= config.tolerance:
+            recommendation = current_replicas
+        else:
+            recommendation = math.ceil(in_flight_requests / config.target_in_flight_requests_per_replica)
+        recommendation = min(max(recommendation, config.min_replicas), config.max_replicas)
+
+        now = self._clock()
+        history = self._recommendations[provider_id]
+        history.append((now, recommendation))
+        while history[0][0] < now - config.scale_down_stabilization_sec:
+            history.popleft()
+        if recommendation >= current_replicas:
+            return recommendation
+        return max(replicas for _, replicas in history)
+
+    async def evaluate(self) -> list[ScalingDecision]:
+        """Scale the providers whose replicas do not match the load, returns the decisions that changed replicas."""
+        in_flight = self._a2a_proxy.take_in_flight_requests()
+        # Providers without requests are still evaluated until they are scaled back to the minimum
+        provider_ids = list(in_flight.keys() | self._recommendations.keys())
+        if not provider_ids:
+            return []
+
+        replicas = await self._deployment_manager.replicas(provider_ids=provider_ids)
+        decisions = []
+        for provider_id, current_replicas in zip(provider_ids, replicas, strict=True):
+            if not current_replicas:  # network provider, removed or scaled to zero
+                self._recommendations.pop(provider_id, None)
+                self._desired_replicas.pop(provider_id, None)
+                continue
+            desired_replicas = self.recommend(
+                provider_id=provider_id,
+                current_replicas=current_replicas,
+                in_flight_requests=in_flight.get(provider_id, 0),
+            )
+            self._desired_replicas[provider_id] = desired_replicas
+            if all(replicas == self._config.min_replicas for _, replicas in self._recommendations[provider_id]):
+                del self._recommendations[provider_id]
+            if desired_replicas != current_replicas:
+                decisions.append(
+                    ScalingDecision(
+                        provider_id=provider_id,
+                        in_flight_requests=in_flight.get(provider_id, 0),
+                        current_replicas=current_replicas,
+                        desired_replicas=desired_replicas,
+                    )
+                )
+
+        errors = []
+        for decision in decisions:
+            direction = "up" if decision.desired_replicas > decision.current_replicas else "down"
+            try:
+                logger.info(
+                    f"Scaling provider {decision.provider_id} {direction} from {decision.current_replicas} "
+                    f"to {decision.desired_replicas} replicas ({decision.in_flight_requests} in-flight requests)"
+                )
+                await self._deployment_manager.scale(
+                    provider_id=decision.provider_id, replicas=decision.desired_replicas
+                )
+                self._decisions.add(1, {"direction": direction, "outcome": "success"})
+            except Exception as ex:
+                self._decisions.add(1, {"direction": direction, "outcome": "error"})
+                errors.append(ex)
+        if errors:
+            raise ExceptionGroup("Exceptions occurred when scaling providers", errors)
+        return decisions
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._config.interval_sec)
+            try:
+                await self.evaluate()
+            except Exception as ex:
+                logger.warning(f"Failed to autoscale providers: {ex!r}")
+
+    async def __aenter__(self):
+        if self._config.enabled:
+            self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await cancel_task(self._task)
+        self._task = None
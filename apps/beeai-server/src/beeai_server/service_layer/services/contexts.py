@@ -1,34 +1,77 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import builtins
 import logging
-from datetime import timedelta
+import time
+from collections.abc import Sequence
+from contextlib import suppress
+from datetime import datetime, timedelta
+from io import BytesIO
 from uuid import UUID
 
 from a2a.types import Artifact, Message, Role, TextPart
 from kink import di, inject
+from opentelemetry.metrics import Meter, get_meter
+from procrastinate.exceptions import AlreadyEnqueued
+from pydantic import TypeAdapter
 
 from beeai_server.api.schema.common import PaginationQuery
+from beeai_server.api.schema.contexts import ContextHistoryQuery
 from beeai_server.api.schema.openai import ChatCompletionRequest
 from beeai_server.configuration import Configuration
 from beeai_server.domain.models.common import Metadata, PaginatedResult
-from beeai_server.domain.models.context import Context, ContextHistoryItem, ContextHistoryItemData, TitleGenerationState
+from beeai_server.domain.models.context import (
+    Context,
+    ContextHistoryItem,
+    ContextHistoryItemData,
+    StoredContextHistoryItem,
+    TitleGenerationState,
+)
+from beeai_server.domain.models.file import AsyncFile
 from beeai_server.domain.models.user import User
 from beeai_server.domain.repositories.file import IObjectStorageRepository
+from beeai_server.exceptions import EntityNotFoundError
 from beeai_server.service_layer.services.model_provider import ModelProviderService
 from beeai_server.service_layer.unit_of_work import IUnitOfWorkFactory
+from beeai_server.telemetry import INSTRUMENTATION_NAME
 from beeai_server.utils.utils import utc_now
 
 logger = logging.getLogger(__name__)
 
+_history_item_data_adapter = TypeAdapter(ContextHistoryItemData)
+
 
 @inject
 class ContextService:
-    def __init__(self, uow: IUnitOfWorkFactory, configuration: Configuration, object_storage: IObjectStorageRepository):
+    def __init__(
+        self,
+        uow: IUnitOfWorkFactory,
+        configuration: Configuration,
+        object_storage: IObjectStorageRepository,
+        meter: Meter | None = None,
+    ):
         self._uow = uow
         self._object_storage = object_storage
         self._configuration = configuration
         self._expire_resources_after = timedelta(days=configuration.context.resource_expire_after_days)
+        self._history_compaction_threshold = configuration.context.history_compaction_threshold
+        self._history_snapshot_chunk_size = configuration.context.history_snapshot_chunk_size
+        self._history_compaction_grace_period = timedelta(
+            seconds=configuration.context.history_compaction_grace_period_sec
+        )
+        self._expiration_batch_size = configuration.context.resource_expiration_batch_size
+        self._history_offload_threshold = configuration.context.history_offload_threshold_bytes
+        self._history_offload_semaphore = asyncio.Semaphore(configuration.context.history_offload_max_concurrency)
+
+        meter = meter or get_meter(INSTRUMENTATION_NAME)
+        self._expired_contexts = meter.create_counter("context_resource_expiration_contexts")
+        self._expired_rows = meter.create_counter("context_resource_expiration_deleted_rows")
+        self._reclaimed_bytes = meter.create_counter("context_resource_expiration_reclaimed_bytes", unit="By")
+        self._expiration_batch_duration = meter.create_histogram(
+            "context_resource_expiration_batch_duration_seconds", unit="s"
+        )
 
     async def create(self, *, user: User, metadata: Metadata) -> Context:
         context = Context(created_by=user.id, metadata=metadata)
@@ -52,6 +95,7 @@ class ContextService:
                 order=pagination.order,
                 order_by=pagination.order_by,
                 include_empty=include_empty,
+                total_count=pagination.total_count,
             )
 
     async def delete(self, *, context_id: UUID, user: User) -> None:
@@ -60,36 +104,88 @@ class ContextService:
             await uow.contexts.get(context_id=context_id, user_id=user.id)
 
             # Files
-            file_ids = [file.id async for file in uow.files.list(user_id=user.id, context_id=context_id)]
-            await self._object_storage.delete_files(file_ids=file_ids)
-            # File DB objects are deleted automatically using cascade
+            # File DB objects would be deleted by cascade, but the references to their blobs need to be released
+            blob_ids = []
+            with suppress(EntityNotFoundError):
+                released_blob_ids = await uow.files.delete(user_id=user.id, context_id=context_id)
+                blob_ids = await uow.files.delete_unreferenced_blobs(blob_ids=released_blob_ids)
 
             # Vector stores
             # deleted automatically using cascade
 
+            # History items are deleted by cascade, their offloaded payloads are removed after the commit
+            offloaded_item_ids = await uow.contexts.list_offloaded_history_item_ids(context_id=context_id)
+
             await uow.contexts.delete(context_id=context_id, user_id=user.id)
             await uow.commit()
 
-    async def _cleanup_expired_resources(self, context_id: UUID) -> dict[str, int]:
-        """Delete resources attached to context"""
-        deleted_stats = {"files": 0, "vector_stores": 0}
+        # Objects are removed only once the rows referencing them are committed as deleted
+        await self._object_storage.delete_files(file_ids=[*blob_ids, *offloaded_item_ids])
+
+    async def _expire_resources_batch(self, *, last_active_before: datetime) -> dict[str, int]:
+        """Expire resources of one batch of contexts in a single transaction."""
+        stats: dict[str, int] = dict.fromkeys(
+            ("contexts", "files", "vector_stores", "blobs", "file_bytes", "vector_store_bytes"), 0
+        )
         async with self._uow() as uow:
+            context_ids = await uow.contexts.list_expired_resource_context_ids(
+                last_active_before=last_active_before, limit=self._expiration_batch_size
+            )
+            if not context_ids:
+                return stats
+            stats["contexts"] = len(context_ids)
+
             # Files
-            file_ids = [file.id async for file in uow.files.list(context_id=context_id)]
-            await self._object_storage.delete_files(file_ids=file_ids)
-            deleted_stats["files"] = await uow.files.delete(context_id=context_id)
+            released_blob_ids = []
+            with suppress(EntityNotFoundError):
+                released_blob_ids = await uow.files.delete(context_ids=context_ids)
+            stats["files"] = len(released_blob_ids)
+            stats["file_bytes"] = await uow.files.unreferenced_blobs_usage(blob_ids=released_blob_ids)
+            blob_ids = await uow.files.delete_unreferenced_blobs(blob_ids=released_blob_ids)
+            stats["blobs"] = len(blob_ids)
 
             # Vector stores
-            deleted_stats["vector_stores"] = await uow.vector_stores.delete(context_id=context_id)
+            stats["vector_store_bytes"] = await uow.vector_stores.total_usage(context_ids=context_ids)
+            with suppress(EntityNotFoundError):
+                stats["vector_stores"] = await uow.vector_stores.delete(context_ids=context_ids)
+
+            # Checkpoint, the contexts are skipped until they are active again
+            await uow.contexts.mark_resources_expired(context_ids=context_ids)
             await uow.commit()
-        return deleted_stats
+
+        # Objects of the whole batch are removed in bulk requests once the blob rows are gone. A rolled back batch
+        # must not leave rows pointing at deleted objects, orphaned objects after a failed deletion are harmless.
+        if blob_ids:
+            try:
+                await self._object_storage.delete_files(file_ids=blob_ids)
+            except Exception as ex:
+                logger.warning(f"Failed to delete objects of expired blobs {blob_ids}: {ex!r}")
+        return stats
 
     async def expire_resources(self) -> dict[str, int]:
-        deleted_stats = {}
-        async with self._uow() as uow:
-            async for context in uow.contexts.list(last_active_before=utc_now() - self._expire_resources_after):
-                deleted_stats.update(await self._cleanup_expired_resources(context_id=context.id))
-        return deleted_stats
+        """
+        Delete files and vector stores of contexts that were not active for resource_expire_after_days.
+
+        Contexts are processed in batches, each committed separately, so an interrupted run loses at most one batch
+        and the next run continues with the remaining contexts.
+        """
+        last_active_before = utc_now() - self._expire_resources_after
+        total_stats: dict[str, int] = {}
+        while True:
+            start = time.perf_counter()
+            stats = await self._expire_resources_batch(last_active_before=last_active_before)
+            if not stats["contexts"]:
+                break
+            self._expiration_batch_duration.record(time.perf_counter() - start)
+            self._expired_contexts.add(stats["contexts"])
+            for resource in ("files", "vector_stores", "blobs"):
+                self._expired_rows.add(stats[resource], attributes={"resource": resource})
+            self._reclaimed_bytes.add(stats["file_bytes"], attributes={"resource": "files"})
+            self._reclaimed_bytes.add(stats["vector_store_bytes"], attributes={"resource": "vector_stores"})
+            total_stats = {key: total_stats.get(key, 0) + value for key, value in stats.items()}
+            if stats["contexts"] < self._expiration_batch_size:
+                break
+        return total_stats
 
     async def update_last_active(self, *, context_id: UUID) -> None:
         async with self._uow() as uow:
@@ -103,27 +199,114 @@ class ContextService:
         return None
 
     async def add_history_item(self, *, context_id: UUID, data: ContextHistoryItemData, user: User) -> None:
+        await self.add_history_items(context_id=context_id, data=[data], user=user)
+
+    async def add_history_items(self, *, context_id: UUID, data: Sequence[ContextHistoryItemData], user: User) -> None:
+        """Append items in a single transaction, created_at is strictly increasing to preserve their order."""
+        now = utc_now()
+        history_items = [
+            ContextHistoryItem(context_id=context_id, data=item_data, created_at=now + timedelta(microseconds=i))
+            for i, item_data in enumerate(data)
+        ]
         async with self._uow() as uow:
             context = await uow.contexts.get(context_id=context_id, user_id=user.id)
-            await uow.contexts.add_history_item(
-                context_id=context_id,
-                history_item=ContextHistoryItem(context_id=context_id, data=data),
+
+        # Payloads are uploaded outside of the transaction, a DB connection is not held during the uploads
+        stored_items = await self._offload_history_items(history_items)
+        try:
+            async with self._uow() as uow:
+                await uow.contexts.add_history_items(context_id=context_id, history_items=stored_items)
+
+                first_user_message = next((item for item in data if getattr(item, "role", None) == Role.user), None)
+                if first_user_message and not (context.metadata or {}).get("title"):
+                    from beeai_server.jobs.tasks.context import generate_conversation_title as task
+
+                    title = self._extract_text(first_user_message) or "Untitled"
+                    title = f"{title[:100]}..." if len(title) > 100 else title
+
+                    should_generate_title = self._configuration.features.generate_conversation_title
+                    state = TitleGenerationState.PENDING if should_generate_title else TitleGenerationState.COMPLETED
+                    await uow.contexts.update_title(context_id=context_id, title=title, generation_state=state)
+
+                    if should_generate_title:
+                        await task.configure(queueing_lock=str(context_id)).defer_async(context_id=str(context_id))
+
+                await uow.commit()
+        except Exception:
+            await self._delete_offloaded_history_items(stored_items)
+            raise
+
+    async def _offload_history_items(
+        self, items: Sequence[ContextHistoryItem]
+    ) -> builtins.list[StoredContextHistoryItem]:
+        """Upload payloads above the threshold to the object storage under the item id, keep the rest inline."""
+
+        async def offload(item: ContextHistoryItem) -> StoredContextHistoryItem:
+            payload = item.data.model_dump_json().encode("utf-8")
+            if len(payload) <= self._history_offload_threshold:
+                return StoredContextHistoryItem(
+                    id=item.id, context_id=item.context_id, created_at=item.created_at, data=item.data
+                )
+
+            buffer = BytesIO(payload)
+
+            async def read(size: int = -1) -> bytes:
+                return buffer.read(size)
+
+            async with self._history_offload_semaphore:
+                await self._object_storage.upload_file(
+                    file_id=item.id,
+                    file=AsyncFile(filename=f"{item.id}.json", content_type="application/json", read=read),
+                )
+            return StoredContextHistoryItem(
+                id=item.id, context_id=item.context_id, created_at=item.created_at, offloaded_size=len(payload)
             )
 
-            if getattr(data, "role", None) == Role.user and not (context.metadata or {}).get("title"):
-                from beeai_server.jobs.tasks.context import generate_conversation_title as task
+        results = await asyncio.gather(*(offload(item) for item in items), return_exceptions=True)
+        stored_items = [result for result in results if isinstance(result, StoredContextHistoryItem)]
+        if errors := [result for result in results if isinstance(result, BaseException)]:
+            # Payloads uploaded before the failure would not be referenced by any item
+            await self._delete_offloaded_history_items(stored_items)
+            raise errors[0]
+        return stored_items
 
-                title = self._extract_text(data) or "Untitled"
-                title = f"{title[:100]}..." if len(title) > 100 else title
+    async def _delete_offloaded_history_items(self, items: Sequence[StoredContextHistoryItem]) -> None:
+        if offloaded_ids := [item.id for item in items if item.offloaded]:
+            try:
+                await self._object_storage.delete_files(file_ids=offloaded_ids)
+            except Exception as ex:
+                logger.warning(f"Failed to delete offloaded history items {offloaded_ids}: {ex!r}")
 
-                should_generate_title = self._configuration.features.generate_conversation_title
-                state = TitleGenerationState.PENDING if should_generate_title else TitleGenerationState.COMPLETED
-                await uow.contexts.update_title(context_id=context_id, title=title, generation_state=state)
+    async def _load_history_items(self, items: Sequence[StoredContextHistoryItem]) -> builtins.list[ContextHistoryItem]:
+        """Fetch offloaded payloads of the given items only, concurrently."""
 
-                if should_generate_title:
-                    await task.configure(queueing_lock=str(context_id)).defer_async(context_id=str(context_id))
+        async def load(item: StoredContextHistoryItem) -> ContextHistoryItem:
+            if item.data is not None:
+                return ContextHistoryItem(
+                    id=item.id, context_id=item.context_id, created_at=item.created_at, data=item.data
+                )
+            payload = bytearray()
+            async with self._history_offload_semaphore, self._object_storage.get_file(file_id=item.id) as file:
+                while chunk := await file.read(64 * 1024):
+                    payload.extend(chunk)
+            return ContextHistoryItem(
+                id=item.id,
+                context_id=item.context_id,
+                created_at=item.created_at,
+                data=_history_item_data_adapter.validate_json(payload),
+            )
 
-            await uow.commit()
+        return list(await asyncio.gather(*(load(item) for item in items)))
+
+    async def _load_history_page(
+        self, result: PaginatedResult[StoredContextHistoryItem]
+    ) -> PaginatedResult[ContextHistoryItem]:
+        return PaginatedResult(
+            items=await self._load_history_items(result.items),
+            total_count=result.total_count,
+            has_more=result.has_more,
+            next_cursor=result.next_cursor,
+        )
 
     async def generate_conversation_title(self, *, context_id: UUID):
         from beeai_server.api.routes.openai import create_chat_completion
@@ -131,6 +314,7 @@ class ContextService:
         async with self._uow() as uow:
             msg = await uow.contexts.list_history(context_id=context_id, limit=1, order="desc", order_by="created_at")
             config = await uow.configuration.get_system_configuration()
+        msg = await self._load_history_page(msg)
 
         if not msg.items:
             logger.warning(f"Cannot generate title for context {context_id}: no history found.")
@@ -180,14 +364,63 @@ class ContextService:
             raise e
 
     async def list_history(
-        self, *, context_id: UUID, user: User, pagination: PaginationQuery
+        self, *, context_id: UUID, user: User, pagination: PaginationQuery | ContextHistoryQuery
     ) -> PaginatedResult[ContextHistoryItem]:
+        page_token, order = pagination.page_token, pagination.order
+        if since := getattr(pagination, "since", None):
+            # Items added after the given one, the page_token continues paging through them
+            page_token, order = page_token or since, "asc"
         async with self._uow() as uow:
             await uow.contexts.get(context_id=context_id, user_id=user.id)
-            return await uow.contexts.list_history(
+            result = await uow.contexts.list_history(
                 context_id=context_id,
                 limit=pagination.limit,
-                page_token=pagination.page_token,
-                order=pagination.order,
+                page_token=page_token,
+                order=order,
                 order_by=pagination.order_by,
+                total_count=pagination.total_count,
+            )
+        return await self._load_history_page(result)
+
+    async def get_full_history(self, *, context_id: UUID, user: User) -> PaginatedResult[ContextHistoryItem]:
+        """Return the compacted snapshot followed by the items added after it, in ascending order."""
+        async with self._uow() as uow:
+            await uow.contexts.get(context_id=context_id, user_id=user.id)
+            snapshot = await uow.contexts.get_history_snapshot(context_id=context_id)
+            snapshot_items = snapshot.items if snapshot else []
+            tail = await uow.contexts.list_history_after(
+                context_id=context_id, after_item=snapshot_items[-1] if snapshot_items else None
+            )
+
+        if len(tail) >= self._history_compaction_threshold:
+            from beeai_server.jobs.tasks.context import compact_context_history as task
+
+            with suppress(AlreadyEnqueued):
+                await task.configure(queueing_lock=str(context_id)).defer_async(context_id=str(context_id))
+
+        items = await self._load_history_items([*snapshot_items, *tail])
+        return PaginatedResult(items=items, total_count=len(items), has_more=False)
+
+    async def compact_history(self, *, context_id: UUID) -> int:
+        """
+        Append history items to the snapshot, returns the number of newly compacted items.
+
+        Only the new items are written, in chunks of bounded size. Items from the last grace period are left out,
+        a concurrent transaction may still commit an item with an older created_at which would be skipped by the
+        snapshot otherwise.
+        """
+        async with self._uow() as uow:
+            last_item = await uow.contexts.get_last_snapshot_history_item(context_id=context_id)
+            new_items = await uow.contexts.list_history_after(
+                context_id=context_id,
+                after_item=last_item,
+                created_before=utc_now() - self._history_compaction_grace_period,
+            )
+            if not new_items:
+                return 0
+            await uow.contexts.append_history_snapshot(
+                context_id=context_id, items=new_items, chunk_size=self._history_snapshot_chunk_size
             )
+            await uow.commit()
+        logger.info(f"Compacted {len(new_items)} history items of context {context_id}")
+        return len(new_items)
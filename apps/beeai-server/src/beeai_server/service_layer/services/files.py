@@ -1,14 +1,18 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import hashlib
 import logging
 from asyncio import CancelledError
 from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager, suppress
+from datetime import timedelta
 from typing import Annotated
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from kink import inject
+from pydantic import HttpUrl
 from typing_extensions import Doc
 
 from beeai_server.configuration import Configuration
@@ -17,14 +21,21 @@ from beeai_server.domain.models.file import (
     ExtractionMetadata,
     ExtractionStatus,
     File,
+    FileBlob,
     FileType,
     TextExtraction,
 )
 from beeai_server.domain.models.user import User
-from beeai_server.domain.repositories.file import IObjectStorageRepository, ITextExtractionBackend
+from beeai_server.domain.repositories.file import (
+    EXTRACTION_FINISHED_CHANNEL,
+    IObjectStorageRepository,
+    ITextExtractionBackend,
+)
+from beeai_server.domain.repositories.notifications import INotificationListener
 from beeai_server.exceptions import EntityNotFoundError, StorageCapacityExceededError
 from beeai_server.service_layer.services.users import UserService
-from beeai_server.service_layer.unit_of_work import IUnitOfWorkFactory
+from beeai_server.service_layer.unit_of_work import IUnitOfWork, IUnitOfWorkFactory
+from beeai_server.utils.utils import utc_now
 
 logger = logging.getLogger(__name__)
 
@@ -37,13 +48,18 @@ class FileService:
         extraction_backend: ITextExtractionBackend,
         uow: IUnitOfWorkFactory,
         user_service: UserService,
+        notification_listener: INotificationListener,
         configuration: Configuration,
     ):
         self._object_storage = object_storage_repository
+        self._notification_listener = notification_listener
         self._uow = uow
         self._user_service = user_service
         self._storage_limit_per_user = configuration.object_storage.storage_limit_per_user_bytes
         self._storage_limit_per_file = configuration.object_storage.max_single_file_size
+        self._presigned_download_expiration = timedelta(
+            seconds=configuration.object_storage.presigned_download_expiration_sec
+        )
         self._extraction_backend = extraction_backend
 
     async def extract_text(self, file_id: UUID, job_id: str):
@@ -51,15 +67,22 @@ class FileService:
         async with self._uow() as uow:
             extraction = await uow.files.get_extraction_by_file_id(file_id=file_id)
             file = await uow.files.get(file_id=file_id)
+            # Identical content might have been extracted since the job was deferred
+            if await self._complete_from_cache(uow, extraction=extraction, file=file):
+                await uow.files.update_extraction(extraction=extraction)
+                await uow.commit()
+                return
             error_log.append(file.model_dump())
             user = await uow.users.get(user_id=file.created_by)
             extraction.set_started(job_id=job_id)
             await uow.files.update_extraction(extraction=extraction)
             await uow.commit()
         try:
-            file_url = await self._object_storage.get_file_url(file_id=file_id)
+            file_url = await self._object_storage.get_file_url(file_id=file.blob_id)
             error_log.append(f"file url: {file_url}")
-            async with self._extraction_backend.extract_text(file_url=file_url) as extracted_file:
+            async with self._extraction_backend.extract_text(
+                file_url=file_url, content_type=file.content_type
+            ) as extracted_file:
                 extracted_db_file = await self.upload_file(
                     file=extracted_file,
                     user=user,
@@ -67,7 +90,10 @@ class FileService:
                     context_id=file.context_id,
                     parent_file_id=file_id,
                 )
-            extraction.set_completed(extracted_file_id=extracted_db_file.id)
+            extraction.set_completed(
+                extracted_file_id=extracted_db_file.id,
+                metadata=ExtractionMetadata(backend=extracted_file.backend),
+            )
             async with self._uow() as uow:
                 await uow.files.update_extraction(extraction=extraction)
                 await uow.commit()
@@ -102,6 +128,9 @@ class FileService:
             content_type=file.content_type,
             context_id=context_id,
         )
+        # Content is always uploaded under a new blob id, the digest is known only after the upload
+        uploaded_blob_id = db_file.blob_id
+        uploaded = False
         try:
             async with self._uow() as uow:
                 total_usage = await uow.files.total_usage(user_id=user.id)
@@ -109,45 +138,115 @@ class FileService:
                 max_size = min(self._storage_limit_per_user - total_usage, self._storage_limit_per_file)
                 file.read = limit_size_wrapper(read=file.read, max_size=max_size)
 
-                db_file.file_size_bytes = await self._object_storage.upload_file(file_id=db_file.id, file=file)
+                uploaded_object = await self._object_storage.upload_file(file_id=uploaded_blob_id, file=file)
+                uploaded = True
+                db_file.file_size_bytes, db_file.content_sha256 = uploaded_object.size, uploaded_object.sha256
+
+                # Identical content uploaded by the same user before only gets another reference
+                blob = await uow.files.acquire_blob(
+                    blob=FileBlob(
+                        id=uploaded_blob_id,
+                        content_sha256=uploaded_object.sha256,
+                        size_bytes=uploaded_object.size,
+                        created_by=user.id,
+                    )
+                )
+                db_file.blob_id = blob.id
                 await uow.files.create(file=db_file)
                 await uow.commit()
-                return db_file
         except Exception:
             # If the file was uploaded and then the commit failed, delete the file from the object storage.
-            if db_file.file_size_bytes is not None:
+            if uploaded:
                 with suppress(Exception):
-                    await self._object_storage.delete_files(file_ids=[db_file.id])
+                    await self._object_storage.delete_files(file_ids=[uploaded_blob_id])
             raise
 
+        if db_file.blob_id != uploaded_blob_id:
+            with suppress(Exception):
+                await self._object_storage.delete_files(file_ids=[uploaded_blob_id])
+        return db_file
+
     async def get(self, *, file_id: UUID, user: User, context_id: UUID | None = None) -> File:
         async with self._uow() as uow:
             return await uow.files.get(file_id=file_id, user_id=user.id, context_id=context_id)
 
     @asynccontextmanager
     async def get_content(
-        self, *, file_id: UUID, user: User, context_id: UUID | None = None
+        self,
+        *,
+        file_id: UUID,
+        user: User,
+        context_id: UUID | None = None,
+        byte_range: Annotated[tuple[int, int] | None, Doc("Inclusive range of bytes to read.")] = None,
     ) -> AsyncIterator[AsyncFile]:
         async with self._uow() as uow:
             # check if the user owns the file
-            await uow.files.get(file_id=file_id, user_id=user.id, context_id=context_id)
-            async with self._object_storage.get_file(file_id=file_id) as file:
-                yield file
+            db_file = await uow.files.get(file_id=file_id, user_id=user.id, context_id=context_id)
+            async with self._object_storage.get_file(file_id=db_file.blob_id, byte_range=byte_range) as file:
+                # The blob might have been uploaded under a different name or content type
+                yield file.model_copy(update={"filename": db_file.filename, "content_type": db_file.content_type})
+
+    async def get_download_url(self, *, file_id: UUID, user: User, context_id: UUID | None = None) -> HttpUrl:
+        async with self._uow() as uow:
+            # check if the user owns the file
+            db_file = await uow.files.get(file_id=file_id, user_id=user.id, context_id=context_id)
+        return await self._object_storage.get_download_url(
+            file_id=db_file.blob_id,
+            filename=db_file.filename,
+            content_type=db_file.content_type,
+            expires_in=self._presigned_download_expiration,
+        )
 
     async def get_extraction(self, *, file_id: UUID, user: User, context_id: UUID | None = None) -> TextExtraction:
         async with self._uow() as uow:
             return await uow.files.get_extraction_by_file_id(file_id=file_id, user_id=user.id, context_id=context_id)
 
+    async def wait_for_extractions(
+        self,
+        *,
+        file_ids: list[UUID],
+        user: User,
+        context_id: UUID | None = None,
+        timeout: timedelta,  # noqa: ASYNC109
+    ) -> list[TextExtraction]:
+        """Wait until extractions of all files are finished or until timeout and return their current state."""
+        file_ids = list(dict.fromkeys(file_ids))
+        # Subscribe before reading the current state, so that no notification can be missed in between
+        async with self._notification_listener.subscribe(EXTRACTION_FINISHED_CHANNEL) as notifications:
+            extractions = await self._list_extractions(file_ids=file_ids, user=user, context_id=context_id)
+            pending = {extraction.file_id for extraction in extractions if not extraction.finished}
+            if not pending:
+                return extractions
+            with suppress(TimeoutError):
+                async with asyncio.timeout(timeout.total_seconds()):
+                    while pending:
+                        with suppress(ValueError):
+                            pending.discard(UUID(await notifications.get()))
+        return await self._list_extractions(file_ids=file_ids, user=user, context_id=context_id)
+
+    async def _list_extractions(
+        self, *, file_ids: list[UUID], user: User, context_id: UUID | None = None
+    ) -> list[TextExtraction]:
+        async with self._uow() as uow:
+            extractions = await uow.files.list_extractions(file_ids=file_ids, user_id=user.id, context_id=context_id)
+        extractions_by_file_id = {extraction.file_id: extraction for extraction in extractions}
+        if missing := [file_id for file_id in file_ids if file_id not in extractions_by_file_id]:
+            raise EntityNotFoundError(entity="text_extraction", id=missing[0], attribute="file_id")
+        return [extractions_by_file_id[file_id] for file_id in file_ids]
+
     async def delete(self, *, file_id: UUID, user: User, context_id: UUID | None = None) -> None:
         async with self._uow() as uow:
-            if await uow.files.delete(file_id=file_id, user_id=user.id, context_id=context_id):
-                await self._object_storage.delete_files(file_ids=[file_id])
-                await uow.commit()
+            released_blob_ids = await uow.files.delete(file_id=file_id, user_id=user.id, context_id=context_id)
+            blob_ids = await uow.files.delete_unreferenced_blobs(blob_ids=released_blob_ids)
+            await uow.commit()
+        await self._delete_blob_objects(blob_ids)
 
     async def create_extraction(self, *, file_id: UUID, user: User, context_id: UUID | None = None) -> TextExtraction:
         async with self._uow() as uow:
             # Check user permissions
-            await uow.files.get(file_id=file_id, user_id=user.id, context_id=context_id, file_type=FileType.USER_UPLOAD)
+            file = await uow.files.get(
+                file_id=file_id, user_id=user.id, context_id=context_id, file_type=FileType.USER_UPLOAD
+            )
             try:
                 # Check if extraction already exists
                 extraction = await uow.files.get_extraction_by_file_id(file_id=file_id)
@@ -156,38 +255,101 @@ class FileService:
                         return extraction
                     case ExtractionStatus.FAILED | ExtractionStatus.CANCELLED:
                         extraction.reset_for_retry()
+                        extraction.cache_key = self._extraction_cache_key(file)
                         await uow.files.update_extraction(extraction=extraction)
                     case _:
                         raise TypeError(f"Unknown extraction status: {extraction.status}")
             except EntityNotFoundError:
-                file_metadata = await self._object_storage.get_file_metadata(file_id=file_id)
-                extraction = TextExtraction(file_id=file_id)
-                if file_metadata.content_type in {"text/plain", "text/markdown"}:
+                extraction = TextExtraction(file_id=file_id, cache_key=self._extraction_cache_key(file))
+                if file.content_type in {"text/plain", "text/markdown"}:
                     extraction.set_completed(
                         extracted_file_id=file_id,  # Point to itself since it's already text
                         metadata=ExtractionMetadata(backend="in-place"),
                     )
                 await uow.files.create_extraction(extraction=extraction)
             if extraction.status == ExtractionStatus.PENDING:
-                from beeai_server.jobs.tasks.file import extract_text
+                if await self._complete_from_cache(uow, extraction=extraction, file=file):
+                    await uow.files.update_extraction(extraction=extraction)
+                else:
+                    from beeai_server.jobs.tasks.file import extract_text
 
-                await extract_text.configure(queueing_lock=str(file_id)).defer_async(file_id=str(file_id))
+                    await extract_text.configure(queueing_lock=str(file_id)).defer_async(file_id=str(file_id))
 
             await uow.commit()
             return extraction
 
+    def _extraction_cache_key(self, file: File) -> str | None:
+        if not file.content_sha256:
+            return None
+        key = f"{file.content_sha256}:{self._extraction_backend.cache_key}"
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    async def _complete_from_cache(self, uow: IUnitOfWork, *, extraction: TextExtraction, file: File) -> bool:
+        """Link the extraction to the text extracted earlier from identical content of the same user."""
+        if not extraction.cache_key:
+            return False
+        try:
+            cached = await uow.files.get_extraction_by_cache_key(
+                cache_key=extraction.cache_key, user_id=file.created_by
+            )
+            cached_file = await uow.files.get(file_id=cached.extracted_file_id)  # pyright: ignore [reportArgumentType]
+        except EntityNotFoundError:
+            return False
+        if not cached_file.content_sha256:
+            return False
+
+        # Take another reference to the extracted text blob instead of extracting it again
+        blob = await uow.files.acquire_blob(
+            blob=FileBlob(
+                id=cached_file.blob_id,
+                content_sha256=cached_file.content_sha256,
+                size_bytes=cached_file.file_size_bytes or 0,
+                created_by=file.created_by,
+            )
+        )
+        # The cached text might be an in-place extraction, which points to the uploaded text file itself
+        extracted_file = cached_file.model_copy(
+            update={
+                "id": uuid4(),
+                "filename": "extracted_text.md",
+                "content_type": "text/markdown",
+                "file_type": FileType.EXTRACTED_TEXT,
+                "created_at": utc_now(),
+                "parent_file_id": file.id,
+                "context_id": file.context_id,
+                "blob_id": blob.id,
+            }
+        )
+        await uow.files.create(file=extracted_file)
+        backend = cached.extraction_metadata.backend if cached.extraction_metadata else self._extraction_backend.name
+        extraction.set_completed(
+            extracted_file_id=extracted_file.id,
+            metadata=ExtractionMetadata(backend=backend, cached_from_extraction_id=str(cached.id)),
+        )
+        return True
+
     async def delete_extraction(self, *, file_id: UUID, user: User, context_id: UUID | None = None) -> None:
         async with self._uow() as uow:
             extraction = await uow.files.get_extraction_by_file_id(
                 file_id=file_id, user_id=user.id, context_id=context_id
             )
 
+            blob_ids = []
             if extraction.extracted_file_id and extraction.extracted_file_id != file_id:
-                await self._object_storage.delete_files(file_ids=[extraction.extracted_file_id])
-                await uow.files.delete(file_id=extraction.extracted_file_id)
+                released_blob_ids = await uow.files.delete(file_id=extraction.extracted_file_id)
+                blob_ids = await uow.files.delete_unreferenced_blobs(blob_ids=released_blob_ids)
 
             await uow.files.delete_extraction(extraction_id=extraction.id)
             await uow.commit()
+        await self._delete_blob_objects(blob_ids)
+
+    async def _delete_blob_objects(self, blob_ids: list[UUID]) -> None:
+        # Objects are deleted only once the blob rows are gone, a rolled back transaction or a concurrent upload of the
+        # same content must not be left with rows pointing at deleted objects. Orphaned objects are harmless.
+        try:
+            await self._object_storage.delete_files(file_ids=blob_ids)
+        except Exception as ex:
+            logger.warning(f"Failed to delete objects of unreferenced blobs {blob_ids}: {ex!r}")
 
 
 def limit_size_wrapper(
@@ -0,0 +1,143 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from kink import inject
+from opentelemetry.metrics import Meter, get_meter
+
+from beeai_server.configuration import Configuration, KeepWarmPolicy, KeepWarmWindow
+from beeai_server.domain.models.provider import Provider, ProviderDeploymentState
+from beeai_server.domain.repositories.env import EnvStoreEntity
+from beeai_server.service_layer.deployment_manager import IProviderDeploymentManager
+from beeai_server.service_layer.unit_of_work import IUnitOfWorkFactory
+from beeai_server.telemetry import INSTRUMENTATION_NAME
+from beeai_server.utils.utils import utc_now
+
+logger = logging.getLogger(__name__)
+
+
+def is_window_active(window: KeepWarmWindow, at: datetime) -> bool:
+    local = at.astimezone(ZoneInfo(window.timezone))
+    local_time, day = local.time(), local.weekday()
+    if window.start <= window.end:
+        return day in window.days and window.start <= local_time < window.end
+    # Window over midnight belongs to the day it starts on
+    return (day in window.days and local_time >= window.start) or (
+        (day - 1) % 7 in window.days and local_time < window.end
+    )
+
+
+def _truncate_to_hour(at: datetime) -> datetime:
+    return at.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+@inject
+class KeepWarmService:
+    """
+    Decides which managed providers should be running ahead of demand and starts them.
+
+    A provider is kept warm when it was requested within the minimum warm period of its policy, when a window of its
+    policy is active or starts within the lead time, or when it was used in the current or the upcoming hour of the
+    week in enough of the past weeks (based on the hourly access history).
+    """
+
+    def __init__(
+        self,
+        deployment_manager: IProviderDeploymentManager,
+        uow: IUnitOfWorkFactory,
+        configuration: Configuration,
+        meter: Meter | None = None,
+    ):
+        self._deployment_manager = deployment_manager
+        self._uow = uow
+        self._config = configuration.provider.keep_warm
+        meter = meter or get_meter(INSTRUMENTATION_NAME)
+        self._prewarmed = meter.create_counter("provider_prewarm_starts")
+
+    def _get_policy(self, provider: Provider) -> KeepWarmPolicy | None:
+        return self._config.policies.get(str(provider.id)) or self._config.policies.get(str(provider.source.root))
+
+    async def _predicted_provider_ids(self, now: datetime) -> set[UUID]:
+        lead_time = timedelta(seconds=self._config.lead_time_sec)
+        predicted = set()
+        async with self._uow() as uow:
+            for hour in {_truncate_to_hour(now), _truncate_to_hour(now + lead_time)}:
+                past_hours = [
+                    hour - timedelta(weeks=week) for week in range(1, self._config.prediction_history_weeks + 1)
+                ]
+                access_counts = await uow.providers.count_access_hours(hours=past_hours)
+                predicted |= {
+                    provider_id
+                    for provider_id, count in access_counts.items()
+                    if count >= self._config.prediction_min_weeks
+                }
+        return predicted
+
+    async def keep_warm_reasons(self, providers: Sequence[Provider], now: datetime | None = None) -> dict[UUID, str]:
+        """Return managed providers which should be running with the reason (min_warm, window or prediction)."""
+        managed = [provider for provider in providers if provider.managed]
+        if not self._config.enabled or not managed:
+            return {}
+        now = now or utc_now()
+        lead_time = timedelta(seconds=self._config.lead_time_sec)
+        predicted = await self._predicted_provider_ids(now) if self._config.prediction_enabled else set()
+
+        reasons = {}
+        for provider in managed:
+            policy = self._get_policy(provider)
+            if policy and provider.last_active_at + timedelta(seconds=policy.min_warm_sec) > now:
+                reasons[provider.id] = "min_warm"
+            elif policy and any(
+                is_window_active(window, now) or is_window_active(window, now + lead_time) for window in policy.windows
+            ):
+                reasons[provider.id] = "window"
+            elif provider.id in predicted:
+                reasons[provider.id] = "prediction"
+        return reasons
+
+    async def warm_providers(self, now: datetime | None = None) -> list[UUID]:
+        """Start scaled down providers which should be kept warm, returns IDs of the started providers."""
+        async with self._uow() as uow:
+            providers = [provider async for provider in uow.providers.list()]
+        reasons = await self.keep_warm_reasons(providers, now)
+        if not reasons:
+            return []
+
+        providers = [provider for provider in providers if provider.id in reasons]
+        states = await self._deployment_manager.state(provider_ids=[provider.id for provider in providers])
+        cold_providers = [
+            provider
+            for provider, state in zip(providers, states, strict=True)
+            if state in {ProviderDeploymentState.READY, ProviderDeploymentState.MISSING}
+        ]
+        if not cold_providers:
+            return []
+
+        async with self._uow() as uow:
+            env = await uow.env.get_all(
+                parent_entity=EnvStoreEntity.PROVIDER, parent_entity_ids=[provider.id for provider in cold_providers]
+            )
+        started, errors = [], []
+        for provider in cold_providers:
+            try:
+                logger.info(f"Pre-warming provider {provider.id} ({reasons[provider.id]})")
+                await self._deployment_manager.create_or_replace(provider=provider, env=env[provider.id])
+                self._prewarmed.add(1, {"reason": reasons[provider.id]})
+                started.append(provider.id)
+            except Exception as ex:
+                errors.append(ex)
+        if errors:
+            raise ExceptionGroup("Exceptions occurred when pre-warming providers", errors)
+        return started
+
+    async def remove_old_access_history(self, now: datetime | None = None) -> int:
+        before = _truncate_to_hour(now or utc_now()) - timedelta(weeks=self._config.prediction_history_weeks + 1)
+        async with self._uow() as uow:
+            deleted = await uow.providers.delete_access_hours(before=before)
+            await uow.commit()
+        return deleted
@@ -2,14 +2,22 @@
 # SPDX-License-Identifier: Apache-2.0
 import difflib
 import logging
+import re
 from asyncio import TaskGroup
 from collections import defaultdict
 from datetime import timedelta
 from uuid import UUID
 
+import ibm_watsonx_ai
+import ibm_watsonx_ai.foundation_models.embeddings
+import openai
 from cachetools import TTLCache
+from fastapi import status
+from fastapi.concurrency import run_in_threadpool
 from httpx import HTTPError
 from kink import inject
+from openai.types import CreateEmbeddingResponse, Embedding
+from openai.types.create_embedding_response import Usage
 from pydantic import HttpUrl
 
 from beeai_server.domain.constants import MODEL_API_KEY_SECRET_NAME
@@ -21,7 +29,7 @@ from beeai_server.domain.models.model_provider import (
     ModelWithScore,
 )
 from beeai_server.domain.repositories.env import EnvStoreEntity
-from beeai_server.exceptions import EntityNotFoundError, ModelLoadFailedError
+from beeai_server.exceptions import EntityNotFoundError, ModelLoadFailedError, PlatformError
 from beeai_server.service_layer.unit_of_work import IUnitOfWorkFactory
 
 logger = logging.getLogger(__name__)
@@ -102,6 +110,52 @@ class ModelProviderService:
                 raise EntityNotFoundError("provider_variable", id=MODEL_API_KEY_SECRET_NAME)
             return result
 
+    async def create_embeddings(self, *, model_id: str, inputs: list[str]) -> CreateEmbeddingResponse:
+        """Embed the inputs using the provider of the model, embeddings are sorted by index and contain floats."""
+        provider = await self.get_provider_by_model_id(model_id=model_id)
+        if not provider.supports_embedding:
+            raise PlatformError("Model does not support embeddings", status_code=status.HTTP_400_BAD_REQUEST)
+        provider_model_id = re.sub(rf"^{provider.type}:", "", model_id)
+        if not inputs:
+            return CreateEmbeddingResponse(
+                object="list", model=provider_model_id, data=[], usage=Usage(prompt_tokens=0, total_tokens=0)
+            )
+        api_key = await self.get_provider_api_key(model_provider_id=provider.id)
+
+        if provider.type == ModelProviderType.WATSONX:
+            response = await run_in_threadpool(
+                ibm_watsonx_ai.foundation_models.embeddings.Embeddings(
+                    model_id=provider_model_id,
+                    credentials=ibm_watsonx_ai.Credentials(url=str(provider.base_url), api_key=api_key),
+                    project_id=provider.watsonx_project_id,
+                    space_id=provider.watsonx_space_id,
+                ).generate,
+                inputs=inputs,
+            )
+            return CreateEmbeddingResponse(
+                object="list",
+                model=response["model_id"],
+                data=[
+                    Embedding(object="embedding", index=i, embedding=result["embedding"])
+                    for i, result in enumerate(response.get("results", []))
+                ],
+                usage=Usage(
+                    prompt_tokens=response.get("usage", {}).get("prompt_tokens", 0),
+                    total_tokens=response.get("usage", {}).get("total_tokens", 0),
+                ),
+            )
+
+        # The encoding format is left to the client library, it requests base64 (not supported by some providers,
+        # e.g. Ollama, which return floats instead) and decodes the embeddings. Voyage does not support "float".
+        async with openai.AsyncOpenAI(
+            api_key=api_key,
+            base_url=str(provider.base_url),
+            default_headers=({"RITS_API_KEY": api_key} if provider.type == ModelProviderType.RITS else {}),
+        ) as client:
+            response = await client.embeddings.create(input=inputs, model=provider_model_id)
+        response.data.sort(key=lambda embedding: embedding.index)
+        return response
+
     async def _get_provider_models(
         self, provider: ModelProvider, api_key: str, raise_error: bool = False
     ) -> list[Model]:
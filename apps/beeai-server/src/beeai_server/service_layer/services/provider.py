@@ -10,9 +10,8 @@ from collections.abc import AsyncIterator, Callable
 from uuid import UUID
 
 from a2a.types import AgentCard
-from fastapi import HTTPException
 from kink import inject
-from starlette.status import HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND
+from starlette.status import HTTP_400_BAD_REQUEST
 
 from beeai_server.domain.models.provider import (
     Provider,
@@ -26,6 +25,8 @@ from beeai_server.exceptions import ManifestLoadError
 from beeai_server.service_layer.deployment_manager import (
     IProviderDeploymentManager,
 )
+from beeai_server.service_layer.services.a2a import A2AProxyService
+from beeai_server.service_layer.services.keep_warm import KeepWarmService
 from beeai_server.service_layer.unit_of_work import IUnitOfWorkFactory
 from beeai_server.utils.logs_container import LogsContainer
 from beeai_server.utils.utils import cancel_task, utc_now
@@ -35,9 +36,17 @@ logger = logging.getLogger(__name__)
 
 @inject
 class ProviderService:
-    def __init__(self, deployment_manager: IProviderDeploymentManager, uow: IUnitOfWorkFactory):
+    def __init__(
+        self,
+        deployment_manager: IProviderDeploymentManager,
+        uow: IUnitOfWorkFactory,
+        a2a_proxy: A2AProxyService,
+        keep_warm: KeepWarmService,
+    ):
         self._uow = uow
         self._deployment_manager = deployment_manager
+        self._a2a_proxy = a2a_proxy
+        self._keep_warm = keep_warm
 
     async def create_provider(
         self,
@@ -47,11 +56,18 @@ class ProviderService:
         auto_remove: bool = False,
         agent_card: AgentCard | None = None,
         variables: dict[str, str] | None = None,
+        source_fingerprint: str | None = None,
     ) -> ProviderWithState:
         try:
             if not agent_card:
                 agent_card = await location.load_agent_card()
-            provider = Provider(source=location, registry=registry, auto_remove=auto_remove, agent_card=agent_card)
+            provider = Provider(
+                source=location,
+                registry=registry,
+                auto_remove=auto_remove,
+                agent_card=agent_card,
+                source_fingerprint=source_fingerprint,
+            )
         except ValueError as ex:
             raise ManifestLoadError(location=location, message=str(ex), status_code=HTTP_400_BAD_REQUEST) from ex
         except Exception as ex:
@@ -68,7 +84,13 @@ class ProviderService:
         return provider_response
 
     async def upgrade_provider(
-        self, *, provider_id: UUID, location: ProviderLocation, force: bool = False
+        self,
+        *,
+        provider_id: UUID,
+        location: ProviderLocation,
+        force: bool = False,
+        agent_card: AgentCard | None = None,
+        source_fingerprint: str | None = None,
     ) -> ProviderWithState:
         async with self._uow() as uow:
             provider = await uow.providers.get(provider_id=provider_id)
@@ -77,7 +99,8 @@ class ProviderService:
             return (await self._get_providers_with_state([provider]))[0]
 
         try:
-            agent_card = await location.load_agent_card()
+            if not agent_card:
+                agent_card = await location.load_agent_card()
         except ValueError as ex:
             raise ManifestLoadError(location=location, message=str(ex), status_code=HTTP_400_BAD_REQUEST) from ex
         except Exception as ex:
@@ -85,6 +108,7 @@ class ProviderService:
 
         provider.source = location
         provider.agent_card = agent_card
+        provider.source_fingerprint = source_fingerprint
 
         async with self._uow() as uow:
             await uow.providers.update(provider=provider)
@@ -120,7 +144,8 @@ class ProviderService:
             for provider, state in zip(providers, provider_states, strict=False):
                 result_providers.append(
                     ProviderWithState(
-                        **provider.model_dump(),
+                        # Field values are passed as they are, the agent card is not validated again
+                        **dict(provider),
                         # We blatantly report a ready state for unmanaged providers
                         # (calling each provider over HTTP is too expensive for a simple list_providers request)
                         # TODO: In-memory state caching for unmanaged providers
@@ -141,6 +166,7 @@ class ProviderService:
             if provider.managed:
                 await self._deployment_manager.delete(provider_id=provider_id)
             await uow.commit()
+        await self._a2a_proxy.release_provider(provider_id=provider_id)
 
     async def scale_down_providers(self):
         active_providers = [
@@ -148,11 +174,15 @@ class ProviderService:
             for provider in await self.list_providers()
             if provider.managed and provider.state == ProviderDeploymentState.RUNNING
         ]
+        keep_warm = await self._keep_warm.keep_warm_reasons(active_providers)
         errors = []
         for provider in active_providers:
             try:
+                if provider.id in keep_warm:
+                    continue
                 if provider.auto_stop_timeout and (provider.last_active_at + provider.auto_stop_timeout) < utc_now():
                     logger.info(f"Scaling down provider: {provider.id}")
+                    # Clients pooled by the API server are evicted by the proxy once they fail to connect
                     await self._deployment_manager.scale_down(provider_id=provider.id)
             except Exception as ex:
                 errors.append(ex)
@@ -169,10 +199,10 @@ class ProviderService:
             return await self._get_providers_with_state(providers=[p async for p in uow.providers.list()])
 
     async def get_provider(self, provider_id: UUID) -> ProviderWithState:
-        providers = [provider for provider in await self.list_providers() if provider.id == provider_id]
-        if not providers:
-            raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=f"Provider with ID: {provider_id!s} not found")
-        return providers[0]
+        async with self._uow() as uow:
+            provider = await uow.providers.get(provider_id=provider_id)
+        [provider_response] = await self._get_providers_with_state(providers=[provider])
+        return provider_response
 
     async def stream_logs(self, provider_id: UUID) -> Callable[..., AsyncIterator[str]]:
         logs_container = LogsContainer()
@@ -0,0 +1,162 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import logging
+from collections import Counter
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from uuid import UUID
+
+from kink import inject
+from pydantic import RootModel
+
+from beeai_server.configuration import Configuration
+from beeai_server.domain.models.provider import Provider, ProviderLocation
+from beeai_server.domain.models.registry import RegistryLocation
+from beeai_server.service_layer.services.provider import ProviderService
+from beeai_server.service_layer.unit_of_work import IUnitOfWorkFactory
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RegistryDiff:
+    to_add: dict[UUID, ProviderLocation]
+    to_remove: list[Provider]
+    to_check: dict[UUID, tuple[Provider, ProviderLocation]]
+
+
+def compute_registry_diff(
+    desired_providers: Mapping[UUID, ProviderLocation], registry_providers: Mapping[UUID, Provider]
+) -> RegistryDiff:
+    return RegistryDiff(
+        to_add={
+            provider_id: location
+            for provider_id, location in desired_providers.items()
+            if provider_id not in registry_providers
+        },
+        to_remove=[
+            provider for provider_id, provider in registry_providers.items() if provider_id not in desired_providers
+        ],
+        to_check={
+            provider_id: (registry_providers[provider_id], location)
+            for provider_id, location in desired_providers.items()
+            if provider_id in registry_providers
+        },
+    )
+
+
+@inject
+class RegistrySyncService:
+    """
+    Synchronizes providers with the configured agent registries.
+
+    Providers are added, upgraded and removed according to the difference between the registries and the providers
+    in the database, with bounded concurrency. The fingerprint of each provider source (image manifest digest or agent
+    card ETag) is persisted, so the agent card of an unchanged provider is not loaded again.
+    """
+
+    def __init__(self, provider_service: ProviderService, uow: IUnitOfWorkFactory, configuration: Configuration):
+        self._provider_service = provider_service
+        self._uow = uow
+        self._config = configuration.agent_registry
+
+    async def _load_desired_providers(
+        self, errors: list[Exception]
+    ) -> tuple[dict[UUID, ProviderLocation], dict[UUID, RegistryLocation]]:
+        desired_providers, registry_by_provider_id = {}, {}
+        registries = list(self._config.locations.values())
+        # Registry which fails to load fails the whole sync, its providers would be removed otherwise
+        registry_locations = await asyncio.gather(*(registry.load() for registry in registries))
+        for registry, provider_locations in zip(registries, registry_locations, strict=True):
+            for provider_location in provider_locations:
+                try:
+                    provider_id = RootModel[ProviderLocation](root=provider_location).root.provider_id
+                    desired_providers[provider_id] = provider_location
+                    registry_by_provider_id[provider_id] = registry
+                except ValueError as e:
+                    errors.append(e)
+        return desired_providers, registry_by_provider_id
+
+    async def sync(self) -> Counter[str]:
+        """Synchronize the providers, returns the number of providers per action."""
+        results: Counter[str] = Counter()
+        if not self._config.locations:
+            return results
+
+        errors: list[Exception] = []
+        try:
+            await self._provider_service.remove_orphaned_providers()
+        except Exception as ex:
+            errors.extend(ex.exceptions if isinstance(ex, ExceptionGroup) else [ex])
+
+        desired_providers, registry_by_provider_id = await self._load_desired_providers(errors)
+        async with self._uow() as uow:
+            registry_providers = {provider.id: provider async for provider in uow.providers.list() if provider.registry}
+        diff = compute_registry_diff(desired_providers, registry_providers)
+        # Providers synced before fingerprints were stored
+        adopted_fingerprints: dict[UUID, str] = {}
+        limiter = asyncio.Semaphore(self._config.sync_concurrency)
+
+        async def run(action: str, location: object, fn: Callable[[], Awaitable[str]]) -> None:
+            async with limiter:
+                try:
+                    results[await fn()] += 1
+                except Exception as ex:
+                    errors.append(RuntimeError(f"[{location}]: Failed to {action} provider: {ex}"))
+
+        async def remove(provider: Provider) -> str:
+            await self._provider_service.delete_provider(provider_id=provider.id)
+            logger.info(f"Removed provider {provider.source}")
+            return "removed"
+
+        async def add(provider_id: UUID, location: ProviderLocation) -> str:
+            fingerprint = await location.get_fingerprint()
+            await self._provider_service.create_provider(
+                location=location, registry=registry_by_provider_id[provider_id], source_fingerprint=fingerprint
+            )
+            logger.info(f"Added provider {location}")
+            return "added"
+
+        async def check(provider: Provider, location: ProviderLocation) -> str:
+            fingerprint = await location.get_fingerprint()
+            stored_fingerprint = provider.source_fingerprint
+            if provider.source.root == location.root and stored_fingerprint in {None, fingerprint}:
+                if stored_fingerprint is None:
+                    adopted_fingerprints[provider.id] = fingerprint
+                return "unchanged"
+            # Source moved to a different tag of the same image, the agent card does not need to be loaded again.
+            # A re-pushed tag is upgraded with the new fingerprint, which rolls the deployment to the new digest.
+            agent_card = provider.agent_card if stored_fingerprint == fingerprint else None
+            await self._provider_service.upgrade_provider(
+                provider_id=provider.id,
+                location=location,
+                force=True,
+                agent_card=agent_card,
+                source_fingerprint=fingerprint,
+            )
+            logger.info(f"Upgraded provider {location}")
+            return "upgraded"
+
+        # Remove old providers first - to prevent agent name collisions
+        async with asyncio.TaskGroup() as tg:
+            for provider in diff.to_remove:
+                tg.create_task(run("remove", provider.source, lambda provider=provider: remove(provider)))
+        async with asyncio.TaskGroup() as tg:
+            for provider_id, location in diff.to_add.items():
+                tg.create_task(run("add", location, lambda pid=provider_id, loc=location: add(pid, loc)))
+            for provider, location in diff.to_check.values():
+                tg.create_task(run("upgrade", location, lambda prov=provider, loc=location: check(prov, loc)))
+
+        try:
+            async with self._uow() as uow:
+                await uow.providers.update_source_fingerprints(fingerprints=adopted_fingerprints)
+                await uow.commit()
+        except Exception as ex:
+            errors.append(ex)
+
+        logger.info(f"Registry synchronized: {dict(results)}")
+        if errors:
+            raise ExceptionGroup("Exceptions occurred when reloading providers", errors)
+        return results
@@ -7,6 +7,7 @@ from uuid import UUID
 from kink import inject
 
 from beeai_server.domain.models.user import User, UserRole
+from beeai_server.domain.repositories.file import IObjectStorageRepository
 from beeai_server.service_layer.unit_of_work import IUnitOfWorkFactory
 
 logger = logging.getLogger(__name__)
@@ -17,8 +18,10 @@ class UserService:
     def __init__(
         self,
         uow: IUnitOfWorkFactory,
+        object_storage: IObjectStorageRepository,
     ):
         self._uow = uow
+        self._object_storage = object_storage
 
     async def create_user(self, *, email: str, role: UserRole = UserRole.USER) -> User:
         async with self._uow() as uow:
@@ -37,5 +40,12 @@ class UserService:
 
     async def delete_user(self, user_id: UUID) -> None:
         async with self._uow() as uow:
+            # History items of the user contexts are deleted by cascade, their offloaded payloads after the commit
+            offloaded_item_ids = await uow.contexts.list_offloaded_history_item_ids(user_id=user_id)
             await uow.users.delete(user_id=user_id)
             await uow.commit()
+        if offloaded_item_ids:
+            try:
+                await self._object_storage.delete_files(file_ids=offloaded_item_ids)
+            except Exception as ex:
+                logger.warning(f"Failed to delete offloaded history items of user {user_id}: {ex!r}")
@@ -2,23 +2,37 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import builtins
+import itertools
 import logging
+from asyncio import CancelledError
 from collections.abc import Iterable
+from datetime import timedelta
 from uuid import UUID
 
 from kink import inject
 
 from beeai_server.configuration import Configuration
+from beeai_server.domain.models.file import ExtractionStatus, FileType
 from beeai_server.domain.models.user import User
 from beeai_server.domain.models.vector_store import (
+    ChunkingParameters,
     DocumentType,
     VectorStore,
     VectorStoreDocument,
+    VectorStoreIngestion,
     VectorStoreItem,
     VectorStoreSearchResult,
 )
-from beeai_server.exceptions import InvalidVectorDimensionError, StorageCapacityExceededError
-from beeai_server.service_layer.unit_of_work import IUnitOfWorkFactory
+from beeai_server.exceptions import (
+    EntityNotFoundError,
+    InvalidVectorDimensionError,
+    PlatformError,
+    StorageCapacityExceededError,
+)
+from beeai_server.service_layer.services.files import FileService
+from beeai_server.service_layer.services.model_provider import ModelProviderService
+from beeai_server.service_layer.unit_of_work import IUnitOfWork, IUnitOfWorkFactory
+from beeai_server.utils.text_splitter import split_text
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +41,19 @@ logger = logging.getLogger(__name__)
 class VectorStoreService:
     """Service for managing vector stores."""
 
-    def __init__(self, uow: IUnitOfWorkFactory, configuration: Configuration):
+    def __init__(
+        self,
+        uow: IUnitOfWorkFactory,
+        configuration: Configuration,
+        file_service: FileService,
+        model_provider_service: ModelProviderService,
+    ):
         self._uow = uow
+        self._file_service = file_service
+        self._model_provider_service = model_provider_service
         self._storage_limit_per_user = configuration.vector_stores.storage_limit_per_user_bytes
+        self._embedding_batch_size = configuration.vector_stores.ingestion_embedding_batch_size
+        self._extraction_timeout = timedelta(seconds=configuration.vector_stores.ingestion_extraction_timeout_sec)
 
     async def list(self, *, user: User) -> list[VectorStore]:
         """List all vector stores for a user."""
@@ -97,34 +121,171 @@ class VectorStoreService:
             vector_store = await uow.vector_stores.get(
                 vector_store_id=vector_store_id, user_id=user.id, context_id=context_id
             )
+            await self._add_items(uow, vector_store=vector_store, items=items)
+            await uow.commit()
+
+    async def _add_items(
+        self, uow: IUnitOfWork, *, vector_store: VectorStore, items: builtins.list[VectorStoreItem]
+    ) -> None:
+        # Check dimension
+        if any(len(item.embedding) != vector_store.dimension for item in items):
+            raise InvalidVectorDimensionError(
+                f"Vector dimensions must match vector store dimension: {vector_store.dimension}"
+            )
+
+        # Check usage
+        usage_bytes_per_document_id = {d.id: d.usage_bytes for d in uow.vector_database.estimate_size(items)}
+        total_usage = await uow.vector_stores.total_usage(user_id=vector_store.created_by)
+        if total_usage + sum(usage_bytes_per_document_id.values()) > self._storage_limit_per_user:
+            # We are a bit more cautious here, the storage may in fact not be exceeded because some documents
+            # or items might already be in the database - the operation below is an upsert, but for simplicity
+            # we check the usage as if all items were new.
+            raise StorageCapacityExceededError(entity="vector_store", max_size=self._storage_limit_per_user)
+
+        await uow.vector_stores.upsert_documents(
+            documents={
+                item.document_id: VectorStoreDocument(
+                    vector_store_id=vector_store.id,
+                    id=item.document_id,
+                    file_id=UUID(item.document_id) if item.document_type == DocumentType.PLATFORM_FILE else None,
+                    usage_bytes=usage_bytes_per_document_id.get(item.document_id),
+                )
+                for item in items
+            }.values()
+        )
+        await uow.vector_database.add_items(collection_id=vector_store.id, items=items)
 
-            # Check dimension
-            if any(len(item.embedding) != vector_store.dimension for item in items):
-                raise InvalidVectorDimensionError(
-                    f"Vector dimensions must match vector store dimension: {vector_store.dimension}"
+    async def create_ingestion(
+        self,
+        *,
+        vector_store_id: UUID,
+        file_ids: builtins.list[UUID],
+        chunking: ChunkingParameters,
+        user: User,
+        context_id: UUID | None = None,
+    ) -> VectorStoreIngestion:
+        """Schedule a job extracting, chunking and embedding the files into the vector store."""
+        file_ids = list(dict.fromkeys(file_ids))
+        async with self._uow() as uow:
+            # check ownership
+            await uow.vector_stores.get(vector_store_id=vector_store_id, user_id=user.id, context_id=context_id)
+            for file_id in file_ids:
+                await uow.files.get(
+                    file_id=file_id, user_id=user.id, context_id=context_id, file_type=FileType.USER_UPLOAD
                 )
+            ingestion = VectorStoreIngestion(
+                vector_store_id=vector_store_id,
+                file_ids=file_ids,
+                chunking=chunking,
+                created_by=user.id,
+                context_id=context_id,
+            )
+            await uow.vector_stores.create_ingestion(ingestion=ingestion)
+            await uow.commit()
 
-            # Check usage
-            usage_bytes_per_document_id = {d.id: d.usage_bytes for d in uow.vector_database.estimate_size(items)}
-            total_usage = await uow.vector_stores.total_usage(user_id=user.id)
-            if total_usage + sum(usage_bytes_per_document_id.values()) > self._storage_limit_per_user:
-                # We are a bit more cautious here, the storage may in fact not be exceeded because some documents
-                # or items might already be in the database - the operation below is an upsert, but for simplicity
-                # we check the usage as if all items were new.
-                raise StorageCapacityExceededError(entity="vector_store", max_size=self._storage_limit_per_user)
-
-            await uow.vector_stores.upsert_documents(
-                documents={
-                    item.document_id: VectorStoreDocument(
-                        vector_store_id=vector_store_id,
-                        id=item.document_id,
-                        file_id=UUID(item.document_id) if item.document_type == DocumentType.PLATFORM_FILE else None,
-                        usage_bytes=usage_bytes_per_document_id.get(item.document_id),
-                    )
-                    for item in items
-                }.values()
+        # Defer only after the commit, the job would not find an uncommitted ingestion
+        from beeai_server.jobs.tasks.vector_store import ingest_files
+
+        await ingest_files.configure().defer_async(ingestion_id=str(ingestion.id))
+        return ingestion
+
+    async def get_ingestion(
+        self, *, vector_store_id: UUID, ingestion_id: UUID, user: User, context_id: UUID | None = None
+    ) -> VectorStoreIngestion:
+        async with self._uow() as uow:
+            ingestion = await uow.vector_stores.get_ingestion(
+                ingestion_id=ingestion_id, user_id=user.id, context_id=context_id
+            )
+        if ingestion.vector_store_id != vector_store_id:
+            raise EntityNotFoundError(entity="vector_store_ingestion", id=ingestion_id)
+        return ingestion
+
+    async def ingest(self, *, ingestion_id: UUID, job_id: str) -> None:
+        async with self._uow() as uow:
+            ingestion = await uow.vector_stores.get_ingestion(ingestion_id=ingestion_id)
+            if ingestion.finished:
+                return
+            vector_store = await uow.vector_stores.get(vector_store_id=ingestion.vector_store_id)
+            user = await uow.users.get(user_id=ingestion.created_by)
+            ingestion.set_started(job_id=job_id)
+            await uow.vector_stores.update_ingestion(ingestion=ingestion)
+            await uow.commit()
+
+        try:
+            for file_id in ingestion.file_ids:
+                await self._ingest_file(ingestion, vector_store=vector_store, file_id=file_id, user=user)
+                ingestion.progress.processed_files += 1
+                await self._update_ingestion(ingestion)
+            ingestion.set_completed()
+            await self._update_ingestion(ingestion)
+        except CancelledError:
+            ingestion.set_cancelled()
+            await self._update_ingestion(ingestion)
+            raise
+        except Exception as ex:
+            ingestion.set_failed(str(ex))
+            await self._update_ingestion(ingestion)
+            raise
+
+    async def _ingest_file(
+        self, ingestion: VectorStoreIngestion, *, vector_store: VectorStore, file_id: UUID, user: User
+    ) -> None:
+        context_id = ingestion.context_id
+        file = await self._file_service.get(file_id=file_id, user=user, context_id=context_id)
+        extraction = await self._file_service.create_extraction(file_id=file_id, user=user, context_id=context_id)
+        if not extraction.finished:
+            [extraction] = await self._file_service.wait_for_extractions(
+                file_ids=[file_id], user=user, context_id=context_id, timeout=self._extraction_timeout
             )
-            await uow.vector_database.add_items(collection_id=vector_store_id, items=items)
+        if extraction.status != ExtractionStatus.COMPLETED or not extraction.extracted_file_id:
+            raise PlatformError(
+                f"Text extraction of file {file_id} did not complete ({extraction.status}): "
+                f"{extraction.error_message or 'timed out'}"
+            )
+
+        content = bytearray()
+        async with self._file_service.get_content(
+            file_id=extraction.extracted_file_id, user=user, context_id=context_id
+        ) as text_file:
+            while chunk := await text_file.read(64 * 1024):
+                content.extend(chunk)
+        chunks = split_text(content.decode("utf-8", errors="replace"), **ingestion.chunking.model_dump())
+
+        embeddings = []
+        for batch in itertools.batched(chunks, self._embedding_batch_size, strict=False):
+            response = await self._model_provider_service.create_embeddings(
+                model_id=vector_store.model_id, inputs=list(batch)
+            )
+            embeddings.extend(embedding.embedding for embedding in response.data)
+            ingestion.progress.embedded_chunks += len(batch)
+            await self._update_ingestion(ingestion)
+
+        items = [
+            VectorStoreItem(
+                document_id=str(file_id),
+                document_type=DocumentType.PLATFORM_FILE,
+                model_id=vector_store.model_id,
+                text=text,
+                embedding=embedding,
+                metadata={
+                    "file_id": str(file_id),
+                    "filename": file.filename,
+                    "chunk_index": str(i),
+                    "total_chunks": str(len(chunks)),
+                },
+            )
+            for i, (text, embedding) in enumerate(zip(chunks, embeddings, strict=True))
+        ]
+        async with self._uow() as uow:
+            # Ingesting a file again replaces its items instead of duplicating them
+            await uow.vector_stores.remove_documents(vector_store_id=vector_store.id, document_ids=[str(file_id)])
+            if items:
+                await self._add_items(uow, vector_store=vector_store, items=items)
+            await uow.commit()
+
+    async def _update_ingestion(self, ingestion: VectorStoreIngestion) -> None:
+        async with self._uow() as uow:
+            await uow.vector_stores.update_ingestion(ingestion=ingestion)
             await uow.commit()
 
     async def search(
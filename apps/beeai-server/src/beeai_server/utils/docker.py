@@ -1,6 +1,7 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import hashlib
 import re
 from typing import Any
 
@@ -94,47 +95,76 @@ async def get_auth_endpoint(registry: str, get_manifest_url: str) -> str | None:
     return auth_url_per_registry[registry]
 
 
-@inject
-async def get_registry_image_config_and_labels(
-    image_id: DockerImageID, configuration: Configuration
-) -> tuple[dict, dict]:
-    # Parse image name to determine registry and repository
-    headers = {
-        "Accept": (
-            "application/vnd.oci.image.index.v1+json,"
-            "application/vnd.oci.image.manifest.v1+json,"
-            "application/vnd.docker.distribution.manifest.list.v2+json,"
-            "application/vnd.docker.distribution.manifest.v2+json"
-        )
-    }
+MANIFEST_ACCEPT_HEADER = (
+    "application/vnd.oci.image.index.v1+json,"
+    "application/vnd.oci.image.manifest.v1+json,"
+    "application/vnd.docker.distribution.manifest.list.v2+json,"
+    "application/vnd.docker.distribution.manifest.v2+json"
+)
+
+
+async def _get_registry_access(
+    client: httpx.AsyncClient, image_id: DockerImageID, configuration: Configuration
+) -> tuple[str, dict[str, str]]:
+    """Return the base URL of the image repository in the registry and the headers for authenticated requests."""
+    headers = {"Accept": MANIFEST_ACCEPT_HEADER}
 
     config = configuration.oci_registry[image_id.registry]
-    protocol = config.protocol
     registry = image_id.registry
 
     if registry.endswith("docker.io"):
         registry = "registry-1.docker.io"
 
-    manifest_base_url = f"{protocol}://{registry}/v2/{image_id.repository}/manifests"
-    get_manifest_url = f"{manifest_base_url}/{image_id.tag}"
+    repository_url = f"{config.protocol}://{registry}/v2/{image_id.repository}"
+    get_manifest_url = f"{repository_url}/manifests/{image_id.tag}"
 
     try:
         token_endpoint = await get_auth_endpoint(registry, get_manifest_url)
     except Exception as ex:
         raise Exception("Image registry does not exist or is not accessible") from ex
 
+    if token_endpoint:
+        token_endpoint = token_endpoint.format(repository=image_id.repository)
+        auth_resp = await client.get(
+            token_endpoint,
+            follow_redirects=True,
+            headers=config.basic_auth_str and {"Authorization": f"Basic {config.basic_auth_str}"},
+        )
+        if auth_resp.status_code != 200:
+            raise Exception(f"Failed to authenticate: {auth_resp.status_code}, {auth_resp.text}")
+        token = auth_resp.json()["token"]
+        headers["Authorization"] = f"Bearer {token}"
+    return repository_url, headers
+
+
+@inject
+async def get_registry_image_digest(image_id: DockerImageID, configuration: Configuration) -> str:
+    """Return the digest of the manifest the image tag points to, without downloading the manifest if possible."""
     async with httpx.AsyncClient() as client:
-        if token_endpoint:
-            token_endpoint = token_endpoint.format(repository=image_id.repository)
-            auth_resp = await client.get(
-                token_endpoint,
-                follow_redirects=True,
-                headers=config.basic_auth_str and {"Authorization": f"Basic {config.basic_auth_str}"},
-            )
-            if auth_resp.status_code != 200:
-                raise Exception(f"Failed to authenticate: {auth_resp.status_code}, {auth_resp.text}")
-            token = auth_resp.json()["token"]
-            headers["Authorization"] = f"Bearer {token}"
+        repository_url, headers = await _get_registry_access(client, image_id, configuration)
+        get_manifest_url = f"{repository_url}/manifests/{image_id.tag}"
+
+        manifest_resp = await client.head(get_manifest_url, headers=headers, follow_redirects=True)
+        if manifest_resp.status_code == 200 and (digest := manifest_resp.headers.get("docker-content-digest")):
+            return digest
+
+        # Registries are not required to send the digest header, compute it from the manifest
+        manifest_resp = await client.get(get_manifest_url, headers=headers, follow_redirects=True)
+        if manifest_resp.status_code != 200:
+            raise Exception(f"Failed to get manifest: {manifest_resp.status_code}, {manifest_resp.text}")
+        return manifest_resp.headers.get("docker-content-digest") or (
+            f"sha256:{hashlib.sha256(manifest_resp.content).hexdigest()}"
+        )
+
+
+@inject
+async def get_registry_image_config_and_labels(
+    image_id: DockerImageID, configuration: Configuration
+) -> tuple[dict, dict]:
+    async with httpx.AsyncClient() as client:
+        repository_url, headers = await _get_registry_access(client, image_id, configuration)
+        manifest_base_url = f"{repository_url}/manifests"
+        get_manifest_url = f"{manifest_base_url}/{image_id.tag}"
 
         manifest_resp = await client.get(get_manifest_url, headers=headers, follow_redirects=True)
 
@@ -150,7 +180,7 @@ async def get_registry_image_config_and_labels(
             manifest = manifest_resp.json()
 
         config_digest = manifest["config"]["digest"]
-        config_url = f"{protocol}://{registry}/v2/{image_id.repository}/blobs/{config_digest}"
+        config_url = f"{repository_url}/blobs/{config_digest}"
         config_resp = await client.get(config_url, headers=headers, follow_redirects=True)
 
         if config_resp.status_code != 200:
@@ -1,11 +1,17 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+from collections import deque
+from collections.abc import AsyncIterator
+
 from fastapi import status
 from fastapi.staticfiles import StaticFiles
+from python_multipart.multipart import MultipartParser, parse_options_header
 from starlette.responses import AsyncContentStream, StreamingResponse
 
 from beeai_server.api.schema.common import ErrorStreamResponse, ErrorStreamResponseError
+from beeai_server.domain.models.file import AsyncFile
+from beeai_server.exceptions import PlatformError
 from beeai_server.utils.utils import extract_messages
 
 
@@ -50,3 +56,103 @@ def streaming_response(content: AsyncContentStream):
             "Connection": "keep-alive",
         },
     )
+
+
+async def read_multipart_file(stream: AsyncIterator[bytes], content_type: str, field_name: str = "file") -> AsyncFile:
+    """
+    Parse a multipart/form-data body incrementally and return the part `field_name` as a file.
+
+    Unlike starlette's form parser, the body is not spooled to a temporary file: the returned file reads directly
+    from the request stream, so the part must be consumed before the request ends. Other fields are skipped.
+    """
+    mime_type, params = parse_options_header(content_type)
+    if mime_type != b"multipart/form-data" or not params.get(b"boundary"):
+        raise ValueError("Expected a multipart/form-data request with a boundary")
+
+    header_field, header_value = bytearray(), bytearray()
+    headers: dict[bytes, bytes] = {}
+    chunks: deque[bytes] = deque()
+    in_file_part = False
+    file_headers: dict[bytes, bytes] | None = None
+    file_done = False
+
+    def on_part_begin():
+        headers.clear()
+
+    def on_header_field(data: bytes, start: int, end: int):
+        header_field.extend(data[start:end])
+
+    def on_header_value(data: bytes, start: int, end: int):
+        header_value.extend(data[start:end])
+
+    def on_header_end():
+        headers[bytes(header_field).lower()] = bytes(header_value)
+        header_field.clear()
+        header_value.clear()
+
+    def on_headers_finished():
+        nonlocal in_file_part, file_headers
+        _, disposition = parse_options_header(headers.get(b"content-disposition"))
+        in_file_part = file_headers is None and disposition.get(b"name") == field_name.encode()
+        if in_file_part:
+            file_headers = {**headers, b"filename": disposition.get(b"filename", b"")}
+
+    def on_part_data(data: bytes, start: int, end: int):
+        if in_file_part:
+            chunks.append(data[start:end])
+
+    def on_part_end():
+        nonlocal in_file_part, file_done
+        file_done = file_done or in_file_part
+        in_file_part = False
+
+    parser = MultipartParser(
+        params[b"boundary"],
+        callbacks={
+            "on_part_begin": on_part_begin,
+            "on_header_field": on_header_field,
+            "on_header_value": on_header_value,
+            "on_header_end": on_header_end,
+            "on_headers_finished": on_headers_finished,
+            "on_part_data": on_part_data,
+            "on_part_end": on_part_end,
+        },
+    )
+    stream = aiter(stream)
+    stream_done = False
+
+    async def feed() -> None:
+        nonlocal stream_done
+        if (chunk := await anext(stream, None)) is None:
+            stream_done = True
+            parser.finalize()
+        elif chunk:
+            parser.write(chunk)
+
+    while file_headers is None and not stream_done:
+        await feed()
+    if file_headers is None:
+        raise ValueError(f"Missing form field '{field_name}'")
+
+    async def read(size: int = -1) -> bytes:
+        # The body is read by the consumer of the file after the request was accepted, errors are client errors
+        try:
+            while not chunks and not file_done and not stream_done:
+                await feed()
+        except ValueError as ex:
+            raise PlatformError(f"Invalid multipart body: {ex}", status_code=status.HTTP_400_BAD_REQUEST) from ex
+        if not chunks and not file_done:
+            raise PlatformError("Unexpected end of multipart body", status_code=status.HTTP_400_BAD_REQUEST)
+        if not chunks:
+            return b""
+        chunk = chunks.popleft()
+        if 0 < size < len(chunk):
+            chunk, rest = chunk[:size], chunk[size:]
+            chunks.appendleft(rest)
+        return chunk
+
+    return AsyncFile(
+        filename=file_headers[b"filename"].decode(errors="replace"),
+        content_type=file_headers.get(b"content-type", b"").decode("latin-1"),
+        read=read,
+    )
@@ -0,0 +1,60 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import deque
+from collections.abc import Sequence
+
+
+def split_text(text: str, *, chunk_size: int, chunk_overlap: int, separators: Sequence[str]) -> list[str]:
+    """
+    Split text recursively into chunks of at most chunk_size characters.
+
+    The first separator found in the text is used to split it, parts which are still too long are split by the
+    following separators. Neighbouring parts are merged back into chunks sharing up to chunk_overlap characters.
+    An empty string separator splits into single characters, without it some chunks may exceed chunk_size.
+    """
+    if chunk_overlap >= chunk_size:
+        raise ValueError("chunk_overlap must be smaller than chunk_size")
+    return _split(text, separators, chunk_size, chunk_overlap)
+
+
+def _split(text: str, separators: Sequence[str], chunk_size: int, chunk_overlap: int) -> list[str]:
+    separator, remaining_separators = separators[-1], []
+    for i, candidate in enumerate(separators):
+        if not candidate or candidate in text:
+            separator, remaining_separators = candidate, separators[i + 1 :]
+            break
+
+    chunks, mergeable = [], []
+    for part in text.split(separator) if separator else list(text):
+        if len(part) <= chunk_size:
+            mergeable.append(part)
+            continue
+        if mergeable:
+            chunks.extend(_merge(mergeable, separator, chunk_size, chunk_overlap))
+            mergeable = []
+        if remaining_separators:
+            chunks.extend(_split(part, remaining_separators, chunk_size, chunk_overlap))
+        elif part := part.strip():
+            chunks.append(part)
+    if mergeable:
+        chunks.extend(_merge(mergeable, separator, chunk_size, chunk_overlap))
+    return chunks
+
+
+def _merge(parts: Sequence[str], separator: str, chunk_size: int, chunk_overlap: int) -> list[str]:
+    chunks = []
+    current: deque[str] = deque()
+    length = 0  # length of the current parts joined by the separator
+    for part in parts:
+        if current and length + len(separator) + len(part) > chunk_size:
+            if chunk := separator.join(current).strip():
+                chunks.append(chunk)
+            # Keep the tail of the previous chunk as overlap, as long as the next part still fits
+            while current and (length > chunk_overlap or length + len(separator) + len(part) > chunk_size):
+                length -= len(current.popleft()) + (len(separator) if current else 0)
+        length += len(part) + (len(separator) if current else 0)
+        current.append(part)
+    if chunk := separator.join(current).strip():
+        chunks.append(chunk)
+    return chunks
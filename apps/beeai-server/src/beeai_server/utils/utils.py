@@ -66,43 +66,78 @@ def async_to_sync_isolated[AnyCallableT: Callable[..., Any]](fn: AnyCallableT) -
     return wrapped_fn
 
 
+_HIGH_SURROGATE_ESCAPE = re.compile(r"\\u[dD][89abAB][0-9a-fA-F]{2}")
+
+
+def _is_escaped(content: str, idx: int) -> bool:
+    """Check whether the character at idx is preceded by an odd number of backslashes."""
+    start = idx
+    while start > 0 and content[start - 1] == "\\":
+        start -= 1
+    return (idx - start) % 2 == 1
+
+
+def _find_string_end(content: str) -> int:
+    """Find the closing quote of a JSON string body, -1 if it's not in the content."""
+    idx = content.find('"')
+    while idx != -1 and _is_escaped(content, idx):
+        idx = content.find('"', idx + 1)
+    return idx
+
+
+def _complete_prefix_length(content: str) -> int:
+    """Length of the content prefix not ending in the middle of an escape sequence or a surrogate pair."""
+    end = len(content)
+    # Escape sequences are at most 6 characters long (\uXXXX), find the last one that could be incomplete
+    idx = content.rfind("\\", max(end - 6, 0))
+    if idx != -1 and not _is_escaped(content, idx) and (idx + 1 == end or (content[idx + 1] == "u" and idx + 6 > end)):
+        end = idx
+    # Keep surrogate pairs together, they can only be decoded at once
+    idx = end - 6
+    if idx >= 0 and _HIGH_SURROGATE_ESCAPE.fullmatch(content, idx, end) and not _is_escaped(content, idx):
+        end = idx
+    return end
+
+
 async def extract_string_value_stream(
-    async_stream: Callable[[int], AsyncIterable[str]], key: str, chunk_size: int = 1024
+    async_stream: Callable[[int], AsyncIterable[str]],
+    key: str,
+    chunk_size: int = 1024,
+    read_size: int = 64 * 1024,
 ) -> AsyncIterable[str]:
+    """
+    Extract the string value of the first occurrence of `key` from a streamed JSON document.
+
+    The input is read in blocks of `read_size` characters. Each block is scanned for the closing quote in bulk and
+    decoded at once by the json module, only the tail of a block that ends inside an escape sequence is carried over.
+    The decoded value is yielded in chunks of at most `chunk_size` characters.
+    """
+    key_pattern = re.compile(rf'"{re.escape(key)}" *: *"')
+    max_key_size = len(key) * 2 + 8
+    stream = aiter(async_stream(read_size))
     buffer = ""
-    max_buffer_size = len(key) * 2
-    state = "outside"
-    if chunk_size < max_buffer_size:
-        raise ValueError("Chunk size too small")
-
-    async for chunk in async_stream(chunk_size):
-        buffer += chunk
-        if state == "outside":
-            if match := re.search(rf'"{key}" *: *"', buffer):
-                buffer = buffer[match.end() :]
-                state = "inside"
-            else:
-                buffer = buffer[-max_buffer_size:]
-        if state == "inside":
-            backslash_count = 0
-            for idx, char in enumerate(buffer):
-                if char == "\\":
-                    backslash_count += 1
-                elif char == '"':
-                    if backslash_count % 2 == 0:
-                        yield json.loads(f'"{buffer[:idx]}"')
-                        return
-                    backslash_count = 0
-                else:
-                    backslash_count = 0
-            if backslash_count % 2 == 0:
-                yield json.loads(f'"{buffer}"')
-                buffer = ""
-            else:
-                yield json.loads(f'"{buffer[:-1]}"')
-                buffer = "\\"
-
-    if state == "inside":
-        raise EOFError("Unterminated string value in JSON input")
+
+    async for block in stream:
+        buffer += block
+        if match := key_pattern.search(buffer):
+            buffer = buffer[match.end() :]
+            break
+        buffer = buffer[-max_key_size:]
     else:
         raise KeyError(f"Key {key} not found in JSON input")
+
+    while True:
+        end = _find_string_end(buffer)
+        terminated = end != -1
+        if not terminated:
+            end = _complete_prefix_length(buffer)
+        content = buffer[:end]
+        text = json.loads(f'"{content}"') if "\\" in content else content
+        for i in range(0, len(text), chunk_size):
+            yield text[i : i + chunk_size]
+        if terminated:
+            return
+        buffer = buffer[end:]
+        if (block := await anext(stream, None)) is None:
+            raise EOFError("Unterminated string value in JSON input")
+        buffer += block
@@ -0,0 +1,135 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark `create_or_replace` of the Kubernetes deployment manager for a provider whose deployment did not change.
+
+Compares the current no-op path (cached templates and manifests, deployment hash compared with the informer cache)
+with the previous one, which read, compiled and rendered the templates on each call and then fetched the deployment
+from the Kubernetes API. The API round trip is simulated by a configurable delay.
+
+Usage (from apps/beeai-server):
+    uv run python -m tests.benchmarks.deployment_manager --iterations 1000 --api-latency-ms 2
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import time
+
+import yaml
+from a2a.types import AgentCapabilities, AgentCard
+from jinja2 import Template
+from kink import di
+from kr8s.asyncio.objects import Secret, Service
+
+from beeai_server.configuration import Configuration
+from beeai_server.domain.models.provider import DockerImageProviderLocation, Provider, ProviderDeploymentState
+from beeai_server.infrastructure.kubernetes.deployment_informer import DeploymentStatus
+from beeai_server.infrastructure.kubernetes.provider_deployment_manager import (
+    TEMPLATE_KIND_TO_FILE_NAME,
+    KubernetesProviderDeploymentManager,
+    TemplateKind,
+)
+from beeai_server.service_layer.deployment_manager import global_provider_variables
+
+
+class StaticInformer:
+    def __init__(self, deployment: DeploymentStatus):
+        self._deployment = deployment
+
+    async def get(self, names):
+        return [self._deployment for _ in names]
+
+    def peek(self, names):
+        return [self._deployment for _ in names]
+
+
+async def legacy_noop(manager: KubernetesProviderDeploymentManager, provider: Provider, env: dict, api_latency: float):
+    """Rendering done by the previous implementation before the deployment was fetched from the API."""
+
+    async def render(kind: TemplateKind, **variables):
+        source = await (manager._template_dir / TEMPLATE_KIND_TO_FILE_NAME[kind]).read_text()
+        return yaml.safe_load(Template(source).render(**variables))
+
+    label = manager._get_k8s_name(provider.id)
+    env = {**env, **global_provider_variables()}
+    service = Service(
+        await render(
+            TemplateKind.SVC,
+            provider_service_name=manager._get_k8s_name(provider.id, kind=TemplateKind.SVC),
+            provider_app_label=label,
+        )
+    )
+    secret = Secret(
+        await render(
+            TemplateKind.SECRET,
+            provider_secret_name=manager._get_k8s_name(provider.id, TemplateKind.SECRET),
+            provider_app_label=label,
+            secret_data={key: base64.b64encode(value.encode()).decode() for key, value in env.items()},
+        )
+    )
+    deployment_manifest = await render(
+        TemplateKind.DEPLOY,
+        provider_deployment_name=manager._get_k8s_name(provider.id, TemplateKind.DEPLOY),
+        provider_app_label=label,
+        image=str(provider.source.root),
+        provider_secret_name=manager._get_k8s_name(provider.id, TemplateKind.SECRET),
+    )
+    combined_manifest = json.dumps({"service": service.raw, "secret": secret.raw, "deployment": deployment_manifest})
+    hashlib.sha256(combined_manifest.encode()).hexdigest()
+    await asyncio.sleep(api_latency)  # Deployment.get
+
+
+async def run(iterations: int, api_latency: float):
+    di[Configuration] = Configuration()
+    provider = Provider(
+        source=DockerImageProviderLocation(root="ghcr.io/i-am-bee/agent:1.0.0"),
+        agent_card=AgentCard(
+            name="Agent",
+            description="Benchmark agent",
+            url="http://agent:8000/",
+            version="1.0.0",
+            default_input_modes=["text"],
+            default_output_modes=["text"],
+            capabilities=AgentCapabilities(),
+            skills=[],
+        ),
+    )
+    env = {f"VARIABLE_{i}": f"value-{i}" for i in range(20)}
+
+    async def unavailable_api():
+        raise RuntimeError("Kubernetes API is not available in the benchmark")
+
+    manager = KubernetesProviderDeploymentManager(api_factory=unavailable_api)  # pyright: ignore [reportArgumentType]
+    manifests = await manager._render_manifests(provider, {**env, **global_provider_variables()})
+    manager._informer = StaticInformer(  # pyright: ignore [reportAttributeAccessIssue]
+        DeploymentStatus(state=ProviderDeploymentState.RUNNING, replicas=1, deployment_hash=manifests.deployment_hash)
+    )
+
+    async def current():
+        assert not await manager.create_or_replace(provider=provider, env=env)
+
+    for name, implementation in [
+        ("legacy", lambda: legacy_noop(manager, provider, env, api_latency)),
+        ("current", current),
+    ]:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await implementation()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<8} {elapsed / iterations * 1e6:10.1f} µs/call  {iterations / elapsed:10.0f} calls/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--api-latency-ms", type=float, default=2, help="simulated Kubernetes API round trip")
+    args = parser.parse_args()
+    asyncio.run(run(args.iterations, args.api_latency_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
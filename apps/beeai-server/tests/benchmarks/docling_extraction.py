@@ -0,0 +1,139 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark text extraction from a fake Docling server returning synthetic markdown.
+
+Compares the current `extract_string_value_stream` with the previous character-level implementation.
+
+Usage (from apps/beeai-server):
+    uv run python -m tests.benchmarks.docling_extraction --sizes-mb 1 10 100
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import socket
+import time
+from collections.abc import AsyncIterable, Callable
+from unittest import mock
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import StreamingResponse
+from starlette.routing import Route
+
+import beeai_server.infrastructure.text_extraction.docling as docling_module
+from beeai_server.configuration import DoclingExtractionConfiguration
+from beeai_server.infrastructure.text_extraction.docling import DoclingTextExtractionBackend
+from beeai_server.utils.utils import extract_string_value_stream
+
+MARKDOWN_BLOCK = (
+    '## Section "{i}"\n\nLorem ipsum dolor sit amet, consectetur adipiscing elit.\tSed do eiusmod tempor.\n'
+    "| col \\ a | col b |\n|---|---|\n| příliš žluťoučký kůň | 🐝 |\n\n<!-- image -->\n"
+)
+
+
+async def legacy_extract_string_value_stream(
+    async_stream: Callable[[int], AsyncIterable[str]], key: str, chunk_size: int = 1024
+) -> AsyncIterable[str]:
+    """Character-level parser used before the bulk scanning implementation."""
+    buffer = ""
+    max_buffer_size = len(key) * 2
+    state = "outside"
+    async for chunk in async_stream(chunk_size):
+        buffer += chunk
+        if state == "outside":
+            if match := re.search(rf'"{key}" *: *"', buffer):
+                buffer = buffer[match.end() :]
+                state = "inside"
+            else:
+                buffer = buffer[-max_buffer_size:]
+        if state == "inside":
+            backslash_count = 0
+            for idx, char in enumerate(buffer):
+                if char == "\\":
+                    backslash_count += 1
+                elif char == '"':
+                    if backslash_count % 2 == 0:
+                        yield json.loads(f'"{buffer[:idx]}"')
+                        return
+                    backslash_count = 0
+                else:
+                    backslash_count = 0
+            if backslash_count % 2 == 0:
+                yield json.loads(f'"{buffer}"')
+                buffer = ""
+            else:
+                yield json.loads(f'"{buffer[:-1]}"')
+                buffer = "\\"
+    raise EOFError("Unterminated string value in JSON input")
+
+
+def create_fake_docling_app(size_bytes: int) -> Starlette:
+    # docling-serve (FastAPI) does not escape non-ascii characters
+    markdown = "".join(MARKDOWN_BLOCK.format(i=i) for i in range(200))
+    escaped_block = json.dumps(markdown, ensure_ascii=False)[1:-1].encode()
+    repeats = max(size_bytes // len(escaped_block), 1)
+
+    async def convert(request: Request):
+        await request.body()
+
+        async def content():
+            yield b'{"document": {"filename": "test.pdf", "md_content": "'
+            for _ in range(repeats):
+                yield escaped_block
+            yield b'"}, "status": "success", "errors": [], "processing_time": 1.0}'
+
+        return StreamingResponse(content(), media_type="application/json")
+
+    return Starlette(routes=[Route("/v1/convert/source", convert, methods=["POST"])])
+
+
+async def extract(backend: DoclingTextExtractionBackend, read_size: int) -> int:
+    extracted_bytes = 0
+    async with backend.extract_text(file_url="http://example.com/test.pdf") as file:  # pyright: ignore [reportArgumentType]
+        while chunk := await file.read(read_size):
+            extracted_bytes += len(chunk)
+    return extracted_bytes
+
+
+async def run(sizes_mb: list[int], read_size: int):
+    for size_mb in sizes_mb:
+        # Listen before the server starts so that early requests wait in the backlog
+        sock = socket.create_server(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+        server = uvicorn.Server(uvicorn.Config(create_fake_docling_app(size_mb * 1024 * 1024), log_level="warning"))
+        server_task = asyncio.create_task(server.serve(sockets=[sock]))
+        backend = DoclingTextExtractionBackend(
+            DoclingExtractionConfiguration(enabled=True, docling_service_url=f"http://127.0.0.1:{port}")
+        )
+        try:
+            for name, implementation in [
+                ("legacy", legacy_extract_string_value_stream),
+                ("current", extract_string_value_stream),
+            ]:
+                with mock.patch.object(docling_module, "extract_string_value_stream", implementation):
+                    start = time.perf_counter()
+                    extracted_bytes = await extract(backend, read_size)
+                    elapsed = time.perf_counter() - start
+                print(
+                    f"{size_mb:>4} MB  {name:<8} {elapsed:8.2f} s  {extracted_bytes / elapsed / 1024 / 1024:8.1f} MB/s"
+                )
+        finally:
+            server.should_exit = True
+            await server_task
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes-mb", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--read-size", type=int, default=64 * 1024, help="size of reads from the extracted file")
+    args = parser.parse_args()
+    asyncio.run(run(args.sizes_mb, args.read_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@
 
 import uuid
 
+import httpx
 import pytest
 from beeai_sdk.a2a.types import AgentMessage
 from beeai_sdk.platform.context import Context
@@ -60,6 +61,12 @@ async def test_context_pagination(subtests):
         created_ats = [item.created_at for item in response.items]
         assert created_ats == sorted(created_ats)  # Should be ascending
 
+    with subtests.test("test without total count"):
+        first_page = await Context.list(limit=2, total_count="none")
+        second_page = await Context.list(limit=2, page_token=first_page.next_page_token, total_count="none")
+        assert first_page.total_count is None
+        assert [i.id for i in first_page.items + second_page.items] == list(reversed(context_ids))[:4]
+
     with subtests.test("test nonexistent cursor"):
         # Using invalid UUID should not crash, just ignore the cursor
         nonexistent_id = uuid.uuid4()
@@ -161,3 +168,31 @@ async def test_context_empty_filtering(subtests):
         assert len(context_ids) == 1
         assert context_with_history.id in context_ids
         assert empty_context.id not in context_ids
+
+
+@pytest.mark.usefixtures("clean_up", "setup_platform_client")
+async def test_context_history_batch(subtests):
+    """Test that batched history items are appended atomically and keep their order."""
+    context = await Context.create()
+    await context.add_history_item(data=AgentMessage(text="single"))
+
+    with subtests.test("batch items are stored in the given order"):
+        await context.add_history_items(data=[AgentMessage(text=f"batch {i}") for i in range(5)])
+        response = await Context.list_history(context.id, order="asc")
+        texts = [item.data.parts[0].root.text for item in response.items]  # pyright: ignore [reportAttributeAccessIssue]
+        assert texts == ["single", *[f"batch {i}" for i in range(5)]]
+
+    with subtests.test("only items after the since cursor are returned"):
+        first = response.items[0]
+        since_response = await Context.list_history(context.id, since=str(first.id))
+        assert [item.id for item in since_response.items] == [item.id for item in response.items[1:]]
+
+    with subtests.test("full history matches the paginated history"):
+        full_history = await Context.get_full_history(context.id)
+        assert [item.id for item in full_history.items] == [item.id for item in response.items]
+        assert full_history.next_page_token == str(response.items[-1].id)
+
+    with subtests.test("empty batch is rejected"):
+        with pytest.raises(httpx.HTTPStatusError, match="422"):
+            await context.add_history_items(data=[])
+        assert len((await Context.list_history(context.id)).items) == 6
@@ -1,16 +1,14 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 from collections.abc import Callable
-from datetime import timedelta
 from io import BytesIO
 
 import httpx
 import pytest
 from beeai_sdk.platform import use_platform_client
-from beeai_sdk.platform.client import PlatformClient
+from beeai_sdk.platform.client import PlatformClient, get_platform_client
 from beeai_sdk.platform.context import Context, ContextPermissions
 from beeai_sdk.platform.file import File
-from tenacity import AsyncRetrying, stop_after_delay, wait_fixed
 
 pytestmark = pytest.mark.e2e
 
@@ -32,6 +30,27 @@ async def test_files(subtests):
     with subtests.test("get file content"):
         async with retrieved_file.load_content() as loaded_file:
             assert loaded_file.text == '{"hello": "world"}'
+            assert loaded_file.etag == f'"{retrieved_file.content_sha256}"'
+
+    with subtests.test("get file content range"):
+        async with retrieved_file.load_content(byte_range=(1, 7)) as loaded_file:
+            assert loaded_file.text == '"hello"'
+        async with retrieved_file.load_content(byte_range=(10, None)) as loaded_file:
+            assert loaded_file.text == '"world"}'
+
+    with subtests.test("get file content via redirect"):
+        async with get_platform_client() as platform_client:
+            response = await platform_client.get(
+                f"/api/v1/files/{file_id}/content", params={"download_mode": "redirect"}
+            )
+            assert response.status_code == 307
+            assert response.headers["Location"]
+            assert response.headers["ETag"] == f'"{retrieved_file.content_sha256}"'
+
+    with subtests.test("get unchanged file content"):
+        async with retrieved_file.load_content(if_none_match=loaded_file.etag) as not_modified_file:
+            assert not_modified_file.not_modified
+            assert not_modified_file.content == b""
 
     with subtests.test("delete file"):
         await File.delete(file_id)
@@ -88,12 +107,9 @@ async def test_text_extraction_pdf_workflow(subtests, test_configuration, test_p
         extraction = await file.get_extraction()
         assert extraction.file_id == file.id
 
-    async for attempt in AsyncRetrying(stop=stop_after_delay(timedelta(seconds=40)), wait=wait_fixed(1)):
-        with attempt:
-            extraction = await file.get_extraction()
-            final_status = extraction.status
-            if final_status not in ["completed", "failed"]:
-                raise ValueError("not completed")
+    with subtests.test("wait for extraction without polling"):
+        extraction = await file.wait_for_extraction(timeout=40)
+        final_status = extraction.status
 
     assert final_status == "completed", f"Expected completed status, got {final_status}: {extraction.error_message}"
     assert extraction.extracted_file_id is not None
@@ -105,6 +121,19 @@ async def test_text_extraction_pdf_workflow(subtests, test_configuration, test_p
             assert len(text_content.text) > 0, "No text content was extracted"
             assert "Beeai is the future of AI" in text_content.text
 
+    with subtests.test("extraction of identical content is served from cache"):
+        duplicate = await File.create(
+            filename="duplicate_document.pdf",
+            content=pdf.getvalue(),
+            content_type="application/pdf",
+        )
+        assert duplicate.content_sha256 == file.content_sha256
+        duplicate_extraction = await duplicate.create_extraction()
+        assert duplicate_extraction.status == "completed"
+        assert duplicate_extraction.extracted_file_id != extraction.extracted_file_id
+        async with duplicate.load_text_content() as duplicate_text_content:
+            assert duplicate_text_content.text == text_content.text
+
     with subtests.test("delete extraction"):
         await file.delete_extraction()
 
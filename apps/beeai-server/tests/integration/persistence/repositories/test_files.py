@@ -8,7 +8,7 @@ import pytest
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
-from beeai_server.domain.models.file import File
+from beeai_server.domain.models.file import File, FileBlob
 from beeai_server.exceptions import EntityNotFoundError
 from beeai_server.infrastructure.persistence.repositories.file import SqlAlchemyFileRepository
 from beeai_server.utils.utils import utc_now
@@ -37,13 +37,18 @@ async def test_user_id(db_transaction) -> uuid.UUID:
 
 
 @pytest.fixture
-async def test_file(test_user_id: uuid.UUID) -> File:
+async def test_file(db_transaction: AsyncConnection, test_user_id: uuid.UUID) -> File:
     """Create a test file for use in tests."""
+    repository = SqlAlchemyFileRepository(connection=db_transaction)
+    blob = await repository.acquire_blob(
+        blob=FileBlob(content_sha256="a" * 64, size_bytes=1024, created_by=test_user_id)
+    )
     return File(
         filename="test_file.txt",
         file_size_bytes=1024,
         content_type="text/plain",
         created_by=test_user_id,
+        blob_id=blob.id,
     )
 
 
@@ -59,18 +64,29 @@ def db_file_for(user_id: uuid.UUID, filename: str = "test_file.txt", file_size_b
     }
 
 
-@pytest.fixture
-async def db_test_file(db_transaction: AsyncConnection, test_user_id: uuid.UUID) -> dict[str, Any]:
-    # Create file data
-    file_data = db_file_for(test_user_id)
-    # Insert file directly into database
+async def insert_db_file(db_transaction: AsyncConnection, file_data: dict[str, Any]):
     await db_transaction.execute(
         text(
-            "INSERT INTO files (id, filename, content_type, file_size_bytes, file_type, created_at, created_by) "
-            "VALUES (:id, :filename, :content_type, :file_size_bytes, :file_type, :created_at, :created_by)"
+            "INSERT INTO file_blobs (id, size_bytes, ref_count, created_at, created_by) "
+            "VALUES (:id, :file_size_bytes, 1, :created_at, :created_by)"
         ),
         file_data,
     )
+    await db_transaction.execute(
+        text(
+            "INSERT INTO files (id, filename, content_type, file_size_bytes, file_type, created_at, created_by, blob_id) "
+            "VALUES (:id, :filename, :content_type, :file_size_bytes, :file_type, :created_at, :created_by, :id)"
+        ),
+        file_data,
+    )
+
+
+@pytest.fixture
+async def db_test_file(db_transaction: AsyncConnection, test_user_id: uuid.UUID) -> dict[str, Any]:
+    # Create file data
+    file_data = db_file_for(test_user_id)
+    # Insert file directly into database
+    await insert_db_file(db_transaction, file_data)
     return file_data
 
 
@@ -202,13 +218,7 @@ async def test_list_files(db_transaction: AsyncConnection, test_user_id: uuid.UU
 
     # Insert files directly into database
     for file_data in user_files + other_user_files:
-        await db_transaction.execute(
-            text(
-                "INSERT INTO files (id, filename, content_type, file_size_bytes, file_type, created_at, created_by) "
-                "VALUES (:id, :filename, :content_type, :file_size_bytes, :file_type, :created_at, :created_by)"
-            ),
-            file_data,
-        )
+        await insert_db_file(db_transaction, file_data)
 
     # List all files
     all_files = {file.id: file async for file in repository.list()}
@@ -253,13 +263,7 @@ async def test_total_usage(db_transaction: AsyncConnection, test_user_id: uuid.U
 
     # Insert files directly into database
     for file_data in user_files + other_user_files:
-        await db_transaction.execute(
-            text(
-                "INSERT INTO files (id, filename, content_type, file_size_bytes, file_type, created_at, created_by) "
-                "VALUES (:id, :filename, :content_type, :file_size_bytes, :file_type, :created_at, :created_by)"
-            ),
-            file_data,
-        )
+        await insert_db_file(db_transaction, file_data)
 
     # Get total usage for all users
     total_usage = await repository.total_usage()
@@ -272,3 +276,36 @@ async def test_total_usage(db_transaction: AsyncConnection, test_user_id: uuid.U
     # Get total usage for other user
     other_user_total_usage = await repository.total_usage(user_id=other_user_id)
     assert other_user_total_usage == 4096
+
+
+async def test_deduplicate_blobs(db_transaction: AsyncConnection, test_user_id: uuid.UUID):
+    repository = SqlAlchemyFileRepository(connection=db_transaction)
+
+    first = await repository.acquire_blob(
+        blob=FileBlob(content_sha256="b" * 64, size_bytes=512, created_by=test_user_id)
+    )
+    second = await repository.acquire_blob(
+        blob=FileBlob(content_sha256="b" * 64, size_bytes=512, created_by=test_user_id)
+    )
+    assert second.id == first.id
+    assert second.ref_count == 2
+
+    files = [
+        File(filename=f"file_{i}.txt", content_type="text/plain", created_by=test_user_id, blob_id=first.id)
+        for i in range(2)
+    ]
+    for file in files:
+        await repository.create(file=file)
+
+    # Identical content is counted only once
+    assert await repository.total_usage(user_id=test_user_id) == 512
+
+    # The blob is released only when the last file referencing it is deleted
+    released = await repository.delete(file_id=files[0].id)
+    assert released == [first.id]
+    assert await repository.unreferenced_blobs_usage(blob_ids=released) == 0
+    assert await repository.delete_unreferenced_blobs(blob_ids=released) == []
+    released = await repository.delete(file_id=files[1].id)
+    assert await repository.unreferenced_blobs_usage(blob_ids=released) == 512
+    assert await repository.delete_unreferenced_blobs(blob_ids=released) == [first.id]
+    assert await repository.total_usage(user_id=test_user_id) == 0
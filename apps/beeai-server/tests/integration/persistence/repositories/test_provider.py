@@ -3,7 +3,7 @@
 
 import json
 import uuid
-from datetime import timedelta
+from datetime import UTC, timedelta
 
 import pytest
 from a2a.types import AgentCapabilities, AgentCard
@@ -110,6 +110,67 @@ async def test_get_provider(db_transaction: AsyncConnection, test_provider):
     assert provider.auto_remove == provider_data["auto_remove"]
 
 
+async def test_agent_card_cache(db_transaction: AsyncConnection, test_provider: Provider):
+    repository = SqlAlchemyProviderRepository(connection=db_transaction)
+    await repository.create(provider=test_provider)
+
+    first = await repository.get(provider_id=test_provider.id)
+    [listed] = [provider async for provider in repository.list()]
+    assert listed.agent_card is first.agent_card
+
+    # Card changed behind the repository's back (e.g. by another process) is detected by its digest
+    changed_card = test_provider.agent_card.model_copy(update={"version": "2.0.0"})
+    await db_transaction.execute(
+        text("UPDATE providers SET agent_card = :agent_card WHERE id = :id"),
+        {"id": test_provider.id, "agent_card": changed_card.model_dump_json()},
+    )
+    changed = await repository.get(provider_id=test_provider.id)
+    assert changed.agent_card.version == "2.0.0"
+
+    await repository.update(provider=test_provider)
+    updated = await repository.get(provider_id=test_provider.id)
+    assert updated.agent_card.version == "1.0.0"
+    assert updated.agent_card is not changed.agent_card
+
+
+async def test_update_last_accessed(db_transaction: AsyncConnection, test_provider: Provider):
+    repository = SqlAlchemyProviderRepository(connection=db_transaction)
+    await repository.create(provider=test_provider)
+    accessed_at = test_provider.last_active_at + timedelta(minutes=1)
+
+    await repository.update_last_accessed(last_accessed={test_provider.id: accessed_at, uuid.uuid4(): accessed_at})
+    # Older timestamp flushed by another replica does not move the access time back
+    await repository.update_last_accessed(last_accessed={test_provider.id: test_provider.last_active_at})
+    await repository.update_last_accessed(last_accessed={})
+
+    provider = await repository.get(provider_id=test_provider.id)
+    assert provider.last_active_at == accessed_at
+
+    # Hours of the accesses are recorded for the keep-warm prediction
+    hour = accessed_at.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+    previous_hour = test_provider.last_active_at.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+    assert await repository.count_access_hours(hours={hour, previous_hour}) == {
+        test_provider.id: len({hour, previous_hour})
+    }
+    assert await repository.delete_access_hours(before=max(hour, previous_hour)) == len({hour, previous_hour}) - 1
+    assert await repository.count_access_hours(hours=[hour - timedelta(weeks=1)]) == {}
+
+
+async def test_source_fingerprints(db_transaction: AsyncConnection, test_provider: Provider):
+    repository = SqlAlchemyProviderRepository(connection=db_transaction)
+    await repository.create(provider=test_provider)
+    assert (await repository.get(provider_id=test_provider.id)).source_fingerprint is None
+
+    await repository.update_source_fingerprints(fingerprints={test_provider.id: "sha256:abc", uuid.uuid4(): "etag"})
+    await repository.update_source_fingerprints(fingerprints={})
+    assert (await repository.get(provider_id=test_provider.id)).source_fingerprint == "sha256:abc"
+
+    # Fingerprint is replaced together with the source by an update
+    test_provider.source_fingerprint = "sha256:def"
+    await repository.update(provider=test_provider)
+    assert (await repository.get(provider_id=test_provider.id)).source_fingerprint == "sha256:def"
+
+
 async def test_get_provider_not_found(db_transaction: AsyncConnection):
     # Create repository
     repository = SqlAlchemyProviderRepository(connection=db_transaction)
@@ -0,0 +1,35 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from beeai_server.infrastructure.persistence.notifications import PostgresNotificationListener
+
+pytestmark = pytest.mark.integration
+
+
+async def test_notifications_are_delivered_on_commit(test_configuration):
+    engine = create_async_engine(test_configuration.db_url)
+    try:
+        async with (
+            PostgresNotificationListener(engine) as listener,
+            listener.subscribe("test_channel") as first,
+            listener.subscribe("test_channel") as second,
+        ):
+            async with engine.connect() as connection:
+                await connection.execute(select(func.pg_notify("test_channel", "rolled back")))
+                await connection.rollback()
+                await connection.execute(select(func.pg_notify("test_channel", "payload")))
+                await connection.execute(select(func.pg_notify("other_channel", "ignored")))
+                await connection.commit()
+
+            assert await asyncio.wait_for(first.get(), timeout=5) == "payload"
+            assert await asyncio.wait_for(second.get(), timeout=5) == "payload"
+            await asyncio.sleep(0.1)
+            assert first.empty()
+    finally:
+        await engine.dispose()
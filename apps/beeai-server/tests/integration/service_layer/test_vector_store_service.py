@@ -30,7 +30,12 @@ async def uow_factory(low_limit_config, clean_up):
 @pytest.fixture
 async def vector_store_service(uow_factory, low_limit_config):
     """Create a VectorStoreService with real transaction behavior."""
-    return VectorStoreService(uow_factory, low_limit_config)
+    return VectorStoreService(
+        uow_factory,
+        low_limit_config,
+        file_service=None,  # pyright: ignore [reportArgumentType]
+        model_provider_service=None,  # pyright: ignore [reportArgumentType]
+    )
 
 
 @pytest.fixture
@@ -4,20 +4,31 @@
 import pytest
 
 from beeai_server.configuration import Configuration
-from beeai_server.utils.docker import DockerImageID, get_registry_image_config_and_labels
+from beeai_server.utils.docker import (
+    DockerImageID,
+    get_registry_image_config_and_labels,
+    get_registry_image_digest,
+)
 
 pytestmark = pytest.mark.integration
 
 
-@pytest.mark.parametrize(
-    "image",
-    [
-        DockerImageID(root="ghcr.io/i-am-bee/beeai-platform/official/beeai-framework/chat:agents-v0.2.14"),
-        DockerImageID(root="redis:latest"),
-        DockerImageID(root="icr.io/ibm-messaging/mq:latest"),
-        DockerImageID(root="registry.goharbor.io/nightly/goharbor/harbor-log:v1.10.0"),
-    ],
-)
+IMAGES = [
+    DockerImageID(root="ghcr.io/i-am-bee/beeai-platform/official/beeai-framework/chat:agents-v0.2.14"),
+    DockerImageID(root="redis:latest"),
+    DockerImageID(root="icr.io/ibm-messaging/mq:latest"),
+    DockerImageID(root="registry.goharbor.io/nightly/goharbor/harbor-log:v1.10.0"),
+]
+
+
+@pytest.mark.parametrize("image", IMAGES)
 async def test_get_registry_image_config_and_labels(image):
     config, _ = await get_registry_image_config_and_labels(image, configuration=Configuration())
     assert config
+
+
+@pytest.mark.parametrize("image", IMAGES)
+async def test_get_registry_image_digest(image):
+    digest = await get_registry_image_digest(image, configuration=Configuration())
+    assert digest.startswith("sha256:")
+    assert await get_registry_image_digest(image, configuration=Configuration()) == digest
@@ -0,0 +1,43 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from starlette.requests import Request
+
+from beeai_server.api.routes.a2a import create_proxy_agent_card, router
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def request_() -> Request:
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1/a2a")
+    scope = {
+        "type": "http",
+        "app": app,
+        "router": app.router,
+        "scheme": "http",
+        "server": ("platform", 80),
+        "root_path": "",
+        "path": "/",
+        "query_string": b"",
+        "headers": [],
+    }
+    return Request(scope)
+
+
+def test_proxy_agent_card_is_cached_per_agent_card(request_, create_agent_card):
+    provider_id = uuid4()
+    card = create_agent_card(url="http://agent:8000/jsonrpc")
+
+    proxy_card = create_proxy_agent_card(card, provider_id=provider_id, request=request_)
+    assert proxy_card.url == f"http://platform/api/v1/a2a/{provider_id}/jsonrpc"
+    assert create_proxy_agent_card(card, provider_id=provider_id, request=request_) is proxy_card
+
+    changed_card = create_agent_card(url="http://agent:8000/jsonrpc", version="2.0.0")
+    changed_proxy_card = create_proxy_agent_card(changed_card, provider_id=provider_id, request=request_)
+    assert changed_proxy_card.version == "2.0.0"
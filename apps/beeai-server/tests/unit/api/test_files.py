@@ -0,0 +1,46 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from fastapi import HTTPException
+
+from beeai_server.api.routes.files import _etag_matches, _parse_byte_range
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        ("bytes=0-99", (0, 99)),
+        ("bytes=10-", (10, 999)),
+        ("bytes=900-5000", (900, 999)),
+        ("bytes=-100", (900, 999)),
+        ("bytes=-5000", (0, 999)),
+        ("bytes=999-999", (999, 999)),
+        # ignored, the whole file is returned
+        ("bytes=0-10,20-30", None),
+        ("items=0-10", None),
+        ("bytes=abc", None),
+        ("bytes=10-5", None),
+        ("bytes=-", None),
+    ],
+)
+def test_parse_byte_range(header, expected):
+    assert _parse_byte_range(header, size=1000) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=-0"])
+def test_parse_byte_range_not_satisfiable(header):
+    with pytest.raises(HTTPException) as exc_info:
+        _parse_byte_range(header, size=1000)
+    assert exc_info.value.status_code == 416
+    assert exc_info.value.headers == {"Content-Range": "bytes */1000"}
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [('"abc"', True), ('W/"abc"', True), ('"xyz", "abc"', True), ("*", True), ('"xyz"', False)],
+)
+def test_etag_matches(header, expected):
+    assert _etag_matches('"abc"', header) is expected
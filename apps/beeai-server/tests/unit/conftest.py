@@ -1,3 +1,146 @@
 # Copyright 2025 © BeeAI a Series of LF Projects, LLC
 # SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+from a2a.types import AgentCapabilities, AgentCard
+from pydantic import HttpUrl
+
+from beeai_server.configuration import Configuration
+from beeai_server.domain.models.provider import (
+    DockerImageProviderLocation,
+    Provider,
+    ProviderDeploymentState,
+    ProviderLocation,
+)
+
+
+class FakeProviderRepository:
+    """In-memory provider repository, implements the methods used by the services under test."""
+
+    def __init__(self):
+        self.providers: list[Provider] = []
+        self.access_counts: dict[UUID, int] = {}
+        self.counted_hours: list[list] = []
+        self.fingerprints: dict[UUID, str] = {}
+        self.flushes: list[dict] = []
+        self.fail = False
+
+    async def get(self, *, provider_id):
+        [provider] = [provider for provider in self.providers if provider.id == provider_id]
+        return provider
+
+    async def list(self):
+        for provider in self.providers:
+            yield provider
+
+    async def update_last_accessed(self, *, last_accessed):
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        self.flushes.append(dict(last_accessed))
+
+    async def count_access_hours(self, *, hours):
+        self.counted_hours.append(sorted(hours))
+        return self.access_counts
+
+    async def update_source_fingerprints(self, *, fingerprints):
+        self.fingerprints |= fingerprints
+
+
+class FakeEnvRepository:
+    async def get_all(self, *, parent_entity, parent_entity_ids):
+        return {parent_entity_id: {} for parent_entity_id in parent_entity_ids}
+
+
+class FakeDeploymentManager:
+    """
+    In-memory deployment manager, deployments are READY (scaled to zero) unless set otherwise.
+
+    Started deployments are STARTING until the `started` event is set.
+    """
+
+    def __init__(self):
+        self.states: dict[UUID, ProviderDeploymentState] = {}
+        self.replica_counts: dict[UUID, int] = {}
+        self.created: list[UUID] = []
+        self.started = asyncio.Event()
+        self.wait_calls = 0
+
+    async def state(self, *, provider_ids):
+        return [self.states.get(provider_id, ProviderDeploymentState.READY) for provider_id in provider_ids]
+
+    async def create_or_replace(self, *, provider, env=None):
+        self.created.append(provider.id)
+        if self.states.get(provider.id) == ProviderDeploymentState.RUNNING:
+            return False
+        self.states[provider.id] = ProviderDeploymentState.STARTING
+        return True
+
+    async def wait_for_startup(self, *, provider_id, timeout):  # noqa: ASYNC109
+        self.wait_calls += 1
+        await self.started.wait()
+        self.states[provider_id] = ProviderDeploymentState.RUNNING
+
+    async def get_provider_url(self, *, provider_id):
+        return HttpUrl("http://agent:8000")
+
+    async def replicas(self, *, provider_ids):
+        return [self.replica_counts.get(provider_id) for provider_id in provider_ids]
+
+    async def scale(self, *, provider_id, replicas):
+        self.replica_counts[provider_id] = replicas
+
+
+@pytest.fixture
+def create_agent_card():
+    def create_agent_card(name: str = "Agent", *, url: str = "http://agent:8000/", version: str = "1.0.0"):
+        return AgentCard(
+            name=name,
+            description="Test agent",
+            url=url,
+            version=version,
+            default_input_modes=["text"],
+            default_output_modes=["text"],
+            capabilities=AgentCapabilities(),
+            skills=[],
+        )
+
+    return create_agent_card
+
+
+@pytest.fixture
+def create_provider(override_global_dependency, create_agent_card):
+    """Create a provider named after its source, a string source is a docker image."""
+
+    def create_provider(source: ProviderLocation | str, **kwargs) -> Provider:
+        location = DockerImageProviderLocation(root=source) if isinstance(source, str) else source
+        with override_global_dependency(Configuration, Configuration()):
+            return Provider(source=location, agent_card=create_agent_card(str(location.root)), **kwargs)
+
+    return create_provider
+
+
+@pytest.fixture
+def provider_repository() -> FakeProviderRepository:
+    return FakeProviderRepository()
+
+
+@pytest.fixture
+def deployment_manager() -> FakeDeploymentManager:
+    return FakeDeploymentManager()
+
+
+@pytest.fixture
+def uow(provider_repository):
+    @asynccontextmanager
+    async def uow():
+        async def commit():
+            pass
+
+        yield SimpleNamespace(providers=provider_repository, env=FakeEnvRepository(), commit=commit)
+
+    return uow
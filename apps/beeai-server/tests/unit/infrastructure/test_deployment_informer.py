@@ -0,0 +1,170 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from datetime import timedelta
+
+import pytest
+
+from beeai_server.domain.models.provider import ProviderDeploymentState
+from beeai_server.infrastructure.kubernetes.deployment_informer import DeploymentStateInformer, DeploymentStatus
+
+pytestmark = pytest.mark.unit
+
+
+def deployment(name: str, resource_version: str, replicas: int = 1, available: int = 0) -> dict:
+    return {
+        "metadata": {"name": name, "resourceVersion": resource_version},
+        "spec": {"replicas": replicas},
+        "status": {"replicas": replicas, "availableReplicas": available},
+    }
+
+
+class FakeResponse:
+    def __init__(self, body: dict | None = None, events: asyncio.Queue | None = None):
+        self._body = body
+        self._events = events
+
+    def json(self) -> dict:
+        assert self._body is not None
+        return self._body
+
+    async def aiter_lines(self):
+        assert self._events is not None
+        while (event := await self._events.get()) is not None:
+            yield json.dumps(event)
+
+
+class FakeApi:
+    """Serves the deployment list and watch streams fed through queues, one queue per watch request."""
+
+    def __init__(self):
+        self.deployments: dict[str, dict] = {}
+        self.resource_version = "1"
+        self.list_calls = 0
+        self.list_error: Exception | None = None
+        self.watch_versions: list[str] = []
+        self.watches: asyncio.Queue[asyncio.Queue] = asyncio.Queue()
+
+    @asynccontextmanager
+    async def async_get_kind(self, kind, label_selector=None, params=None, watch=False, **kwargs):
+        assert kind == "deployment"
+        assert label_selector == {"managedBy": "beeai-platform"}
+        if not watch:
+            self.list_calls += 1
+            if self.list_error:
+                raise self.list_error
+            items = list(self.deployments.values())
+            yield None, FakeResponse({"metadata": {"resourceVersion": self.resource_version}, "items": items})
+            return
+        self.watch_versions.append(params["resourceVersion"])
+        events = asyncio.Queue()
+        await self.watches.put(events)
+        yield None, FakeResponse(events=events)
+
+    async def next_watch(self) -> asyncio.Queue:
+        return await asyncio.wait_for(self.watches.get(), timeout=1)
+
+
+@pytest.fixture
+async def api():
+    return FakeApi()
+
+
+@pytest.fixture
+async def informer(api):
+    async def api_factory():
+        return api
+
+    informer = DeploymentStateInformer(
+        api_factory=api_factory,  # pyright: ignore [reportArgumentType]
+        label_selector={"managedBy": "beeai-platform"},
+        retry_backoff=timedelta(seconds=0.01),
+    )
+    try:
+        yield informer
+    finally:
+        await informer.close()
+
+
+async def get_states(informer: DeploymentStateInformer, names: list[str]) -> list[ProviderDeploymentState]:
+    return [status.state if status else ProviderDeploymentState.MISSING for status in await informer.get(names)]
+
+
+async def settle():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def test_informer_applies_watch_events(api, informer):
+    api.deployments = {
+        "running": deployment("running", "1", available=1),
+        "idle": deployment("idle", "1", replicas=0),
+    }
+
+    assert await informer.get(["running", "idle", "missing"]) == [
+        DeploymentStatus(state=ProviderDeploymentState.RUNNING, replicas=1),
+        DeploymentStatus(state=ProviderDeploymentState.READY, replicas=0),
+        None,
+    ]
+
+    watch = await api.next_watch()
+    watch.put_nowait({"type": "ADDED", "object": deployment("missing", "2")})
+    watch.put_nowait({"type": "MODIFIED", "object": deployment("idle", "3", available=1)})
+    watch.put_nowait({"type": "DELETED", "object": deployment("running", "4")})
+    await settle()
+
+    states = await get_states(informer, ["running", "idle", "missing"])
+    assert states == [
+        ProviderDeploymentState.MISSING,
+        ProviderDeploymentState.RUNNING,
+        ProviderDeploymentState.STARTING,
+    ]
+    assert api.list_calls == 1
+
+    # Stream closed by the server timeout, the watch continues from the last seen version without listing again
+    watch.put_nowait({"type": "BOOKMARK", "object": {"metadata": {"resourceVersion": "5"}}})
+    watch.put_nowait(None)
+    await api.next_watch()
+    assert api.watch_versions == ["1", "5"]
+    assert api.list_calls == 1
+
+
+async def test_informer_resyncs_on_expired_watch(api, informer):
+    api.deployments = {"first": deployment("first", "1", available=1)}
+    assert await get_states(informer, ["first"]) == [ProviderDeploymentState.RUNNING]
+    watch = await api.next_watch()
+
+    # Changes missed while the watch was expired are picked up by the full list
+    api.deployments = {"second": deployment("second", "7", replicas=0)}
+    api.resource_version = "7"
+    watch.put_nowait({"type": "ERROR", "object": {"kind": "Status", "code": 410, "message": "too old"}})
+    await api.next_watch()
+
+    assert await get_states(informer, ["first", "second"]) == [
+        ProviderDeploymentState.MISSING,
+        ProviderDeploymentState.READY,
+    ]
+    assert api.list_calls == 2
+    assert api.watch_versions == ["1", "7"]
+
+
+async def test_informer_cache_is_not_live_while_resyncing(api, informer):
+    api.deployments = {"first": deployment("first", "1", available=1)}
+    assert informer.peek(["first"]) is None  # initial sync
+    await informer.get(["first"])
+    assert informer.peek(["first"]) == [DeploymentStatus(state=ProviderDeploymentState.RUNNING, replicas=1)]
+    watch = await api.next_watch()
+
+    # The last snapshot is still served to lookups, but it is not live until the deployments are listed again
+    api.list_error = RuntimeError("API unavailable")
+    watch.put_nowait({"type": "ERROR", "object": {"kind": "Status", "code": 500, "message": "internal error"}})
+    await asyncio.sleep(0.05)
+    assert informer.peek(["first"]) is None
+    assert await get_states(informer, ["first"]) == [ProviderDeploymentState.RUNNING]
+
+    api.list_error = None
+    await api.next_watch()
+    assert informer.peek(["first"]) is not None
@@ -0,0 +1,111 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import hashlib
+from contextlib import asynccontextmanager
+from io import BytesIO
+from uuid import uuid4
+
+import pytest
+
+from beeai_server.configuration import Configuration, ObjectStorageConfiguration
+from beeai_server.domain.models.file import AsyncFile
+from beeai_server.infrastructure.object_storage.repository import S3ObjectStorageRepository
+
+pytestmark = pytest.mark.unit
+
+PART_SIZE = 5 * 1024 * 1024
+
+
+class FakeS3Client:
+    def __init__(self, fail_on_part: int | None = None):
+        self.fail_on_part = fail_on_part
+        self.objects: dict[str, bytes] = {}
+        self.parts: dict[int, bytes] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.aborted = False
+        self.calls: list[str] = []
+
+    async def put_object(self, **kwargs):
+        self.calls.append("put_object")
+        self.objects[kwargs["Key"]] = kwargs["Body"]
+
+    async def create_multipart_upload(self, **kwargs):
+        self.calls.append("create_multipart_upload")
+        return {"UploadId": "upload-id"}
+
+    async def upload_part(self, **kwargs):
+        part_number = kwargs["PartNumber"]
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01 * (part_number % 3))
+            if part_number == self.fail_on_part:
+                raise RuntimeError("upload failed")
+            self.parts[part_number] = kwargs["Body"]
+            return {"ETag": f"etag-{part_number}"}
+        finally:
+            self.in_flight -= 1
+
+    async def complete_multipart_upload(self, **kwargs):
+        self.calls.append("complete_multipart_upload")
+        assert [p["ETag"] for p in kwargs["MultipartUpload"]["Parts"]] == [f"etag-{n}" for n in sorted(self.parts)]
+        self.objects[kwargs["Key"]] = b"".join(self.parts[n] for n in sorted(self.parts))
+
+    async def abort_multipart_upload(self, **kwargs):
+        self.aborted = True
+
+
+def create_repository(client: FakeS3Client, concurrency: int = 2) -> S3ObjectStorageRepository:
+    config = Configuration(
+        object_storage=ObjectStorageConfiguration(
+            multipart_part_size_bytes=PART_SIZE, multipart_max_concurrency=concurrency
+        )
+    )
+    repository = S3ObjectStorageRepository(configuration=config)
+
+    @asynccontextmanager
+    async def get_client():
+        yield client
+
+    repository._get_client = get_client
+    return repository
+
+
+def async_file(data: bytes) -> AsyncFile:
+    buffer = BytesIO(data)
+
+    async def read(size: int = -1) -> bytes:
+        return buffer.read(min(size, 64 * 1024))
+
+    return AsyncFile(filename="file.bin", content_type="application/octet-stream", read=read)
+
+
+@pytest.mark.parametrize("size", [0, 1000, PART_SIZE, PART_SIZE * 4 + 17])
+async def test_upload_file(size):
+    client = FakeS3Client()
+    repository = create_repository(client)
+    data = bytes(i % 251 for i in range(size))
+    file_id = uuid4()
+
+    result = await repository.upload_file(file_id=file_id, file=async_file(data))
+
+    assert result.size == size
+    assert result.sha256 == hashlib.sha256(data).hexdigest()
+    assert client.objects[f"files/{file_id}"] == data
+    assert client.max_in_flight <= 2
+    if size < PART_SIZE:
+        assert client.calls == ["put_object"]
+
+
+async def test_upload_file_aborts_on_failure():
+    client = FakeS3Client(fail_on_part=2)
+    repository = create_repository(client)
+
+    with pytest.raises(RuntimeError, match="upload failed"):
+        await repository.upload_file(file_id=uuid4(), file=async_file(b"x" * PART_SIZE * 3))
+
+    assert client.aborted
+    assert "complete_multipart_upload" not in client.calls
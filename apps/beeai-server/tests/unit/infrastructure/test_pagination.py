@@ -0,0 +1,118 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import UUID, Column, DateTime, MetaData, Table
+from sqlalchemy.dialects import postgresql
+
+from beeai_server.domain.models.common import TotalCount
+from beeai_server.exceptions import PlatformError
+from beeai_server.infrastructure.persistence.repositories.utils import cursor_paginate, decode_cursor, encode_cursor
+
+pytestmark = pytest.mark.unit
+
+items_table = Table(
+    "items",
+    MetaData(),
+    Column("id", UUID, primary_key=True),
+    Column("created_at", DateTime(timezone=True)),
+)
+
+
+class FakeConnection:
+    def __init__(self, rows: list[dict], scalar=None):
+        self.rows = [
+            SimpleNamespace(_mapping={items_table.c[key]: value for key, value in row.items()}) for row in rows
+        ]
+        self.scalar = scalar
+        self.statements: list[str] = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        return SimpleNamespace(
+            fetchall=lambda: self.rows,
+            fetchone=lambda: None,
+            scalar=lambda: self.scalar,
+            scalar_one=lambda: self.scalar,
+        )
+
+
+def create_rows(count: int) -> list[dict]:
+    now = datetime.now(UTC)
+    return [{"id": uuid4(), "created_at": now - timedelta(seconds=i)} for i in range(count)]
+
+
+def test_cursor_round_trip():
+    created_at, id = datetime.now(UTC), uuid4()
+    cursor = encode_cursor(created_at, id)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, id)
+
+
+def test_invalid_cursor():
+    with pytest.raises(PlatformError, match="Invalid page token"):
+        decode_cursor("not-a-cursor")
+
+
+async def test_paginate_with_keyset_cursor():
+    rows = create_rows(3)
+    connection = FakeConnection(rows)
+
+    result = await cursor_paginate(
+        connection=connection,  # pyright: ignore [reportArgumentType]
+        query=items_table.select(),
+        order_column=items_table.c.created_at,
+        id_column=items_table.c.id,
+        limit=2,
+        after_cursor=encode_cursor(datetime.now(UTC), uuid4()),
+        total_count=TotalCount.NONE,
+    )
+
+    assert result.has_more
+    assert result.total_count is None
+    assert decode_cursor(result.next_cursor or "") == (rows[1]["created_at"], rows[1]["id"])
+    # A single query, the cursor row is not looked up and rows are not counted
+    [statement] = connection.statements
+    assert "(items.created_at, items.id) < (" in statement
+    assert "ORDER BY items.created_at DESC, items.id DESC" in statement
+
+
+async def test_paginate_counts():
+    connection = FakeConnection(create_rows(1), scalar=[{"Plan": {"Plan Rows": 42}}])
+
+    result = await cursor_paginate(
+        connection=connection,  # pyright: ignore [reportArgumentType]
+        query=items_table.select(),
+        order_column=items_table.c.created_at,
+        id_column=items_table.c.id,
+        limit=2,
+        order="asc",
+        total_count=TotalCount.ESTIMATED,
+    )
+
+    assert not result.has_more
+    assert result.total_count == 42
+    assert connection.statements[1].startswith("EXPLAIN (FORMAT JSON) SELECT")
+
+
+async def test_paginate_with_legacy_id_cursor():
+    connection = FakeConnection([], scalar=0)
+
+    result = await cursor_paginate(
+        connection=connection,  # pyright: ignore [reportArgumentType]
+        query=items_table.select(),
+        order_column=items_table.c.created_at,
+        id_column=items_table.c.id,
+        limit=2,
+        after_cursor=str(uuid4()),
+    )
+
+    # The cursor row was looked up, it does not exist so the cursor is ignored
+    assert len(connection.statements) == 3
+    assert "(items.created_at, items.id)" not in connection.statements[1]
+    assert result.total_count == 0
+    assert result.next_cursor is None
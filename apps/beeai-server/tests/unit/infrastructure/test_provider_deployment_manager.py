@@ -0,0 +1,87 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import Iterator
+
+import pytest
+
+from beeai_server.configuration import Configuration
+from beeai_server.domain.models.provider import Provider, ProviderDeploymentState
+from beeai_server.infrastructure.kubernetes.deployment_informer import DeploymentStatus
+from beeai_server.infrastructure.kubernetes.provider_deployment_manager import KubernetesProviderDeploymentManager
+from beeai_server.service_layer.deployment_manager import global_provider_variables
+
+pytestmark = pytest.mark.unit
+
+
+class FakeInformer:
+    def __init__(self):
+        self.deployments: dict[str, DeploymentStatus] = {}
+        self.live = True
+        self.closed = False
+
+    async def get(self, names):
+        return [self.deployments.get(name) for name in names]
+
+    def peek(self, names):
+        return [self.deployments.get(name) for name in names] if self.live else None
+
+    async def close(self):
+        self.closed = True
+
+
+async def unavailable_api():
+    raise AssertionError("Kubernetes API should not be called")
+
+
+@pytest.fixture
+def provider(override_global_dependency, create_provider) -> Iterator[Provider]:
+    with override_global_dependency(Configuration, Configuration()):
+        yield create_provider("ghcr.io/i-am-bee/agent:1.0.0")
+
+
+async def test_unchanged_deployment_is_not_touched(provider):
+    manager = KubernetesProviderDeploymentManager(api_factory=unavailable_api)  # pyright: ignore [reportArgumentType]
+    informer = manager._informer = FakeInformer()  # pyright: ignore [reportAttributeAccessIssue]
+
+    env = {"API_KEY": "secret", **global_provider_variables()}
+    manifests = await manager._render_manifests(provider, env)
+    assert await manager._render_manifests(provider, dict(env)) is manifests
+    assert manifests.deployment["metadata"]["labels"]["deployment-hash"] == manifests.deployment_hash
+
+    deployment_name = manifests.deployment["metadata"]["name"]
+    informer.deployments[deployment_name] = DeploymentStatus(
+        state=ProviderDeploymentState.RUNNING, replicas=1, deployment_hash=manifests.deployment_hash
+    )
+    assert await manager.create_or_replace(provider=provider, env={"API_KEY": "secret"}) is False
+
+    # Changed variables, a scaled down deployment or a stale cache go through the API
+    for env, replicas, live in (
+        ({"API_KEY": "rotated"}, 1, True),
+        ({"API_KEY": "secret"}, 0, True),
+        ({"API_KEY": "secret"}, 1, False),
+    ):
+        informer.deployments[deployment_name] = informer.deployments[deployment_name]._replace(replicas=replicas)
+        informer.live = live
+        with pytest.raises(AssertionError, match="should not be called"):
+            await manager.create_or_replace(provider=provider, env=env)
+
+
+async def test_repushed_image_changes_deployment_hash(provider):
+    manager = KubernetesProviderDeploymentManager(api_factory=unavailable_api)  # pyright: ignore [reportArgumentType]
+    env = global_provider_variables()
+
+    hashes = set()
+    for fingerprint in ("sha256:aaa", "sha256:bbb"):
+        provider.source_fingerprint = fingerprint
+        manifests = await manager._render_manifests(provider, env)
+        [container] = manifests.deployment["spec"]["template"]["spec"]["containers"]
+        assert container["image"] == f"ghcr.io/i-am-bee/agent:1.0.0@{fingerprint}"
+        hashes.add(manifests.deployment_hash)
+    assert len(hashes) == 2
+
+
+async def test_informer_is_closed_on_exit():
+    async with KubernetesProviderDeploymentManager(api_factory=unavailable_api) as manager:  # pyright: ignore [reportArgumentType]
+        informer = manager._informer = FakeInformer()  # pyright: ignore [reportAttributeAccessIssue]
+    assert informer.closed
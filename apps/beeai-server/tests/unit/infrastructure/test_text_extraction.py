@@ -0,0 +1,168 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import zipfile
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from io import BytesIO
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from beeai_server.configuration import DoclingExtractionConfiguration
+from beeai_server.domain.models.file import ExtractedFile
+from beeai_server.infrastructure.text_extraction import local
+from beeai_server.infrastructure.text_extraction.chain import ChainTextExtractionBackend, UnsupportedDocumentError
+from beeai_server.infrastructure.text_extraction.local import LocalTextExtractionBackend, extract_docx, extract_html
+
+pytestmark = pytest.mark.unit
+
+DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+FILE_URL = "http://object-storage/file"
+
+
+def create_docx(paragraphs: list[tuple[str | None, str]]) -> bytes:
+    body = "".join(
+        f"<w:p>{f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ''}<w:r><w:t>{text}</w:t></w:r></w:p>"
+        for style, text in paragraphs
+    )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", document)
+    return buffer.getvalue()
+
+
+def test_extract_html():
+    html = b"""
+        <html><head><title>ignored</title><style>p { color: red }</style></head>
+        <body>
+            <h1>Bees</h1>
+            <p>Bees are   <b>flying</b> insects.</p>
+            <script>console.log("ignored")</script>
+            <ul><li>Honey</li><li>Wax</li></ul>
+        </body></html>
+    """
+    assert extract_html(html) == "# Bees\n\nBees are flying insects.\n\n- Honey\n\n- Wax"
+
+
+def test_extract_docx():
+    docx = create_docx([("Title", "Bees"), ("Heading2", "Products"), (None, "Honey &amp; wax")])
+    assert extract_docx(docx) == "# Bees\n\n## Products\n\nHoney & wax"
+
+
+def test_extract_docx_limits_decompressed_size(monkeypatch):
+    docx = create_docx([(None, "Honey" * 1000)])
+    monkeypatch.setattr(local, "_MAX_DOCX_DOCUMENT_SIZE", 1000)
+    with pytest.raises(ValueError, match="larger than 1000 bytes"):
+        extract_docx(docx)
+
+
+@asynccontextmanager
+async def local_backend(**config):
+    async with LocalTextExtractionBackend(DoclingExtractionConfiguration(local_max_workers=1, **config)) as backend:
+        yield backend
+    assert backend._executor is None
+
+
+async def test_local_backend_extracts_docx(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url=FILE_URL, content=create_docx([(None, "Hello")]))
+
+    async with (
+        local_backend() as backend,
+        backend.extract_text(file_url=FILE_URL, content_type=DOCX_CONTENT_TYPE) as file,  # pyright: ignore [reportArgumentType]
+    ):
+        assert file.backend == "local"
+        assert await file.read(-1) == b"Hello"
+
+
+@pytest.mark.parametrize(
+    ("content_type", "content", "config"),
+    [
+        ("application/pdf", None, {}),
+        ("text/html", None, {"local_extraction_enabled": False}),
+        ("text/html; charset=utf-8", b"<html><body><img src='scan.png'></body></html>", {}),
+        ("text/html", b"<p>" + b"a" * 100 + b"</p>", {"local_max_file_size_bytes": 10}),
+        (DOCX_CONTENT_TYPE, b"not a zip file", {}),
+    ],
+)
+async def test_local_backend_unsupported(httpx_mock: HTTPXMock, content_type, content, config):
+    if content is not None:
+        httpx_mock.add_response(url=FILE_URL, content=content)
+
+    async with local_backend(**config) as backend:
+        with pytest.raises(UnsupportedDocumentError):
+            async with backend.extract_text(file_url=FILE_URL, content_type=content_type):  # pyright: ignore [reportArgumentType]
+                pass
+
+
+class BrokenExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs):
+        raise BrokenProcessPool("A process in the process pool was terminated abruptly")
+
+
+async def test_local_backend_replaces_broken_pool(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url=FILE_URL, content=create_docx([(None, "Hello")]), is_reusable=True)
+
+    async with local_backend() as backend:
+        backend._executor = BrokenExecutor()  # pyright: ignore [reportAttributeAccessIssue]
+        with pytest.raises(UnsupportedDocumentError, match="terminated abruptly"):
+            async with backend.extract_text(file_url=FILE_URL, content_type=DOCX_CONTENT_TYPE):  # pyright: ignore [reportArgumentType]
+                pass
+        assert backend._executor is None
+
+        async with backend.extract_text(file_url=FILE_URL, content_type=DOCX_CONTENT_TYPE) as file:  # pyright: ignore [reportArgumentType]
+            assert await file.read(-1) == b"Hello"
+
+
+class FakeBackend:
+    def __init__(self, name: str, supported: bool):
+        self.name = name
+        self.cache_key = f'{{"backend": "{name}"}}'
+        self.supported = supported
+        self.calls = 0
+
+    @asynccontextmanager
+    async def extract_text(self, *, file_url, content_type=None, timeout=None):  # noqa: ASYNC109
+        self.calls += 1
+        if not self.supported:
+            raise UnsupportedDocumentError("unsupported")
+
+        async def read(size: int = -1) -> bytes:
+            return self.name.encode()
+
+        yield ExtractedFile(filename="extracted_text.md", content_type="text/markdown", read=read, backend=self.name)
+
+
+async def test_chain_falls_back_to_next_backend():
+    local, docling, unused = FakeBackend("local", False), FakeBackend("docling", True), FakeBackend("unused", True)
+    chain = ChainTextExtractionBackend([local, docling, unused])
+
+    async with chain.extract_text(file_url=FILE_URL, content_type="application/pdf") as file:  # pyright: ignore [reportArgumentType]
+        assert file.backend == "docling"
+        assert await file.read(-1) == b"docling"
+    assert (local.calls, docling.calls, unused.calls) == (1, 1, 0)
+    assert chain.name == "local+docling+unused"
+
+
+async def test_chain_without_supported_backend():
+    chain = ChainTextExtractionBackend([FakeBackend("local", False)])
+
+    with pytest.raises(UnsupportedDocumentError, match="local: unsupported"):
+        async with chain.extract_text(file_url=FILE_URL):  # pyright: ignore [reportArgumentType]
+            pass
+
+
+async def test_chain_does_not_fall_back_on_errors_after_extraction():
+    docling, unused = FakeBackend("docling", True), FakeBackend("unused", True)
+    chain = ChainTextExtractionBackend([docling, unused])
+
+    with pytest.raises(RuntimeError, match="upload failed"):
+        async with chain.extract_text(file_url=FILE_URL):  # pyright: ignore [reportArgumentType]
+            raise RuntimeError("upload failed")
+    assert unused.calls == 0
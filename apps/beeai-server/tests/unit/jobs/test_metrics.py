@@ -0,0 +1,91 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from types import SimpleNamespace
+
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from beeai_server.jobs.metrics import JOB_EVENTS_QUERY, LAST_EVENT_ID_QUERY, QUEUE_DEPTH_QUERY, JobQueueMetrics
+
+pytestmark = pytest.mark.unit
+
+
+class FakeConnector:
+    def __init__(self):
+        self.depth_rows = []
+        self.events = []
+        self.last_event_id = 0
+        self.queries = []
+
+    async def execute_query_all_async(self, query, **arguments):
+        self.queries.append((query, arguments))
+        if query == QUEUE_DEPTH_QUERY:
+            return self.depth_rows
+        if query == LAST_EVENT_ID_QUERY:
+            return [{"id": self.last_event_id}]
+        if query == JOB_EVENTS_QUERY:
+            rows = [row for row in self.events if row["id"] > arguments["after_id"]]
+            return rows[: arguments["limit"]]
+        raise AssertionError(f"Unexpected query: {query}")
+
+
+def collect_metrics(reader: InMemoryMetricReader) -> dict[str, list]:
+    data = reader.get_metrics_data()
+    return {
+        metric.name: list(metric.data.data_points)
+        for resource_metrics in data.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
+
+
+async def test_job_queue_metrics():
+    connector = FakeConnector()
+    reader = InMemoryMetricReader()
+    metrics = JobQueueMetrics(
+        SimpleNamespace(connector=connector),  # pyright: ignore [reportArgumentType]
+        queues=["text_extraction", "cron:cleanup"],
+        batch_size=2,
+        meter=MeterProvider(metric_readers=[reader]).get_meter("test"),
+    )
+
+    connector.last_event_id = 10
+    connector.events = [{"id": 5, "queue_name": "text_extraction", "type": "started", "elapsed": 100.0}]
+    connector.depth_rows = [
+        {"queue_name": "text_extraction", "status": "todo", "jobs": 7, "oldest_age": 12.5},
+        {"queue_name": "text_extraction", "status": "doing", "jobs": 5, "oldest_age": None},
+    ]
+    await metrics.collect()
+
+    points = collect_metrics(reader)
+    depth = {(p.attributes["queue"], p.attributes["status"]): p.value for p in points["job_queue_depth"]}
+    assert depth == {
+        ("text_extraction", "todo"): 7,
+        ("text_extraction", "doing"): 5,
+        ("cron:cleanup", "todo"): 0,
+        ("cron:cleanup", "doing"): 0,
+    }
+    oldest_age = {p.attributes["queue"]: p.value for p in points["job_queue_oldest_age_seconds"]}
+    assert oldest_age == {"text_extraction": 12.5, "cron:cleanup": 0.0}
+    # history before the first collection is not replayed
+    assert "job_wait_seconds" not in points
+
+    connector.events += [
+        {"id": 11, "queue_name": "text_extraction", "type": "started", "elapsed": 2.0},
+        {"id": 12, "queue_name": "text_extraction", "type": "started", "elapsed": 4.0},
+        {"id": 13, "queue_name": "text_extraction", "type": "succeeded", "elapsed": 30.0},
+        {"id": 14, "queue_name": "cron:cleanup", "type": "deferred_for_retry", "elapsed": 1.0},
+        {"id": 15, "queue_name": "cron:cleanup", "type": "failed", "elapsed": None},
+    ]
+    await metrics.collect()
+    await metrics.collect()
+
+    points = collect_metrics(reader)
+    [wait] = points["job_wait_seconds"]
+    assert (wait.count, wait.sum) == (2, 6.0)
+    durations = {
+        (p.attributes["queue"], p.attributes["status"]): (p.count, p.sum) for p in points["job_duration_seconds"]
+    }
+    assert durations == {("text_extraction", "succeeded"): (1, 30.0), ("cron:cleanup", "retry"): (1, 1.0)}
@@ -0,0 +1,304 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import functools
+import importlib.util
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import httpx
+import pytest
+from opentelemetry.metrics import NoOpMeter
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from pydantic import ValidationError
+from pytest_httpx import HTTPXMock
+
+from beeai_server.configuration import (
+    A2AProxyConfiguration,
+    AdmissionControlConfiguration,
+    AdmissionLimits,
+    Configuration,
+)
+from beeai_server.domain.models.provider import NetworkProviderLocation, Provider
+from beeai_server.domain.models.user import User
+from beeai_server.exceptions import ProviderOverloadedError
+from beeai_server.service_layer.services.a2a import (
+    A2AProxyService,
+    ProviderAdmissionController,
+    ProviderClientPool,
+    ProxyClient,
+)
+
+pytestmark = pytest.mark.unit
+
+AGENT_URL = "http://agent:8000"
+USER = User(email="user@beeai.dev")
+
+
+@pytest.fixture
+async def pool():
+    pool = ProviderClientPool(A2AProxyConfiguration(client_idle_timeout_sec=60))
+    try:
+        yield pool
+    finally:
+        await pool.close()
+
+
+async def test_requests_reuse_provider_client(pool, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url=f"{AGENT_URL}/jsonrpc", json={"result": "ok"}, is_reusable=True)
+    provider_id = uuid4()
+
+    pooled = await pool.get(provider_id=provider_id, base_url=AGENT_URL)
+    for _ in range(2):
+        response = await ProxyClient(pooled.lease).send_request(method="POST", url="/jsonrpc", content=b"{}")
+        assert response.content == b'{"result":"ok"}'
+
+    assert await pool.get(provider_id=provider_id, base_url=AGENT_URL) is pooled
+    assert not pooled.client.is_closed
+    assert pooled.active_requests == 0
+
+
+async def test_streamed_response_holds_client(pool, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(
+        url=f"{AGENT_URL}/stream", content=b"data: 1\n\n", headers={"content-type": "text/event-stream"}
+    )
+    provider_id = uuid4()
+
+    pooled = await pool.get(provider_id=provider_id, base_url=AGENT_URL)
+    response = await ProxyClient(pooled.lease).send_request(method="GET", url="/stream")
+    assert pooled.active_requests == 1
+    assert response.stream is not None
+    assert b"".join([chunk async for chunk in response.stream]) == b"data: 1\n\n"
+    assert pooled.active_requests == 0
+    # peak concurrency is reported to the autoscaler once
+    assert pool.take_in_flight_requests() == {provider_id: 1}
+    assert pool.take_in_flight_requests() == {provider_id: 0}
+
+
+async def test_client_is_leased_after_admission(pool, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(url=f"{AGENT_URL}/jsonrpc", json={"result": "ok"})
+    provider_id = uuid4()
+    stale = await pool.get(provider_id=provider_id, base_url=AGENT_URL)
+    admitted = asyncio.Event()
+
+    @asynccontextmanager
+    async def admit():
+        await admitted.wait()
+        yield
+
+    lease = functools.partial(pool.lease, provider_id=provider_id, base_url=AGENT_URL)
+    request = asyncio.create_task(ProxyClient(lease, admit).send_request(method="POST", url="/jsonrpc", content=b"{}"))
+    await asyncio.sleep(0)
+    # Client closed while the request is queued, e.g. the provider was restarted
+    await pool.remove(provider_id=provider_id)
+    admitted.set()
+
+    response = await request
+    assert response.content == b'{"result":"ok"}'
+    assert stale.client.is_closed
+
+
+async def test_client_is_evicted_when_connection_fails(pool, httpx_mock: HTTPXMock):
+    # Provider scaled to zero, possibly by another process
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"), url=f"{AGENT_URL}/jsonrpc")
+    provider_id = uuid4()
+    lease = functools.partial(pool.lease, provider_id=provider_id, base_url=AGENT_URL)
+    pooled = await pool.get(provider_id=provider_id, base_url=AGENT_URL)
+
+    with pytest.raises(httpx.ConnectError):
+        await ProxyClient(lease).send_request(method="POST", url="/jsonrpc", content=b"{}")
+    assert pooled.client.is_closed
+    assert await pool.get(provider_id=provider_id, base_url=AGENT_URL) is not pooled
+
+
+async def test_clients_are_evicted(pool):
+    first, second, third = uuid4(), uuid4(), uuid4()
+    idle = await pool.get(provider_id=first, base_url=AGENT_URL)
+    busy = await pool.get(provider_id=second, base_url=AGENT_URL)
+    moved = await pool.get(provider_id=third, base_url=AGENT_URL)
+    idle.last_used = busy.last_used = -1000
+    async with busy.lease():
+        # idle clients are closed unless a request is in flight, clients are recreated when the provider URL changes
+        recreated = await pool.get(provider_id=third, base_url="http://agent-2:8000")
+    assert idle.client.is_closed
+    assert not busy.client.is_closed
+    assert moved.client.is_closed
+    assert recreated is not moved
+
+    await pool.remove(provider_id=second)
+    assert busy.client.is_closed
+    assert await pool.get(provider_id=second, base_url=AGENT_URL) is not busy
+
+
+@pytest.fixture
+def provider(override_global_dependency, create_provider, provider_repository) -> Provider:
+    with override_global_dependency(Configuration, Configuration()):
+        provider = create_provider(NetworkProviderLocation(root=AGENT_URL))
+    provider_repository.providers.append(provider)
+    return provider
+
+
+@pytest.fixture
+def create_service(uow, deployment_manager):
+    def create_service(meter=None, **config) -> A2AProxyService:
+        return A2AProxyService(
+            provider_deployment_manager=deployment_manager,
+            uow=uow,
+            user_service=None,  # pyright: ignore [reportArgumentType]
+            configuration=Configuration(a2a_proxy=A2AProxyConfiguration(**config)),
+            meter=meter or NoOpMeter("test"),
+        )
+
+    return create_service
+
+
+async def test_last_accessed_is_flushed_in_batches(provider, provider_repository, create_service):
+    async with create_service(last_accessed_flush_interval_sec=3600) as service:
+        before = datetime.now(UTC)
+        for _ in range(3):
+            await service.get_proxy_client(provider_id=provider.id, user=USER)
+        assert provider_repository.flushes == []
+
+        provider_repository.fail = True
+        with pytest.raises(ConnectionError):
+            await service.flush_last_accessed()
+        provider_repository.fail = False
+        await service.get_proxy_client(provider_id=provider.id, user=USER)
+        await service.flush_last_accessed()
+
+        [flushed] = provider_repository.flushes
+        assert flushed.keys() == {provider.id}
+        assert before < flushed[provider.id] < datetime.now(UTC) + timedelta(seconds=1)
+
+        await service.get_proxy_client(provider_id=provider.id, user=USER)
+    # remaining access times are flushed on shutdown
+    assert len(provider_repository.flushes) == 2
+
+
+async def test_cold_start_is_single_flight(create_provider, provider_repository, deployment_manager, create_service):
+    provider = create_provider("ghcr.io/i-am-bee/agent:1.0.0")
+    provider_repository.providers.append(provider)
+    reader = InMemoryMetricReader()
+    meter = MeterProvider(metric_readers=[reader]).get_meter("test")
+
+    async with create_service(meter) as service:
+        requests = [asyncio.create_task(service.get_proxy_client(provider_id=provider.id, user=USER)) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        requests[0].cancel()  # disconnected client does not cancel the startup shared with others
+        assert collect_metrics(reader)["provider_cold_start_queued_requests"][0].value == 4
+
+        deployment_manager.started.set()
+        clients = await asyncio.gather(*requests[1:])
+        assert len(clients) == 4
+        assert (len(deployment_manager.created), deployment_manager.wait_calls) == (1, 1)
+
+        metrics = collect_metrics(reader)
+        assert metrics["provider_cold_start_queued_requests"][0].value == 0
+        [duration] = metrics["provider_cold_start_duration_seconds"]
+        assert (duration.count, duration.attributes) == (1, {"outcome": "success"})
+
+        # Running provider is only checked, the next request does not wait for startup
+        await service.get_proxy_client(provider_id=provider.id, user=USER)
+        assert (len(deployment_manager.created), deployment_manager.wait_calls) == (2, 1)
+
+
+async def test_admission_control_is_fair_across_users(provider):
+    reader = InMemoryMetricReader()
+    controller = ProviderAdmissionController(
+        AdmissionControlConfiguration(
+            providers={str(provider.id): AdmissionLimits(max_in_flight_requests=1, max_queued_requests=3)},
+            retry_after_sec=7,
+        ),
+        MeterProvider(metric_readers=[reader]).get_meter("test"),
+    )
+    heavy_user, other_user = uuid4(), uuid4()
+    admitted = []
+    release = asyncio.Event()
+
+    async def request(user_id, name):
+        async with controller.admit(provider=provider, user_id=user_id):
+            admitted.append(name)
+            await release.wait()
+
+    running = asyncio.create_task(request(heavy_user, "running"))
+    await asyncio.sleep(0)
+    queued = [
+        asyncio.create_task(request(user_id, name))
+        for user_id, name in ((heavy_user, "heavy-1"), (heavy_user, "heavy-2"), (other_user, "other"))
+    ]
+    await asyncio.sleep(0)
+
+    with pytest.raises(ProviderOverloadedError) as exc_info:
+        await request(other_user, "rejected")
+    assert (exc_info.value.status_code, exc_info.value.headers) == (503, {"Retry-After": "7"})
+
+    # Requests are admitted one at a time, alternating between users
+    release.set()
+    await asyncio.gather(running, *queued)
+    assert admitted == ["running", "heavy-1", "other", "heavy-2"]
+
+    metrics = collect_metrics(reader)
+    [rejected] = metrics["a2a_proxy_rejected_requests"]
+    assert (rejected.attributes, rejected.value) == ({"reason": "queue_full"}, 1)
+    [queue_wait] = metrics["a2a_proxy_queue_wait_seconds"]
+    assert (queue_wait.attributes, queue_wait.count) == ({"outcome": "admitted"}, 3)
+
+
+async def test_admission_control_queue_timeout(provider):
+    controller = ProviderAdmissionController(
+        AdmissionControlConfiguration(max_in_flight_requests=1, queue_timeout_sec=0.01), NoOpMeter("test")
+    )
+    async with controller.admit(provider=provider, user_id=uuid4()):
+        with pytest.raises(ProviderOverloadedError):
+            async with controller.admit(provider=provider, user_id=uuid4()):
+                pass
+
+        # Disconnected client leaves the queue
+        waiting = asyncio.create_task(controller.admit(provider=provider, user_id=uuid4()).__aenter__())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+    assert controller._queues == {}
+
+
+async def test_admission_control_cancel_and_release_in_same_iteration(provider):
+    controller = ProviderAdmissionController(AdmissionControlConfiguration(max_in_flight_requests=1), NoOpMeter("test"))
+    user_id = uuid4()
+    running = controller.admit(provider=provider, user_id=user_id)
+    await running.__aenter__()
+    cancelled, admitted, queued = (
+        asyncio.create_task(controller.admit(provider=provider, user_id=user_id).__aenter__()) for _ in range(3)
+    )
+    await asyncio.sleep(0)
+
+    # The slot is released after the waiter is cancelled, but before the cancelled request runs again
+    cancelled.cancel()
+    await running.__aexit__(None, None, None)
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    await admitted
+    assert not queued.done()
+    [queue] = controller._queues.values()
+    assert (queue.in_flight, queue.queued, len(queue.waiters[user_id])) == (1, 1, 1)
+    queued.cancel()
+
+
+def collect_metrics(reader: InMemoryMetricReader) -> dict[str, list]:
+    data = reader.get_metrics_data()
+    return {
+        metric.name: list(metric.data.data_points)
+        for resource_metrics in data.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
+
+
+def test_network_provider_http2_requires_h2(monkeypatch):
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+    with pytest.raises(ValidationError, match="requires the 'h2' package"):
+        A2AProxyConfiguration(network_provider_http2=True)
+    assert not A2AProxyConfiguration().network_provider_http2
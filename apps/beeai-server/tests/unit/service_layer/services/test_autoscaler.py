@@ -0,0 +1,127 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from uuid import uuid4
+
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from pydantic import ValidationError
+
+from beeai_server.configuration import AutoscalingConfiguration, Configuration
+from beeai_server.service_layer.services.autoscaler import ProviderAutoscaler, ScalingDecision
+
+pytestmark = pytest.mark.unit
+
+
+class FakeA2AProxy:
+    def __init__(self):
+        self.in_flight = {}
+
+    def take_in_flight_requests(self):
+        in_flight, self.in_flight = self.in_flight, {}
+        return in_flight
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def reader() -> InMemoryMetricReader:
+    return InMemoryMetricReader()
+
+
+def create_autoscaler(deployment_manager, a2a_proxy, clock, reader, **config) -> ProviderAutoscaler:
+    configuration = Configuration()
+    configuration.provider.autoscaling = AutoscalingConfiguration(**config)
+    return ProviderAutoscaler(
+        deployment_manager=deployment_manager,  # pyright: ignore [reportArgumentType]
+        a2a_proxy=a2a_proxy,  # pyright: ignore [reportArgumentType]
+        configuration=configuration,
+        meter=MeterProvider(metric_readers=[reader]).get_meter("test"),
+        clock=clock,
+    )
+
+
+def collect_metrics(reader: InMemoryMetricReader) -> dict[str, list]:
+    data = reader.get_metrics_data()
+    return {
+        metric.name: list(metric.data.data_points)
+        for resource_metrics in data.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
+
+
+async def test_autoscaler_scales_with_hysteresis(reader, deployment_manager):
+    provider_id, network_provider_id, idle_provider_id = uuid4(), uuid4(), uuid4()
+    a2a_proxy, clock = FakeA2AProxy(), FakeClock()
+    deployment_manager.replica_counts = {provider_id: 1, idle_provider_id: 0}
+    autoscaler = create_autoscaler(
+        deployment_manager,
+        a2a_proxy,
+        clock,
+        reader,
+        enabled=True,
+        max_replicas=4,
+        target_in_flight_requests_per_replica=10,
+        scale_down_stabilization_sec=60,
+    )
+
+    # Load is spread over replicas immediately, up to the maximum
+    a2a_proxy.in_flight = {provider_id: 25, network_provider_id: 100, idle_provider_id: 3}
+    assert await autoscaler.evaluate() == [
+        ScalingDecision(provider_id=provider_id, in_flight_requests=25, current_replicas=1, desired_replicas=3)
+    ]
+    clock.now = 15
+    a2a_proxy.in_flight = {provider_id: 100}
+    await autoscaler.evaluate()
+    assert deployment_manager.replica_counts[provider_id] == 4
+
+    # Load within the tolerance or a short drop does not remove replicas
+    for second, in_flight in ((30, 38), (45, 5), (60, 0)):
+        clock.now = second
+        a2a_proxy.in_flight = {provider_id: in_flight}
+        assert await autoscaler.evaluate() == []
+
+    # Replicas are removed once the load stays low for the stabilization window
+    clock.now = 95
+    [decision] = await autoscaler.evaluate()
+    assert (decision.current_replicas, decision.desired_replicas) == (4, 1)
+    assert deployment_manager.replica_counts == {provider_id: 1, idle_provider_id: 0}
+
+    metrics = collect_metrics(reader)
+    assert sorted(
+        (point.attributes["direction"], point.value) for point in metrics["provider_autoscaler_decisions"]
+    ) == [("down", 1), ("up", 2)]
+    [desired] = metrics["provider_autoscaler_desired_replicas"]
+    assert (desired.attributes, desired.value) == ({"provider_id": str(provider_id)}, 1)
+
+    # Provider at the minimum without load is no longer evaluated
+    clock.now = 110
+    deployment_manager.replica_counts = {}
+    assert await autoscaler.evaluate() == []
+
+
+async def test_autoscaler_is_started_only_when_enabled(deployment_manager):
+    autoscaler = create_autoscaler(deployment_manager, FakeA2AProxy(), FakeClock(), InMemoryMetricReader())
+    async with autoscaler:
+        assert autoscaler._task is None
+
+    autoscaler = create_autoscaler(
+        deployment_manager, FakeA2AProxy(), FakeClock(), InMemoryMetricReader(), enabled=True
+    )
+    async with autoscaler:
+        assert autoscaler._task is not None
+    assert autoscaler._task is None
+
+
+def test_autoscaling_requires_single_api_server_replica():
+    AutoscalingConfiguration(api_server_replicas=2)
+    with pytest.raises(ValidationError, match="single API server replica"):
+        AutoscalingConfiguration(enabled=True, api_server_replicas=2)
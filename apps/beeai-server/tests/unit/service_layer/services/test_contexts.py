@@ -0,0 +1,398 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from io import BytesIO
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+from a2a.types import Message, Part, Role, TextPart
+from opentelemetry.metrics import NoOpMeter
+
+from beeai_server.configuration import Configuration, ContextConfiguration
+from beeai_server.domain.models.context import Context, ContextHistorySnapshot, StoredContextHistoryItem
+from beeai_server.domain.models.file import AsyncFile
+from beeai_server.domain.models.user import User
+from beeai_server.service_layer.services.contexts import ContextService
+from beeai_server.utils.utils import utc_now
+
+pytestmark = pytest.mark.unit
+
+
+class FakeContextRepository:
+    def __init__(self, context: Context):
+        self.context = context
+        self.history: list[StoredContextHistoryItem] = []
+        self.snapshot_chunks: list[list[StoredContextHistoryItem]] = []
+        self.titles: list[str | None] = []
+
+    async def get(self, *, context_id, user_id=None):
+        return self.context
+
+    async def add_history_items(self, *, context_id, history_items):
+        self.history.extend(history_items)
+
+    async def update_title(self, *, context_id, title=None, generation_state):
+        self.titles.append(title)
+
+    async def get_history_snapshot(self, *, context_id):
+        if not self.snapshot_chunks:
+            return None
+        items = [item for chunk in self.snapshot_chunks for item in chunk]
+        return ContextHistorySnapshot(context_id=context_id, items=items)
+
+    async def get_last_snapshot_history_item(self, *, context_id):
+        return self.snapshot_chunks[-1][-1] if self.snapshot_chunks else None
+
+    async def append_history_snapshot(self, *, context_id, items, chunk_size):
+        self.snapshot_chunks.extend(items[offset : offset + chunk_size] for offset in range(0, len(items), chunk_size))
+
+    async def list_history_after(self, *, context_id, after_item=None, created_before=None):
+        return [
+            item
+            for item in sorted(self.history, key=lambda item: (item.created_at, item.id))
+            if (not after_item or (item.created_at, item.id) > (after_item.created_at, after_item.id))
+            and (not created_before or item.created_at < created_before)
+        ]
+
+
+class FakeObjectStorage:
+    def __init__(self):
+        self.objects: dict[UUID, bytes] = {}
+
+    async def upload_file(self, *, file_id, file):
+        self.objects[file_id] = await file.read(-1)
+
+    @asynccontextmanager
+    async def get_file(self, *, file_id, byte_range=None):
+        buffer = BytesIO(self.objects[file_id])
+
+        async def read(size: int = -1) -> bytes:
+            return buffer.read(size)
+
+        yield AsyncFile(filename=f"{file_id}.json", content_type="application/json", read=read)
+
+    async def delete_files(self, *, file_ids):
+        for file_id in file_ids:
+            self.objects.pop(file_id)
+
+
+class FakeTask:
+    def __init__(self):
+        self.deferred: list[dict] = []
+
+    def configure(self, **kwargs):
+        return self
+
+    async def defer_async(self, **kwargs):
+        self.deferred.append(kwargs)
+
+
+@pytest.fixture
+def user() -> User:
+    return User(email="user@example.com")
+
+
+@pytest.fixture
+def contexts(user) -> FakeContextRepository:
+    return FakeContextRepository(Context(created_by=user.id))
+
+
+@pytest.fixture
+def compaction_task(monkeypatch) -> FakeTask:
+    import beeai_server.jobs.tasks.context
+
+    task = FakeTask()
+    monkeypatch.setattr(beeai_server.jobs.tasks.context, "compact_context_history", task)
+    return task
+
+
+@pytest.fixture
+def title_task(monkeypatch) -> FakeTask:
+    import beeai_server.jobs.tasks.context
+
+    task = FakeTask()
+    monkeypatch.setattr(beeai_server.jobs.tasks.context, "generate_conversation_title", task)
+    return task
+
+
+@pytest.fixture
+def object_storage() -> FakeObjectStorage:
+    return FakeObjectStorage()
+
+
+@pytest.fixture
+def context_service(contexts, object_storage) -> ContextService:
+    @asynccontextmanager
+    async def uow():
+        async def commit():
+            pass
+
+        yield SimpleNamespace(contexts=contexts, commit=commit)
+
+    return ContextService(
+        uow=uow,  # pyright: ignore [reportArgumentType]
+        configuration=Configuration(
+            context=ContextConfiguration(
+                history_compaction_threshold=3,
+                history_snapshot_chunk_size=3,
+                history_compaction_grace_period_sec=60,
+                history_offload_threshold_bytes=1000,
+            )
+        ),
+        object_storage=object_storage,  # pyright: ignore [reportArgumentType]
+        meter=NoOpMeter("test"),
+    )
+
+
+def message(text: str, role: Role = Role.user) -> Message:
+    return Message(message_id=text, role=role, parts=[Part(root=TextPart(text=text))])
+
+
+def add_items(contexts: FakeContextRepository, count: int, age: timedelta) -> list[StoredContextHistoryItem]:
+    items = [
+        StoredContextHistoryItem(
+            id=uuid4(),
+            context_id=contexts.context.id,
+            created_at=utc_now() - age + timedelta(milliseconds=i),
+            data=message(f"message {i}"),
+        )
+        for i in range(count)
+    ]
+    contexts.history.extend(items)
+    return items
+
+
+def item_ids(items: list) -> list[UUID]:
+    return [item.id for item in items]
+
+
+async def test_compact_history(context_service, contexts):
+    old_items = add_items(contexts, 4, age=timedelta(hours=1))
+    add_items(contexts, 2, age=timedelta(seconds=1))  # within the grace period
+
+    assert await context_service.compact_history(context_id=contexts.context.id) == 4
+    assert [item_ids(chunk) for chunk in contexts.snapshot_chunks] == [item_ids(old_items[:3]), item_ids(old_items[3:])]
+    assert await context_service.compact_history(context_id=contexts.context.id) == 0
+
+    # Only the newly compacted items are written
+    newer_items = add_items(contexts, 2, age=timedelta(minutes=30))
+    assert await context_service.compact_history(context_id=contexts.context.id) == 2
+    assert [item_ids(chunk) for chunk in contexts.snapshot_chunks[2:]] == [item_ids(newer_items)]
+    snapshot = await contexts.get_history_snapshot(context_id=contexts.context.id)
+    assert snapshot
+    assert item_ids(snapshot.items) == item_ids(old_items + newer_items)
+
+
+async def test_get_full_history(context_service, contexts, compaction_task, user):
+    items = add_items(contexts, 5, age=timedelta(hours=1))
+    await context_service.compact_history(context_id=contexts.context.id)
+    items += add_items(contexts, 2, age=timedelta(seconds=1))
+
+    result = await context_service.get_full_history(context_id=contexts.context.id, user=user)
+
+    assert item_ids(result.items) == item_ids(items)
+    assert result.total_count == 7
+    assert not result.has_more
+    assert result.next_page_token == str(items[-1].id)
+    assert not compaction_task.deferred
+
+
+async def test_get_full_history_schedules_compaction(context_service, contexts, compaction_task, user):
+    items = add_items(contexts, 3, age=timedelta(hours=1))
+
+    result = await context_service.get_full_history(context_id=contexts.context.id, user=user)
+
+    assert item_ids(result.items) == item_ids(items)
+    assert compaction_task.deferred == [{"context_id": str(contexts.context.id)}]
+
+
+async def test_add_history_items_keeps_order(context_service, contexts, title_task, user):
+    data = [message("agent", role=Role.agent), message("first"), message("second")]
+
+    await context_service.add_history_items(context_id=contexts.context.id, data=data, user=user)
+
+    created_ats = [item.created_at for item in contexts.history]
+    assert [item.data for item in contexts.history] == data
+    assert created_ats == sorted(set(created_ats))  # strictly increasing, ties would make the order ambiguous
+    assert contexts.titles == ["first"]
+    assert title_task.deferred == [{"context_id": str(contexts.context.id)}]
+
+
+async def test_large_history_items_are_offloaded(context_service, contexts, object_storage, title_task, user):
+    small, large = message("small", role=Role.agent), message("large " + "x" * 1000, role=Role.agent)
+
+    await context_service.add_history_items(context_id=contexts.context.id, data=[small, large], user=user)
+
+    stored_small, stored_large = contexts.history
+    assert stored_small.data == small
+    assert stored_large.offloaded
+    assert stored_large.offloaded_size == len(object_storage.objects[stored_large.id])
+
+    result = await context_service.get_full_history(context_id=contexts.context.id, user=user)
+    assert [item.data for item in result.items] == [small, large]
+
+
+async def test_offloaded_history_items_are_deleted_on_failure(
+    context_service, contexts, object_storage, title_task, user, monkeypatch
+):
+    upload_file, uploads = object_storage.upload_file, []
+
+    async def fail_second_upload(*, file_id, file):
+        uploads.append(file_id)
+        if len(uploads) == 2:
+            raise RuntimeError("upload failed")
+        await upload_file(file_id=file_id, file=file)
+
+    monkeypatch.setattr(object_storage, "upload_file", fail_second_upload)
+    data = [message(f"large {i} " + "x" * 1000, role=Role.agent) for i in range(3)]
+    with pytest.raises(RuntimeError, match="upload failed"):
+        await context_service.add_history_items(context_id=contexts.context.id, data=data, user=user)
+    assert len(uploads) == 3
+    assert object_storage.objects == {}
+
+    async def update_title(**kwargs):
+        raise RuntimeError("update failed")
+
+    monkeypatch.setattr(object_storage, "upload_file", upload_file)
+    monkeypatch.setattr(contexts, "update_title", update_title)
+    with pytest.raises(RuntimeError, match="update failed"):
+        await context_service.add_history_items(
+            context_id=contexts.context.id, data=[message("first " + "x" * 1000)], user=user
+        )
+    assert object_storage.objects == {}
+
+
+class FakeExpirationRepositories:
+    """Contexts with resources, deleted in batches by context ids."""
+
+    def __init__(self):
+        self.last_active_at: dict[UUID, datetime] = {}
+        self.resources_expired_at: dict[UUID, datetime] = {}
+        self.files: dict[UUID, UUID] = {}  # file id -> context id, each file has its own blob of 10 bytes
+        self.unreferenced_blobs: list[UUID] = []
+        self.vector_stores: dict[UUID, UUID] = {}
+
+    def add_context(self, age: timedelta) -> UUID:
+        context_id = uuid4()
+        self.last_active_at[context_id] = utc_now() - age
+        self.files[uuid4()] = context_id
+        self.vector_stores[uuid4()] = context_id
+        return context_id
+
+    async def list_expired_resource_context_ids(self, *, last_active_before, limit):
+        expired = [
+            context_id
+            for context_id, last_active_at in sorted(self.last_active_at.items(), key=lambda item: item[1])
+            if last_active_at < last_active_before
+            and self.resources_expired_at.get(context_id, last_active_at - timedelta(1)) < last_active_at
+        ]
+        return expired[:limit]
+
+    async def mark_resources_expired(self, *, context_ids):
+        for context_id in context_ids:
+            self.resources_expired_at[context_id] = utc_now()
+
+    async def delete(self, *, context_ids):
+        deleted = [file_id for file_id, context_id in self.files.items() if context_id in context_ids]
+        for file_id in deleted:
+            del self.files[file_id]
+        self.unreferenced_blobs.extend(deleted)
+        return deleted
+
+    async def unreferenced_blobs_usage(self, *, blob_ids):
+        return 10 * len(set(blob_ids) & set(self.unreferenced_blobs))
+
+    async def delete_unreferenced_blobs(self, *, blob_ids):
+        deleted = [blob_id for blob_id in self.unreferenced_blobs if blob_id in set(blob_ids)]
+        self.unreferenced_blobs = [blob_id for blob_id in self.unreferenced_blobs if blob_id not in set(blob_ids)]
+        return deleted
+
+
+class FakeVectorStoreRepository:
+    def __init__(self, repositories: FakeExpirationRepositories):
+        self.repositories = repositories
+
+    async def total_usage(self, *, context_ids):
+        return 100 * sum(context_id in context_ids for context_id in self.repositories.vector_stores.values())
+
+    async def delete(self, *, context_ids):
+        stores = self.repositories.vector_stores
+        deleted = [store_id for store_id, context_id in stores.items() if context_id in context_ids]
+        for store_id in deleted:
+            del stores[store_id]
+        return len(deleted)
+
+
+class RecordingObjectStorage:
+    def __init__(self):
+        self.delete_requests: list[list[UUID]] = []
+
+    async def delete_files(self, *, file_ids):
+        self.delete_requests.append(list(file_ids))
+
+
+def create_expiration_service(
+    repositories: FakeExpirationRepositories, object_storage: RecordingObjectStorage, commit_error: bool = False
+) -> ContextService:
+    @asynccontextmanager
+    async def uow():
+        async def commit():
+            if commit_error:
+                raise RuntimeError("commit failed")
+
+        yield SimpleNamespace(
+            contexts=repositories,
+            files=repositories,
+            vector_stores=FakeVectorStoreRepository(repositories),
+            commit=commit,
+        )
+
+    return ContextService(
+        uow=uow,  # pyright: ignore [reportArgumentType]
+        configuration=Configuration(
+            context=ContextConfiguration(resource_expire_after_days=7, resource_expiration_batch_size=2)
+        ),
+        object_storage=object_storage,  # pyright: ignore [reportArgumentType]
+        meter=NoOpMeter("test"),
+    )
+
+
+async def test_expire_resources_in_batches():
+    repositories = FakeExpirationRepositories()
+    expired = [repositories.add_context(age=timedelta(days=10, minutes=i)) for i in range(5)]
+    active = repositories.add_context(age=timedelta(hours=1))
+    object_storage = RecordingObjectStorage()
+    context_service = create_expiration_service(repositories, object_storage)
+
+    stats = await context_service.expire_resources()
+
+    assert stats == {
+        "contexts": 5,
+        "files": 5,
+        "vector_stores": 5,
+        "blobs": 5,
+        "file_bytes": 50,
+        "vector_store_bytes": 500,
+    }
+    # Objects are deleted in one request per batch, oldest contexts first
+    assert [len(request) for request in object_storage.delete_requests] == [2, 2, 1]
+    assert set(repositories.resources_expired_at) == set(expired)
+    assert set(repositories.files.values()) == set(repositories.vector_stores.values()) == {active}
+
+    # Already expired contexts are skipped by the next run
+    assert await context_service.expire_resources() == {}
+
+
+async def test_expired_objects_are_kept_when_commit_fails():
+    repositories = FakeExpirationRepositories()
+    repositories.add_context(age=timedelta(days=10))
+    object_storage = RecordingObjectStorage()
+    context_service = create_expiration_service(repositories, object_storage, commit_error=True)
+
+    with pytest.raises(RuntimeError, match="commit failed"):
+        await context_service.expire_resources()
+    # The rolled back rows still reference the objects
+    assert object_storage.delete_requests == []
@@ -0,0 +1,235 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+
+from beeai_server.configuration import Configuration
+from beeai_server.domain.models.file import ExtractionMetadata, ExtractionStatus, File, FileType, TextExtraction
+from beeai_server.domain.models.user import User
+from beeai_server.domain.repositories.file import EXTRACTION_FINISHED_CHANNEL
+from beeai_server.exceptions import EntityNotFoundError
+from beeai_server.service_layer.services.files import FileService
+
+pytestmark = pytest.mark.unit
+
+
+class FakeNotificationListener:
+    def __init__(self):
+        self.subscribers: dict[str, set[asyncio.Queue[str]]] = {}
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str):
+        queue = asyncio.Queue()
+        self.subscribers.setdefault(channel, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            self.subscribers[channel].discard(queue)
+
+    def notify(self, channel: str, payload: str):
+        for queue in self.subscribers.get(channel, ()):
+            queue.put_nowait(payload)
+
+
+class FakeFileRepository:
+    def __init__(self):
+        self.extractions: dict[UUID, TextExtraction] = {}
+        self.list_calls = 0
+        self.file_blobs: dict[UUID, UUID] = {}  # file id -> blob id
+        self.blob_refs: dict[UUID, int] = {}
+        self.commit_error: Exception | None = None
+        self.files: dict[UUID, File] = {}
+
+    async def get(self, *, file_id, user_id=None, context_id=None, file_type=None):
+        return self.files[file_id]
+
+    async def create(self, *, file):
+        self.files[file.id] = file
+
+    async def acquire_blob(self, *, blob):
+        self.blob_refs[blob.id] = self.blob_refs.get(blob.id, 0) + 1
+        return blob
+
+    async def get_extraction_by_file_id(self, *, file_id, user_id=None, context_id=None):
+        return self.extractions[file_id]
+
+    async def get_extraction_by_cache_key(self, *, cache_key, user_id):
+        return next(
+            extraction
+            for extraction in self.extractions.values()
+            if extraction.cache_key == cache_key and extraction.status == ExtractionStatus.COMPLETED
+        )
+
+    async def update_extraction(self, *, extraction):
+        self.extractions[extraction.file_id] = extraction
+
+    async def list_extractions(self, *, file_ids, user_id=None, context_id=None):
+        self.list_calls += 1
+        return [self.extractions[file_id].model_copy() for file_id in file_ids if file_id in self.extractions]
+
+    async def delete(self, *, file_id, user_id=None, context_id=None):
+        blob_id = self.file_blobs.pop(file_id)
+        self.blob_refs[blob_id] -= 1
+        return [blob_id]
+
+    async def delete_unreferenced_blobs(self, *, blob_ids):
+        deleted = [blob_id for blob_id in blob_ids if not self.blob_refs[blob_id]]
+        for blob_id in deleted:
+            del self.blob_refs[blob_id]
+        return deleted
+
+
+class RecordingObjectStorage:
+    def __init__(self):
+        self.delete_requests: list[list[UUID]] = []
+
+    async def delete_files(self, *, file_ids):
+        self.delete_requests.append(list(file_ids))
+
+
+@pytest.fixture
+def files() -> FakeFileRepository:
+    return FakeFileRepository()
+
+
+@pytest.fixture
+def listener() -> FakeNotificationListener:
+    return FakeNotificationListener()
+
+
+@pytest.fixture
+def object_storage() -> RecordingObjectStorage:
+    return RecordingObjectStorage()
+
+
+@pytest.fixture
+def file_service(files, listener, object_storage) -> FileService:
+    @asynccontextmanager
+    async def uow():
+        async def commit():
+            if files.commit_error:
+                raise files.commit_error
+
+        yield SimpleNamespace(files=files, commit=commit)
+
+    return FileService(
+        object_storage_repository=object_storage,  # pyright: ignore [reportArgumentType]
+        extraction_backend=None,  # pyright: ignore [reportArgumentType]
+        uow=uow,  # pyright: ignore [reportArgumentType]
+        user_service=None,  # pyright: ignore [reportArgumentType]
+        notification_listener=listener,
+        configuration=Configuration(),
+    )
+
+
+@pytest.fixture
+def user() -> User:
+    return User(email="user@example.com")
+
+
+def add_extraction(files: FakeFileRepository, status: ExtractionStatus) -> TextExtraction:
+    extraction = TextExtraction(file_id=uuid4(), status=status)
+    files.extractions[extraction.file_id] = extraction
+    return extraction
+
+
+async def test_wait_for_finished_extractions(file_service, files, user):
+    completed = add_extraction(files, ExtractionStatus.COMPLETED)
+    failed = add_extraction(files, ExtractionStatus.FAILED)
+
+    result = await file_service.wait_for_extractions(
+        file_ids=[failed.file_id, completed.file_id], user=user, timeout=timedelta(seconds=10)
+    )
+
+    assert [extraction.file_id for extraction in result] == [failed.file_id, completed.file_id]
+    assert files.list_calls == 1
+
+
+async def test_wait_for_extractions_notified(file_service, files, listener, user):
+    first = add_extraction(files, ExtractionStatus.IN_PROGRESS)
+    second = add_extraction(files, ExtractionStatus.PENDING)
+
+    wait = asyncio.create_task(
+        file_service.wait_for_extractions(
+            file_ids=[first.file_id, second.file_id], user=user, timeout=timedelta(seconds=10)
+        )
+    )
+    await asyncio.sleep(0.01)
+    for extraction in (first, second):
+        files.extractions[extraction.file_id].status = ExtractionStatus.COMPLETED
+        listener.notify(EXTRACTION_FINISHED_CHANNEL, str(uuid4()))  # other files are ignored
+        listener.notify(EXTRACTION_FINISHED_CHANNEL, str(extraction.file_id))
+        await asyncio.sleep(0.01)
+
+    result = await asyncio.wait_for(wait, timeout=1)
+    assert [extraction.status for extraction in result] == [ExtractionStatus.COMPLETED, ExtractionStatus.COMPLETED]
+    assert not listener.subscribers[EXTRACTION_FINISHED_CHANNEL]
+
+
+async def test_wait_for_extractions_timeout(file_service, files, user):
+    extraction = add_extraction(files, ExtractionStatus.IN_PROGRESS)
+
+    [result] = await file_service.wait_for_extractions(
+        file_ids=[extraction.file_id], user=user, timeout=timedelta(seconds=0.05)
+    )
+
+    assert result.status == ExtractionStatus.IN_PROGRESS
+    assert files.list_calls == 2
+
+
+async def test_wait_for_missing_extraction(file_service, files, user):
+    extraction = add_extraction(files, ExtractionStatus.COMPLETED)
+
+    with pytest.raises(EntityNotFoundError):
+        await file_service.wait_for_extractions(
+            file_ids=[extraction.file_id, uuid4()], user=user, timeout=timedelta(seconds=1)
+        )
+
+
+async def test_blob_objects_are_deleted_after_commit(file_service, files, object_storage, user):
+    shared_blob, own_blob = uuid4(), uuid4()
+    first, second, third = uuid4(), uuid4(), uuid4()
+    files.file_blobs = {first: shared_blob, second: shared_blob, third: own_blob}
+    files.blob_refs = {shared_blob: 2, own_blob: 1}
+
+    # Blob still referenced by another file is kept
+    await file_service.delete(file_id=first, user=user)
+    await file_service.delete(file_id=third, user=user)
+    assert object_storage.delete_requests == [[], [own_blob]]
+
+    # Rolled back rows still reference the object
+    files.commit_error = RuntimeError("commit failed")
+    with pytest.raises(RuntimeError, match="commit failed"):
+        await file_service.delete(file_id=second, user=user)
+    assert object_storage.delete_requests == [[], [own_blob]]
+
+
+async def test_cached_in_place_extraction_is_copied_as_extracted_text(file_service, files, user):
+    text_file = File(filename="notes.txt", content_type="text/plain", content_sha256="a" * 64, created_by=user.id)
+    cached = TextExtraction(file_id=text_file.id, cache_key="key")
+    cached.set_completed(extracted_file_id=text_file.id, metadata=ExtractionMetadata(backend="in-place"))
+    # Same content uploaded with a content type which needs extraction
+    upload = text_file.model_copy(
+        update={"id": uuid4(), "filename": "notes", "content_type": "application/octet-stream"}
+    )
+    for file, extraction in ((text_file, cached), (upload, TextExtraction(file_id=upload.id, cache_key="key"))):
+        files.files[file.id] = file
+        files.extractions[file.id] = extraction
+
+    await file_service.extract_text(upload.id, job_id="job")
+
+    extraction = files.extractions[upload.id]
+    assert extraction.status == ExtractionStatus.COMPLETED
+    extracted_file = files.files[extraction.extracted_file_id]  # pyright: ignore [reportArgumentType]
+    assert (extracted_file.file_type, extracted_file.filename, extracted_file.parent_file_id) == (
+        FileType.EXTRACTED_TEXT,
+        "extracted_text.md",
+        upload.id,
+    )
+    assert files.blob_refs[text_file.blob_id] == 1
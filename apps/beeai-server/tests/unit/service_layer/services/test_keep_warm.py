@@ -0,0 +1,99 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from datetime import UTC, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from opentelemetry.metrics import NoOpMeter
+
+from beeai_server.configuration import Configuration, KeepWarmPolicy, KeepWarmWindow
+from beeai_server.domain.models.provider import Provider
+from beeai_server.service_layer.services.keep_warm import KeepWarmService, is_window_active
+
+pytestmark = pytest.mark.unit
+
+PRAGUE = ZoneInfo("Europe/Prague")
+MONDAY_MORNING = datetime(2025, 9, 29, 7, 55, tzinfo=PRAGUE)
+
+
+@pytest.fixture
+def providers(create_provider, provider_repository) -> list[Provider]:
+    last_week = MONDAY_MORNING - timedelta(days=7)
+    provider_repository.providers = [
+        create_provider(f"ghcr.io/i-am-bee/{name}:1.0.0", last_active_at=last_week)
+        for name in ("office", "batch", "idle")
+    ]
+    return provider_repository.providers
+
+
+@pytest.fixture
+def create_service(uow, deployment_manager):
+    def create_service(**keep_warm) -> KeepWarmService:
+        configuration = Configuration()
+        configuration.provider.keep_warm = configuration.provider.keep_warm.model_copy(update=keep_warm)
+        return KeepWarmService(
+            deployment_manager=deployment_manager,
+            uow=uow,
+            configuration=configuration,
+            meter=NoOpMeter("test"),
+        )
+
+    return create_service
+
+
+@pytest.mark.parametrize(
+    ("window", "at", "expected"),
+    [
+        (KeepWarmWindow(start=time(8), end=time(17)), datetime(2025, 9, 29, 8, tzinfo=UTC), True),
+        (KeepWarmWindow(start=time(8), end=time(17)), datetime(2025, 9, 29, 17, tzinfo=UTC), False),
+        (
+            KeepWarmWindow(start=time(8), end=time(17), timezone="Europe/Prague"),
+            datetime(2025, 9, 29, 6, tzinfo=UTC),
+            True,
+        ),
+        (KeepWarmWindow(days={0}, start=time(8), end=time(17)), datetime(2025, 9, 30, 9, tzinfo=UTC), False),
+        # over midnight from Monday to Tuesday
+        (KeepWarmWindow(days={0}, start=time(22), end=time(2)), datetime(2025, 9, 30, 1, tzinfo=UTC), True),
+        (KeepWarmWindow(days={0}, start=time(22), end=time(2)), datetime(2025, 9, 29, 1, tzinfo=UTC), False),
+    ],
+)
+def test_is_window_active(window, at, expected):
+    assert is_window_active(window, at) is expected
+
+
+async def test_warm_providers(providers, provider_repository, deployment_manager, create_service):
+    office, batch, idle = providers
+    office_hours = KeepWarmWindow(days={0, 1, 2, 3, 4}, start=time(8), end=time(17), timezone="Europe/Prague")
+    service = create_service(
+        policies={str(office.source.root): KeepWarmPolicy(windows=[office_hours])},
+        lead_time_sec=600,
+        prediction_min_weeks=2,
+    )
+    # batch was used in the upcoming hour of the week in 2 of the last 4 weeks, idle only once
+    provider_repository.access_counts = {batch.id: 2, idle.id: 1}
+
+    assert await service.warm_providers(MONDAY_MORNING - timedelta(minutes=15)) == [batch.id]
+    assert provider_repository.counted_hours[0] == [
+        datetime(2025, 9, 29, 5, tzinfo=UTC) - timedelta(weeks=week) for week in range(4, 0, -1)
+    ]
+
+    # Office hours start within the lead time, batch is already starting
+    assert await service.warm_providers(MONDAY_MORNING) == [office.id]
+    assert deployment_manager.created == [batch.id, office.id]
+
+
+async def test_keep_warm_reasons(providers, provider_repository, create_service):
+    office = providers[0]
+    service = create_service(
+        policies={str(office.id): KeepWarmPolicy(min_warm_sec=3600)},
+        prediction_enabled=False,
+    )
+    office.last_active_at = MONDAY_MORNING - timedelta(minutes=30)
+
+    assert await service.keep_warm_reasons(providers, MONDAY_MORNING) == {office.id: "min_warm"}
+    assert await service.keep_warm_reasons(providers, MONDAY_MORNING + timedelta(hours=1)) == {}
+    assert not provider_repository.counted_hours
+
+    disabled = create_service(enabled=False)
+    assert await disabled.keep_warm_reasons(providers, MONDAY_MORNING) == {}
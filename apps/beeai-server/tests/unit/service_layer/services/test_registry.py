@@ -0,0 +1,100 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+import yaml
+from pydantic import FileUrl
+
+from beeai_server.configuration import AgentRegistryConfiguration, Configuration
+from beeai_server.domain.models.provider import DockerImageProviderLocation, Provider
+from beeai_server.domain.models.registry import FileSystemRegistryLocation
+from beeai_server.service_layer.services.registry import RegistrySyncService
+
+pytestmark = pytest.mark.unit
+
+# Manifest digests of the images in the container registry
+DIGESTS = {
+    "ghcr.io/i-am-bee/unchanged:1.0.0": "sha256:aaa",
+    "ghcr.io/i-am-bee/repushed:1.0.0": "sha256:bbb-new",
+    "ghcr.io/i-am-bee/retagged:1.0.1": "sha256:ccc",
+    "ghcr.io/i-am-bee/legacy:1.0.0": "sha256:ddd",
+    **{f"ghcr.io/i-am-bee/new-{i}:1.0.0": f"sha256:new-{i}" for i in range(4)},
+}
+
+
+class FakeProviderService:
+    def __init__(self):
+        self.calls = []
+        self.running = self.max_running = 0
+
+    async def _call(self, *call):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        self.calls.append(call)
+
+    async def remove_orphaned_providers(self):
+        pass
+
+    async def delete_provider(self, *, provider_id):
+        await self._call("delete", provider_id)
+
+    async def create_provider(self, *, location, registry, source_fingerprint):
+        await self._call("create", str(location.root), source_fingerprint)
+
+    async def upgrade_provider(self, *, provider_id, location, force, agent_card, source_fingerprint):
+        await self._call("upgrade", str(location.root), agent_card and agent_card.name, source_fingerprint)
+
+
+@pytest.fixture
+def registry_location(tmp_path) -> FileSystemRegistryLocation:
+    registry_file = tmp_path / "registry.yaml"
+    registry_file.write_text(yaml.safe_dump({"providers": [{"location": image} for image in DIGESTS]}))
+    return FileSystemRegistryLocation(root=FileUrl(f"file://{registry_file}"))
+
+
+async def test_sync_skips_unchanged_providers(
+    override_global_dependency, monkeypatch, create_provider, provider_repository, uow, registry_location
+):
+    async def get_fingerprint(self):
+        return DIGESTS[str(self.root)]
+
+    monkeypatch.setattr(DockerImageProviderLocation, "get_fingerprint", get_fingerprint)
+
+    def create_registry_provider(image: str, source_fingerprint: str | None = None) -> Provider:
+        return create_provider(image, registry=registry_location, source_fingerprint=source_fingerprint)
+
+    unchanged = create_registry_provider("ghcr.io/i-am-bee/unchanged:1.0.0", "sha256:aaa")
+    repushed = create_registry_provider("ghcr.io/i-am-bee/repushed:1.0.0", "sha256:bbb-old")
+    retagged = create_registry_provider("ghcr.io/i-am-bee/retagged:1.0.0", "sha256:ccc")
+    legacy = create_registry_provider("ghcr.io/i-am-bee/legacy:1.0.0")
+    removed = create_registry_provider("ghcr.io/i-am-bee/removed:1.0.0")
+    provider_repository.providers = [unchanged, repushed, retagged, legacy, removed]
+
+    provider_service = FakeProviderService()
+    configuration = Configuration(
+        agent_registry=AgentRegistryConfiguration(locations={"test": registry_location}, sync_concurrency=2)
+    )
+    service = RegistrySyncService(
+        provider_service=provider_service,  # pyright: ignore [reportArgumentType]
+        uow=uow,
+        configuration=configuration,
+    )
+
+    with override_global_dependency(Configuration, Configuration()):
+        results = await service.sync()
+
+    assert results == {"added": 4, "upgraded": 2, "unchanged": 2, "removed": 1}
+    assert provider_service.calls[0] == ("delete", removed.id)
+    assert sorted(call for call in provider_service.calls if call[0] == "upgrade") == [
+        ("upgrade", "ghcr.io/i-am-bee/repushed:1.0.0", None, "sha256:bbb-new"),
+        # same image under a new tag, the agent card is reused
+        ("upgrade", "ghcr.io/i-am-bee/retagged:1.0.1", "ghcr.io/i-am-bee/retagged:1.0.0", "sha256:ccc"),
+    ]
+    assert ("create", "ghcr.io/i-am-bee/new-0:1.0.0", "sha256:new-0") in provider_service.calls
+    assert provider_service.max_running == 2
+    # fingerprint of a provider synced before fingerprints were stored is adopted without an upgrade
+    assert provider_repository.fingerprints == {legacy.id: "sha256:ddd"}
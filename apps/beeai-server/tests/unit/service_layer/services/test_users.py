@@ -0,0 +1,55 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+
+from beeai_server.service_layer.services.users import UserService
+
+pytestmark = pytest.mark.unit
+
+
+class FakeRepositories:
+    def __init__(self):
+        self.offloaded_item_ids: dict[UUID, list[UUID]] = {}  # user id -> offloaded history item ids
+        self.deleted_users: list[UUID] = []
+
+    async def list_offloaded_history_item_ids(self, *, user_id):
+        return self.offloaded_item_ids.get(user_id, [])
+
+    async def delete(self, *, user_id):
+        self.deleted_users.append(user_id)
+        return 1
+
+
+class RecordingObjectStorage:
+    def __init__(self):
+        self.delete_requests: list[list[UUID]] = []
+
+    async def delete_files(self, *, file_ids):
+        self.delete_requests.append(list(file_ids))
+
+
+async def test_offloaded_history_is_deleted_with_user():
+    repositories, object_storage = FakeRepositories(), RecordingObjectStorage()
+    user_id, item_ids = uuid4(), [uuid4(), uuid4()]
+    repositories.offloaded_item_ids[user_id] = item_ids
+    commits = []
+
+    @asynccontextmanager
+    async def uow():
+        async def commit():
+            commits.append(list(object_storage.delete_requests))
+
+        yield SimpleNamespace(users=repositories, contexts=repositories, commit=commit)
+
+    service = UserService(uow=uow, object_storage=object_storage)  # pyright: ignore [reportArgumentType]
+    await service.delete_user(user_id)
+
+    assert repositories.deleted_users == [user_id]
+    # Objects are deleted only after the cascade is committed
+    assert commits == [[]]
+    assert object_storage.delete_requests == [item_ids]
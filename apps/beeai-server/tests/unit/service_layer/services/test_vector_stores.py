@@ -0,0 +1,222 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+from openai.types import CreateEmbeddingResponse, Embedding
+from openai.types.create_embedding_response import Usage
+
+from beeai_server.configuration import Configuration, VectorStoresConfiguration
+from beeai_server.domain.models.file import AsyncFile, ExtractionStatus, File, TextExtraction
+from beeai_server.domain.models.user import User
+from beeai_server.domain.models.vector_store import (
+    ChunkingParameters,
+    IngestionStatus,
+    VectorStore,
+    VectorStoreDocumentInfo,
+    VectorStoreIngestion,
+)
+from beeai_server.exceptions import PlatformError
+from beeai_server.service_layer.services.vector_stores import VectorStoreService
+
+pytestmark = pytest.mark.unit
+
+
+class FakeVectorStoreRepository:
+    def __init__(self, vector_store: VectorStore):
+        self.vector_store = vector_store
+        self.ingestions: dict[UUID, VectorStoreIngestion] = {}
+        self.ingestion_updates: list[VectorStoreIngestion] = []
+        self.documents: set[str] = set()
+
+    async def get(self, *, vector_store_id, user_id=None, context_id=None):
+        return self.vector_store
+
+    async def get_ingestion(self, *, ingestion_id, user_id=None, context_id=None):
+        return self.ingestions[ingestion_id].model_copy(deep=True)
+
+    async def update_ingestion(self, *, ingestion):
+        self.ingestions[ingestion.id] = ingestion.model_copy(deep=True)
+        self.ingestion_updates.append(ingestion.model_copy(deep=True))
+
+    async def remove_documents(self, *, vector_store_id, document_ids):
+        self.documents -= set(document_ids)
+
+    async def total_usage(self, *, user_id=None):
+        return 0
+
+    async def upsert_documents(self, *, documents):
+        self.documents |= {document.id for document in documents}
+
+
+class FakeVectorDatabase:
+    def __init__(self):
+        self.items = []
+
+    def estimate_size(self, items):
+        return [VectorStoreDocumentInfo(id=item.document_id, usage_bytes=1) for item in items]
+
+    async def add_items(self, collection_id, items):
+        self.items.extend(items)
+
+
+class FakeFileService:
+    def __init__(self, user: User):
+        self.files: dict[UUID, File] = {}
+        self.contents: dict[UUID, str] = {}
+        self.extractions: dict[UUID, TextExtraction] = {}
+        self.user = user
+
+    def add_file(self, content: str, status: ExtractionStatus = ExtractionStatus.COMPLETED) -> File:
+        file = File(filename="bees.md", content_type="text/markdown", created_by=self.user.id)
+        self.files[file.id] = file
+        self.contents[file.id] = content
+        self.extractions[file.id] = TextExtraction(
+            file_id=file.id, extracted_file_id=file.id, status=status, error_message="broken document"
+        )
+        return file
+
+    async def get(self, *, file_id, user, context_id=None):
+        return self.files[file_id]
+
+    async def create_extraction(self, *, file_id, user, context_id=None):
+        return self.extractions[file_id]
+
+    async def wait_for_extractions(self, *, file_ids, user, context_id=None, timeout):  # noqa: ASYNC109
+        return [self.extractions[file_id] for file_id in file_ids]
+
+    @asynccontextmanager
+    async def get_content(self, *, file_id, user, context_id=None, byte_range=None):
+        content = [self.contents[file_id].encode()]
+
+        async def read(size: int = -1) -> bytes:
+            return content.pop() if content else b""
+
+        yield AsyncFile(filename="bees.md", content_type="text/markdown", read=read)
+
+
+class FakeModelProviderService:
+    def __init__(self):
+        self.requests: list[list[str]] = []
+
+    async def create_embeddings(self, *, model_id, inputs):
+        self.requests.append(inputs)
+        return CreateEmbeddingResponse(
+            object="list",
+            model=model_id,
+            data=[
+                Embedding(object="embedding", index=i, embedding=[float(len(text))] * 64)
+                for i, text in enumerate(inputs)
+            ],
+            usage=Usage(prompt_tokens=0, total_tokens=0),
+        )
+
+
+@pytest.fixture
+def user() -> User:
+    return User(email="user@example.com")
+
+
+@pytest.fixture
+def vector_stores(user) -> FakeVectorStoreRepository:
+    return FakeVectorStoreRepository(VectorStore(model_id="ollama:embed", dimension=64, created_by=user.id))
+
+
+@pytest.fixture
+def vector_database() -> FakeVectorDatabase:
+    return FakeVectorDatabase()
+
+
+@pytest.fixture
+def file_service(user) -> FakeFileService:
+    return FakeFileService(user)
+
+
+@pytest.fixture
+def model_provider_service() -> FakeModelProviderService:
+    return FakeModelProviderService()
+
+
+@pytest.fixture
+def vector_store_service(user, vector_stores, vector_database, file_service, model_provider_service):
+    @asynccontextmanager
+    async def uow():
+        async def get_user(*, user_id):
+            return user
+
+        async def commit():
+            pass
+
+        yield SimpleNamespace(
+            vector_stores=vector_stores,
+            vector_database=vector_database,
+            users=SimpleNamespace(get=get_user),
+            commit=commit,
+        )
+
+    return VectorStoreService(
+        uow=uow,  # pyright: ignore [reportArgumentType]
+        configuration=Configuration(vector_stores=VectorStoresConfiguration(ingestion_embedding_batch_size=2)),
+        file_service=file_service,  # pyright: ignore [reportArgumentType]
+        model_provider_service=model_provider_service,  # pyright: ignore [reportArgumentType]
+    )
+
+
+def add_ingestion(vector_stores: FakeVectorStoreRepository, file_ids: list[UUID]) -> VectorStoreIngestion:
+    ingestion = VectorStoreIngestion(
+        vector_store_id=vector_stores.vector_store.id,
+        file_ids=file_ids,
+        chunking=ChunkingParameters(chunk_size=20, chunk_overlap=0),
+        created_by=vector_stores.vector_store.created_by,
+    )
+    vector_stores.ingestions[ingestion.id] = ingestion
+    return ingestion
+
+
+async def test_ingest(vector_store_service, vector_stores, vector_database, file_service, model_provider_service):
+    first = file_service.add_file("Bees make honey.\n\nHoney is sweet.\n\nWax builds combs.")
+    second = file_service.add_file("Queens lay eggs.")
+    ingestion = add_ingestion(vector_stores, [first.id, second.id])
+
+    await vector_store_service.ingest(ingestion_id=ingestion.id, job_id="job")
+
+    result = vector_stores.ingestions[ingestion.id]
+    assert result.status == IngestionStatus.COMPLETED
+    assert result.progress.model_dump() == {"total_files": 2, "processed_files": 2, "embedded_chunks": 4}
+    assert model_provider_service.requests == [["Bees make honey.", "Honey is sweet."], ["Wax builds combs."], ["Queens lay eggs."]]  # fmt: skip
+    assert [(item.document_id, item.text, item.metadata["chunk_index"]) for item in vector_database.items] == [
+        (str(first.id), "Bees make honey.", "0"),
+        (str(first.id), "Honey is sweet.", "1"),
+        (str(first.id), "Wax builds combs.", "2"),
+        (str(second.id), "Queens lay eggs.", "0"),
+    ]
+    assert vector_database.items[0].embedding == [16.0] * 64
+    assert vector_stores.documents == {str(first.id), str(second.id)}
+    assert [update.progress.embedded_chunks for update in vector_stores.ingestion_updates] == [0, 2, 3, 3, 4, 4, 4]
+
+
+async def test_ingest_failed_extraction(vector_store_service, vector_stores, vector_database, file_service):
+    first = file_service.add_file("Bees make honey.")
+    second = file_service.add_file("", status=ExtractionStatus.FAILED)
+    ingestion = add_ingestion(vector_stores, [first.id, second.id])
+
+    with pytest.raises(PlatformError, match="broken document"):
+        await vector_store_service.ingest(ingestion_id=ingestion.id, job_id="job")
+
+    result = vector_stores.ingestions[ingestion.id]
+    assert result.status == IngestionStatus.FAILED
+    assert "broken document" in (result.error_message or "")
+    assert result.progress.processed_files == 1
+    assert len(vector_database.items) == 1
+
+
+async def test_ingest_finished_ingestion_is_skipped(vector_store_service, vector_stores, file_service):
+    ingestion = add_ingestion(vector_stores, [file_service.add_file("Bees").id])
+    ingestion.set_completed()
+
+    await vector_store_service.ingest(ingestion_id=ingestion.id, job_id="job")
+
+    assert not vector_stores.ingestion_updates
@@ -0,0 +1,87 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import procrastinate
+import pytest
+from procrastinate.testing import InMemoryConnector
+
+from beeai_server import run_workers as run_workers_module
+from beeai_server.configuration import Configuration, JobsConfiguration
+from beeai_server.run_workers import resolve_queue_concurrency, run_workers
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def app() -> procrastinate.App:
+    app = procrastinate.App(connector=InMemoryConnector())
+
+    @app.task(queue="text_extraction")
+    async def extract(): ...
+
+    @app.task(queue="cron:cleanup")
+    async def cleanup(): ...
+
+    @app.task(queue="unconfigured")
+    async def other(): ...
+
+    return app
+
+
+def test_resolve_queue_concurrency(app):
+    configuration = JobsConfiguration(
+        queue_concurrency={"text_extraction": 8, "cron:cleanup": 1}, default_concurrency=2
+    )
+
+    assert resolve_queue_concurrency(app, configuration) == {"cron:cleanup": 1, "text_extraction": 8, "unconfigured": 2}
+    assert resolve_queue_concurrency(app, configuration, ["text_extraction"]) == {"text_extraction": 8}
+    assert resolve_queue_concurrency(app, configuration, []) == {}
+    with pytest.raises(ValueError, match="Unknown queues"):
+        resolve_queue_concurrency(app, configuration, ["missing"])
+
+
+class FakeMetrics:
+    def __init__(self, app, queues, interval_sec):
+        self.queues = sorted(queues)
+
+    async def run(self):
+        await asyncio.Event().wait()
+
+
+async def test_run_worker_per_queue(app, monkeypatch):
+    started: dict[str, dict] = {}
+    cancelled: list[str] = []
+
+    async def run_worker_async(**kwargs):
+        [queue] = kwargs["queues"]
+        started[queue] = kwargs
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(queue)
+            raise
+
+    monkeypatch.setattr(app, "run_worker_async", run_worker_async)
+    monkeypatch.setattr(run_workers_module, "JobQueueMetrics", FakeMetrics)
+    configuration = Configuration(jobs=JobsConfiguration(queue_concurrency={"text_extraction": 8}))
+
+    async with run_workers(app=app, configuration=configuration, queues=["text_extraction", "cron:cleanup"]):
+        await asyncio.sleep(0)
+        assert {queue: kwargs["concurrency"] for queue, kwargs in started.items()} == {
+            "text_extraction": 8,
+            "cron:cleanup": 1,
+        }
+        assert not any(kwargs["install_signal_handlers"] for kwargs in started.values())
+
+    assert sorted(cancelled) == ["cron:cleanup", "text_extraction"]
+
+
+async def test_run_workers_disabled(app, monkeypatch):
+    async def run_worker_async(**kwargs):
+        raise AssertionError("No worker should be started")
+
+    monkeypatch.setattr(app, "run_worker_async", run_worker_async)
+    async with run_workers(app=app, configuration=Configuration(), queues=[]):
+        await asyncio.sleep(0)
@@ -0,0 +1,62 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from beeai_server.exceptions import PlatformError
+from beeai_server.utils.fastapi import read_multipart_file
+
+pytestmark = pytest.mark.unit
+
+BOUNDARY = "boundary123"
+
+
+def multipart_body(*parts: tuple[str, str | None, bytes]) -> bytes:
+    body = b""
+    for name, filename, content in parts:
+        disposition = f'form-data; name="{name}"' + (f'; filename="{filename}"' if filename else "")
+        body += f"--{BOUNDARY}\r\nContent-Disposition: {disposition}\r\n".encode()
+        if filename:
+            body += b"Content-Type: text/plain\r\n"
+        body += b"\r\n" + content + b"\r\n"
+    return body + f"--{BOUNDARY}--\r\n".encode()
+
+
+async def chunked(data: bytes, chunk_size: int):
+    for i in range(0, len(data), chunk_size):
+        yield data[i : i + chunk_size]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+async def test_read_multipart_file(chunk_size):
+    content = b"hello world\r\n--not-a-boundary" * 500
+    body = multipart_body(("other", None, b"value"), ("file", "test.txt", content), ("after", None, b"x"))
+    file = await read_multipart_file(chunked(body, chunk_size), f"multipart/form-data; boundary={BOUNDARY}")
+
+    assert file.filename == "test.txt"
+    assert file.content_type == "text/plain"
+    result = b""
+    while chunk := await file.read(100):
+        assert len(chunk) <= 100
+        result += chunk
+    assert result == content
+
+
+async def test_read_multipart_file_missing_field():
+    body = multipart_body(("other", "test.txt", b"value"))
+    with pytest.raises(ValueError, match="Missing form field"):
+        await read_multipart_file(chunked(body, 10), f"multipart/form-data; boundary={BOUNDARY}")
+
+
+async def test_read_multipart_file_truncated():
+    body = multipart_body(("file", "test.txt", b"value" * 100))[:200]
+    file = await read_multipart_file(chunked(body, 10), f"multipart/form-data; boundary={BOUNDARY}")
+    with pytest.raises(PlatformError, match="Unexpected end") as exc_info:
+        while await file.read(100):
+            pass
+    assert exc_info.value.status_code == 400
+
+
+async def test_read_multipart_file_invalid_content_type():
+    with pytest.raises(ValueError, match="multipart/form-data"):
+        await read_multipart_file(chunked(b"", 10), "application/json")
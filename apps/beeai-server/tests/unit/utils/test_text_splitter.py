@@ -0,0 +1,50 @@
+# Copyright 2025 © BeeAI a Series of LF Projects, LLC
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from beeai_server.utils.text_splitter import split_text
+
+pytestmark = pytest.mark.unit
+
+SEPARATORS = ["\n\n", "\n", " ", ""]
+
+
+def test_split_short_text():
+    assert split_text("Bees make honey.", chunk_size=100, chunk_overlap=10, separators=SEPARATORS) == [
+        "Bees make honey."
+    ]
+    assert split_text("  \n\n ", chunk_size=100, chunk_overlap=10, separators=SEPARATORS) == []
+
+
+def test_split_prefers_paragraphs():
+    text = "First paragraph.\n\nSecond paragraph.\n\nThird paragraph."
+    assert split_text(text, chunk_size=40, chunk_overlap=0, separators=SEPARATORS) == [
+        "First paragraph.\n\nSecond paragraph.",
+        "Third paragraph.",
+    ]
+
+
+def test_split_with_overlap():
+    text = "one two three four five six seven"
+    chunks = split_text(text, chunk_size=13, chunk_overlap=5, separators=SEPARATORS)
+    assert chunks == ["one two three", "three four", "four five six", "six seven"]
+
+
+def test_split_long_words():
+    chunks = split_text("a" * 25, chunk_size=10, chunk_overlap=0, separators=SEPARATORS)
+    assert chunks == ["a" * 10, "a" * 10, "a" * 5]
+    assert split_text("a" * 25, chunk_size=10, chunk_overlap=0, separators=[" "]) == ["a" * 25]
+
+
+@pytest.mark.parametrize(("chunk_size", "chunk_overlap"), [(50, 0), (100, 20), (300, 299)])
+def test_split_respects_chunk_size(chunk_size, chunk_overlap):
+    text = "\n\n".join(" ".join(f"word{i}x{j}" for j in range(i % 40)) for i in range(100))
+    chunks = split_text(text, chunk_size=chunk_size, chunk_overlap=chunk_overlap, separators=SEPARATORS)
+    assert all(0 < len(chunk) <= chunk_size for chunk in chunks)
+    assert set(text.split()) == {word for chunk in chunks for word in chunk.split()}
+
+
+def test_split_invalid_overlap():
+    with pytest.raises(ValueError, match="chunk_overlap"):
+        split_text("text", chunk_size=10, chunk_overlap=10, separators=SEPARATORS)
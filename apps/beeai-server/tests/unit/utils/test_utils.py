@@ -29,13 +29,17 @@ def async_json_reader(obj: dict[str, Any] | str):
         {"first_key": '"text": "haha"', "text": "abcde" * 100, "other_key": 666},
         {"text": 'escape "hell\\"\\' * 1000},
         {"text": 'escape "hell2\\n\t\r\\d"\\' * 1000},
+        {"text": "unicode ěščř 🐝 \ud83d \\ud83d" * 100},
+        {"text": ""},
     ],
 )
-async def test_extract_string_value_stream(obj):
+@pytest.mark.parametrize("read_size", [1, 5, 7, 128, 64 * 1024])
+async def test_extract_string_value_stream(obj, read_size):
     reader = async_json_reader(obj)
 
     result = []
-    async for chunk in extract_string_value_stream(reader, "text", chunk_size=128):
+    async for chunk in extract_string_value_stream(reader, "text", chunk_size=128, read_size=read_size):
+        assert len(chunk) <= 128
         result.append(chunk)
 
     assert "".join(result) == obj["text"]